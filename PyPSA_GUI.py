@@ -25,28 +25,55 @@ def _ensure_proj_lib_env():
         pass
 
 _ensure_proj_lib_env()
-import pypsa
+# pypsa(linopy/xarray/scipy 포함)는 네트워크 생성 시점에만 임포트하여, 입력 검증 등 가벼운 작업(src/pipeline_cli.py)이
+# 최적화 스택 로드를 기다리지 않도록 함
 import pandas as pd
 import numpy as np
 from datetime import datetime
 import os
 import traceback
 import sys
-import copy
+import gc
+import time
 
 
 # src 폴더를 Python 경로에 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-# 지도 모듈은 선택적 임포트로 처리하여 rasterio/GDAL 미설치 시에도 실행이 가능하도록 함
+# 지도 모듈(korea_map, geopandas/GDAL)은 지도를 그릴 때 plot_renderer에서 지연 임포트
+# (rasterio/GDAL 미설치 시에도 실행 가능하고, 지도가 필요 없는 작업은 로드 비용 없음)
+
+# 실행 카탈로그(SQLite)도 선택적 임포트: 없으면 기록만 생략
 try:
-    from korea_map import KoreaMapVisualizer  # noqa: F401
-except Exception as _map_e:
-    KoreaMapVisualizer = None
-    try:
-        _force_print(f"지도 모듈 로드 경고: {str(_map_e)}")
-    except Exception:
-        pass
+    import run_catalog as _run_catalog
+except Exception as _cat_e:
+    _run_catalog = None
+    print(f"실행 카탈로그 모듈 로드 경고: {str(_cat_e)}")
+
+# 연도/실행 통합 결과 큐브(Parquet, pyarrow 필요)도 선택적 임포트
+try:
+    import results_cube as _results_cube
+except Exception as _cube_e:
+    _results_cube = None
+    print(f"결과 큐브 모듈 로드 경고: {str(_cube_e)}")
+
+# 연도별 입력 copy-on-write 오버레이 (pandas만 사용)
+from input_overlay import InputOverlay, update_column_by_name, set_column
+
+# 멀티년 실행 연도별 체크포인트 (중단 후 이어서 실행)
+import year_checkpoint as _year_checkpoint
+
+# 멀티년 실행 연도 결과 요약/지연 로드 (스트리밍 모드)
+import year_results as _year_results
+
+# 수요 엔진: 부하·연도별 연간 수요 × (지역, 에너지) 패턴, 시계열은 네트워크 생성 시에만 계산
+from demand_engine import DemandEngine, scenario_values, scale_to_targets
+
+# 생성/풀이 네트워크 캐시 (입력·스위치·코드·솔버 설정 해시 기준, DISABLE_NETWORK_CACHE=1로 비활성화)
+import network_cache as _network_cache
+
+# 단계별 시간/메모리 프로파일 (결과 폴더에 Chrome 트레이스 + 요약, DISABLE_PROFILING=1로 비활성화)
+import run_profiler as _profiler
 
 # 상수 정의
 INPUT_FILE = "integrated_input_data.xlsx"
@@ -68,6 +95,7 @@ def _normalize_region_code(value):
     except Exception:
         return str(value)
 
+@_profiler.profiled()
 def read_input_data(input_file):
     """Excel 파일에서 입력 데이터 읽기"""
     try:
@@ -244,41 +272,18 @@ def _apply_scenario_demand_scaling(network, input_data):
         if not scenario:
             print("시나리오_에너지수요 시트가 없거나 해당 연도 데이터가 없습니다. 기본 부하를 사용합니다.")
             return
-        group_to_loads = {}
-        for load_name in network.loads.index:
-            region = load_name.split('_')[0] if '_' in load_name else None
-            demand_type = None
-            lname = load_name.lower()
-            if '_demand_el' in lname:
-                demand_type = 'EL'
-            elif '_demand_h2' in lname:
-                demand_type = 'H2'
-            elif '_demand_h' in lname:
-                demand_type = 'H'
-            if region and demand_type:
-                key = (region, demand_type)
-                group_to_loads.setdefault(key, []).append(load_name)
-        total_scaled_groups = 0
-        for key, names in group_to_loads.items():
-            region, dtype = key
-            target = scenario.get((region, dtype))
-            if target is None:
-                continue
-            current = 0.0
-            for nm in names:
-                if nm in network.loads_t.p_set.columns:
-                    current += float(np.nansum(network.loads_t.p_set[nm].values))
-            if current <= 0:
-                if target > 0:
+        # (지역, 에너지) 그룹 합계 → 배율을 한 번에 계산해 전체 시계열에 곱함
+        factors, groups = scale_to_targets(network.loads_t.p_set, scenario)
+        for (region, dtype), row in groups.iterrows():
+            if pd.isna(row['scale']):
+                if row['target'] > 0:
                     print(f"경고: {region}-{dtype} 현재 부하 합계가 0입니다. 스케일링을 건너뜁니다.")
                 continue
             # 이미 패턴 합계=1로 연간 총량을 분배했으므로, 스케일은 미세 오차 보정 수준이어야 함
-            scale = target / current
-            for nm in names:
-                if nm in network.loads_t.p_set.columns:
-                    network.loads_t.p_set[nm] = network.loads_t.p_set[nm] * scale
-            print(f"수요 스케일링 적용: {region}-{dtype}: 현재 {current:.1f} → 목표 {target:.1f} (배율 {scale:.6f})")
-            total_scaled_groups += 1
+            print(f"수요 스케일링 적용: {region}-{dtype}: 현재 {row['current']:.1f} → 목표 {row['target']:.1f} (배율 {row['scale']:.6f})")
+        total_scaled_groups = int(groups['scale'].notna().sum())
+        if total_scaled_groups:
+            network.loads_t.p_set = network.loads_t.p_set * factors
         if total_scaled_groups == 0:
             print("시나리오 스케일링 대상 그룹이 없습니다. 이름 규칙 또는 시트 컬럼을 확인하세요.")
     except Exception as e:
@@ -464,10 +469,13 @@ def _get_load_pattern(input_data, region, demand_type, snapshots_len):
         return None
 
 def create_network(input_data):
+    import pypsa
+    steps = _profiler.Steps('create_network')
     try:
         network = pypsa.Network()
         
         # carriers 정의
+        steps.next('carriers')
         carriers = {
             'AC': {'name': 'AC', 'co2_emissions': 0},
             'DC': {'name': 'DC', 'co2_emissions': 0},
@@ -488,6 +496,7 @@ def create_network(input_data):
                        co2_emissions=specs['co2_emissions'])
         
         # 시간 설정
+        steps.next('snapshots')
         if 'timeseries' in input_data and not input_data['timeseries'].empty:
             ts = input_data['timeseries'].iloc[0]
             snapshots = pd.date_range(
@@ -511,6 +520,7 @@ def create_network(input_data):
             snapshots_length = len(snapshots)
         
         # 버스 추가 - 실제 데이터만 사용
+        steps.next('buses')
         if 'buses' in input_data:
             print("\n=== 버스 추가 시작 ===")
             for _, bus in input_data['buses'].iterrows():
@@ -528,6 +538,7 @@ def create_network(input_data):
                 print(f"버스 추가됨: {bus_name} (carrier: {carrier}, v_nom: {v_nom_val})")
         
         # 재생에너지 패턴 준비
+        steps.next('renewable_patterns')
         renewable_patterns = {}
         if 'renewable_patterns' in input_data:
             patterns_df = input_data['renewable_patterns']
@@ -571,6 +582,7 @@ def create_network(input_data):
                 print("⚠️ 재생에너지 패턴을 찾을 수 없습니다. 기본값 1.0을 사용합니다.")
         
         # 발전기 추가
+        steps.next('generators')
         if 'generators' in input_data:
             print("\n=== 발전기 추가 시작 ===")
             defined_buses = set(network.buses.index)
@@ -609,6 +621,7 @@ def create_network(input_data):
                 print(f"발전기 추가됨: {gen_name} (p_nom: {p_nom_value}, carrier: {params['carrier']})")
         
         # 발전기 추가 후 재생에너지 패턴 적용
+        steps.next('generator_patterns')
         print("\n=== 재생에너지 패턴 적용 시작 ===")
         pv_applied_count = 0
         wt_applied_count = 0
@@ -670,6 +683,7 @@ def create_network(input_data):
                     print(f"⚠️ {gen_name}: 패턴 적용되지 않음 - 기본값 1.0 사용")
         
         # 발전기 효율 및 최대/최소 출력비율(p_max_pu/p_min_pu) 반영
+        steps.next('generator_limits')
         try:
             gdf = input_data.get('generators', pd.DataFrame())
             if not gdf.empty:
@@ -728,6 +742,7 @@ def create_network(input_data):
             print(f"발전기 효율/출력비율 적용 경고: {_e_der}")
         
         # 발전기 백업 보강: 각 버스에 최소 하나의 가용 발전기 보장
+        steps.next('backup_generators')
         try:
             print("\n=== 버스별 기본 발전기 보강 확인 ===")
             buses_with_gen = set(network.generators.bus.unique()) if not network.generators.empty else set()
@@ -899,51 +914,26 @@ def create_network(input_data):
         except Exception as e:
             print(f"p_max_pu 기본값 설정 중 오류: {str(e)}")
         
-        # 부하 추가
+        # 부하 추가 (수요 엔진: 총수요 × 8760 × 패턴, 패턴이 없으면 일정 부하, 스냅샷 × 부하 행렬을 한 번에 생성)
+        steps.next('loads')
         if 'loads' in input_data:
             print("\n=== 부하 추가 시작 ===")
-            for _, load in input_data['loads'].iterrows():
-                name = str(load['name'])
-                bus_name = str(load['bus'])
-                p_set = float(load['p_set'])
-                
-                # 부하 패턴 적용
-                if 'load_patterns' in input_data:
-                    # 부하 이름에서 지역과 타입 추출
-                    region = name.split('_')[0] if '_' in name else None
-                    dtype = 'EL' if '_Demand_EL' in name else ('H2' if '_Demand_H2' in name else ('H' if '_Demand_H' in name else None))
-                    pattern = _get_load_pattern(input_data, region, dtype, len(snapshots)) if region and dtype else None
-
-                    if pattern is not None:
-                        # 총수요 × 8760 × 패턴(스케일 없이 그대로 적용)
-                        p_set = float(p_set) * 8760.0 * pattern
-                        print(f"부하 {name}에 패턴 적용됨 (총수요×8760×패턴)")
-                    else:
-                        cols = list(input_data['load_patterns'].columns) if 'load_patterns' in input_data else []
-                        print(f"부하 {name}: 패턴 미발견 (region={region}, type={dtype}), 사용 가능 컬럼: {cols[:10]}{'...' if len(cols)>10 else ''}")
-                        # 패턴이 없는 경우 일정한 부하
-                        p_set = np.full(len(snapshots), p_set)
-                        print(f"부하 {name}에 일정한 부하 적용됨")
-                else:
-                    p_set = np.full(len(snapshots), p_set)
-                
-                network.add("Load",
-                          name=name,
-                          bus=bus_name)
-                # 시간별 p_set은 명시적으로 loads_t에 설정 (스냅샷 인덱스 정렬)
-                if isinstance(p_set, pd.Series):
-                    series = p_set.reindex(network.snapshots)
-                elif isinstance(p_set, (np.ndarray, list)):
-                    series = pd.Series(p_set, index=network.snapshots)
-                else:
-                    series = pd.Series(np.full(len(network.snapshots), float(p_set)), index=network.snapshots)
-                network.loads_t.p_set[name] = series
-                print(f"부하 추가됨: {name} (버스: {bus_name})")
+            engine = DemandEngine(input_data)
+            load_p_set = engine.matrix(network.snapshots)
+            patterned = set(load_p_set.attrs.get('patterned', []))
+            constant = [name for name in load_p_set.columns if name not in patterned]
+            if constant and 'load_patterns' in input_data:
+                cols = list(input_data['load_patterns'].columns)
+                print(f"패턴 미발견 부하 {len(constant)}개(일정한 부하 적용): {constant[:10]}{'...' if len(constant)>10 else ''}, "
+                      f"사용 가능 컬럼: {cols[:10]}{'...' if len(cols)>10 else ''}")
+            network.add("Load", load_p_set.columns, bus=engine.loads['bus'].values, p_set=load_p_set)
+            print(f"부하 추가됨: {len(load_p_set.columns)}개 (패턴 적용(총수요×8760×패턴) {len(patterned)}개, 일정한 부하 {len(constant)}개)")
         
         # 시나리오 수요 스케일링 비활성화 (지역별 시트 원본 데이터 사용)
         # _apply_scenario_demand_scaling(network, input_data)
         
         # 스케일링 이후 사후 백업 발전기 보강(전력/열 버스 대상)
+        steps.next('post_backup_generators')
         try:
             added_backup = 0
             for bus in network.buses.index:
@@ -1021,6 +1011,7 @@ def create_network(input_data):
             print(f"사후 백업 발전기 보강 경고: {_e_post}")
         
         # Links 추가
+        steps.next('links')
         if 'links' in input_data:
             print("\n=== Links 추가 시작 ===")
             links_df = input_data['links']
@@ -1223,6 +1214,7 @@ def create_network(input_data):
                     print(f"Link {link_name} 건너뜀: 유효하지 않은 버스 연결 (bus0: {bus0_name}, bus1: {bus1_name})")
         
         # 저장장치 추가
+        steps.next('stores')
         if 'stores' in input_data:
             print("\n=== Stores 추가 시작 ===")
             for _, store in input_data['stores'].iterrows():
@@ -1256,6 +1248,7 @@ def create_network(input_data):
                     print(f"저장장치 {store_name} 건너뜀: 버스 '{bus_name}'가 존재하지 않음")
         
         # 선로 추가 (있는 경우)
+        steps.next('lines')
         if 'lines' in input_data and not input_data['lines'].empty:
             print("\n=== 선로 추가 시작 ===")
             added_lines = 0
@@ -1382,6 +1375,7 @@ def create_network(input_data):
             print("\n선로 데이터가 없습니다.")
         
         # 링크 효율 NaN 일괄 보정: efficiency2/efficiency3 NaN → 0.0
+        steps.next('link_efficiency')
         try:
             if not network.links.empty:
                 if 'efficiency2' in network.links.columns:
@@ -1393,6 +1387,7 @@ def create_network(input_data):
             print(f"링크 효율 보정 경고: {_e_eff}")
         
         # CO2 제약 추가 (한글/영문 헤더 모두 지원)
+        steps.next('co2_limit')
         if os.environ.get('DISABLE_CO2_LIMIT','0')=='1':
             print('CO2 제약 비활성화됨(DISABLE_CO2_LIMIT=1)')
         elif 'constraints' in input_data and not input_data['constraints'].empty:
@@ -1432,6 +1427,7 @@ def create_network(input_data):
             print("경고: constraints 시트에 'name' 컬럼이 없어 전역 제약을 적용하지 못했습니다.")
         
         # 최종 안전장치: 여전히 수요 충족이 불가할 경우 초고비용 슬랙 발전기 추가
+        steps.next('slack_generators')
         try:
             failsafe_added = 0
             ensure_slack = os.environ.get('ENABLE_ALWAYS_SLACK', '1') == '1'
@@ -1492,19 +1488,96 @@ def create_network(input_data):
             print(f"최후수단 슬랙 발전기 추가 경고: {_e_fs}")
         
         # 경계값(최소/최대) 정리: infeasible 방지
+        steps.next('bounds')
         try:
             _sanitize_component_bounds(network)
         except Exception as _e_s:
             print(f"경계값 정리 경고: {_e_s}")
+        steps.done(buses=len(network.buses), generators=len(network.generators), snapshots=len(network.snapshots))
         return network
         
     except Exception as e:
+        steps.done(error=str(e))
         print(f"네트워크 생성 중 오류 발생: {str(e)}")
         traceback.print_exc()
         return None
 
-def optimize_network(network):
-    """네트워크 최적화"""
+def _solver_option_variants(num_cores):
+    """CPLEX 최적화 옵션 세트(순차 폴백)"""
+    return [
+        {'name': 'barrier',      'opts': {'threads': num_cores, 'lpmethod': 4, 'parallel': 1, 'barrier.algorithm': 3}},
+        {'name': 'dual-simplex', 'opts': {'threads': num_cores, 'lpmethod': 2, 'parallel': 1}},
+        {'name': 'primal-simplex','opts': {'threads': num_cores, 'lpmethod': 1, 'parallel': 1}}
+    ]
+
+def solver_settings():
+    """솔버 설정 요약 (네트워크 캐시 풀이 키, 결과에 영향이 없는 스레드 수는 제외)"""
+    return {'solver': 'cplex',
+            'variants': [{'name': v['name'], 'opts': {k: x for k, x in v['opts'].items() if k != 'threads'}}
+                         for v in _solver_option_variants(1)]}
+
+def network_cache_key(input_data, input_hash=None):
+    """네트워크 캐시 키 (캐시 비활성화 시 None)"""
+    if not _network_cache.cache_enabled():
+        return None
+    try:
+        return _network_cache.cache_key(input_data, solver_settings(), input_hash)
+    except Exception as e:
+        print(f"네트워크 캐시 키 계산 경고: {str(e)}")
+        return None
+
+@_profiler.profiled()
+def build_network_cached(input_data, key=None, timings=None):
+    """네트워크 생성 (생성 캐시 적중 시 create_network를 건너뛰고 저장된 네트워크 로드)"""
+    t_build = time.perf_counter()
+    network = _network_cache.load_network(key, 'built') if key else None
+    if network is None:
+        network = create_network(input_data)
+        if key:
+            _network_cache.store_network(key, 'built', network)
+    elif timings is not None:
+        timings['cache'] = 'built'
+    if timings is not None:
+        timings['build_seconds'] = round(time.perf_counter() - t_build, 3)
+    return network
+
+def _solved_optimal(network):
+    """solve_info 상태가 ('ok', 'optimal')인지 (optimize_network는 warning 상태도 성공으로 반환하므로 풀이 캐시 저장 판단용)"""
+    status = str((getattr(network, 'solve_info', None) or {}).get('status', '')).lower()
+    return "'ok'" in status and 'optimal' in status and 'infeasible' not in status
+
+def build_and_optimize(input_data, warm_start=None, capture_basis=False, input_hash=None, timings=None, build_fn=None):
+    """네트워크 생성 → 최적화 (네트워크 캐시: 같은 입력/스위치/코드/솔버 설정이면 생성·풀이를 건너뛰고 바로 저장 단계로)
+
+    build_fn: 풀이 캐시 미스 시 네트워크 생성 함수 (input_data, key, timings) → 네트워크 (기본 build_network_cached)
+
+    Returns:
+        tuple: (네트워크, 성공 여부) - 풀이 캐시 적중 시 저장된 풀린 네트워크와 True
+    """
+    key = network_cache_key(input_data, input_hash)
+    network = _network_cache.load_network(key, 'solved') if key else None
+    if network is not None:
+        if timings is not None:
+            timings['cache'] = 'solved'
+        return network, True
+    if key:
+        for line in _network_cache.explain_miss(key, 'solved'):
+            print(line)
+    network = (build_fn or build_network_cached)(input_data, key, timings)
+    success = optimize_network(network, warm_start=warm_start, capture_basis=capture_basis)
+    if success and key and _solved_optimal(network):
+        _network_cache.store_network(key, 'solved', network)
+    return network, success
+
+@_profiler.profiled()
+def optimize_network(network, warm_start=None, capture_basis=False, **optimize_kwargs):
+    """네트워크 최적화
+
+    warm_start: 이전 해 basis(warm_start.ModelBasis) - 이 모델로 매핑해 dual simplex(advance=1)를 먼저 시도
+    capture_basis: True면 풀이 basis를 network.solve_basis에 보관 (다음 해 워밍스타트용)
+    WARM_START=0 환경변수로 둘 다 비활성화
+    optimize_kwargs: network.optimize.create_model에 그대로 전달 (예: 다기간 모델의 multi_investment_periods=True, snapshots=기간 스냅샷)
+    """
     if network is None:
         print("네트워크가 생성되지 않았습니다.")
         return False
@@ -1515,6 +1588,11 @@ def optimize_network(network):
         # CPU 코어 수 확인
         import multiprocessing
         num_cores = multiprocessing.cpu_count()
+        # 병렬 스윕 등에서 작업당 솔버 스레드 제한 (SOLVER_THREADS, 기본 전체 코어)
+        try:
+            num_cores = max(1, int(os.environ.get('SOLVER_THREADS', '0'))) if os.environ.get('SOLVER_THREADS') else num_cores
+        except ValueError:
+            pass
         print(f"사용 가능한 CPU 코어 수: {num_cores}")
         
         # 시점별 CHP 링크 요약(진단용)
@@ -1540,47 +1618,141 @@ def optimize_network(network):
         except Exception:
             pass
         
+        # 최적화 전 사전 점검 (시간별 공급 적정성, 송전 한계 최대유량, 변환 체인)
+        # PRESOLVE_SCREEN=0: 생략, warn: 보고만, 그 외(기본): 확실한 infeasible 원인이 있으면 솔버 실행 중단
+        screen_mode = os.environ.get('PRESOLVE_SCREEN', '1').lower()
+        if screen_mode != '0':
+            try:
+                from adequacy_screen import screen_network
+                with _profiler.stage('optimize_network.presolve_screen'):
+                    screen = screen_network(network)
+                screen.print_report()
+                network.screen_result = screen
+                if screen.infeasible and screen_mode != 'warn':
+                    print("\n사전 점검에서 infeasible 원인이 발견되어 솔버를 실행하지 않습니다. "
+                          "(무시하고 실행하려면 PRESOLVE_SCREEN=warn)")
+                    network.solve_info = {
+                        'solver': 'cplex',
+                        'method': None,
+                        'status': 'screened_infeasible',
+                        'error': '; '.join(f"{r['check']} - {r['location']}" for _, r in
+                                           screen.findings[screen.findings['severity'] == 'infeasible'].head(5).iterrows()),
+                        'solve_seconds': 0.0
+                    }
+                    return False
+            except Exception as e:
+                print(f"사전 점검 경고: {str(e)}")
+        
         # 최적화 옵션 세트(순차 폴백)
-        option_variants = [
-            {'name': 'barrier',      'opts': {'threads': num_cores, 'lpmethod': 4, 'parallel': 1, 'barrier.algorithm': 3}},
-            {'name': 'dual-simplex', 'opts': {'threads': num_cores, 'lpmethod': 2, 'parallel': 1}},
-            {'name': 'primal-simplex','opts': {'threads': num_cores, 'lpmethod': 1, 'parallel': 1}}
-        ]
+        option_variants = _solver_option_variants(num_cores)
         
         last_status = None
         last_error = None
-        for variant in option_variants:
-            vname = variant['name']
-            sopts = variant['opts']
-            print(f"\n[시도] CPLEX 방법: {vname}, 옵션: {sopts}")
-            try:
-                status = network.optimize(solver_name='cplex', solver_options=sopts)
-                print(f"→ 상태: {status}")
-                last_status = status
-                if isinstance(status, tuple):
-                    st_main = status[0]
-                else:
-                    st_main = str(status)
-                if st_main and ('ok' in st_main.lower() or 'optimal' in st_main.lower()):
-                    break
-            except ValueError as e:
-                if 'No objects to concatenate' in str(e):
-                    print("경고: AC 각도 결과(v_ang)가 없어 후처리에서 concat 실패. 각도 결과 없이 계속 진행합니다.")
-                    network.buses_t.v_ang = pd.DataFrame(index=network.snapshots, columns=network.buses.index)
-                    last_status = 'ok'
-                    break
-                else:
+        used_variant = None
+        solve_started = time.perf_counter()
+
+        # 연도 간 워밍스타트: 이전 해 basis를 (이름, 요소, 스냅샷 위치)로 이 모델에 매핑
+        # barrier는 시작 basis를 쓰지 않으므로 매핑된 basis로 dual simplex를 먼저 시도
+        basis_dir = None
+        warm_stats = None
+        if (warm_start is not None or capture_basis) and os.environ.get('WARM_START', '1') != '0':
+            import tempfile
+            basis_dir = tempfile.mkdtemp(prefix='pypsa-basis-')
+            if warm_start is not None:
+                try:
+                    with _profiler.stage('optimize_network.create_model'):
+                        network.optimize.create_model(**optimize_kwargs)
+                    start_fn = os.path.join(basis_dir, 'start.bas')
+                    with _profiler.stage('optimize_network.warm_start_map'):
+                        warm_stats = warm_start.write_for(network.model, start_fn, 'cplex')
+                    print(f"워밍스타트 basis 매핑: 열 {warm_stats['mapped_columns']:,}/{warm_stats['columns']:,}, "
+                          f"행 {warm_stats['mapped_rows']:,}/{warm_stats['rows']:,} (이전 basis의 {warm_stats['coverage']:.0%})")
+                    option_variants.insert(0, {'name': 'warm-dual-simplex',
+                                               'opts': {'threads': num_cores, 'lpmethod': 2, 'parallel': 1, 'advance': 1},
+                                               'warmstart_fn': start_fn})
+                except Exception as e:
+                    print(f"워밍스타트 준비 경고: {str(e)}")
+        basis_kwargs = {'basis_fn': os.path.join(basis_dir, 'solution.bas')} if basis_dir else {}
+
+        # 프로세스 분리 풀이: 모델 파일을 작업 프로세스에 넘기고 파이썬 쪽 모델 해제 (SOLVE_OUT_OF_PROCESS=1)
+        if os.environ.get('SOLVE_OUT_OF_PROCESS', '0') == '1':
+            from solve_worker import solve_out_of_process
+            last_status, last_error, used_variant = solve_out_of_process(
+                network, option_variants, solver_name='cplex', basis_fn=basis_kwargs.get('basis_fn'),
+                model_ready=warm_stats is not None, **optimize_kwargs)
+            print(f"→ 상태: {last_status}")
+        else:
+            # linopy 모델은 한 번만 만들고 옵션 세트별로 다시 풂 (모델 생성과 솔버 시간을 따로 기록)
+            # 워밍스타트 매핑에 쓴 모델은 그대로 풀어야 label이 일치
+            if warm_stats is None:
+                try:
+                    with _profiler.stage('optimize_network.create_model'):
+                        network.optimize.create_model(**optimize_kwargs)
+                except Exception as e:
+                    last_error = str(e)
+                    print(f"→ 모델 생성 예외: {last_error}")
+                    option_variants = []
+            for variant in option_variants:
+                vname = variant['name']
+                sopts = variant['opts']
+                used_variant = vname
+                print(f"\n[시도] CPLEX 방법: {vname}, 옵션: {sopts}")
+                try:
+                    warm_kwargs = {'warmstart_fn': variant['warmstart_fn']} if variant.get('warmstart_fn') else {}
+                    with _profiler.stage('optimize_network.solve', variant=vname):
+                        status = network.optimize.solve_model(solver_name='cplex', solver_options=sopts,
+                                                              **warm_kwargs, **basis_kwargs)
+                    print(f"→ 상태: {status}")
+                    last_status = status
+                    if isinstance(status, tuple):
+                        st_main = status[0]
+                    else:
+                        st_main = str(status)
+                    if st_main and ('ok' in st_main.lower() or 'optimal' in st_main.lower()):
+                        break
+                except ValueError as e:
+                    if 'No objects to concatenate' in str(e):
+                        print("경고: AC 각도 결과(v_ang)가 없어 후처리에서 concat 실패. 각도 결과 없이 계속 진행합니다.")
+                        network.buses_t.v_ang = pd.DataFrame(index=network.snapshots, columns=network.buses.index)
+                        last_status = 'ok'
+                        break
+                    else:
+                        last_error = str(e)
+                        print(f"→ 예외: {last_error}")
+                        continue
+                except Exception as e:
                     last_error = str(e)
                     print(f"→ 예외: {last_error}")
                     continue
-            except Exception as e:
-                last_error = str(e)
-                print(f"→ 예외: {last_error}")
-                continue
         
         print(f"\n최종 최적화 상태: {last_status}")
         if hasattr(network, 'objective'):
             print(f"목적함수 값: {network.objective}")
+
+        # 실행 카탈로그/결과 저장에서 참조할 솔버 정보
+        network.solve_info = {
+            'solver': 'cplex',
+            'method': used_variant,
+            'status': str(last_status),
+            'error': last_error,
+            'solve_seconds': round(time.perf_counter() - solve_started, 3)
+        }
+        if warm_stats is not None:
+            network.solve_info['warm_start_coverage'] = round(warm_stats['coverage'], 3)
+
+        # 다음 해 워밍스타트용 basis 보관
+        if basis_dir:
+            try:
+                solution_fn = basis_kwargs['basis_fn']
+                solved = bool(last_status) and ('unknown' not in str(last_status).lower())
+                if capture_basis and solved and os.path.exists(solution_fn):
+                    from warm_start import ModelBasis
+                    network.solve_basis = ModelBasis.from_file(network.model, solution_fn, 'cplex')
+            except Exception as e:
+                print(f"basis 보관 경고: {str(e)}")
+            finally:
+                import shutil
+                shutil.rmtree(basis_dir, ignore_errors=True)
         
         # 실패 시 LP 문제 내보내기(환경변수로 활성화)
         try:
@@ -1599,6 +1771,21 @@ def optimize_network(network):
                         print("네트워크 모델 객체가 없어 LP 내보내기 불가")
         except Exception:
             pass
+
+        # IIS 분석: 최종 상태가 ok/optimal이 아니면(('warning', 'infeasible') 포함) 모순 제약을
+        # 컴포넌트/스냅샷/입력 시트 행으로 매핑 (환경변수로 활성화)
+        if os.environ.get('ANALYZE_IIS', '0') == '1' and not _solved_optimal(network):
+            try:
+                from iis_analyzer import analyze_infeasible_network
+                iis_result = analyze_infeasible_network(
+                    network,
+                    input_file=INPUT_FILE,
+                    output_dir=os.path.join('results', 'debug'),
+                    time_limit=float(os.environ.get('IIS_TIME_LIMIT', '600')),
+                )
+                network.solve_info['iis_files'] = iis_result['files']
+            except Exception as _e_iis:
+                print(f"IIS 분석 경고: {str(_e_iis)}")
         
         return bool(last_status) and ('unknown' not in str(last_status).lower())
         
@@ -1844,8 +2031,15 @@ def _build_country_timeseries_tables(network):
 
     return ts_el, ts_h, ts_h2
 
-def save_results(network, filename=None, subdir=None):
-    """최적화 결과를 Excel 파일로 저장"""
+def save_results(network, filename=None, subdir=None, run_meta=None):
+    """최적화 결과를 Excel 파일로 저장
+
+    run_meta: 실행 카탈로그에 함께 기록할 메타데이터(dict, 선택)
+      예: {'year': 2030, 'run_group': '20250915_105813', 'input_hash': '...', 'timings': {...}}
+    """
+    save_started = time.perf_counter()
+    steps = _profiler.Steps('save_results')
+    results_dir = None
     try:
         has_objective = hasattr(network, 'objective') and (network.objective is not None)
         if not has_objective:
@@ -1864,6 +2058,7 @@ def save_results(network, filename=None, subdir=None):
         print(f"결과를 '{results_dir}' 폴더에 저장 중...")
 
         # 1. 기본 Excel 결과 파일
+        steps.next('excel')
         excel_filename = f'{results_dir}/optimization_result_{current_time}.xlsx'
         with pd.ExcelWriter(excel_filename, engine='openpyxl') as writer:
             # 발전기 출력 결과 (없으면 빈 프레임 저장)
@@ -2003,6 +2198,7 @@ def save_results(network, filename=None, subdir=None):
                     pass
 
         # 2. 개별 CSV 파일들 저장
+        steps.next('csv')
         try:
             gen_info_df = pd.DataFrame({
                 'bus': network.generators.bus,
@@ -2046,7 +2242,27 @@ def save_results(network, filename=None, subdir=None):
         except Exception:
             pass
 
+        # 송전 혼잡 지표 (한계 도달 시간, 이용률 백분위/지속곡선, 방향별 송전량, 혼잡 비용)
+        steps.next('congestion')
+        try:
+            from congestion import analyze_network as _analyze_congestion, save_congestion_tables
+            congestion_tables = _analyze_congestion(network)
+            save_congestion_tables(congestion_tables, f'{results_dir}/optimization_result_{current_time}',
+                                   year=(run_meta or {}).get('year'))
+        except Exception as _e3:
+            print(f"송전 혼잡 지표 저장 경고: {_e3}")
+
+        # 발전기 이용률/출력제한/확장 지표 (발전기별·지역×발전원별, 연간·월간)
+        steps.next('generation_metrics')
+        try:
+            from generation_metrics import analyze_network as _analyze_generation, save_generation_metrics
+            save_generation_metrics(_analyze_generation(network, hourly_groups=False),
+                                    f'{results_dir}/optimization_result_{current_time}')
+        except Exception as _e4:
+            print(f"발전기 이용률 지표 저장 경고: {_e4}")
+
         # 최종에너지 집계 CSV
+        steps.next('final_energy')
         try:
             fe_total, fe_by_region = build_final_energy_supply_tables(network)
             if fe_total is not None and not fe_total.empty:
@@ -2056,7 +2272,17 @@ def save_results(network, filename=None, subdir=None):
         except Exception as _e2:
             print(f"최종에너지 공급 집계 CSV 저장 경고: {_e2}")
 
+        # 최적화 전 사전 점검 결과 (원인 순위표)
+        steps.next('presolve_screen')
+        screen = getattr(network, 'screen_result', None)
+        if screen is not None and not screen.findings.empty:
+            try:
+                screen.save(f'{results_dir}/optimization_result_{current_time}_presolve_screen.csv')
+            except Exception as _e6:
+                print(f"사전 점검 결과 저장 경고: {_e6}")
+
         # 3. 통계 정보 JSON 파일
+        steps.next('stats')
         try:
             total_cost_val = float(network.objective)
         except Exception:
@@ -2076,269 +2302,162 @@ def save_results(network, filename=None, subdir=None):
             json.dump(stats, f, ensure_ascii=False, indent=2)
 
         # 4. PyPSA 네트워크 파일 저장
+        steps.next('netcdf')
         network.export_to_netcdf(f'{results_dir}/optimization_result_{current_time}.nc')
 
         # 5. 지역별 분석 결과 생성
+        steps.next('regional_analysis')
         analyze_regional_results(network, results_dir, current_time)
 
         # 6. 시각화 결과 생성
+        steps.next('plots')
         create_visualizations(network, results_dir, current_time)
 
+        # 인터랙티브 대시보드 (단일 HTML, 지역/기술/에너지원/선로 뷰, 오프라인 동작)
+        steps.next('dashboard')
+        if os.environ.get('DISABLE_DASHBOARD', '0') != '1':
+            try:
+                from dashboard import build_dashboard
+                build_dashboard(network, f'{results_dir}/optimization_result_{current_time}_dashboard.html',
+                                title=f'optimization_result_{current_time}')
+            except Exception as _e5:
+                print(f"대시보드 생성 경고: {_e5}")
+
+        # 7. 실행 카탈로그 등록
+        steps.next('run_catalog')
+        meta = dict(run_meta or {})
+        timings = dict(meta.get('timings') or {})
+        timings['save_seconds'] = round(time.perf_counter() - save_started, 3)
+        meta['timings'] = timings
+        run_id = _record_run_in_catalog(network, results_dir, current_time, meta)
+
+        # 8. 연도/실행 통합 결과 큐브에 추가 (카탈로그와 같은 run_id 사용)
+        steps.next('results_cube')
+        _append_to_results_cube(network, current_time, meta, run_id)
+
         print(f"결과가 '{results_dir}' 폴더에 저장되었습니다.")
         print(f"- Excel 파일: {excel_filename}")
         print(f"- CSV 파일들: generator_output, load, storage, line_usage")
         print(f"- 통계 파일: stats.json")
         print(f"- 네트워크 파일: .nc")
         print(f"- 시각화 파일들: PNG, HTML")
+        print(f"- 대시보드: dashboard.html")
+
+        # 9. 단계별 시간/메모리 프로파일 (Chrome 트레이스 + 요약, 한 줄 요약 출력)
+        steps.done()
+        _profiler.write_run(results_dir, current_time, meta)
 
         return True
 
     except Exception as e:
         print(f"결과 저장 중 오류 발생: {str(e)}")
         traceback.print_exc()
+        steps.done(error=str(e))
+        if results_dir and os.path.isdir(results_dir):
+            _profiler.write_run(results_dir, current_time, run_meta)
         return False
 
-def create_visualizations(network, results_dir, current_time):
+def _record_run_in_catalog(network, results_dir, current_time, run_meta=None):
+    """save_results 산출물과 실행 메타데이터를 실행 카탈로그(SQLite)에 기록"""
+    if _run_catalog is None or os.environ.get('DISABLE_RUN_CATALOG', '0') == '1':
+        return None
+    try:
+        meta = dict(run_meta or {})
+        solve_info = getattr(network, 'solve_info', None) or {}
+        has_objective = hasattr(network, 'objective') and (network.objective is not None)
+        year = _infer_run_year(network, meta)
+        timings = dict(meta.get('timings') or {})
+        if 'solve_seconds' in solve_info and 'solve_seconds' not in timings:
+            timings['solve_seconds'] = solve_info['solve_seconds']
+        slack_mwh, fallback_mwh = _run_catalog.summarize_slack(network)
+        run_id = meta.get('run_id') or _run_catalog.new_run_id(current_time)
+        with _run_catalog.RunCatalog() as catalog:
+            catalog.record_run(
+                run_id,
+                results_dir=results_dir,
+                year=year,
+                run_group=meta.get('run_group'),
+                input_hash=meta.get('input_hash'),
+                solver=solve_info.get('solver'),
+                solver_method=solve_info.get('method'),
+                status=meta.get('status') or ('ok' if has_objective else 'failed'),
+                objective=float(network.objective) if has_objective else None,
+                slack_mwh=slack_mwh,
+                fallback_mwh=fallback_mwh,
+                timings=timings,
+                artifacts=_run_catalog.collect_artifacts(results_dir, current_time),
+                extra=meta.get('extra')
+            )
+        print(f"실행 카탈로그 등록: {run_id} (연도 {year}, {catalog.path})")
+        return run_id
+    except Exception as e:
+        print(f"실행 카탈로그 기록 경고: {str(e)}")
+        return None
+
+def _infer_run_year(network, run_meta=None):
+    """실행 메타데이터의 연도, 없으면 첫 스냅샷의 연도"""
+    year = (run_meta or {}).get('year')
+    if year is None:
+        try:
+            year = int(pd.Timestamp(network.snapshots[0]).year)
+        except Exception:
+            year = None
+    return year
+
+def _append_to_results_cube(network, current_time, run_meta=None, run_id=None):
+    """디스패치/흐름/가격/용량을 연도·실행 통합 결과 큐브(Parquet)에 추가"""
+    if _results_cube is None or os.environ.get('DISABLE_RESULTS_CUBE', '0') == '1':
+        return None
+    if not (hasattr(network, 'objective') and network.objective is not None):
+        return None
+    try:
+        meta = dict(run_meta or {})
+        year = _infer_run_year(network, meta)
+        if year is None:
+            print("결과 큐브 추가 생략: 연도를 알 수 없습니다.")
+            return None
+        run_id = run_id or meta.get('run_id') or f"{current_time}"
+        cube = _results_cube.ResultsCube()
+        written = cube.append_network(network, run_id, year, run_group=meta.get('run_group'))
+        print(f"결과 큐브 추가: {run_id} (연도 {year}, {cube.root}) - " +
+              ", ".join(f"{k} {v:,}행" for k, v in written.items()))
+        return written
+    except Exception as e:
+        print(f"결과 큐브 추가 경고: {str(e)}")
+        return None
+
+def create_visualizations(network, results_dir, current_time, plots=None):
+    """시각화 결과 생성 (src/plot_renderer.py의 플롯 명세를 선택/병렬/캐시 렌더링)
+
+    PLOT_SET(예: "charts,maps", "none"), PLOT_WORKERS, PLOT_DPI 환경변수로 조정하며,
+    입력 데이터 해시가 같은 플롯은 다시 그리지 않습니다(DISABLE_PLOT_CACHE=1로 해제).
+    """
     if os.environ.get('DISABLE_PLOTS','0') == '1':
         print('시각화 생략(DISABLE_PLOTS=1)')
         return True
-    """시각화 결과 생성"""
     try:
-        import matplotlib.pyplot as plt
-        import plotly.graph_objects as go
-        import plotly.express as px
-        from plotly.subplots import make_subplots
-        import plotly.offline as pyo
-        
-        # 한글 폰트 설정(윈도우: 맑은 고딕)
-        try:
-            import matplotlib as mpl
-            mpl.rcParams['font.family'] = ['Malgun Gothic', 'DejaVu Sans']
-            mpl.rcParams['axes.unicode_minus'] = False
-            import warnings as _warn
-            import logging as _logging
-            _warn.filterwarnings('ignore', message='findfont:', category=UserWarning, module='matplotlib')
-            try:
-                _logging.getLogger('matplotlib.font_manager').setLevel(_logging.ERROR)
-            except Exception:
-                pass
-        except Exception:
-            pass
-        
+        import plot_renderer
+
         print("시각화 결과 생성 중...")
-        
-        # 1. 지역별 에너지 밸런스 차트
-        gen_output = network.generators_t.p
-        load_output = network.loads_t.p
-        
-        # 지역별 발전량과 부하량 계산
-        regional_generation = {}
-        regional_load = {}
-        
-        for gen_name in gen_output.columns:
-            if '_' in gen_name:
-                region = gen_name.split('_')[0]
-                if region not in regional_generation:
-                    regional_generation[region] = 0
-                regional_generation[region] += gen_output[gen_name].sum()
-        
-        for load_name in load_output.columns:
-            if '_' in load_name:
-                region = load_name.split('_')[0]
-                if region not in regional_load:
-                    regional_load[region] = 0
-                regional_load[region] += load_output[load_name].sum()
-        
-        # 지역별 에너지 밸런스 DataFrame 생성
-        regions = list(set(list(regional_generation.keys()) + list(regional_load.keys())))
-        balance_data = []
-        for region in regions:
-            gen = regional_generation.get(region, 0)
-            load = regional_load.get(region, 0)
-            balance = gen - load
-            balance_data.append([region, gen, load, balance])
-        
-        balance_df = pd.DataFrame(balance_data, columns=['지역', '발전량(MWh)', '부하량(MWh)', '밸런스(MWh)'])
-        balance_df.to_csv(f'{results_dir}/regional_energy_balance.csv', index=False, encoding='utf-8-sig')
-        
-        # 지역별 에너지 밸런스 차트 생성
-        fig, ax = plt.subplots(figsize=(15, 8))
-        x = range(len(balance_df))
-        width = 0.35
-        
-        ax.bar([i - width/2 for i in x], balance_df['발전량(MWh)'], width, label='발전량', alpha=0.8)
-        ax.bar([i + width/2 for i in x], balance_df['부하량(MWh)'], width, label='부하량', alpha=0.8)
-        
-        ax.set_xlabel('지역')
-        ax.set_ylabel('에너지 (MWh)')
-        ax.set_title('지역별 에너지 밸런스')
-        ax.set_xticks(x)
-        ax.set_xticklabels(balance_df['지역'], rotation=45)
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig(f'{results_dir}/regional_energy_balance.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        # 2. 지역별 재생에너지 비율 차트
-        renewable_ratio_data = []
-        for region in regions:
-            total_gen = 0
-            renewable_gen = 0
-            
-            for gen_name in gen_output.columns:
-                if gen_name.startswith(region + '_'):
-                    gen_sum = gen_output[gen_name].sum()
-                    total_gen += gen_sum
-                    if 'PV' in gen_name or 'WT' in gen_name or 'Wind' in gen_name or 'Solar' in gen_name:
-                        renewable_gen += gen_sum
-            
-            if total_gen > 0:
-                ratio = (renewable_gen / total_gen) * 100
-            else:
-                ratio = 0
-            
-            renewable_ratio_data.append([region, renewable_gen, total_gen, ratio])
-        
-        renewable_df = pd.DataFrame(renewable_ratio_data, columns=['지역', '재생에너지(MWh)', '총발전량(MWh)', '재생에너지비율(%)'])
-        
-        # 재생에너지 비율 차트
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(20, 8))
-        
-        # 재생에너지 비율 막대 차트
-        ax1.bar(renewable_df['지역'], renewable_df['재생에너지비율(%)'], color='green', alpha=0.7)
-        ax1.set_xlabel('지역')
-        ax1.set_ylabel('재생에너지 비율 (%)')
-        ax1.set_title('지역별 재생에너지 비율')
-        ax1.tick_params(axis='x', rotation=45)
-        ax1.grid(True, alpha=0.3)
-        
-        # 재생에너지 vs 총발전량 비교
-        x = range(len(renewable_df))
-        width = 0.35
-        
-        ax2.bar([i - width/2 for i in x], renewable_df['재생에너지(MWh)'], width, label='재생에너지', color='green', alpha=0.7)
-        ax2.bar([i + width/2 for i in x], renewable_df['총발전량(MWh)'] - renewable_df['재생에너지(MWh)'], width, label='기타 발전', color='gray', alpha=0.7)
-        
-        ax2.set_xlabel('지역')
-        ax2.set_ylabel('발전량 (MWh)')
-        ax2.set_title('지역별 발전원별 발전량')
-        ax2.set_xticks(x)
-        ax2.set_xticklabels(renewable_df['지역'], rotation=45)
-        ax2.legend()
-        ax2.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig(f'{results_dir}/regional_renewable_ratio.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        # 3. 송전선로 조류 지도 (HTML)
-        if not network.lines_t.p0.empty:
-            # 송전선로 조류 데이터 준비
-            line_flows = network.lines_t.p0.mean()  # 평균 조류
-            transmission_data = []
-            
-            for line_name in line_flows.index:
-                if line_name in network.lines.index:
-                    bus0 = network.lines.at[line_name, 'bus0']
-                    bus1 = network.lines.at[line_name, 'bus1']
-                    flow = line_flows[line_name]
-                    capacity = network.lines.at[line_name, 's_nom']
-                    utilization = abs(flow) / capacity * 100 if capacity > 0 else 0
-                    
-                    transmission_data.append([line_name, bus0, bus1, flow, capacity, utilization])
-            
-            transmission_df = pd.DataFrame(transmission_data, 
-                                         columns=['선로명', '시작버스', '종료버스', '평균조류(MW)', '용량(MVA)', '이용률(%)'])
-            transmission_df.to_csv(f'{results_dir}/transmission_flow.csv', index=False, encoding='utf-8-sig')
-            
-            # 송전선로 네트워크 그래프
-            import networkx as nx
-            
-            G = nx.Graph()
-            
-            # 노드 추가 (버스)
-            for bus in network.buses.index:
-                G.add_node(bus)
-            
-            # 엣지 추가 (선로)
-            for line_name in network.lines.index:
-                bus0 = network.lines.at[line_name, 'bus0']
-                bus1 = network.lines.at[line_name, 'bus1']
-                if line_name in line_flows.index:
-                    flow = abs(line_flows[line_name])
-                    G.add_edge(bus0, bus1, weight=flow, line_name=line_name)
-            
-            # 네트워크 그래프 그리기
-            plt.figure(figsize=(20, 15))
-            pos = nx.spring_layout(G, k=3, iterations=50)
-            
-            # 노드 그리기
-            nx.draw_networkx_nodes(G, pos, node_color='lightblue', node_size=500, alpha=0.8)
-            
-            # 엣지 그리기 (조류 크기에 따라 두께 조정)
-            edges = G.edges()
-            weights = [G[u][v]['weight'] for u, v in edges]
-            max_weight = max(weights) if weights else 1e-6
-            edge_widths = [w/max_weight * 5 + 0.5 for w in weights]
-            
-            nx.draw_networkx_edges(G, pos, width=edge_widths, alpha=0.6, edge_color='red')
-            
-            # 라벨 그리기
-            nx.draw_networkx_labels(G, pos, font_size=8, font_weight='bold')
-            
-            plt.title('송전선로 네트워크 및 조류 현황', fontsize=16, fontweight='bold')
-            plt.axis('off')
-            plt.tight_layout()
-            plt.savefig(f'{results_dir}/transmission_network_graph.png', dpi=300, bbox_inches='tight')
-            plt.close()
-            
-            # 인터랙티브 송전선로 지도 (HTML)
-            fig = go.Figure()
-            
-            # 선로별 조류 막대 차트
-            fig.add_trace(go.Bar(
-                x=transmission_df['선로명'],
-                y=transmission_df['이용률(%)'],
-                name='선로 이용률',
-                text=transmission_df['평균조류(MW)'].round(1),
-                textposition='auto',
-                hovertemplate='<b>%{x}</b><br>이용률: %{y:.1f}%<br>조류: %{text} MW<extra></extra>'
-            ))
-            
-            fig.update_layout(
-                title='송전선로별 이용률 및 조류 현황',
-                xaxis_title='송전선로',
-                yaxis_title='이용률 (%)',
-                hovermode='x unified',
-                height=600
-            )
-            
-            pyo.plot(fig, filename=f'{results_dir}/transmission_flow_map.html', auto_open=False)
-        
-        # 4. 한국 지도 기반 송전선로 시각화 추가
-        try:
-            create_korea_transmission_map(network, results_dir, current_time)
-        except Exception as e:
-            print(f"한국 지도 기반 송전선로 시각화 생성 중 오류: {str(e)}")
-        
-        # 5. 이전 버전의 한국 지도 시각화 추가
-        try:
-            create_legacy_korea_map(network, results_dir, current_time)
-        except Exception as e:
-            print(f"이전 버전 한국 지도 시각화 생성 중 오류: {str(e)}")
-        
-        print("시각화 결과 생성 완료:")
-        print("- 지역별 에너지 밸런스 차트")
-        print("- 지역별 재생에너지 비율 차트")
-        print("- 송전선로 네트워크 그래프")
-        print("- 인터랙티브 송전선로 지도")
-        print("- 한국 지도 기반 송전선로 시각화")
-        print("- 이전 버전 한국 지도 시각화")
-        
-        return True
-        
+        started = time.perf_counter()
+        status = plot_renderer.render_network_plots(network, results_dir, current_time, plots=plots)
+
+        labels = {
+            'energy_balance': '지역별 에너지 밸런스 차트',
+            'renewable_ratio': '지역별 재생에너지 비율 차트',
+            'transmission_graph': '송전선로 네트워크 그래프',
+            'transmission_html': '인터랙티브 송전선로 지도',
+            'korea_transmission_map': '한국 지도 기반 송전선로 시각화',
+            'legacy_korea_map': '이전 버전 한국 지도 시각화'
+        }
+        state_labels = {'rendered': '생성', 'unchanged': '변경 없음', 'cached': '캐시 사용',
+                        'skipped': '선택 안 함', 'error': '오류'}
+        print(f"시각화 결과 생성 완료 ({time.perf_counter() - started:.1f}초):")
+        for name, state in status.items():
+            print(f"- {labels.get(name, name)}: {state_labels.get(state, state)}")
+
+        return all(state != 'error' for state in status.values())
+
     except Exception as e:
         print(f"시각화 생성 중 오류 발생: {str(e)}")
         traceback.print_exc()
@@ -2347,167 +2466,16 @@ def create_visualizations(network, results_dir, current_time):
 def create_korea_transmission_map(network, results_dir, current_time):
     """한국 지도 기반 송전선로 시각화"""
     try:
-        from korea_map import KoreaMapVisualizer
-        import matplotlib.pyplot as plt
-        
+        import plot_renderer
+
         print("한국 지도 기반 송전선로 시각화 생성 중...")
-        
-        # 지역 코드와 한국어 이름 매핑
-        region_mapping = {
-            'SEL': '서울특별시',
-            'BSN': '부산광역시', 
-            'DGU': '대구광역시',
-            'ICN': '인천광역시',
-            'GWJ': '광주광역시',
-            'DJN': '대전광역시',
-            'USN': '울산광역시',
-            'SJG': '세종특별자치시',
-            'GGD': '경기도',
-            'GWD': '강원도',
-            'CBD': '충청북도',
-            'CND': '충청남도',
-            'JBD': '전라북도',
-            'JND': '전라남도',
-            'GBD': '경상북도',
-            'GND': '경상남도',
-            'JJD': '제주특별자치도'
-        }
-        
-        # 송전선로 조류 데이터 준비
-        line_flows = network.lines_t.p0.mean() if not network.lines_t.p0.empty else pd.Series()
-        
-        # 송전선로 정보를 DataFrame으로 구성
-        transmission_lines = []
-        
-        for line_name in network.lines.index:
-            bus0 = network.lines.at[line_name, 'bus0']
-            bus1 = network.lines.at[line_name, 'bus1']
-            
-            # 버스 이름에서 지역 코드 추출
-            region0 = bus0.split('_')[0] if '_' in bus0 else bus0
-            region1 = bus1.split('_')[0] if '_' in bus1 else bus1
-            
-            # 지역 코드를 한국어 이름으로 변환
-            region0_name = region_mapping.get(region0, region0)
-            region1_name = region_mapping.get(region1, region1)
-            
-            # 조류 정보
-            flow = line_flows.get(line_name, 0) if line_name in line_flows.index else 0
-            capacity = network.lines.at[line_name, 's_nom']
-            utilization = abs(flow) / capacity * 100 if capacity > 0 else 0
-            
-            transmission_lines.append({
-                '선로명': line_name,
-                '시작지역': region0_name,
-                '종료지역': region1_name,
-                '조류(MW)': flow,
-                '용량(MVA)': capacity,
-                '이용률(%)': utilization
-            })
-        
-        # DataFrame 생성
-        transmission_df = pd.DataFrame(transmission_lines)
-        
-        # 한국 지도 시각화 객체 생성
-        visualizer = KoreaMapVisualizer()
-        
-        if visualizer.load_map_data():
-            # 기본 한국 지도 생성
-            map_save_path = f'{results_dir}/korea_transmission_map_{current_time}.png'
-            
-            # 지도 그리기
-            fig, ax = plt.subplots(figsize=(15, 12))
-            
-            # 행정구역 경계 그리기
-            visualizer.map_data.plot(ax=ax, 
-                                   color='lightgray', 
-                                   edgecolor='black', 
-                                   linewidth=0.5,
-                                   alpha=0.7)
-            
-            # 지역 중심점 계산
-            region_centroids = {}
-            for idx, row in visualizer.map_data.iterrows():
-                region_name = row['SIDO_NM']
-                centroid = row.geometry.centroid
-                region_centroids[region_name] = (centroid.x, centroid.y)
-            
-            # 송전선로 그리기
-            for _, line in transmission_df.iterrows():
-                start_region = line['시작지역']
-                end_region = line['종료지역']
-                utilization = line['이용률(%)']
-                
-                if start_region in region_centroids and end_region in region_centroids:
-                    start_x, start_y = region_centroids[start_region]
-                    end_x, end_y = region_centroids[end_region]
-                    
-                    # 이용률에 따른 선 두께와 색상 설정
-                    line_width = max(0.5, utilization / 20)  # 최소 0.5, 최대 5
-                    
-                    if utilization > 80:
-                        color = 'red'
-                    elif utilization > 60:
-                        color = 'orange'
-                    elif utilization > 40:
-                        color = 'yellow'
-                    else:
-                        color = 'green'
-                    
-                    # 송전선로 그리기
-                    ax.plot([start_x, end_x], [start_y, end_y], 
-                           color=color, linewidth=line_width, alpha=0.8)
-                    
-                    # 중점에 이용률 표시 (이용률이 높은 경우만)
-                    if utilization > 50:
-                        mid_x = (start_x + end_x) / 2
-                        mid_y = (start_y + end_y) / 2
-                        ax.text(mid_x, mid_y, f'{utilization:.0f}%', 
-                               fontsize=8, ha='center', va='center',
-                               bbox=dict(facecolor='white', alpha=0.7, edgecolor='none'))
-            
-            # 지역 중심점에 지역명 표시
-            for region_name, (x, y) in region_centroids.items():
-                # 지역 코드로 변환
-                region_code = None
-                for code, name in region_mapping.items():
-                    if name == region_name:
-                        region_code = code
-                        break
-                
-                if region_code:
-                    ax.plot(x, y, 'ko', markersize=8, alpha=0.8)
-                    ax.text(x, y + 20000, region_code, fontsize=10, ha='center', va='bottom',
-                           fontweight='bold',
-                           bbox=dict(facecolor='white', alpha=0.8, edgecolor='black'))
-            
-            # 범례 추가
-            legend_elements = [
-                plt.Line2D([0], [0], color='green', lw=2, label='이용률 < 40%'),
-                plt.Line2D([0], [0], color='yellow', lw=2, label='이용률 40-60%'),
-                plt.Line2D([0], [0], color='orange', lw=2, label='이용률 60-80%'),
-                plt.Line2D([0], [0], color='red', lw=2, label='이용률 > 80%')
-            ]
-            ax.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(0.02, 0.98))
-            
-            ax.set_title('한국 송전선로 이용률 현황', fontsize=16, fontweight='bold', pad=20)
-            ax.set_axis_off()
-            
-            plt.tight_layout()
-            plt.savefig(map_save_path, dpi=300, bbox_inches='tight', facecolor='white')
-            plt.close()
-            
-            print(f"한국 지도 기반 송전선로 시각화가 '{map_save_path}'에 저장되었습니다.")
-            
-            # 송전선로 상세 정보 CSV 저장
-            transmission_df.to_csv(f'{results_dir}/korea_transmission_details_{current_time}.csv', 
-                                 index=False, encoding='utf-8-sig')
-            
-            return True
-        
-            print("한국 지도 데이터를 로드할 수 없습니다.")
+        status = plot_renderer.render_network_plots(network, results_dir, current_time,
+                                                    plots=['korea_transmission_map'], workers=1)
+        if status.get('korea_transmission_map') == 'error':
             return False
-            
+        print(f"한국 지도 기반 송전선로 시각화가 '{results_dir}/korea_transmission_map_{current_time}.png'에 저장되었습니다.")
+        return True
+
     except Exception as e:
         print(f"한국 지도 기반 송전선로 시각화 생성 중 오류: {str(e)}")
         traceback.print_exc()
@@ -2516,244 +2484,16 @@ def create_korea_transmission_map(network, results_dir, current_time):
 def create_legacy_korea_map(network, results_dir, current_time):
     """이전 버전의 한국 지도 시각화 (간단한 지역 연결 지도)"""
     try:
-        import matplotlib.pyplot as plt
-        import matplotlib.patches as patches
-        from matplotlib.patches import FancyBboxPatch
-        import numpy as np
-        
+        import plot_renderer
+
         print("이전 버전 한국 지도 시각화 생성 중...")
-        
-        # 한국 지역 좌표 정의 (간단한 버전)
-        region_coords = {
-            'SEL': (5, 7),    # 서울
-            'ICN': (4, 7),    # 인천
-            'GGD': (5, 6),    # 경기
-            'GWD': (7, 8),    # 강원
-            'CBD': (6, 5),    # 충북
-            'CND': (4, 5),    # 충남
-            'DJN': (5, 4),    # 대전
-            'SJG': (5, 4.5),  # 세종
-            'JBD': (3, 3),    # 전북
-            'JND': (2, 2),    # 전남
-            'GWJ': (3, 2.5),  # 광주
-            'GBD': (7, 4),    # 경북
-            'DGU': (7, 3),    # 대구
-            'GND': (6, 2),    # 경남
-            'BSN': (7, 1),    # 부산
-            'USN': (7.5, 1.5), # 울산
-            'JJD': (1, 0)     # 제주
-        }
-        
-        # 송전선로 조류 데이터 준비
-        line_flows = network.lines_t.p0.mean() if not network.lines_t.p0.empty else pd.Series()
-        
-        # 지역별 발전량 계산
-        gen_output = network.generators_t.p
-        regional_generation = {}
-        regional_renewable = {}
-        
-        for gen_name in gen_output.columns:
-            if '_' in gen_name:
-                region = gen_name.split('_')[0]
-                gen_sum = gen_output[gen_name].sum()
-                
-                if region not in regional_generation:
-                    regional_generation[region] = 0
-                    regional_renewable[region] = 0
-                
-                regional_generation[region] += gen_sum
-                
-                # 재생에너지 여부 확인
-                if any(keyword in gen_name for keyword in ['PV', 'WT', 'Solar', 'Wind']):
-                    regional_renewable[region] += gen_sum
-        
-        # 지역별 부하량 계산
-        load_output = network.loads_t.p
-        regional_load = {}
-        
-        for load_name in load_output.columns:
-            if '_' in load_name:
-                region = load_name.split('_')[0]
-                load_sum = load_output[load_name].sum()
-                
-                if region not in regional_load:
-                    regional_load[region] = 0
-                regional_load[region] += load_sum
-        
-        # 그래프 생성
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(20, 10))
-        
-        # 첫 번째 지도: 발전량과 송전선로
-        ax1.set_xlim(0, 9)
-        ax1.set_ylim(-1, 9)
-        ax1.set_aspect('equal')
-        
-        # 지역별 발전량을 원의 크기로 표현
-        max_generation = max(regional_generation.values()) if regional_generation else 1e-6
-        
-        for region, coords in region_coords.items():
-            x, y = coords
-            generation = regional_generation.get(region, 0)
-            renewable = regional_renewable.get(region, 0)
-            load = regional_load.get(region, 0)
-            
-            # 발전량에 비례한 원의 크기
-            size = max(50, (generation / max_generation) * 1000) if max_generation > 0 else 50
-            
-            # 재생에너지 비율에 따른 색상
-            renewable_ratio = renewable / generation if generation > 0 else 0
-            color = plt.cm.RdYlGn(renewable_ratio)
-            
-            # 지역 원 그리기
-            circle = plt.Circle((x, y), np.sqrt(size)/20, color=color, alpha=0.7, edgecolor='black')
-            ax1.add_patch(circle)
-            
-            # 지역명 표시
-            ax1.text(x, y, region, ha='center', va='center', fontsize=8, fontweight='bold')
-            
-            # 발전량 정보 표시
-            info_text = f"{generation/1000:.0f}GWh"
-            if renewable_ratio > 0:
-                info_text += f"\n재생{renewable_ratio*100:.0f}%"
-            ax1.text(x, y-0.5, info_text, ha='center', va='top', fontsize=6)
-        
-        # 송전선로 그리기
-        for line_name in network.lines.index:
-            bus0 = network.lines.at[line_name, 'bus0']
-            bus1 = network.lines.at[line_name, 'bus1']
-            
-            # 버스 이름에서 지역 코드 추출
-            region0 = bus0.split('_')[0] if '_' in bus0 else bus0
-            region1 = bus1.split('_')[0] if '_' in bus1 else bus1
-            
-            if region0 in region_coords and region1 in region_coords:
-                x0, y0 = region_coords[region0]
-                x1, y1 = region_coords[region1]
-                
-                # 조류 정보
-                flow = abs(line_flows.get(line_name, 0)) if line_name in line_flows.index else 0
-                capacity = network.lines.at[line_name, 's_nom']
-                utilization = flow / capacity * 100 if capacity > 0 else 0
-                
-                # 이용률에 따른 선 색상과 두께
-                if utilization > 80:
-                    color = 'red'
-                    width = 3
-                elif utilization > 60:
-                    color = 'orange'
-                    width = 2.5
-                elif utilization > 40:
-                    color = 'yellow'
-                    width = 2
-                else:
-                    color = 'green'
-                    width = 1.5
-                
-                # 송전선로 그리기
-                ax1.plot([x0, x1], [y0, y1], color=color, linewidth=width, alpha=0.8)
-                
-                # 이용률이 높은 경우 수치 표시
-                if utilization > 50:
-                    mid_x, mid_y = (x0 + x1) / 2, (y0 + y1) / 2
-                    ax1.text(mid_x, mid_y, f'{utilization:.0f}%', 
-                            fontsize=6, ha='center', va='center',
-                            bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', pad=1))
-        
-        ax1.set_title('지역별 발전량 및 송전선로 이용률', fontsize=14, fontweight='bold')
-        ax1.set_xlabel('재생에너지 비율: 빨간색(낮음) → 녹색(높음)', fontsize=10)
-        ax1.grid(True, alpha=0.3)
-        ax1.set_xticks([])
-        ax1.set_yticks([])
-        
-        # 두 번째 지도: 에너지 밸런스
-        ax2.set_xlim(0, 9)
-        ax2.set_ylim(-1, 9)
-        ax2.set_aspect('equal')
-        
-        # 지역별 에너지 밸런스 (발전량 - 부하량)
-        for region, coords in region_coords.items():
-            x, y = coords
-            generation = regional_generation.get(region, 0)
-            load = regional_load.get(region, 0)
-            balance = generation - load
-            
-            # 밸런스에 따른 색상 (잉여: 파란색, 부족: 빨간색)
-            gen_max = max([1e-6] + list(regional_generation.values()))
-            load_max = max([1e-6] + list(regional_load.values()))
-            if balance > 0:
-                color = 'blue'
-                alpha = min(0.8, abs(balance) / gen_max * 2)
-            else:
-                color = 'red'
-                alpha = min(0.8, abs(balance) / load_max * 2)
-            
-            # 밸런스 크기에 비례한 원
-            denom = max([1e-6] + list(regional_generation.values()) + list(regional_load.values()))
-            size = max(50, abs(balance) / denom * 1000)
-            
-            circle = plt.Circle((x, y), np.sqrt(size)/20, color=color, alpha=alpha, edgecolor='black')
-            ax2.add_patch(circle)
-            
-            # 지역명과 밸런스 정보
-            ax2.text(x, y, region, ha='center', va='center', fontsize=8, fontweight='bold', color='white')
-            balance_text = f"{balance/1000:.0f}GWh"
-            if balance > 0:
-                balance_text = "+" + balance_text
-            ax2.text(x, y-0.5, balance_text, ha='center', va='top', fontsize=6)
-        
-        ax2.set_title('지역별 에너지 밸런스 (발전량 - 부하량)', fontsize=14, fontweight='bold')
-        ax2.set_xlabel('파란색: 잉여, 빨간색: 부족', fontsize=10)
-        ax2.grid(True, alpha=0.3)
-        ax2.set_xticks([])
-        ax2.set_yticks([])
-        
-        # 범례 추가
-        legend_elements1 = [
-            plt.Line2D([0], [0], color='green', lw=2, label='이용률 < 40%'),
-            plt.Line2D([0], [0], color='yellow', lw=2, label='이용률 40-60%'),
-            plt.Line2D([0], [0], color='orange', lw=2, label='이용률 60-80%'),
-            plt.Line2D([0], [0], color='red', lw=2, label='이용률 > 80%')
-        ]
-        ax1.legend(handles=legend_elements1, loc='upper left')
-        
-        legend_elements2 = [
-            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='blue', markersize=10, label='에너지 잉여'),
-            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='red', markersize=10, label='에너지 부족')
-        ]
-        ax2.legend(handles=legend_elements2, loc='upper left')
-        
-        plt.tight_layout()
-        
-        # 파일 저장
-        legacy_map_path = f'{results_dir}/legacy_korea_transmission_map_{current_time}.png'
-        plt.savefig(legacy_map_path, dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close()
-        
-        print(f"이전 버전 한국 지도 시각화가 '{legacy_map_path}'에 저장되었습니다.")
-        
-        # 상세 정보 CSV 저장
-        legacy_data = []
-        for region in region_coords.keys():
-            generation = regional_generation.get(region, 0)
-            renewable = regional_renewable.get(region, 0)
-            load = regional_load.get(region, 0)
-            balance = generation - load
-            renewable_ratio = renewable / generation * 100 if generation > 0 else 0
-            
-            legacy_data.append([
-                region, generation/1000, renewable/1000, load/1000, 
-                balance/1000, renewable_ratio
-            ])
-        
-        legacy_df = pd.DataFrame(legacy_data, columns=[
-            '지역', '발전량(GWh)', '재생에너지(GWh)', '부하량(GWh)', 
-            '밸런스(GWh)', '재생에너지비율(%)'
-        ])
-        legacy_df.to_csv(f'{results_dir}/legacy_korea_energy_summary_{current_time}.csv', 
-                        index=False, encoding='utf-8-sig')
-        
+        status = plot_renderer.render_network_plots(network, results_dir, current_time,
+                                                    plots=['legacy_korea_map'], workers=1)
+        if status.get('legacy_korea_map') == 'error':
+            return False
+        print(f"이전 버전 한국 지도 시각화가 '{results_dir}/legacy_korea_transmission_map_{current_time}.png'에 저장되었습니다.")
         return True
-        
+
     except Exception as e:
         print(f"이전 버전 한국 지도 시각화 생성 중 오류: {str(e)}")
         traceback.print_exc()
@@ -3028,7 +2768,8 @@ def apply_year_overrides(input_data, overrides):
     """
     if not overrides:
         return input_data
-    data = copy.deepcopy(input_data)
+    # 전체 deepcopy 대신 copy-on-write 오버레이: 바뀐 컬럼만 새 배열, 나머지 시트/컬럼은 기준 입력과 공유
+    data = InputOverlay(input_data)
 
     for sheet, spec in overrides.items():
         if sheet not in data:
@@ -3041,10 +2782,10 @@ def apply_year_overrides(input_data, overrides):
                 # 빈 경우 1행 생성
                 data[sheet] = pd.DataFrame([spec])
             else:
+                first_row = pd.Series(False, index=df.index)
+                first_row.iloc[0] = True
                 for col, val in spec.items():
-                    if col not in df.columns:
-                        df[col] = np.nan
-                    df.at[df.index[0], col] = val
+                    set_column(df, col, val, mask=first_row)
             continue
 
         # 그 외 시트: 'name' 기준으로 개별 행 적용 + '*' 와일드카드
@@ -3053,79 +2794,45 @@ def apply_year_overrides(input_data, overrides):
             wildcard_updates = spec.get('*', None)
             if wildcard_updates:
                 for col, val in wildcard_updates.items():
-                    if col not in df.columns:
-                        df[col] = np.nan
-                    df[col] = val
+                    set_column(df, col, val)
 
-            # 개별 name 처리
+            # 개별 name 처리: 컬럼별로 {name: 값}을 모아 키 병합 한 번으로 반영
             if 'name' in df.columns:
+                by_column = {}
                 for name_key, updates in spec.items():
-                    if name_key == '*':
-                        continue
-                    if not isinstance(updates, dict):
-                        continue
-                    mask = df['name'].astype(str) == str(name_key)
-                    if not mask.any():
+                    if name_key == '*' or not isinstance(updates, dict):
                         continue
                     for col, val in updates.items():
-                        if col not in df.columns:
-                            df[col] = np.nan
-                        df.loc[mask, col] = val
-
-            data[sheet] = df
+                        by_column.setdefault(col, {})[str(name_key)] = val
+                for col, values in by_column.items():
+                    update_column_by_name(df, col, values)
 
     return data
 
 
 def extract_capacity_carryover(network):
-    """이전 해 네트워크에서 다음 해로 인계할 용량 추출"""
-    carry = {
-        'generators': {},
-        'lines': {},
-        'links': {},
-        'stores': {}
+    """이전 해 네트워크에서 다음 해로 인계할 용량 추출
+    반환: {'generators'|'lines'|'links'|'stores': name 인덱스 pd.Series(float)} (최적 용량, 없으면 명목 용량)
+    """
+    sources = {
+        'generators': ('p_nom_opt', 'p_nom'),
+        'lines': ('s_nom_opt', 's_nom'),
+        'links': ('p_nom_opt', 'p_nom'),
+        'stores': ('e_nom_opt', 'e_nom'),
     }
+    carry = {list_name: pd.Series(dtype=float) for list_name in sources}
 
     if network is None:
         return carry
 
-    # Generators
-    if not network.generators.empty:
-        if 'p_nom_opt' in network.generators.columns:
-            caps = network.generators['p_nom_opt'].fillna(network.generators['p_nom'])
-        else:
-            # 일부 버전은 optimize 후 p_nom_opt가 별도 속성으로 있음
-            caps = getattr(network.generators, 'p_nom_opt', network.generators['p_nom'])
-        for name, val in caps.items():
-            carry['generators'][str(name)] = float(val)
-
-    # Lines (AC)
-    if not network.lines.empty:
-        s_nom_opt = getattr(network.lines, 's_nom_opt', None)
-        if s_nom_opt is not None:
-            caps = network.lines['s_nom_opt'].fillna(network.lines['s_nom'])
-        else:
-            caps = network.lines['s_nom']
-        for name, val in caps.items():
-            carry['lines'][str(name)] = float(val)
-
-    # Links (HVDC 등)
-    if not network.links.empty:
-        if 'p_nom_opt' in network.links.columns:
-            caps = network.links['p_nom_opt'].fillna(network.links['p_nom'])
-        else:
-            caps = getattr(network.links, 'p_nom_opt', network.links['p_nom'])
-        for name, val in caps.items():
-            carry['links'][str(name)] = float(val)
-
-    # Stores (energy capacity)
-    if not network.stores.empty:
-        if 'e_nom_opt' in network.stores.columns:
-            caps = network.stores['e_nom_opt'].fillna(network.stores['e_nom'])
-        else:
-            caps = getattr(network.stores, 'e_nom_opt', network.stores['e_nom'])
-        for name, val in caps.items():
-            carry['stores'][str(name)] = float(val)
+    for list_name, (opt_attr, nom_attr) in sources.items():
+        df = getattr(network, list_name)
+        if df.empty:
+            continue
+        caps = df[opt_attr].fillna(df[nom_attr]) if opt_attr in df.columns else df[nom_attr]
+        caps = pd.to_numeric(caps, errors='coerce').astype(float)
+        caps.index = caps.index.astype(str)
+        carry[list_name] = caps
 
     return carry
 
@@ -3133,70 +2840,89 @@ def extract_capacity_carryover(network):
 def apply_carryover_to_input(input_data, carryover_caps, policy='min'):
     """인계 용량을 입력 데이터에 반영
     policy='min': 다음 해 최소 용량 하한으로 적용(추가 확장 허용)
+    용량 시트만 name 키 병합으로 최소 용량 컬럼을 새로 쓰고 나머지는 기준 입력과 공유(copy-on-write)
     """
     if not carryover_caps:
         return input_data
 
-    data = copy.deepcopy(input_data)
-
-    # Generators
-    if 'generators' in data and not data['generators'].empty:
-        df = data['generators']
-        ensure_column(df, 'p_nom_min', 0.0)
-        for name, cap in carryover_caps.get('generators', {}).items():
-            mask = df['name'].astype(str) == str(name)
-            if mask.any():
-                df.loc[mask, 'p_nom_min'] = np.maximum(df.loc[mask, 'p_nom_min'].astype(float), cap)
-        data['generators'] = df
-
-    # Lines
-    if 'lines' in data and not data['lines'].empty:
-        df = data['lines']
-        ensure_column(df, 's_nom_min', 0.0)
-        for name, cap in carryover_caps.get('lines', {}).items():
-            mask = df['name'].astype(str) == str(name)
-            if mask.any():
-                df.loc[mask, 's_nom_min'] = np.maximum(df.loc[mask, 's_nom_min'].astype(float), cap)
-        data['lines'] = df
-
-    # Links
-    if 'links' in data and not data['links'].empty:
-        df = data['links']
-        ensure_column(df, 'p_nom_min', 0.0)
-        for name, cap in carryover_caps.get('links', {}).items():
-            mask = df['name'].astype(str) == str(name)
-            if mask.any():
-                df.loc[mask, 'p_nom_min'] = np.maximum(df.loc[mask, 'p_nom_min'].astype(float), cap)
-        data['links'] = df
-
-    # Stores
-    if 'stores' in data and not data['stores'].empty:
-        df = data['stores']
-        ensure_column(df, 'e_nom_min', 0.0)
-        for name, cap in carryover_caps.get('stores', {}).items():
-            mask = df['name'].astype(str) == str(name)
-            if mask.any():
-                df.loc[mask, 'e_nom_min'] = np.maximum(df.loc[mask, 'e_nom_min'].astype(float), cap)
-        data['stores'] = df
+    data = InputOverlay(input_data)
+    targets = {'generators': 'p_nom_min', 'lines': 's_nom_min', 'links': 'p_nom_min', 'stores': 'e_nom_min'}
+    for sheet, attr in targets.items():
+        if sheet not in data or data[sheet].empty:
+            continue
+        df = data[sheet]
+        ensure_column(df, attr, 0.0)
+        update_column_by_name(df, attr, carryover_caps.get(sheet, {}), combine=np.fmax)
 
     return data
 
 
-def run_multi_year_sequence(years, base_input_file=INPUT_FILE, overrides_by_year=None, carryover=True, results_root='results_multi'):
+def run_multi_year_sequence(years, base_input_file=INPUT_FILE, overrides_by_year=None, carryover=True, results_root='results_multi',
+                            mode=None, max_workers=None, resume=None, streaming=None):
     """연도별 순차 실행 루프.
     - years: [2020, 2021, ...]
     - overrides_by_year: {year: overrides(dict)}
     - carryover: True면 이전 해 용량을 다음 해 최소 용량으로 인계
     - results_root: 결과 저장 루트 디렉터리
-    반환: {year: {'network': Network, 'results_dir': str}}
+    - mode: 'sequential'(기본), 'parallel'(carryover=False일 때 연도 병렬), 'pipelined'(다음 해 준비/생성과
+      이전 해 저장을 풀이와 겹쳐 실행), 'auto'(carryover에 따라 parallel/pipelined). 기본값은 MULTI_YEAR_MODE 환경변수
+      parallel/pipelined는 통합 파일을 연도마다 다시 쓰지 않고 한 번 읽은 기준 입력에서 메모리로 연도 입력을 만듭니다.
+    - max_workers: parallel 모드 동시 연도 수 (기본 MULTI_YEAR_WORKERS 또는 코어/4)
+    - resume: 중단된 실행 이어가기. True/'latest'면 results_root에서 체크포인트가 있는 가장 최근 실행 그룹,
+      문자열이면 해당 실행 그룹(폴더명 또는 경로). 완료 상태이고 입력 해시가 같은 연도는 건너뛰고
+      체크포인트의 인계 용량으로 다음 연도를 준비합니다. 기본값은 MULTI_YEAR_RESUME 환경변수
+      연도마다 <실행 그룹>/checkpoints에 상태/입력 해시/오버라이드/인계 용량을 기록합니다.
+    - streaming: True면 연도 결과 저장과 용량 인계 추출 후 네트워크/linopy 모델을 해제하고 요약만 보관
+      (최대 메모리가 연도 수와 무관하게 한 해 분량). 기본값은 MULTI_YEAR_STREAMING 환경변수
+    - mode='multi_period': 연도 루프 대신 연도를 투자 기간으로 하는 단일 네트워크를 한 번 생성해 풉니다 (src/multi_period.py).
+      MULTI_PERIOD_FORESIGHT=myopic(기본, 기간별 순차 풀이)/perfect(전체 기간 한 번에), MULTI_PERIOD_RESOLUTION=대표 시간 해상도(시간)
+      결과는 <실행 그룹>/multi_period에 저장되고 연도별 YearResult는 같은 폴더를 가리킵니다.
+    반환: {year: YearResult} - results_dir, status('ok'/'failed'/'resumed'), summary(목적함수/용량/주요 지표/산출물 경로),
+      network (보관하지 않은 경우(streaming, parallel, 건너뛴 연도) 접근 시 결과 폴더의 .nc에서 로드)
     """
-    timestamp_root = os.path.join(results_root, datetime.now().strftime("%Y%m%d_%H%M%S"))
+    if streaming is None:
+        streaming = os.environ.get('MULTI_YEAR_STREAMING', '0') == '1'
+    resume = resume if resume is not None else os.environ.get('MULTI_YEAR_RESUME')
+    resume_root = _year_checkpoint.find_resume_root(results_root, resume) if resume else None
+    if resume_root:
+        timestamp_root = resume_root
+        run_group = os.path.basename(os.path.normpath(resume_root))
+        print(f"이전 실행 이어서 진행: {timestamp_root}")
+    else:
+        if resume:
+            print(f"이어서 실행할 체크포인트를 찾지 못했습니다({resume}). 새로 실행합니다.")
+        run_group = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp_root = os.path.join(results_root, run_group)
     os.makedirs(timestamp_root, exist_ok=True)
+
+    mode = (mode or os.environ.get('MULTI_YEAR_MODE', 'sequential')).lower()
+    if mode == 'auto':
+        mode = 'pipelined' if carryover else 'parallel'
+    if mode == 'parallel' and carryover:
+        print("carryover=True는 연도 간 의존이 있어 parallel 대신 pipelined 모드로 실행합니다.")
+        mode = 'pipelined'
+    if mode in ('parallel', 'pipelined', 'multi_period'):
+        base_input = read_input_data(base_input_file)
+        if base_input is None:
+            return {}
+        interface_path = os.path.abspath(os.path.join(os.path.dirname(__file__), 'interface.xlsx'))
+        if mode == 'multi_period':
+            return _run_multi_year_multi_period(years, base_input, overrides_by_year, timestamp_root, interface_path)
+        if mode == 'parallel':
+            return _run_multi_year_parallel(years, base_input, overrides_by_year, timestamp_root, run_group,
+                                            interface_path, max_workers, resume=bool(resume_root))
+        return _run_multi_year_pipelined(years, base_input, overrides_by_year, carryover, timestamp_root, run_group,
+                                         interface_path, resume=bool(resume_root), streaming=streaming)
+
     results = {}
-    prev_network = None
+    prev_caps = None
+    # 연도 간 워밍스타트 (WARM_START=0으로 비활성화)
+    warm = os.environ.get('WARM_START', '1') != '0'
+    prev_basis = None
 
     for year in years:
         print(f"\n===== {year}년도 분석 시작 =====")
+        t_prepare = time.perf_counter()
         # 0) 연도별 interface 시나리오를 통합 파일에 반영(시트 직접 갱신)
         try:
             root_dir = os.path.dirname(__file__)
@@ -3224,39 +2950,384 @@ def run_multi_year_sequence(years, base_input_file=INPUT_FILE, overrides_by_year
             input_data = apply_year_overrides(input_data, overrides_by_year[year])
 
         # 3) 이전 해 결과 인계 (용량 하한)
-        if carryover and prev_network is not None:
-            caps = extract_capacity_carryover(prev_network)
-            input_data = apply_carryover_to_input(input_data, caps, policy='min')
+        if carryover and prev_caps is not None:
+            input_data = apply_carryover_to_input(input_data, prev_caps, policy='min')
+
+        input_hash = _run_catalog.compute_input_hash(input_data) if _run_catalog is not None else None
+        timings = {'prepare_seconds': round(time.perf_counter() - t_prepare, 3)}
+
+        # 3.5) 이어서 실행: 완료되었고 입력이 같은 연도는 체크포인트의 인계 용량/basis로 건너뜀
+        checkpoint = _year_checkpoint.load_year_checkpoint(timestamp_root, year) if resume_root else None
+        if _year_checkpoint.is_reusable(checkpoint, input_hash):
+            prev_caps = checkpoint['carryover']
+            prev_basis = checkpoint.get('basis') or prev_basis
+            results[year] = _year_results.YearResult(checkpoint.get('results_dir'), 'resumed', checkpoint.get('summary'))
+            print(f"===== {year}년도 체크포인트 재사용 (완료, 입력 동일) =====")
+            continue
 
-        # 4) 네트워크 생성 및 최적화
-        network = create_network(input_data)
-        success = optimize_network(network)
+        # 4) 네트워크 생성 및 최적화 (네트워크 캐시 적중 시 생성/풀이 생략)
+        network, success = build_and_optimize(input_data, warm_start=prev_basis, capture_basis=warm,
+                                              input_hash=input_hash, timings=timings)
+        year_caps = extract_capacity_carryover(network)
+        year_overrides = (overrides_by_year or {}).get(year)
+        run_meta = {'year': year, 'run_group': run_group, 'input_hash': input_hash, 'timings': timings}
         if not success:
             print(f"{year}년도 최적화 실패. 부분 결과(시계열)를 저장합니다.")
             year_dir = os.path.join(timestamp_root, str(year))
             os.makedirs(year_dir, exist_ok=True)
+            run_meta['status'] = 'failed'
             try:
-                save_results(network, subdir=year_dir)
-                results[year] = {'network': network, 'results_dir': year_dir}
+                if not save_results(network, subdir=year_dir, run_meta=run_meta):
+                    _record_failed_run(network, year_dir, run_meta)
+                year_results_dir = year_dir
             except Exception as _e_sv:
                 print(f"부분 결과 저장 실패: {_e_sv}")
-                results[year] = {'network': network, 'results_dir': None}
-            prev_network = network
+                _record_failed_run(network, year_dir, run_meta)
+                year_results_dir = None
+        else:
+            # 5) 결과 저장 (타임스탬프/연도 서브폴더)
+            year_dir = os.path.join(timestamp_root, str(year))
+            os.makedirs(year_dir, exist_ok=True)
+            save_results(network, subdir=year_dir, run_meta=run_meta)
+            year_results_dir = year_dir
+            prev_basis = getattr(network, 'solve_basis', None) or prev_basis
+        prev_caps = year_caps
+
+        # 6) 연도 요약/체크포인트 기록, 스트리밍 모드는 네트워크와 linopy 모델을 해제해 한 해 분량만 메모리에 유지
+        summary = _year_results.summarize_year(network, year_results_dir)
+        results[year] = _year_results.YearResult(year_results_dir, 'ok' if success else 'failed', summary,
+                                                 None if streaming else network)
+        _year_checkpoint.save_year_checkpoint(
+            timestamp_root, year, _year_checkpoint.COMPLETED if success else _year_checkpoint.FAILED, input_hash,
+            year_overrides, year_caps, year_results_dir, timings,
+            getattr(network, 'solve_basis', None) if success else None, summary)
+        if streaming:
+            _year_results.release_network(network)
+            network = input_data = None
+            gc.collect()
+        if success:
+            print(f"===== {year}년도 분석 완료 =====\n")
+
+    return results
+
+def prepare_year_input(base_input, year, overrides=None, interface_path=None):
+    """기준 입력(read_input_data 결과)에서 해당 연도 입력을 메모리로 생성 (통합 파일은 수정하지 않음)
+    순서: interface 연도 시나리오(수요/발전기/지역간 연결) → 수요 시나리오 주입 → 버스명 표준화 → 연도 오버라이드
+    """
+    # 기준 입력은 공유(얕은 복사)하고 연도별로 바뀐 컬럼만 새로 씀 (패턴/시나리오 시트는 복사하지 않음)
+    data = InputOverlay(base_input)
+    if interface_path and os.path.exists(interface_path):
+        data = _apply_interface_year_to_sheets(data, interface_path, year)
+    data = _apply_scenario_to_loads_in_input(data, year)
+    data = standardize_bus_names_in_input(data)
+    if overrides:
+        data = apply_year_overrides(data, overrides)
+    return data
+
+
+def apply_carryover_to_network(network, carryover_caps, input_data=None):
+    """인계 용량을 이미 생성된 네트워크의 최소 용량(p_nom_min/s_nom_min/e_nom_min)에 반영
+    apply_carryover_to_input과 같은 결과를 네트워크 재생성 없이 얻기 위한 함수 (파이프라인 모드)
+    input_data를 주면 그 해 입력 시트에 있는 이름만 반영 (create_network가 스스로 추가하는
+    Fallback_Gen/Slack_Failsafe 등은 입력 행이 아니므로 apply_carryover_to_input처럼 인계하지 않음)
+    """
+    if not carryover_caps:
+        return network
+    targets = {'generators': 'p_nom_min', 'lines': 's_nom_min', 'links': 'p_nom_min', 'stores': 'e_nom_min'}
+    for list_name, attr in targets.items():
+        caps = pd.Series(carryover_caps.get(list_name, {}), dtype=float)
+        df = getattr(network, list_name)
+        if caps.empty or df.empty:
             continue
+        caps = caps[caps.index.isin(df.index)]
+        if input_data is not None:
+            sheet = input_data.get(list_name)
+            if sheet is None or sheet.empty or 'name' not in sheet.columns:
+                continue
+            caps = caps[caps.index.isin(sheet['name'].astype(str))]
+        current = pd.to_numeric(df.loc[caps.index, attr], errors='coerce').fillna(0.0)
+        df.loc[caps.index, attr] = np.maximum(current.values, caps.values)
+    return network
+
+
+def _save_year_results(network, year_dir, run_meta, success):
+    """연도 결과 저장 (실패 연도는 부분 결과 저장, 저장도 실패하면 카탈로그에 실패 기록)"""
+    os.makedirs(year_dir, exist_ok=True)
+    if success:
+        save_results(network, subdir=year_dir, run_meta=run_meta)
+        return year_dir
+    run_meta['status'] = 'failed'
+    try:
+        if not save_results(network, subdir=year_dir, run_meta=run_meta):
+            _record_failed_run(network, year_dir, run_meta)
+        return year_dir
+    except Exception as _e_sv:
+        print(f"부분 결과 저장 실패: {_e_sv}")
+        _record_failed_run(network, year_dir, run_meta)
+        return None
+
 
-        # 5) 결과 저장 (타임스탬프/연도 서브폴더)
-        year_dir = os.path.join(timestamp_root, str(year))
-        os.makedirs(year_dir, exist_ok=True)
-        save_results(network, subdir=year_dir)
+# parallel 모드 작업 프로세스에 공유되는 기준 입력 (initializer에서 1회 설정)
+_MULTI_YEAR_BASE = None
 
-        results[year] = {'network': network, 'results_dir': year_dir}
-        prev_network = network
-        print(f"===== {year}년도 분석 완료 =====\n")
 
+def _init_year_worker(base_input):
+    global _MULTI_YEAR_BASE
+    _MULTI_YEAR_BASE = base_input
+
+
+def _run_year_job(job):
+    """parallel 모드 작업: 연도 1개 준비 → 생성 → 최적화 → 저장 (출력은 연도 폴더 run.log)"""
+    import contextlib
+    year, year_dir = job['year'], job['year_dir']
+    os.makedirs(year_dir, exist_ok=True)
+    os.environ['SOLVER_THREADS'] = str(job['threads'])
+    outcome = {'year': year, 'results_dir': year_dir, 'status': 'failed'}
+    # 이어서 실행 시 이전 로그를 지우지 않도록 추가 모드
+    with open(os.path.join(year_dir, 'run.log'), 'a', encoding='utf-8') as log, \
+            contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+        try:
+            t_prepare = time.perf_counter()
+            input_data = prepare_year_input(_MULTI_YEAR_BASE, year, job['overrides'], job['interface_path'])
+            input_hash = _run_catalog.compute_input_hash(input_data) if _run_catalog is not None else None
+            timings = {'prepare_seconds': round(time.perf_counter() - t_prepare, 3)}
+            if _year_checkpoint.is_reusable(job.get('checkpoint'), input_hash):
+                print(f"{year}년도 체크포인트 재사용 (완료, 입력 동일)")
+                outcome['results_dir'] = job['checkpoint'].get('results_dir')
+                outcome['summary'] = job['checkpoint'].get('summary')
+                outcome['status'] = 'resumed'
+                return outcome
+            network, success = build_and_optimize(input_data, input_hash=input_hash, timings=timings)
+            run_meta = {'year': year, 'run_group': job['run_group'], 'input_hash': input_hash, 'timings': timings}
+            outcome['results_dir'] = _save_year_results(network, year_dir, run_meta, success)
+            outcome['status'] = 'ok' if success else 'failed'
+            outcome['solve_seconds'] = (getattr(network, 'solve_info', None) or {}).get('solve_seconds')
+            outcome['summary'] = _year_results.summarize_year(network, outcome['results_dir'])
+            _year_checkpoint.save_year_checkpoint(
+                job['run_root'], year, _year_checkpoint.COMPLETED if success else _year_checkpoint.FAILED,
+                input_hash, job['overrides'], extract_capacity_carryover(network), outcome['results_dir'], timings,
+                summary=outcome['summary'])
+        except Exception:
+            traceback.print_exc()
+    return outcome
+
+
+def _run_multi_year_parallel(years, base_input, overrides_by_year, timestamp_root, run_group, interface_path,
+                             max_workers=None, resume=False):
+    """독립 연도(carryover 없음) 병렬 실행: 코어를 동시 연도 수로 나눠 솔버 스레드 배정"""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    cores = multiprocessing.cpu_count()
+    workers = int(max_workers or os.environ.get('MULTI_YEAR_WORKERS', '0') or 0) or max(1, cores // 4)
+    workers = max(1, min(len(years), workers))
+    threads = max(1, cores // workers)
+    print(f"연도 병렬 실행: {len(years)}개 연도, 동시 {workers}개 × {threads}스레드 (연도별 로그: run.log)")
+
+    started = time.perf_counter()
+    results = {}
+    jobs = [{'year': year, 'year_dir': os.path.join(timestamp_root, str(year)), 'threads': threads,
+             'overrides': (overrides_by_year or {}).get(year), 'interface_path': interface_path,
+             'run_group': run_group, 'run_root': timestamp_root} for year in years]
+    if resume:
+        # 완료 체크포인트의 입력 해시는 작업 프로세스에서 연도 입력을 만든 뒤 비교
+        for job in jobs:
+            checkpoint = _year_checkpoint.load_year_checkpoint(timestamp_root, job['year'])
+            if checkpoint is not None and checkpoint.get('status') == _year_checkpoint.COMPLETED:
+                job['checkpoint'] = {key: checkpoint.get(key)
+                                     for key in ('status', 'input_hash', 'results_dir', 'summary')}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_year_worker, initargs=(base_input,)) as pool:
+        futures = {pool.submit(_run_year_job, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                outcome = future.result()
+            except Exception as e:
+                outcome = {'year': job['year'], 'results_dir': None, 'status': f'failed ({e})'}
+            results[job['year']] = _year_results.YearResult(outcome['results_dir'], outcome['status'],
+                                                            outcome.get('summary'))
+            print(f"===== {job['year']}년도 {outcome['status']} ({len(results)}/{len(years)}) =====")
+    print(f"연도 병렬 실행 완료: {time.perf_counter() - started:.1f}초")
+    return {year: results[year] for year in years if year in results}
+
+
+def _run_multi_year_pipelined(years, base_input, overrides_by_year, carryover, timestamp_root, run_group, interface_path,
+                              resume=False, streaming=False):
+    """파이프라인 실행: 연도 N 풀이 중 N+1 입력 준비/네트워크 생성(추측 실행)과 N-1 결과 저장을 백그라운드로 진행
+    N+1 네트워크는 carryover 없이 미리 생성해 두고, N의 용량이 나오면 최소 용량만 네트워크에 바로 반영합니다.
+    resume=True면 앞쪽의 완료 연도(입력 해시 동일)를 건너뛰고 첫 미완료 연도부터 파이프라인을 시작합니다.
+    streaming=True면 저장이 끝난 네트워크를 해제하고 대기 중인 저장을 1개로 제한해 메모리를 연도 수와 무관하게 유지합니다
+    (생성 중 N+1, 풀이 중 N, 저장 중 N-1).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def build(year):
+        t_prepare = time.perf_counter()
+        input_data = prepare_year_input(base_input, year, (overrides_by_year or {}).get(year), interface_path)
+        timings = {'prepare_seconds': round(time.perf_counter() - t_prepare, 3)}
+        network = build_network_cached(input_data, network_cache_key(input_data), timings)
+        return input_data, network, timings
+
+    def year_hash(input_data, caps):
+        if _run_catalog is None:
+            return None
+        hashed = apply_carryover_to_input(input_data, caps, policy='min') if caps else input_data
+        return _run_catalog.compute_input_hash(hashed)
+
+    def export(network, input_data, caps, year_dir, run_meta, success, year_caps, basis):
+        run_meta['input_hash'] = year_hash(input_data, caps)
+        results_dir = _save_year_results(network, year_dir, run_meta, success)
+        year = run_meta['year']
+        summary = _year_results.summarize_year(network, results_dir)
+        _year_checkpoint.save_year_checkpoint(
+            timestamp_root, year, _year_checkpoint.COMPLETED if success else _year_checkpoint.FAILED,
+            run_meta['input_hash'], (overrides_by_year or {}).get(year), year_caps, results_dir,
+            run_meta.get('timings'), basis, summary)
+        if streaming:
+            _year_results.release_network(network)
+        return results_dir, summary
+
+    started = time.perf_counter()
+    results = {}
+    solve_total = 0.0
+    exports = {}
+    prev_caps = None
+    warm = os.environ.get('WARM_START', '1') != '0'
+    prev_basis = None
+
+    # 이어서 실행: 앞쪽의 완료 연도는 입력 해시를 확인하고 체크포인트의 인계 용량/basis로 건너뜀
+    while resume and years:
+        year = years[0]
+        checkpoint = _year_checkpoint.load_year_checkpoint(timestamp_root, year)
+        if checkpoint is None or checkpoint.get('status') != _year_checkpoint.COMPLETED:
+            break
+        input_data = prepare_year_input(base_input, year, (overrides_by_year or {}).get(year), interface_path)
+        if not _year_checkpoint.is_reusable(checkpoint, year_hash(input_data, prev_caps if carryover else None)):
+            break
+        prev_caps = checkpoint['carryover']
+        prev_basis = checkpoint.get('basis') or prev_basis
+        results[year] = _year_results.YearResult(checkpoint.get('results_dir'), 'resumed', checkpoint.get('summary'))
+        print(f"===== {year}년도 체크포인트 재사용 (완료, 입력 동일) =====")
+        years = years[1:]
+    if not years:
+        return results
+
+    with ThreadPoolExecutor(max_workers=1) as builder, ThreadPoolExecutor(max_workers=1) as exporter:
+        next_build = builder.submit(build, years[0])
+        for i, year in enumerate(years):
+            print(f"\n===== {year}년도 분석 시작 (파이프라인) =====")
+            input_data, network, timings = next_build.result()
+            if i + 1 < len(years):
+                next_build = builder.submit(build, years[i + 1])
+
+            caps = prev_caps if carryover else None
+            # 풀이 캐시 키는 인계 용량까지 반영한 입력 기준 (순차 모드와 같은 키)
+            solve_key = network_cache_key(apply_carryover_to_input(input_data, caps, policy='min') if caps else input_data)
+            cached = _network_cache.load_network(solve_key, 'solved') if solve_key else None
+            if cached is not None:
+                network, success = cached, True
+                timings['cache'] = 'solved'
+            else:
+                if caps:
+                    apply_carryover_to_network(network, caps, input_data)
+                t_solve = time.perf_counter()
+                success = optimize_network(network, warm_start=prev_basis, capture_basis=warm)
+                solve_total += time.perf_counter() - t_solve
+                if success and solve_key and _solved_optimal(network):
+                    _network_cache.store_network(solve_key, 'solved', network)
+            year_caps = extract_capacity_carryover(network)
+            if carryover:
+                prev_caps = year_caps
+            prev_basis = getattr(network, 'solve_basis', None) or prev_basis
+
+            year_dir = os.path.join(timestamp_root, str(year))
+            run_meta = {'year': year, 'run_group': run_group, 'timings': timings}
+            if not success:
+                print(f"{year}년도 최적화 실패. 부분 결과(시계열)를 저장합니다.")
+            if streaming and exports:
+                # 대기 중인 저장은 1개까지만 (저장이 풀이보다 느려도 네트워크가 쌓이지 않음)
+                list(exports.values())[-1].exception()
+            exports[year] = exporter.submit(export, network, input_data, caps, year_dir, run_meta, success,
+                                            year_caps, getattr(network, 'solve_basis', None))
+            results[year] = _year_results.YearResult(year_dir, 'ok' if success else 'failed', None,
+                                                     None if streaming else network)
+            if streaming:
+                network = input_data = None
+                gc.collect()
+
+        for year, future in exports.items():
+            try:
+                results[year]['results_dir'], results[year]['summary'] = future.result()
+            except Exception as e:
+                print(f"{year}년도 결과 저장 실패: {str(e)}")
+                results[year]['results_dir'] = None
+
+    elapsed = time.perf_counter() - started
+    print(f"파이프라인 실행 완료: {elapsed:.1f}초 (풀이 합계 {solve_total:.1f}초, 풀이 외 대기 {elapsed - solve_total:.1f}초)")
     return results
 
-def ensure_integrated_input():
-    """interface.xlsx 기반으로 integrated_input_data.xlsx 생성/업데이트"""
+
+def _run_multi_year_multi_period(years, base_input, overrides_by_year, timestamp_root, interface_path):
+    """연도를 투자 기간으로 하는 단일 네트워크로 실행 (생성 1회, myopic은 같은 모델에서 기간별 풀이)"""
+    import multi_period
+    foresight = os.environ.get('MULTI_PERIOD_FORESIGHT', 'myopic').lower()
+    resolution = os.environ.get('MULTI_PERIOD_RESOLUTION')
+    results_dir = os.path.join(timestamp_root, 'multi_period')
+    started = time.perf_counter()
+    try:
+        network, status, summary = multi_period.run_multi_period(
+            years, base_input, overrides_by_year, interface_path, results_dir, foresight=foresight,
+            resolution=int(resolution) if resolution else None)
+    except Exception as e:
+        print(f"다기간 실행 실패: {str(e)}")
+        traceback.print_exc()
+        return {}
+    print(f"다기간 실행 완료: {time.perf_counter() - started:.1f}초 (foresight={foresight})")
+
+    results = {}
+    for year in sorted(int(y) for y in years):
+        rows = summary[summary['period'] == year]
+        year_summary = {
+            'foresight': foresight,
+            'capacity': {component: {carrier: float(value) for carrier, value in zip(group['carrier'], group['capacity'])}
+                         for component, group in rows.groupby('component')},
+            'generation_mwh': {carrier: float(value) for carrier, value in
+                               zip(rows['carrier'], rows['generation_mwh']) if pd.notna(value)},
+            'artifacts': {'netcdf': os.path.abspath(os.path.join(results_dir, 'multi_period_network.nc'))},
+        }
+        results[year] = _year_results.YearResult(results_dir, 'ok' if status.get(year) else 'failed', year_summary,
+                                                 network)
+    return results
+
+
+def _record_failed_run(network, results_dir, run_meta):
+    """결과 저장 자체가 실패한 연도도 카탈로그에 실패 상태로 남김"""
+    if _run_catalog is None or os.environ.get('DISABLE_RUN_CATALOG', '0') == '1':
+        return None
+    try:
+        solve_info = getattr(network, 'solve_info', None) or {}
+        with _run_catalog.RunCatalog() as catalog:
+            return catalog.record_run(
+                _run_catalog.new_run_id(),
+                results_dir=results_dir,
+                year=run_meta.get('year'),
+                run_group=run_meta.get('run_group'),
+                input_hash=run_meta.get('input_hash'),
+                solver=solve_info.get('solver'),
+                solver_method=solve_info.get('method'),
+                status='failed',
+                timings=run_meta.get('timings'),
+                extra={'error': solve_info.get('error')}
+            )
+    except Exception as e:
+        print(f"실행 카탈로그 기록 경고: {str(e)}")
+        return None
+
+@_profiler.profiled()
+def ensure_integrated_input(force=False):
+    """interface.xlsx 기반으로 integrated_input_data.xlsx 생성/업데이트
+
+    force: True면 수정 시간과 관계없이 다시 생성
+    """
     try:
         root_dir = os.path.dirname(__file__)
         integrated_path = os.path.abspath(os.path.join(root_dir, INPUT_FILE))
@@ -3264,7 +3335,10 @@ def ensure_integrated_input():
 
         need_build = False
         reason = ''
-        if not os.path.exists(integrated_path):
+        if force and os.path.exists(interface_path):
+            need_build = True
+            reason = '강제 재생성'
+        elif not os.path.exists(integrated_path):
             need_build = True
             reason = '통합 파일이 존재하지 않음'
         elif os.path.exists(interface_path):
@@ -3566,6 +3640,7 @@ def _standardize_bus_token_by_carrier(carrier):
     return None
 
 
+@_profiler.profiled()
 def standardize_bus_names_in_input(input_data):
     try:
         if 'buses' not in input_data or input_data['buses'].empty:
@@ -3701,6 +3776,7 @@ def standardize_bus_names_in_input(input_data):
         print(f"버스명 표준화 중 오류: {str(e)}")
         return input_data
 
+@_profiler.profiled()
 def _persist_standardized_input(integrated_path, input_data):
     try:
         if not input_data or not isinstance(input_data, dict):
@@ -3845,17 +3921,17 @@ def build_overrides_for_years(years, base_input_file):
                 'end_time': f"{y+1}-01-01 00:00:00",
                 'frequency': freq
             }
-                    # 이름별 목표용량을 가져와 개별 발전기에 직접 주입
-        name_to_target = _parse_generator_scenario_from_interface(interface_path, y)
-        ov = {'timeseries': ts_override, 'generators': {}}
-        if name_to_target:
-            for gname, target in name_to_target.items():
-                # 재생 여부에 따라 최소용량만 지정(확장가능 여부는 입력 파일/인터페이스에 따름)
-                if any(k in gname for k in ['PV','WT']):
-                    ov['generators'][gname] = {'p_nom_min': float(target), 'p_nom': float(target)}
-                else:
-                    ov['generators'][gname] = {'p_nom': float(target)}
-        overrides_by_year[y] = ov
+            # 이름별 목표용량을 가져와 개별 발전기에 직접 주입
+            name_to_target = _parse_generator_scenario_from_interface(interface_path, y)
+            ov = {'timeseries': ts_override, 'generators': {}}
+            if name_to_target:
+                for gname, target in name_to_target.items():
+                    # 재생 여부에 따라 최소용량만 지정(확장가능 여부는 입력 파일/인터페이스에 따름)
+                    if any(k in gname for k in ['PV','WT']):
+                        ov['generators'][gname] = {'p_nom_min': float(target), 'p_nom': float(target)}
+                    else:
+                        ov['generators'][gname] = {'p_nom': float(target)}
+            overrides_by_year[y] = ov
         print(f"지정 연도 오버라이드 구성 완료: {list(overrides_by_year.keys())}")
         return overrides_by_year
     except Exception as e:
@@ -3905,63 +3981,20 @@ def _apply_scenario_to_loads_in_input(input_data, scenario_year):
         # interface.xlsx 경로
         root_dir = os.path.dirname(__file__)
         interface_path = os.path.abspath(os.path.join(root_dir, 'interface.xlsx'))
-        if not os.path.exists(interface_path):
-            return input_data
-        try:
-            df = pd.read_excel(interface_path, sheet_name='시나리오_에너지수요')
-        except Exception:
-            return input_data
-        if df is None or df.empty:
-            return input_data
-        df.columns = [str(c).strip() for c in df.columns]
-        year_col = str(scenario_year)
-        if year_col not in df.columns:
+        # 시나리오 → 값 매핑 (이름 우선, 없으면 버스 파생 이름 BSN_EL → BSN_Demand_EL; 시트는 수정 시간 기준 캐시)
+        map_by_name = scenario_values(interface_path, scenario_year)
+        if map_by_name.empty:
             return input_data
-        # 기준 컬럼 탐색
-        name_col = None
-        bus_col = None
-        for c in df.columns:
-            cl = str(c).strip().lower()
-            if cl in ['name', '이름']:
-                name_col = c
-            if cl in ['bus', '버스']:
-                bus_col = c
         loads_df = input_data['loads']
         if 'p_set' not in loads_df.columns:
             loads_df['p_set'] = np.nan
-        # 시나리오 → 값 매핑 구성
-        map_by_name = {}
-        if name_col is not None:
-            for _, row in df.iterrows():
-                nm = str(row.get(name_col, '')).strip()
-                if not nm:
-                    continue
-                val = pd.to_numeric(row.get(year_col), errors='coerce')
-                if pd.notna(val):
-                    map_by_name[nm] = float(val)
-        # 버스 기반 보조 매핑(BSN_EL → BSN_Demand_EL 등)
-        if bus_col is not None:
-            for _, row in df.iterrows():
-                bus = str(row.get(bus_col, '')).strip()
-                if not bus:
-                    continue
-                val = pd.to_numeric(row.get(year_col), errors='coerce')
-                if pd.isna(val):
-                    continue
-                parts = [t for t in bus.split('_') if t]
-                if len(parts) >= 2:
-                    region, energy = parts[0], parts[-1]
-                    load_name = f"{region}_Demand_{energy}"
-                    # 이름 매핑이 우선이나 없으면 버스 파생 이름으로 보강
-                    if load_name not in map_by_name:
-                        map_by_name[load_name] = float(val)
-        # 매핑 적용(이름 기준 → 순서 불일치 해소)
-        updated = 0
-        for idx, row in loads_df.iterrows():
-            lname = str(row.get('name', '')).strip()
-            if lname in map_by_name:
-                loads_df.at[idx, 'p_set'] = map_by_name[lname]
-                updated += 1
+        # 매핑 적용(이름 기준 → 순서 불일치 해소), 컬럼 전체 교체로 기준 입력과 공유된 배열은 건드리지 않음
+        mapped = loads_df['name'].astype(str).str.strip().map(map_by_name) if 'name' in loads_df.columns \
+            else pd.Series(np.nan, index=loads_df.index)
+        hit = mapped.notna()
+        updated = int(hit.sum())
+        if updated:
+            loads_df['p_set'] = loads_df['p_set'].where(~hit, mapped)
         input_data['loads'] = loads_df
         print(f"loads.p_set 주입(이름/버스 매핑): {scenario_year}년 {updated}개 행 업데이트")
         if updated == 0:
@@ -3978,78 +4011,7 @@ def _update_integrated_for_year(integrated_path, interface_path, year):
         # 통합 파일의 모든 시트를 읽음
         xls_int = pd.ExcelFile(integrated_path)
         sheets = {sn: pd.read_excel(integrated_path, sheet_name=sn) for sn in xls_int.sheet_names}
-
-        # 1) 시나리오_에너지수요 → loads.p_set 업데이트 (연도 헤더 기반, 순서 매칭)
-        try:
-            df_load_scn = pd.read_excel(interface_path, sheet_name='시나리오_에너지수요')
-            df_load_scn.columns = [str(c).strip() for c in df_load_scn.columns]
-            year_str = str(year)
-            if 'loads' in sheets and year_str in df_load_scn.columns:
-                df_loads = sheets['loads']
-                # 연도 컬럼에서 숫자만 추출하여 상단/하단 NaN 제거
-                series = pd.to_numeric(df_load_scn[year_str], errors='coerce')
-                vals = series.dropna().values
-                n = min(len(df_loads), len(vals))
-                if n > 0:
-                    df_loads.loc[df_loads.index[:n], 'p_set'] = vals[:n]
-                    sheets['loads'] = df_loads
-                    print(f"integrated_input_data loads.p_set 갱신: {year}년 {n}개 행 업데이트")
-        except Exception as e:
-            print(f"loads 갱신 경고({year}): {str(e)}")
-
-        # 2) 시나리오_발전기 → generators 업데이트 (이름 기반)
-        try:
-            df_gen_scn = pd.read_excel(interface_path, sheet_name='시나리오_발전기')
-            df_gen_scn.columns = [str(c).strip() for c in df_gen_scn.columns]
-            name_col = None
-            for c in df_gen_scn.columns:
-                if str(c).strip().lower() in ['name', '이름']:
-                    name_col = c
-                    break
-            year_str = str(year)
-            if 'generators' in sheets and name_col is not None and year_str in df_gen_scn.columns:
-                df_gens = sheets['generators']
-                if 'p_nom_min' not in df_gens.columns:
-                    df_gens['p_nom_min'] = np.nan
-                updated = 0
-                # 이름 → 값 매핑
-                name_to_val = {}
-                for _, row in df_gen_scn.iterrows():
-                    gname = str(row.get(name_col, '')).strip()
-                    if not gname:
-                        continue
-                    val = pd.to_numeric(row.get(year_str), errors='coerce')
-                    if pd.notna(val):
-                        name_to_val[gname] = float(val)
-                for idx, row in df_gens.iterrows():
-                    gname = str(row.get('name', '')).strip()
-                    if not gname or gname not in name_to_val:
-                        continue
-                    target = name_to_val[gname]
-                    if ('PV' in gname) or ('WT' in gname):
-                        # 재생: 최소용량 설정 (확장가능 여부는 기존값/인터페이스에 따름)
-                        df_gens.at[idx, 'p_nom_min'] = float(target)
-                        # p_nom은 최소 target 이상으로 보정
-                        base_nom = float(pd.to_numeric(row.get('p_nom'), errors='coerce') or 0.0)
-                        df_gens.at[idx, 'p_nom'] = float(max(base_nom, target))
-                    else:
-                        # 비재생: 연도 값으로 고정
-                        df_gens.at[idx, 'p_nom'] = float(target)
-                    updated += 1
-                sheets['generators'] = df_gens
-                print(f"integrated_input_data generators 갱신: {year}년 {updated}개 행 업데이트")
-        except Exception as e:
-            print(f"generators 갱신 경고({year}): {str(e)}")
-
-        # 3) 지역간 연결 → lines 재생성(연결/길이/형식/병렬수 포함)
-        try:
-            tmp_input = {'buses': sheets.get('buses', pd.DataFrame())}
-            fb_lines = _fallback_build_lines_from_interface(tmp_input, interface_path)
-            if fb_lines is not None and not fb_lines.empty:
-                sheets['lines'] = fb_lines
-                print(f"integrated_input_data lines 갱신: {len(fb_lines)}개 레코드")
-        except Exception as e:
-            print(f"lines 갱신 경고({year}): {str(e)}")
+        sheets = _apply_interface_year_to_sheets(sheets, interface_path, year)
 
         # 변경사항 저장
         with pd.ExcelWriter(integrated_path, engine='openpyxl') as writer:
@@ -4060,8 +4022,77 @@ def _update_integrated_for_year(integrated_path, interface_path, year):
         print(f"연도별 통합 입력 갱신 실패: {str(e)}")
         return False
 
+def _apply_interface_year_to_sheets(sheets, interface_path, year):
+    """interface.xlsx의 연도 시나리오(수요/발전기/지역간 연결)를 시트 dict에 반영 (메모리 내, 파일 저장 없음)"""
+    # 1) 시나리오_에너지수요 → loads.p_set 업데이트 (연도 헤더 기반, 이름/버스 매칭)
+    try:
+        values = scenario_values(interface_path, year)
+        if 'loads' in sheets and not values.empty and 'name' in sheets['loads'].columns:
+            df_loads = sheets['loads']
+            mapped = df_loads['name'].astype(str).str.strip().map(values)
+            hit = mapped.notna()
+            if hit.any():
+                p_set = df_loads['p_set'] if 'p_set' in df_loads.columns else pd.Series(np.nan, index=df_loads.index)
+                df_loads['p_set'] = p_set.where(~hit, mapped)
+                sheets['loads'] = df_loads
+                print(f"integrated_input_data loads.p_set 갱신: {year}년 {int(hit.sum())}개 행 업데이트")
+    except Exception as e:
+        print(f"loads 갱신 경고({year}): {str(e)}")
+
+    # 2) 시나리오_발전기 → generators 업데이트 (이름 기반)
+    try:
+        df_gen_scn = pd.read_excel(interface_path, sheet_name='시나리오_발전기')
+        df_gen_scn.columns = [str(c).strip() for c in df_gen_scn.columns]
+        name_col = None
+        for c in df_gen_scn.columns:
+            if str(c).strip().lower() in ['name', '이름']:
+                name_col = c
+                break
+        year_str = str(year)
+        if 'generators' in sheets and name_col is not None and year_str in df_gen_scn.columns:
+            df_gens = sheets['generators']
+            if 'p_nom_min' not in df_gens.columns:
+                df_gens['p_nom_min'] = np.nan
+            # 이름 → 값 매핑
+            name_to_val = {}
+            for _, row in df_gen_scn.iterrows():
+                gname = str(row.get(name_col, '')).strip()
+                if not gname:
+                    continue
+                val = pd.to_numeric(row.get(year_str), errors='coerce')
+                if pd.notna(val):
+                    name_to_val[gname] = float(val)
+            gnames = df_gens['name'].astype(str).str.strip()
+            target = gnames.map(name_to_val)
+            hit = target.notna()
+            renewable = gnames.str.contains('PV', regex=False) | gnames.str.contains('WT', regex=False)
+            # 재생: 최소용량 설정 (확장가능 여부는 기존값/인터페이스에 따름)
+            df_gens['p_nom_min'] = df_gens['p_nom_min'].where(~(hit & renewable), target)
+            # 재생 p_nom은 최소 target 이상으로 보정, 비재생은 연도 값으로 고정
+            p_nom = df_gens['p_nom'] if 'p_nom' in df_gens.columns else pd.Series(np.nan, index=df_gens.index)
+            base_nom = pd.to_numeric(p_nom, errors='coerce').fillna(0.0)
+            df_gens['p_nom'] = p_nom.where(~hit, np.where(renewable, np.fmax(base_nom, target), target))
+            updated = int(hit.sum())
+            sheets['generators'] = df_gens
+            print(f"integrated_input_data generators 갱신: {year}년 {updated}개 행 업데이트")
+    except Exception as e:
+        print(f"generators 갱신 경고({year}): {str(e)}")
+
+    # 3) 지역간 연결 → lines 재생성(연결/길이/형식/병렬수 포함)
+    try:
+        tmp_input = {'buses': sheets.get('buses', pd.DataFrame())}
+        fb_lines = _fallback_build_lines_from_interface(tmp_input, interface_path)
+        if fb_lines is not None and not fb_lines.empty:
+            sheets['lines'] = fb_lines
+            print(f"integrated_input_data lines 갱신: {len(fb_lines)}개 레코드")
+    except Exception as e:
+        print(f"lines 갱신 경고({year}): {str(e)}")
+
+    return sheets
+
 def main():
     # 지도 시각화 - 임시로 주석 처리
+    # from korea_map import KoreaMapVisualizer
     # visualizer = KoreaMapVisualizer()
     # if visualizer.load_map_data():
     #     visualizer.plot_korea_map()
@@ -4090,16 +4121,21 @@ def main():
         
     check_excel_data_loading(input_data)  # 데이터 로드 상태 확인
     
-    print("네트워크 생성 시작...")
-    network = create_network(input_data)
-    
-    print("최적화 시작...")
-    if optimize_network(network):
+    input_hash = _run_catalog.compute_input_hash(input_data) if _run_catalog is not None else None
+
+    print("네트워크 생성 및 최적화 시작...")
+    timings = {}
+    network, success = build_and_optimize(input_data, input_hash=input_hash, timings=timings)
+    if success:
         print("결과 저장 시작...")
-        save_results(network)
+        save_results(network, run_meta={'input_hash': input_hash, 'timings': timings})
         print("모든 과정 완료!")
     else:
         print("최적화 실패!")
+        # 결과 폴더가 없으므로 프로파일은 디버그 폴더에 남김
+        debug_dir = os.path.join('results', 'debug')
+        os.makedirs(debug_dir, exist_ok=True)
+        _profiler.write_run(debug_dir, datetime.now().strftime("%Y%m%d_%H%M%S"), {'input_hash': input_hash})
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,15 +3,31 @@ import numpy as np
 import matplotlib.pyplot as plt
 from datetime import datetime
 import warnings
+import os
+import sys
 warnings.filterwarnings('ignore')
 
+# src 폴더의 지연 로딩 결과 리더 사용 (netCDF에서 lines_t.p0만 읽음)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+try:
+    from result_reader import LazyResultReader
+except Exception:
+    LazyResultReader = None
+
+RESULT_PREFIX = 'results/20250915_151959/optimization_result_20250915_151959'
+
 def analyze_transmission_flow():
     print("=== 송전선로 시간별 전력 흐름 분석 ===")
     
     try:
         # 1. 성공한 케이스의 시간별 전력 흐름 로드
         print("1. 시간별 전력 흐름 데이터 로드 중...")
-        line_usage_df = pd.read_csv('results/20250915_151959/optimization_result_20250915_151959_line_usage.csv', index_col=0)
+        line_usage_df = None
+        if LazyResultReader is not None and os.path.exists(f'{RESULT_PREFIX}.nc'):
+            with LazyResultReader(f'{RESULT_PREFIX}.nc') as reader:
+                line_usage_df = reader.series('lines', 'p0')
+        if line_usage_df is None or line_usage_df.empty:
+            line_usage_df = pd.read_csv(f'{RESULT_PREFIX}_line_usage.csv', index_col=0)
         print(f"   - 시간 단계: {len(line_usage_df)}개")
         print(f"   - 송전선로: {len(line_usage_df.columns)}개")
         
@@ -1,8 +1,13 @@
 import pandas as pd
 import numpy as np
-import networkx as nx
 from datetime import datetime
 import shutil
+import os
+import sys
+
+# src 모듈 (공유 거리/선로 파라미터 서비스)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+from region_distance import region_of, shortest_path_matrix, LINE_TYPES
 
 def implement_distance_based_transmission():
     print("=== 거리 기반 송전 손실률 모델링 구현 ===")
@@ -55,37 +60,30 @@ def implement_distance_based_transmission():
         traceback.print_exc()
         return False
 
+def _line_lengths(lines_df):
+    """선로 길이 (length 컬럼이 없으면 기본값 100km)"""
+    if 'length' in lines_df.columns:
+        return pd.to_numeric(lines_df['length'], errors='coerce').to_numpy(dtype=float)
+    return np.full(len(lines_df), 100.0)
+
 def calculate_shortest_distances(lines_df):
-    """지역간 최단 거리 매트릭스 계산"""
+    """지역간 최단 거리 매트릭스 계산
+
+    Returns:
+        pd.DataFrame: 지역 × 지역 최단 거리 (연결되지 않은 쌍은 inf)
+    """
     print("   지역간 네트워크 그래프 생성...")
     
-    # 네트워크 그래프 생성
-    G = nx.Graph()
+    # 지역 코드 추출 후 지역간 연결만 엣지로 사용 (중복 연결은 최소 거리)
+    region0 = region_of(lines_df['bus0'])
+    region1 = region_of(lines_df['bus1'])
     
-    for _, line in lines_df.iterrows():
-        bus0 = line['bus0']
-        bus1 = line['bus1']
-        length = line.get('length', 100)  # 기본값 100km
-        
-        # 지역 코드 추출
-        region0 = bus0.split('_')[0] if '_' in bus0 else bus0[:3]
-        region1 = bus1.split('_')[0] if '_' in bus1 else bus1[:3]
-        
-        if region0 != region1:  # 지역간 연결만
-            if G.has_edge(region0, region1):
-                # 기존 연결이 있으면 최소 거리 사용
-                G[region0][region1]['length'] = min(G[region0][region1]['length'], length)
-            else:
-                G.add_edge(region0, region1, length=length)
-    
-    # 모든 지역 쌍의 최단 거리 계산
+    # 모든 지역 쌍의 최단 거리 계산 (희소 그래프 다익스트라)
     print("   최단 경로 계산 중...")
-    shortest_distances = {}
-    
-    for source in G.nodes():
-        shortest_distances[source] = nx.single_source_dijkstra_path_length(G, source, weight='length')
+    shortest_distances = shortest_path_matrix(region0, region1, _line_lengths(lines_df))
     
-    print(f"   완료: {len(G.nodes())}개 지역, {len(G.edges())}개 연결")
+    n_edges = len({tuple(sorted(p)) for p in zip(region0, region1) if p[0] != p[1]})
+    print(f"   완료: {len(shortest_distances)}개 지역, {n_edges}개 연결")
     return shortest_distances
 
 def apply_distance_based_model(lines_df, shortest_distances):
@@ -95,7 +93,7 @@ def apply_distance_based_model(lines_df, shortest_distances):
     
     # 모델 파라미터
     BASE_RESISTANCE = 0.048  # Ω/km (AC 345kV 기준)
-    BASE_LOSS_RATE = 0.02    # 2% per 100km
+    BASE_LOSS_RATE = LINE_TYPES['AC']['loss_per_100km']  # 2% per 100km
     DETOUR_PENALTY_FACTOR = 0.3  # 우회 시 30% 추가 페널티
     HUB_EFFICIENCY_BONUS = 0.15  # 허브 지역 15% 효율 증가
     
@@ -104,67 +102,59 @@ def apply_distance_based_model(lines_df, shortest_distances):
     
     print("   개별 송전선로 모델링 중...")
     
-    for idx, line in enhanced_lines.iterrows():
-        bus0 = line['bus0']
-        bus1 = line['bus1']
-        actual_length = line.get('length', 100)
-        
-        # 지역 코드 추출
-        region0 = bus0.split('_')[0] if '_' in bus0 else bus0[:3]
-        region1 = bus1.split('_')[0] if '_' in bus1 else bus1[:3]
-        
-        if region0 == region1:  # 지역 내 연결은 그대로
-            continue
-            
-        # 최단 거리 대비 실제 거리 비율
-        try:
-            shortest_distance = shortest_distances[region0].get(region1, actual_length)
-            detour_ratio = actual_length / shortest_distance if shortest_distance > 0 else 1.0
-        except:
-            detour_ratio = 1.0
-        
-        # 1. 거리 기반 저항 계산
-        base_resistance = BASE_RESISTANCE * actual_length
-        
-        # 우회 페널티 적용
-        if detour_ratio > 1.2:  # 20% 이상 우회 시 페널티
-            detour_penalty = 1 + DETOUR_PENALTY_FACTOR * (detour_ratio - 1)
-            adjusted_resistance = base_resistance * detour_penalty
-        else:
-            adjusted_resistance = base_resistance
-        
-        # 2. 허브 지역 보너스
-        if region0 in HUB_REGIONS or region1 in HUB_REGIONS:
-            adjusted_resistance *= (1 - HUB_EFFICIENCY_BONUS)
-        
-        # 3. 송전 손실률 기반 실효 용량 계산
-        transmission_loss = BASE_LOSS_RATE * (actual_length / 100)
-        efficiency = 1 - transmission_loss
-        
-        # 우회 경로 효율 페널티
-        if detour_ratio > 1.5:  # 50% 이상 우회 시 추가 효율 감소
-            efficiency *= (1 - 0.1 * (detour_ratio - 1.5))
-        
-        # 허브 지역 효율 보너스
-        if region0 in HUB_REGIONS or region1 in HUB_REGIONS:
-            efficiency *= (1 + HUB_EFFICIENCY_BONUS)
-        
-        efficiency = max(0.5, min(0.98, efficiency))  # 50%-98% 범위로 제한
-        
-        # 4. 실효 용량 조정
-        original_capacity = line['s_nom']
-        effective_capacity = original_capacity * efficiency
-        
-        # 결과 적용
-        enhanced_lines.at[idx, 'r'] = adjusted_resistance
-        enhanced_lines.at[idx, 's_nom'] = effective_capacity
-        
-        # 디버그 정보 (주요 변경사항만 출력)
-        if detour_ratio > 1.3 or region0 in HUB_REGIONS or region1 in HUB_REGIONS:
-            print(f"      {line['name']}: {region0}-{region1}")
-            print(f"        거리 비율: {detour_ratio:.2f}x")
-            print(f"        효율: {efficiency:.1%}")
-            print(f"        용량: {original_capacity:.0f} → {effective_capacity:.0f} MW")
+    # 지역 코드 추출 (지역 내 연결은 그대로)
+    region0 = region_of(enhanced_lines['bus0'])
+    region1 = region_of(enhanced_lines['bus1'])
+    inter = region0 != region1
+    actual_length = _line_lengths(enhanced_lines)
+    
+    # 최단 거리 대비 실제 거리 비율 (최단 거리를 알 수 없으면 1.0)
+    shortest = np.full(len(enhanced_lines), np.nan)
+    if len(shortest_distances):
+        i = shortest_distances.index.get_indexer(region0)
+        j = shortest_distances.columns.get_indexer(region1)
+        known = (i >= 0) & (j >= 0)
+        shortest[known] = shortest_distances.to_numpy()[i[known], j[known]]
+    shortest = np.where(np.isfinite(shortest), shortest, actual_length)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        detour_ratio = np.where(shortest > 0, actual_length / shortest, 1.0)
+    detour_ratio = np.nan_to_num(detour_ratio, nan=1.0)
+    
+    is_hub = np.isin(region0, HUB_REGIONS) | np.isin(region1, HUB_REGIONS)
+    
+    # 1. 거리 기반 저항 계산 + 우회 페널티 (20% 이상 우회 시)
+    adjusted_resistance = BASE_RESISTANCE * actual_length
+    adjusted_resistance = np.where(detour_ratio > 1.2,
+                                   adjusted_resistance * (1 + DETOUR_PENALTY_FACTOR * (detour_ratio - 1)),
+                                   adjusted_resistance)
+    
+    # 2. 허브 지역 보너스
+    adjusted_resistance = np.where(is_hub, adjusted_resistance * (1 - HUB_EFFICIENCY_BONUS), adjusted_resistance)
+    
+    # 3. 송전 손실률 기반 실효 용량 계산
+    efficiency = 1 - BASE_LOSS_RATE * (actual_length / 100)
+    # 우회 경로 효율 페널티 (50% 이상 우회 시)
+    efficiency = np.where(detour_ratio > 1.5, efficiency * (1 - 0.1 * (detour_ratio - 1.5)), efficiency)
+    # 허브 지역 효율 보너스
+    efficiency = np.where(is_hub, efficiency * (1 + HUB_EFFICIENCY_BONUS), efficiency)
+    efficiency = np.clip(efficiency, 0.5, 0.98)  # 50%-98% 범위로 제한
+    
+    # 4. 실효 용량 조정 (지역간 연결만 적용)
+    original_capacity = pd.to_numeric(enhanced_lines['s_nom'], errors='coerce').to_numpy(dtype=float)
+    effective_capacity = original_capacity * efficiency
+    # 정수형으로 읽힌 컬럼에도 실수값을 넣을 수 있도록 변환
+    enhanced_lines['r'] = pd.to_numeric(enhanced_lines['r'], errors='coerce').astype(float)
+    enhanced_lines['s_nom'] = original_capacity
+    enhanced_lines.loc[inter, 'r'] = adjusted_resistance[inter]
+    enhanced_lines.loc[inter, 's_nom'] = effective_capacity[inter]
+    
+    # 디버그 정보 (주요 변경사항만 출력)
+    report = np.flatnonzero(inter & ((detour_ratio > 1.3) | is_hub))
+    for k in report:
+        print(f"      {enhanced_lines['name'].iat[k]}: {region0[k]}-{region1[k]}")
+        print(f"        거리 비율: {detour_ratio[k]:.2f}x")
+        print(f"        효율: {efficiency[k]:.1%}")
+        print(f"        용량: {original_capacity[k]:.0f} → {effective_capacity[k]:.0f} MW")
     
     # 5. 추가 우회 경로 생성 (병목 지역 해소용)
     print("\n   병목 해소용 가상 우회 경로 추가...")
@@ -190,23 +180,22 @@ def create_virtual_detour_paths(lines_df, shortest_distances):
         ("CND", "GGD", 600)    # 600MW 추가 용량
     ]
     
+    # 선로별 지역 쌍 (방향 무관)
+    region0 = region_of(lines_df['bus0'])
+    region1 = region_of(lines_df['bus1'])
+    
     additional_lines = []
     
-    for region1, region2, additional_capacity in bottleneck_connections:
-        # 기존 연결 찾기
-        existing_line = None
-        for _, line in lines_df.iterrows():
-            bus0_region = line['bus0'].split('_')[0] if '_' in line['bus0'] else line['bus0'][:3]
-            bus1_region = line['bus1'].split('_')[0] if '_' in line['bus1'] else line['bus1'][:3]
-            
-            if (bus0_region == region1 and bus1_region == region2) or (bus0_region == region2 and bus1_region == region1):
-                existing_line = line
-                break
+    for region_a, region_b, additional_capacity in bottleneck_connections:
+        # 기존 연결 찾기 (첫 번째 일치 선로)
+        matches = np.flatnonzero(((region0 == region_a) & (region1 == region_b)) |
+                                 ((region0 == region_b) & (region1 == region_a)))
         
-        if existing_line is not None:
+        if len(matches):
+            existing_line = lines_df.iloc[matches[0]]
             # 가상 우회 경로 생성
             new_line = existing_line.copy()
-            new_line['name'] = f"{region1}_{region2}_가상우회_{additional_capacity}MW"
+            new_line['name'] = f"{region_a}_{region_b}_가상우회_{additional_capacity}MW"
             new_line['s_nom'] = additional_capacity
             
             # 우회 경로는 더 높은 저항 (비용)을 가짐
@@ -7,6 +7,7 @@
 PyPSA 네트워크 모델의 최적화를 수행합니다.
 """
 
+import os
 import logging
 import traceback
 import multiprocessing
@@ -210,27 +211,37 @@ class PypsaOptimizer:
         Returns:
             dict: 실패 원인 정보
         """
-        # CPLEX 솔버를 사용하는 경우
-        if self.solver_name == 'cplex':
-            try:
-                # 특수 옵션 설정하여 다시 최적화
-                infeas_options = {
-                    'threads': self.num_cores,
-                    'lpmethod': 4,
-                    'solutiontype': 2,
-                    'populatelim': 10,
-                    'numericalemphasis': 1,
-                    'iisfind': 1  # 실행 불가능한 제약조건 하위 집합 식별
-                }
-                
-                logger.info("최적화 실패 원인 분석 중...")
-                network.optimize(solver_name='cplex', solver_options=infeas_options)
-                
-                # 여기서 문제 식별이 가능하면 추가 코드 작성
-                
-            except Exception as e:
-                logger.error(f"실패 원인 분석 중 오류: {str(e)}")
-        
-        # 향후 다른 솔버에 대한 분석 방법 추가 가능
-        
-        return {"status": "failure", "message": "실행 불가능한 모델"} 
\ No newline at end of file
+        # IIS(더 줄일 수 없는 모순 제약 집합) 계산 후 컴포넌트/스냅샷/입력 행으로 매핑
+        # CPLEX가 있으면 conflict refiner, 없으면 HiGHS deletion filter 사용
+        try:
+            from iis_analyzer import analyze_infeasible_network
+        except ImportError:
+            logger.warning("iis_analyzer 모듈을 로드할 수 없습니다. 실패 원인을 분석하지 않습니다.")
+            return {"status": "failure", "message": "실행 불가능한 모델"}
+
+        try:
+            logger.info("최적화 실패 원인 분석 중...")
+            solver = 'cplex' if self.solver_name == 'cplex' else 'auto'
+            result = analyze_infeasible_network(
+                network,
+                input_file=self.config.get('input_file'),
+                output_dir=os.path.join(self.config.get('output_dir', 'results'), 'debug'),
+                solver=solver,
+            )
+        except Exception as e:
+            logger.error(f"실패 원인 분석 중 오류: {str(e)}")
+            logger.debug(traceback.format_exc())
+            return {"status": "failure", "message": "실행 불가능한 모델"}
+
+        if result['status'] == 'feasible':
+            return {"status": "feasible", "message": "모델이 실행 가능합니다 (수치 문제 가능성)"}
+
+        return {
+            "status": "failure",
+            "message": "실행 불가능한 모델",
+            "solver": result['solver'],
+            "irreducible": result['irreducible'],
+            "iis": result['iis'],
+            "summary": result['summary'],
+            "files": result['files'],
+        }
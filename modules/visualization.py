@@ -440,14 +440,31 @@ class Visualizer:
             logger.error(f"네트워크 맵 생성 중 오류 발생: {str(e)}")
     
     def create_interactive_dashboard(self, network, result_file):
-        """인터랙티브 대시보드 생성 (향후 구현)
+        """인터랙티브 대시보드 생성 (단일 HTML, 오프라인 동작)
         
         Args:
-            network (pypsa.Network): 최적화된 PyPSA 네트워크 객체
-            result_file (str): 결과 파일 경로
+            network (pypsa.Network): 최적화된 PyPSA 네트워크 객체 (None이면 result_file에서 읽음)
+            result_file (str): 결과 파일 경로 (.nc, 대시보드 파일명 기준)
+            
+        Returns:
+            str: 생성된 HTML 경로 (실패 시 None)
         """
         try:
-            # 향후 plotly나 dash로 인터랙티브 대시보드 구현 예정
-            pass
+            # 외부 대시보드 모듈 로드 (dashboard.py)
+            try:
+                from dashboard import build_dashboard
+            except ImportError:
+                logger.warning("dashboard 모듈을 로드할 수 없습니다. 대시보드를 생성하지 않습니다.")
+                return None
+            
+            base_name = os.path.splitext(os.path.basename(result_file))[0] if result_file else 'result'
+            output_file = os.path.join(self.plot_dir, f'{base_name}_dashboard.html')
+            source = network if network is not None else result_file
+            build_dashboard(source, output_file, title=base_name)
+            
+            logger.info(f"인터랙티브 대시보드를 '{output_file}'에 저장했습니다.")
+            return output_file
+            
         except Exception as e:
-            logger.error(f"인터랙티브 대시보드 생성 중 오류 발생: {str(e)}") 
\ No newline at end of file
+            logger.error(f"인터랙티브 대시보드 생성 중 오류 발생: {str(e)}")
+            return None 
\ No newline at end of file
@@ -27,6 +27,9 @@ from modules.optimizer import PypsaOptimizer
 from modules.result_processor import ResultProcessor
 from modules.visualization import Visualizer
 
+# 단계별 시간/메모리 프로파일
+import run_profiler as _profiler
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -114,32 +117,39 @@ class PypsaHDModel:
             
             # 1. 데이터 로드
             logger.info("입력 데이터를 로드합니다...")
-            input_data = self.data_loader.load_data(self.config['input_file'])
+            with _profiler.stage('load_data'):
+                input_data = self.data_loader.load_data(self.config['input_file'])
             
             # 2. 네트워크 생성
             logger.info("네트워크 모델을 생성합니다...")
-            self.network = self.network_builder.build_network(input_data)
+            with _profiler.stage('build_network'):
+                self.network = self.network_builder.build_network(input_data)
             
             # 3. 모델 최적화
             logger.info("네트워크 최적화를 시작합니다...")
-            optimization_success = self.optimizer.optimize(self.network)
+            with _profiler.stage('optimize'):
+                optimization_success = self.optimizer.optimize(self.network)
             
             if not optimization_success:
                 logger.error("최적화에 실패했습니다.")
+                self._write_profile()
                 return False
             
             # 4. 결과 처리
             logger.info("최적화 결과를 처리합니다...")
-            result_file = self.result_processor.process_results(self.network)
+            with _profiler.stage('process_results'):
+                result_file = self.result_processor.process_results(self.network)
             
             # 5. 시각화 (설정에서 활성화된 경우)
             if self.config['visualization']['enabled']:
                 logger.info("결과를 시각화합니다...")
-                self.visualizer.visualize_results(self.network, input_data)
+                with _profiler.stage('visualize'):
+                    self.visualizer.visualize_results(self.network, input_data)
             
             elapsed_time = time.time() - start_time
             logger.info(f"모델 실행이 완료되었습니다. 소요 시간: {elapsed_time:.2f}초")
             logger.info(f"결과 파일: {result_file}")
+            self._write_profile()
             
             return True
             
@@ -148,6 +158,10 @@ class PypsaHDModel:
             traceback.print_exc()
             return False
     
+    def _write_profile(self):
+        """단계별 시간/메모리 프로파일을 결과 디렉토리에 저장"""
+        _profiler.write_run(self.config['output_dir'], datetime.now().strftime("%Y%m%d_%H%M%S"))
+
     def get_network(self):
         """최적화된 네트워크 객체 반환"""
         return self.network
@@ -0,0 +1,724 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+최적화 전 공급 적정성/실행 가능성 사전 점검 모듈
+
+생성된 pypsa.Network를 솔버에 넘기기 전에 1초 이내로 점검하여, 처음부터 infeasible인
+모델에 솔버 시간을 쓰지 않도록 합니다. (diagnose_infeasibility.py, analyze_infeasible_causes.py,
+check_network_balance.py, analyze_infeasibility.py의 수동 점검을 대체)
+
+점검 항목:
+    1. 구조      - 공급 경로가 전혀 없는 부하 버스, 정의되지 않은 버스 참조, 효율 0 링크
+    2. 적정성    - 연결된 섬(같은 캐리어의 선로/링크로 연결된 버스 묶음)별 시간별
+                   가용 용량(p_max_pu × p_nom, 확장가능은 p_nom_max) vs 부하 (8760시간 행렬 연산)
+    3. 필수운전  - p_min_pu × p_nom 최소 출력이 부하 + 반출/저장 한도를 넘는 시간
+    4. 송전 한계 - 부족 위험 시간대에 버스 그래프 최대유량(max-flow)으로 지역간 송전 제약 확인
+    5. 변환 체인 - 전해조/히트펌프/CHP 등 변환 링크 용량 및 상류(전력) 버스에 걸리는 추가 부하
+
+심각도:
+    infeasible - 완화(낙관) 조건에서도 수요를 맞출 수 없음 → 솔버도 infeasible
+    likely     - 변환 체인 부하를 포함하면 부족 (추정치, infeasible 가능성 높음)
+    slack      - 슬랙/보강 발전기(_Slack_, _Fallback_Gen) 없이는 부족 (고비용 해)
+    warning    - 데이터 이상 (실행은 가능)
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components, maximum_flow, breadth_first_order
+
+SEVERITY_ORDER = {'infeasible': 0, 'likely': 1, 'slack': 2, 'warning': 3}
+
+# 슬랙/보강 발전기 이름 패턴 (create_network에서 추가)
+SLACK_PATTERN = r'_Slack_|_Fallback_Gen'
+
+# 최대유량 점검 시간 수 상한 및 용량 해상도(MW)
+MAX_FLOW_HOURS = 48
+FLOW_RESOLUTION = 0.1
+
+# 무한 용량 (확장 상한 없음, 저장소 등)
+_INF = 1e12
+
+# 부족 판정 허용오차 (MW)
+TOLERANCE = 1e-3
+
+
+class ScreenResult:
+    """사전 점검 결과"""
+
+    def __init__(self, findings, summary, elapsed):
+        self.findings = findings
+        self.summary = summary
+        self.elapsed = elapsed
+
+    @property
+    def infeasible(self):
+        """확실한 infeasible 원인이 있는지 여부"""
+        return bool((self.findings['severity'] == 'infeasible').any()) if not self.findings.empty else False
+
+    def counts(self):
+        if self.findings.empty:
+            return {}
+        return self.findings['severity'].value_counts().to_dict()
+
+    def print_report(self, top=15):
+        """순위별 원인 출력"""
+        print(f"\n=== 최적화 전 사전 점검 ({self.elapsed * 1000:.0f} ms) ===")
+        for key, value in self.summary.items():
+            print(f"- {key}: {value}")
+        if self.findings.empty:
+            print("문제가 발견되지 않았습니다.")
+            return
+        print(f"발견된 원인 {len(self.findings)}개 (상위 {min(top, len(self.findings))}개):")
+        for rank, row in self.findings.head(top).iterrows():
+            amount = []
+            if row['peak_shortfall_mw'] > 0:
+                amount.append(f"최대 {row['peak_shortfall_mw']:,.0f} MW")
+            if row['energy_mwh'] > 0:
+                amount.append(f"{row['energy_mwh']:,.0f} MWh")
+            if row['hours'] > 0:
+                amount.append(f"{int(row['hours'])}시간")
+            print(f"  {rank}. [{row['severity']}] {row['check']} - {row['location']} ({row['carrier']})"
+                  + (f": {', '.join(amount)}" if amount else ''))
+            print(f"     {row['detail']}")
+
+    def save(self, path):
+        """원인 목록 CSV 저장"""
+        self.findings.to_csv(path, encoding='utf-8-sig')
+        return path
+
+
+# ---------------------------------------------------------------------------
+# 입력 행렬 구성
+# ---------------------------------------------------------------------------
+
+def _dynamic(network, list_name, attr):
+    """시계열 속성: (정적 테이블 내 위치, T × K 값) 또는 None"""
+    static = getattr(network, list_name)
+    try:
+        dynamic = getattr(network, f'{list_name}_t', {})[attr]
+    except Exception:
+        return None
+    if dynamic is None or dynamic.empty:
+        return None
+    positions = static.index.get_indexer(dynamic.columns)
+    valid = positions >= 0
+    return positions[valid], dynamic.to_numpy(dtype=float)[:, valid]
+
+
+def _bus_sum(network, list_name, attr, default, scale, positions, n_buses, sign=1.0):
+    """버스별 Σ max(sign × 속성, 0) × scale (T × B)
+
+    정적 값만 가진 요소는 한 번에 합산하고 시계열이 있는 열만 곱하므로
+    발전기 수천 개 × 8760시간 밀집 행렬을 만들지 않습니다.
+    """
+    static = getattr(network, list_name)
+    T = len(network.snapshots)
+    valid = (positions >= 0) & (scale != 0)
+    dynamic = _dynamic(network, list_name, attr)
+    is_dynamic = np.zeros(len(static), dtype=bool)
+    if dynamic is not None:
+        is_dynamic[dynamic[0]] = True
+    per_unit = np.clip(sign * _numeric(static, attr, default), 0, None)
+    fixed = valid & ~is_dynamic
+    base = np.bincount(positions[fixed], weights=(per_unit * scale)[fixed], minlength=n_buses)
+    out = np.tile(base.astype(float), (T, 1))
+    if dynamic is not None:
+        columns, values = dynamic
+        keep = valid[columns]
+        columns = columns[keep]
+        if len(columns):
+            out += _to_bus(np.clip(sign * values[:, keep], 0, None) * scale[columns], positions[columns], n_buses)
+    return out
+
+
+def _dense(network, list_name, attr, default=1.0):
+    """시변/정적 속성을 스냅샷 × 요소 배열로 (정적 값을 채운 뒤 시계열 열만 덮어씀)"""
+    static = getattr(network, list_name)
+    T = len(network.snapshots)
+    values = np.empty((T, len(static)))
+    values[:] = _numeric(static, attr, default)
+    dynamic = _dynamic(network, list_name, attr)
+    if dynamic is not None:
+        values[:, dynamic[0]] = dynamic[1]
+    return values
+
+
+def _numeric(static, column, default=0.0):
+    if column in static.columns:
+        return pd.to_numeric(static[column], errors='coerce').fillna(default).to_numpy(dtype=float)
+    return np.full(len(static), default, dtype=float)
+
+
+def _flag(static, column):
+    if column in static.columns:
+        return static[column].fillna(False).astype(bool).to_numpy()
+    return np.zeros(len(static), dtype=bool)
+
+
+def _capacity_bounds(static, nom):
+    """(최대 용량, 최소 용량): 확장가능 요소는 nom_max/nom_min, 그 외는 nom"""
+    value = _numeric(static, nom)
+    extendable = _flag(static, f'{nom}_extendable')
+    nom_max = _numeric(static, f'{nom}_max', np.inf)
+    nom_min = _numeric(static, f'{nom}_min', 0.0)
+    upper = np.where(extendable, np.minimum(nom_max, _INF), value)
+    lower = np.where(extendable, nom_min, value)
+    return upper, lower
+
+
+def _bus_positions(buses, names):
+    """버스 이름 → 버스 위치 (-1: 정의되지 않은 버스)"""
+    return pd.Index(buses).get_indexer(pd.Index(names).astype(str))
+
+
+def _to_bus(values, positions, n_buses):
+    """T × N 값을 버스별로 합산 (T × B), 정의되지 않은 버스는 제외"""
+    valid = positions >= 0
+    # 버스 수가 작으므로 밀집 지시행렬 곱(BLAS)이 희소 행렬 곱보다 빠름
+    indicator = np.zeros((len(positions), n_buses))
+    indicator[np.flatnonzero(valid), positions[valid]] = 1.0
+    if values.size == 0:
+        return np.zeros((values.shape[0], n_buses))
+    return values @ indicator
+
+
+def _link_ports(links):
+    """링크 출력 포트 목록: [(포트 번호, 버스 열 이름, 효율 속성)]"""
+    ports = [(1, 'bus1', 'efficiency')]
+    k = 2
+    while f'bus{k}' in links.columns:
+        ports.append((k, f'bus{k}', f'efficiency{k}'))
+        k += 1
+    return ports
+
+
+def _build_model(network):
+    """점검용 버스/시간 행렬 구성"""
+    buses = pd.Index(network.buses.index.astype(str))
+    n_buses = len(buses)
+    snapshots = network.snapshots
+    T = len(snapshots)
+    labels = (network.buses['carrier'].astype(str).replace({'nan': ''}).to_numpy()
+              if 'carrier' in network.buses.columns else np.full(n_buses, 'AC', dtype=object))
+    carriers = np.array([label.lower() for label in labels], dtype=object)
+    weightings = network.snapshot_weightings
+    weights = weightings['generators' if 'generators' in weightings.columns else weightings.columns[0]].to_numpy(dtype=float)
+
+    model = {'buses': buses, 'carriers': carriers, 'carrier_labels': labels, 'T': T, 'weights': weights,
+             'snapshots': snapshots, 'dangling': []}
+
+    # 부하
+    loads = network.loads
+    load_pos = _bus_positions(buses, loads['bus']) if len(loads) else np.array([], dtype=int)
+    load_p = _dense(network, 'loads', 'p_set', 0.0)
+    if 'active' in loads.columns:
+        load_p = load_p * loads['active'].fillna(True).astype(bool).to_numpy()
+    model['load'] = _to_bus(load_p, load_pos, n_buses)
+    model['dangling'] += [('부하', name, bus) for name, bus, pos in zip(loads.index, loads['bus'], load_pos) if pos < 0]
+
+    # 발전기 (가용 용량, 필수운전 최소 출력, 슬랙 구분)
+    gens = network.generators
+    gen_pos = _bus_positions(buses, gens['bus']) if len(gens) else np.array([], dtype=int)
+    upper, lower = _capacity_bounds(gens, 'p_nom')
+    is_slack = np.asarray(pd.Index(gens.index.astype(str)).str.contains(SLACK_PATTERN, regex=True), dtype=bool)
+    if 'active' in gens.columns:
+        active = gens['active'].fillna(True).astype(bool).to_numpy()
+        upper, lower = upper * active, lower * active
+    model['supply'] = _bus_sum(network, 'generators', 'p_max_pu', 1.0, upper * ~is_slack, gen_pos, n_buses)
+    model['slack'] = _bus_sum(network, 'generators', 'p_max_pu', 1.0, upper * is_slack, gen_pos, n_buses)
+    # 기동/정지(committable) 발전기는 꺼질 수 있으므로 필수운전에서 제외
+    committable = _flag(gens, 'committable')
+    model['must_run'] = _bus_sum(network, 'generators', 'p_min_pu', 0.0, lower * ~is_slack * ~committable,
+                                 gen_pos, n_buses)
+    model['has_gen'] = np.bincount(gen_pos[gen_pos >= 0], minlength=n_buses) > 0
+    model['dangling'] += [('발전기', name, bus) for name, bus, pos in zip(gens.index, gens['bus'], gen_pos) if pos < 0]
+
+    # 저장장치(StorageUnit): 방전 용량은 공급, 충전 용량은 흡수
+    units = network.storage_units
+    if len(units):
+        unit_pos = _bus_positions(buses, units['bus'])
+        upper, _ = _capacity_bounds(units, 'p_nom')
+        discharge = np.clip(_dense(network, 'storage_units', 'p_max_pu', 1.0), 0, None) * upper
+        charge = np.clip(-_dense(network, 'storage_units', 'p_min_pu', -1.0), 0, None) * upper
+        model['supply'] += _to_bus(discharge, unit_pos, n_buses)
+        model['sink'] = _to_bus(charge, unit_pos, n_buses)
+        model['has_gen'] |= np.bincount(unit_pos[unit_pos >= 0], minlength=n_buses) > 0
+    else:
+        model['sink'] = np.zeros((T, n_buses))
+
+    # 저장소(Store): 출력 제한이 없으므로 버스 단위 무한 공급/흡수로 취급 (에너지 점검만 가능)
+    stores = network.stores
+    store_pos = _bus_positions(buses, stores['bus']) if len(stores) else np.array([], dtype=int)
+    model['has_store'] = np.bincount(store_pos[store_pos >= 0], minlength=n_buses) > 0
+    store_energy = np.zeros(n_buses)
+    if len(stores):
+        e_initial = _numeric(stores, 'e_initial') * ~_flag(stores, 'e_cyclic')
+        np.add.at(store_energy, store_pos[store_pos >= 0], e_initial[store_pos >= 0])
+    model['store_energy'] = store_energy
+
+    # 운송 간선 (선로 양방향, 같은 캐리어 링크) 과 변환 유입(다른 캐리어 링크 출력)
+    edges = []  # (from, to, 시간별 용량 T, 이름)
+    conversion = np.zeros((T, n_buses))
+    conversion_out = np.zeros((T, n_buses))
+    chains = []  # (링크, bus0 위치, 출력 버스 위치, 효율, 시간별 입력 용량)
+
+    lines = network.lines
+    if len(lines):
+        upper, _ = _capacity_bounds(lines, 's_nom')
+        s_max_pu = _dense(network, 'lines', 's_max_pu', 1.0)
+        cap = s_max_pu * upper
+        pos0, pos1 = _bus_positions(buses, lines['bus0']), _bus_positions(buses, lines['bus1'])
+        for k, name in enumerate(lines.index):
+            if pos0[k] >= 0 and pos1[k] >= 0:
+                edges.append((pos0[k], pos1[k], cap[:, k], str(name)))
+                edges.append((pos1[k], pos0[k], cap[:, k], str(name)))
+        model['dangling'] += [('선로', name, f"{b0}/{b1}") for name, b0, b1, p0, p1
+                              in zip(lines.index, lines['bus0'], lines['bus1'], pos0, pos1) if p0 < 0 or p1 < 0]
+
+    links = network.links
+    model['bad_links'] = []
+    if len(links):
+        upper, _ = _capacity_bounds(links, 'p_nom')
+        forward = np.clip(_dense(network, 'links', 'p_max_pu', 1.0), 0, None) * upper
+        backward = np.clip(-_dense(network, 'links', 'p_min_pu', 0.0), 0, None) * upper
+        pos0 = _bus_positions(buses, links['bus0'])
+        for port, bus_column, eff_attr in _link_ports(links):
+            bus_names = links[bus_column].astype(str).replace({'nan': '', 'None': ''})
+            used = (bus_names != '').to_numpy()
+            if not used.any():
+                continue
+            pos_k = _bus_positions(buses, bus_names)
+            eff = _dense(network, 'links', eff_attr, 1.0)
+            for k, name in enumerate(links.index):
+                if not used[k]:
+                    continue
+                if pos0[k] < 0 or pos_k[k] < 0:
+                    model['dangling'].append(('링크', name, f"{links['bus0'].iloc[k]}/{bus_names.iloc[k]}"))
+                    continue
+                eff_k = eff[:, k]
+                if port == 1 and np.nanmax(eff_k) <= 0:
+                    model['bad_links'].append(str(name))
+                    continue
+                if eff_k.min() < 0:
+                    # 음의 효율 포트는 입력(소비) 포트 → 공급으로 보지 않음
+                    continue
+                same_carrier = carriers[pos0[k]] == carriers[pos_k[k]]
+                if port == 1 and same_carrier:
+                    edges.append((pos0[k], pos_k[k], forward[:, k] * np.minimum(eff_k, 1.0), str(name)))
+                    if backward[:, k].any():
+                        edges.append((pos_k[k], pos0[k], backward[:, k], str(name)))
+                else:
+                    conversion[:, pos_k[k]] += forward[:, k] * eff_k
+                    chains.append((str(name), pos0[k], pos_k[k], eff_k, forward[:, k]))
+                    if port == 1:
+                        conversion_out[:, pos0[k]] += forward[:, k]
+
+    model['edges'] = edges
+    # 최대유량용 간선 배열 (시간별 용량 T × E)
+    model['edge_rows'] = np.array([e[0] for e in edges], dtype=np.int32)
+    model['edge_cols'] = np.array([e[1] for e in edges], dtype=np.int32)
+    model['edge_caps'] = np.column_stack([e[2] for e in edges]) if edges else np.zeros((T, 0))
+    model['edge_names'] = [e[3] for e in edges]
+    model['edge_carrier'] = {e[3]: labels[e[0]] for e in edges}
+    model['conversion'] = conversion
+    model['conversion_out'] = conversion_out
+    model['chains'] = chains
+    return model
+
+
+# ---------------------------------------------------------------------------
+# 점검
+# ---------------------------------------------------------------------------
+
+def _islands(model):
+    """운송 간선(용량 > 0)으로 연결된 버스 묶음"""
+    n_buses = len(model['buses'])
+    rows = [e[0] for e in model['edges'] if np.nanmax(e[2], initial=0) > 0]
+    cols = [e[1] for e in model['edges'] if np.nanmax(e[2], initial=0) > 0]
+    graph = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(n_buses, n_buses))
+    _, labels = connected_components(graph, directed=False)
+    return labels
+
+
+def _island_name(model, members):
+    regions = sorted({name.split('_')[0] for name in model['buses'][members]})
+    if len(members) == 1:
+        return model['buses'][members[0]]
+    if len(regions) > 4:
+        return f"{len(regions)}개 지역 ({len(members)}개 버스)"
+    return ', '.join(regions)
+
+
+def _finding(severity, check, carrier, location, detail, hours=0, peak=0.0, energy=0.0):
+    return {'severity': severity, 'check': check, 'carrier': carrier or 'AC', 'location': location,
+            'hours': int(hours), 'peak_shortfall_mw': float(peak), 'energy_mwh': float(energy), 'detail': detail}
+
+
+def _shortfall_stats(shortfall, weights):
+    positive = np.clip(shortfall, 0, None)
+    hit = positive > TOLERANCE
+    return int(hit.sum()), float(positive.max(initial=0.0)), float(weights @ positive)
+
+
+def _first_hour(model, shortfall):
+    return pd.Timestamp(model['snapshots'][int(np.argmax(shortfall))]).strftime('%m-%d %H시')
+
+
+def _check_structure(model):
+    findings = []
+    inbound = np.zeros(len(model['buses']), dtype=bool)
+    for source, target, cap, _ in model['edges']:
+        if np.nanmax(cap, initial=0) > 0:
+            inbound[target] = True
+    inbound |= model['conversion'].max(axis=0, initial=0) > 0
+    supplied = model['has_gen'] | model['has_store'] | inbound | (model['slack'].max(axis=0, initial=0) > 0)
+    peak_load = model['load'].max(axis=0, initial=0)
+    for b in np.flatnonzero((peak_load > TOLERANCE) & ~supplied):
+        hours, peak, energy = _shortfall_stats(model['load'][:, b], model['weights'])
+        findings.append(_finding('infeasible', '공급 경로 없음', model['carrier_labels'][b], model['buses'][b],
+                                 '부하가 있지만 발전기/저장장치/유입 선로·링크가 없습니다.', hours, peak, energy))
+    for kind, name, bus in model['dangling']:
+        findings.append(_finding('warning', '정의되지 않은 버스', '', str(name),
+                                 f"{kind} '{name}'이(가) 정의되지 않은 버스 '{bus}'를 참조합니다."))
+    for name in model['bad_links']:
+        findings.append(_finding('warning', '효율 0 링크', '', name, '효율이 0 이하여서 에너지를 전달하지 못합니다.'))
+    return findings
+
+
+def _island_balance(model, labels, extra_load=None):
+    """섬별 시간별 (수요, 공급(슬랙 제외), 슬랙, 필수운전, 흡수 한도) 집계 (T × 섬)"""
+    n_islands = labels.max() + 1 if len(labels) else 0
+    group = lambda values: _to_bus(values, labels, n_islands)  # noqa: E731
+    load = model['load'] if extra_load is None else model['load'] + extra_load
+    return {
+        'load': group(load),
+        'supply': group(model['supply'] + model['conversion']),
+        'slack': group(model['slack']),
+        'must_run': group(model['must_run']),
+        'absorb': group(np.clip(load, 0, None) + model['sink'] + model['conversion_out']),
+        'has_store': np.bincount(labels, weights=model['has_store'], minlength=n_islands) > 0,
+        'store_energy': np.bincount(labels, weights=model['store_energy'], minlength=n_islands),
+    }
+
+
+def _check_adequacy(model, labels):
+    """섬별 시간별 가용 용량 vs 부하, 필수운전 과잉"""
+    findings = []
+    balance = _island_balance(model, labels)
+    weights = model['weights']
+    for island in range(labels.max() + 1 if len(labels) else 0):
+        members = np.flatnonzero(labels == island)
+        load = balance['load'][:, island]
+        if load.max(initial=0) <= TOLERANCE and balance['must_run'][:, island].max(initial=0) <= TOLERANCE:
+            continue
+        carrier = model['carrier_labels'][members[0]]
+        location = _island_name(model, members)
+        supply = balance['supply'][:, island]
+        slack = balance['slack'][:, island]
+
+        if balance['has_store'][island]:
+            # 저장소는 출력 제한이 없으므로 연간 에너지로만 판정
+            total_need = float(weights @ load) - balance['store_energy'][island]
+            for severity, available, label in (('infeasible', supply + slack, '슬랙 포함'),
+                                               ('slack', supply, '슬랙 제외')):
+                gap = total_need - float(weights @ available)
+                if gap > TOLERANCE:
+                    findings.append(_finding(severity, '연간 에너지 부족', carrier, location,
+                                             f"저장소가 있는 섬의 연간 공급 가능량({label})이 수요보다 작습니다.",
+                                             0, 0.0, gap))
+                    break
+        else:
+            shortfall = load - supply - slack
+            hours, peak, energy = _shortfall_stats(shortfall, weights)
+            if hours:
+                findings.append(_finding('infeasible', '시간별 용량 부족', carrier, location,
+                                         f"슬랙 포함 가용 용량이 부하보다 작습니다 (최대 부족 {_first_hour(model, shortfall)}).",
+                                         hours, peak, energy))
+            else:
+                shortfall = load - supply
+                hours, peak, energy = _shortfall_stats(shortfall, weights)
+                if hours:
+                    findings.append(_finding('slack', '시간별 용량 부족', carrier, location,
+                                             f"슬랙/보강 발전기 없이는 부하를 맞출 수 없습니다 (최대 부족 {_first_hour(model, shortfall)}).",
+                                             hours, peak, energy))
+
+            excess = balance['must_run'][:, island] - balance['absorb'][:, island]
+            hours, peak, energy = _shortfall_stats(excess, weights)
+            if hours:
+                findings.append(_finding('infeasible', '필수운전 과잉', carrier, location,
+                                         f"p_min_pu 최소 출력이 부하 + 반출/충전 한도를 초과합니다 (최대 {_first_hour(model, excess)}).",
+                                         hours, peak, energy))
+    return findings
+
+
+def _select_hours(model, labels, limit, extra_load=None):
+    """최대유량 점검 시간 선택: 버스별 최대 국지 부족 시간 + 국지 부족 합계 최대 시간"""
+    local = model['load'] - model['supply'] - model['conversion'] - model['slack']
+    if extra_load is not None:
+        local = local + extra_load
+    local[:, model['has_store']] = -_INF
+    candidates = set()
+    deficit_buses = np.flatnonzero(local.max(axis=0, initial=-_INF) > TOLERANCE)
+    if len(deficit_buses) == 0:
+        return []
+    candidates.update(np.argmax(local[:, deficit_buses], axis=0).tolist())
+    stress = np.clip(local, 0, None).sum(axis=1)
+    order = np.argsort(-stress)
+    for t in order:
+        if len(candidates) >= limit or stress[t] <= TOLERANCE:
+            break
+        candidates.add(int(t))
+    return sorted(candidates)[:limit]
+
+
+def _max_flow_hour(model, t, include_slack, extra_load=None):
+    """t시간 버스 그래프 최대유량: (부족량, 병목 간선 이름 목록)"""
+    n = len(model['buses'])
+    source, sink = n, n + 1
+    load = model['load'][t] if extra_load is None else model['load'][t] + extra_load[t]
+    demand = np.clip(load, 0, None)
+    supply = model['supply'][t] + model['conversion'][t] + np.clip(-load, 0, None)
+    if include_slack:
+        supply = supply + model['slack'][t]
+    supply = np.where(model['has_store'], _INF, supply)
+
+    scale = 1.0 / FLOW_RESOLUTION
+    cap_limit = np.iinfo(np.int32).max // 64
+    edge_t = model['edge_caps'][t]
+    active = np.flatnonzero(edge_t > 0)
+    rows, cols = model['edge_rows'][active], model['edge_cols'][active]
+    # 낙관적 반올림 (공급/용량 올림, 수요 내림) → 부족 판정은 항상 보수적
+    edge_caps = np.minimum(np.ceil(edge_t[active] * scale), cap_limit)
+    supply_caps = np.minimum(np.ceil(supply * scale), cap_limit)
+    demand_caps = np.minimum(np.floor(demand * scale), cap_limit)
+    src_nodes = np.flatnonzero(supply_caps > 0)
+    dst_nodes = np.flatnonzero(demand_caps > 0)
+    all_rows = np.concatenate([rows, np.full(len(src_nodes), source), dst_nodes]).astype(np.int32)
+    all_cols = np.concatenate([cols, src_nodes, np.full(len(dst_nodes), sink)]).astype(np.int32)
+    all_caps = np.concatenate([edge_caps, supply_caps[src_nodes], demand_caps[dst_nodes]]).astype(np.int32)
+    graph = sparse.csr_matrix((all_caps, (all_rows, all_cols)), shape=(n + 2, n + 2))
+    result = maximum_flow(graph, source, sink)
+    shortfall = (demand_caps.sum() - result.flow_value) / scale
+    if shortfall <= TOLERANCE * 10:
+        return 0.0, []
+
+    # 최소 절단: 잔여 그래프에서 source로부터 도달 가능한 버스 → 도달 불가 버스로 가는 포화 간선
+    residual = (graph - result.flow).tocsr()
+    residual.data = np.where(residual.data > 0, residual.data, 0)
+    residual.eliminate_zeros()
+    reach = np.zeros(n + 2, dtype=bool)
+    reach[breadth_first_order(residual, source, directed=True, return_predecessors=False)] = True
+    crossing = reach[rows] & ~reach[cols]
+    cut = sorted({model['edge_names'][k] for k in active[crossing]})
+    return shortfall, cut
+
+
+def _check_transfer(model, labels, max_hours, extra_load=None, severity_override=None, skip_cuts=()):
+    """선택 시간대 최대유량으로 지역간 송전 한계 확인
+
+    Returns:
+        tuple: (원인 목록, 보고된 절단 간선 묶음 집합)
+    """
+    findings = []
+    hours = _select_hours(model, labels, max_hours, extra_load)
+    cuts = {}
+    for t in hours:
+        if severity_override:
+            # 심각도가 정해진 경우(변환 체인 추정) 슬랙 포함으로 한 번만 점검
+            shortfall, cut = _max_flow_hour(model, t, True, extra_load)
+            severity = severity_override
+        else:
+            # 슬랙 제외로 먼저 풀고, 부족할 때만 슬랙 포함으로 다시 풀어 심각도 판정
+            shortfall, cut = _max_flow_hour(model, t, False, extra_load)
+            if shortfall > 0:
+                with_slack, slack_cut = _max_flow_hour(model, t, True, extra_load)
+                severity = 'infeasible' if with_slack > 0 else 'slack'
+                if with_slack > 0:
+                    shortfall, cut = with_slack, slack_cut
+        if shortfall <= 0:
+            continue
+        key = (severity, tuple(cut))
+        entry = cuts.setdefault(key, {'hours': 0, 'peak': 0.0, 'energy': 0.0, 't': t})
+        entry['hours'] += 1
+        entry['energy'] += shortfall * model['weights'][t]
+        if shortfall > entry['peak']:
+            entry['peak'], entry['t'] = shortfall, t
+    reported = set()
+    for (severity, cut), entry in cuts.items():
+        if not cut or cut in skip_cuts:
+            # 간선 병목이 아닌 경우는 적정성 점검에서, 같은 절단은 앞 단계에서 이미 보고됨
+            continue
+        reported.add(cut)
+        when = pd.Timestamp(model['snapshots'][entry['t']]).strftime('%m-%d %H시')
+        shown = ', '.join(cut[:8]) + (f" 외 {len(cut) - 8}개" if len(cut) > 8 else '')
+        findings.append(_finding(severity, '송전 한계', model['edge_carrier'].get(cut[0]), f"선로 {len(cut)}개 절단",
+                                 f"최대유량 병목 선로/링크: {shown} (최대 부족 {when}, 점검 {len(hours)}시간 중)",
+                                 entry['hours'], entry['peak'], entry['energy']))
+    return findings, reported
+
+
+def _check_chains(model, labels):
+    """변환 링크(전해조, 히트펌프, CHP 등) 체인 점검
+
+    - 입력 버스 섬에 공급 수단이 전혀 없는 변환 링크 (하류 공급으로 계산하지 않음)
+    - 하류 섬의 부족분을 변환 링크로 채울 때 상류 섬(주로 전력)에 걸리는 추가 부하
+
+    Returns:
+        tuple: (원인 목록, 상류 버스 추가 부하 T × B 또는 None)
+    """
+    findings = []
+    if not model['chains']:
+        return findings, None
+    T, n = model['T'], len(model['buses'])
+    weights = model['weights']
+    base = _island_balance(model, labels)
+    n_islands = labels.max() + 1
+
+    # 입력 측 섬에 공급(발전/슬랙/변환 유입/저장소)이 전혀 없는 링크는 동작 불가
+    island_has_input = ((base['supply'] + base['slack']).max(axis=0) > TOLERANCE) | base['has_store']
+    live = []
+    for name, pos0, pos_k, eff, cap in model['chains']:
+        if island_has_input[labels[pos0]]:
+            live.append((name, pos0, pos_k, eff, cap))
+            continue
+        model['conversion'][:, pos_k] -= cap * eff
+        findings.append(_finding('warning', '변환 링크 입력 없음', model['carrier_labels'][pos0], name,
+                                 f"입력 버스 '{model['buses'][pos0]}' 쪽에 공급 수단이 없어 동작할 수 없습니다."))
+    if len(live) < len(model['chains']):
+        base = _island_balance(model, labels)
+
+    # 하류 섬 부족분 (변환 유입 제외, 저장소 섬은 연평균)
+    conversion_by_island = _to_bus(model['conversion'], labels, n_islands)
+    need = np.clip(base['load'] - (base['supply'] - conversion_by_island) - base['slack'], 0, None)
+    for island in np.flatnonzero(base['has_store']):
+        need[:, island] = weights @ need[:, island] / max(weights.sum(), 1.0)
+
+    by_island = {}
+    for name, pos0, pos_k, eff, cap in live:
+        by_island.setdefault(labels[pos_k], []).append((name, pos0, eff, cap))
+
+    # 필요 유입량을 링크 출력 용량 비율로 나누고 효율로 환산해 상류 버스 부하로 더함
+    extra_load = np.zeros((T, n))
+    for island, chain in by_island.items():
+        if need[:, island].max() <= TOLERANCE:
+            continue
+        effs = np.column_stack([eff for _, _, eff, _ in chain])
+        out_caps = np.column_stack([cap for _, _, _, cap in chain]) * effs
+        total_out = out_caps.sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            share = np.where(total_out[:, None] > 0, out_caps / total_out[:, None], 0.0)
+            delivered = np.minimum(need[:, island], total_out)[:, None] * share
+            draw = np.where(effs > 0, delivered / effs, 0.0)
+        for k, (_, pos0, _, _) in enumerate(chain):
+            extra_load[:, pos0] += draw[:, k]
+
+    if not extra_load.any():
+        return findings, None
+
+    # 변환 부하를 포함한 상류 섬 적정성 (추정치 → likely)
+    with_chain = _island_balance(model, labels, extra_load)
+    for island in range(n_islands):
+        if base['has_store'][island]:
+            continue
+        available = base['supply'][:, island] + base['slack'][:, island]
+        if (base['load'][:, island] - available > TOLERANCE).any():
+            continue
+        after = with_chain['load'][:, island] - available
+        hours, peak, energy = _shortfall_stats(after, weights)
+        if hours:
+            members = np.flatnonzero(labels == island)
+            consumers = sorted({name for name, pos0, _, _, _ in live if labels[pos0] == island})
+            shown = ', '.join(consumers[:5]) + (f" 외 {len(consumers) - 5}개" if len(consumers) > 5 else '')
+            extra = float(weights @ (with_chain['load'][:, island] - base['load'][:, island]))
+            findings.append(_finding('likely', '변환 체인 상류 부족', model['carrier_labels'][members[0]],
+                                     _island_name(model, members),
+                                     f"하류 수요를 위한 변환 링크({shown}) 입력 {extra:,.0f} MWh(추정)를 더하면 "
+                                     f"가용 용량이 부족합니다 (최대 부족 {_first_hour(model, after)}).",
+                                     hours, peak, energy))
+    return findings, extra_load
+
+
+def screen_network(network, max_flow_hours=None):
+    """최적화 전 사전 점검
+
+    Args:
+        network (pypsa.Network): 생성된(미최적화) 네트워크
+        max_flow_hours (int, optional): 최대유량 점검 시간 수 상한 (기본 MAX_FLOW_HOURS)
+
+    Returns:
+        ScreenResult: findings(심각도 순 DataFrame), summary, elapsed(초)
+    """
+    started = time.perf_counter()
+    max_flow_hours = MAX_FLOW_HOURS if max_flow_hours is None else int(max_flow_hours)
+
+    model = _build_model(network)
+    labels = _islands(model)
+
+    findings = _check_structure(model)
+    # 변환 체인을 먼저 점검해 동작할 수 없는 링크를 공급에서 제외
+    chain_findings, extra_load = _check_chains(model, labels)
+    findings += chain_findings
+    findings += _check_adequacy(model, labels)
+    transfer_findings, cuts = _check_transfer(model, labels, max_flow_hours)
+    findings += transfer_findings
+    if extra_load is not None:
+        findings += _check_transfer(model, labels, max_flow_hours, extra_load, severity_override='likely',
+                                    skip_cuts=cuts)[0]
+
+    columns = ['severity', 'check', 'carrier', 'location', 'hours', 'peak_shortfall_mw', 'energy_mwh', 'detail']
+    table = pd.DataFrame(findings, columns=columns)
+    if not table.empty:
+        # 공급 경로가 없는 버스는 용량 부족으로 중복 보고하지 않음
+        no_path = table.loc[table['check'] == '공급 경로 없음', 'location']
+        table = table[~((table['check'] == '시간별 용량 부족') & table['location'].isin(no_path))]
+        table = table.drop_duplicates(subset=['severity', 'check', 'location', 'detail'])
+        table['_order'] = table['severity'].map(SEVERITY_ORDER)
+        table = table.sort_values(['_order', 'energy_mwh', 'peak_shortfall_mw'],
+                                  ascending=[True, False, False]).drop(columns='_order')
+        table.index = pd.RangeIndex(1, len(table) + 1, name='rank')
+
+    weights = model['weights']
+    total_load = model['load'].sum(axis=1)
+    total_supply = (model['supply'] + model['conversion']).sum(axis=1)
+    summary = {
+        '버스/섬': f"{len(model['buses'])}개 / {labels.max() + 1 if len(labels) else 0}개",
+        '최대 부하(MW)': f"{total_load.max() if len(total_load) else 0:,.0f}",
+        '최소 가용 용량(MW, 슬랙 제외)': (f"{total_supply.min():,.0f}" if len(total_supply) and total_supply.min() < _INF
+                                     else '상한 없음 (확장 상한 없는 요소 포함)'),
+        '연간 부하(MWh)': f"{weights @ total_load:,.0f}",
+    }
+    return ScreenResult(table, summary, time.perf_counter() - started)
+
+
+def screen_input_file(input_file=None):
+    """통합 입력 Excel로 네트워크를 생성해 사전 점검 (기존 진단 스크립트 대체)
+
+    Args:
+        input_file (str, optional): 입력 파일 (기본 PyPSA_GUI.INPUT_FILE)
+
+    Returns:
+        ScreenResult: 점검 결과 (입력 로드 실패 시 None)
+    """
+    import os
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import PyPSA_GUI
+
+    input_data = PyPSA_GUI.read_input_data(input_file or PyPSA_GUI.INPUT_FILE)
+    if input_data is None:
+        return None
+    input_data = PyPSA_GUI.standardize_bus_names_in_input(input_data)
+    network = PyPSA_GUI.create_network(input_data)
+    return screen_network(network)
+
+
+if __name__ == '__main__':
+    import sys
+    result = screen_input_file(sys.argv[1] if len(sys.argv) > 1 else None)
+    if result is not None:
+        result.print_report(top=30)
+        sys.exit(1 if result.infeasible else 0)
@@ -16,9 +16,35 @@ from datetime import datetime
 import json
 import re
 
+from generation_metrics import compute_generation_metrics, normalize_carrier
+
+# 지연 로딩 결과 리더 (netCDF에서 필요한 변수만 읽음)
+try:
+    from result_reader import LazyResultReader
+except Exception:
+    LazyResultReader = None
+
+
+def find_result_nc(results_dir):
+    """결과 디렉토리의 optimization_result_*.nc 파일 경로 (없으면 None)"""
+    nc_files = sorted(glob.glob(os.path.join(results_dir, 'optimization_result_*.nc')))
+    return nc_files[-1] if nc_files else None
+
 
 def find_latest_results():
     """최신 결과 디렉토리를 찾습니다."""
+    # 실행 카탈로그(SQLite) 색인 조회 우선: results_multi/<timestamp>/<year> 폴더도 포함
+    try:
+        from run_catalog import RunCatalog, get_catalog_path
+        if os.path.exists(get_catalog_path()):
+            with RunCatalog() as catalog:
+                run = catalog.latest_run()
+            if run and run.get('results_dir') and os.path.isdir(run['results_dir']):
+                print(f"실행 카탈로그에서 최신 결과 디렉토리를 찾았습니다: {run['results_dir']}")
+                return run['results_dir']
+    except Exception as e:
+        print(f"실행 카탈로그 조회 경고: {str(e)}")
+
     results_dir = 'results'
     if not os.path.exists(results_dir):
         print(f"결과 디렉토리 '{results_dir}'를 찾을 수 없습니다.")
@@ -58,8 +84,23 @@ def find_latest_results():
         return None
 
 
-def load_generator_output(results_dir):
-    """발전기 출력 데이터를 로드합니다."""
+def load_generator_output(results_dir, names=None, month=None):
+    """발전기 출력 데이터를 로드합니다.
+
+    netCDF 결과가 있으면 요청한 발전기(names)/월(month)만 지연 로딩하고,
+    없으면 기존 CSV 파일 전체를 읽습니다.
+    """
+    nc_file = find_result_nc(results_dir)
+    if nc_file and LazyResultReader is not None:
+        try:
+            with LazyResultReader(nc_file) as reader:
+                gen_output = reader.series('generators', 'p', names=names, month=month)
+            if not gen_output.empty:
+                print(f"netCDF에서 발전기 출력 데이터를 로드했습니다. 크기: {gen_output.shape}")
+                return gen_output
+        except Exception as e:
+            print(f"netCDF 지연 로딩 경고: {str(e)} - CSV 파일로 대체")
+
     generator_output_file = os.path.join(results_dir, 'generators_output.csv')
     
     if not os.path.exists(generator_output_file):
@@ -91,10 +132,18 @@ def load_generator_info(results_dir):
         generator_info_file = os.path.join(results_dir, 'generators_info.csv')
         network_file = os.path.join(results_dir, 'network.csv')
         
+        nc_file = find_result_nc(results_dir)
+        
         if os.path.exists(generator_info_file):
             gen_info = pd.read_csv(generator_info_file)
             print(f"발전기 정보 데이터를 로드했습니다. 크기: {gen_info.shape}")
             return gen_info
+        elif nc_file and LazyResultReader is not None:
+            with LazyResultReader(nc_file) as reader:
+                gen_info = reader.static('generators', ['bus', 'carrier', 'p_nom', 'p_nom_opt', 'p_nom_extendable'])
+            gen_info = gen_info.rename_axis('name').reset_index()
+            print(f"netCDF에서 발전기 정보를 로드했습니다. 크기: {gen_info.shape}")
+            return gen_info
         elif os.path.exists(network_file):
             network = pd.read_csv(network_file)
             if 'Generator' in network['component'].values:
@@ -113,7 +162,9 @@ def infer_carrier_from_name(name):
     """발전기 이름에서 에너지원(carrier) 유형을 추론합니다."""
     name_lower = name.lower()
     
-    if 'pv' in name_lower or 'solar' in name_lower or '태양' in name_lower:
+    if 'slack' in name_lower or 'fallback' in name_lower or 'failsafe' in name_lower:
+        return 'slack'
+    elif 'pv' in name_lower or 'solar' in name_lower or '태양' in name_lower:
         return 'solar'
     elif 'wind' in name_lower or 'wt' in name_lower or '풍력' in name_lower:
         return 'wind'
@@ -121,7 +172,7 @@ def infer_carrier_from_name(name):
         return 'nuclear'
     elif 'coal' in name_lower or '석탄' in name_lower:
         return 'coal'
-    elif 'gas' in name_lower or '가스' in name_lower:
+    elif 'gas' in name_lower or 'lng' in name_lower or '가스' in name_lower:
         return 'gas'
     elif 'oil' in name_lower or '석유' in name_lower:
         return 'oil'
@@ -137,110 +188,79 @@ def infer_carrier_from_name(name):
         return 'unknown'
 
 
+def _generator_static(gen_output, gen_info=None):
+    """발전기 정보 테이블을 발전기명 인덱스의 정적 테이블로 변환 (출력 데이터에 있는 발전기만)"""
+    if gen_info is None or 'name' not in gen_info.columns:
+        return pd.DataFrame(index=pd.Index(gen_output.columns, name='name'))
+    static = gen_info.drop_duplicates('name').set_index('name')
+    return static.reindex(gen_output.columns)
+
+
 def analyze_renewable_capacity_factor(gen_output, gen_info=None):
     """재생에너지 발전기의 용량 사용률(Capacity Factor)을 분석합니다."""
     if gen_output is None:
         print("발전기 출력 데이터가 없어 용량 사용률을 계산할 수 없습니다.")
         return None
     
-    # 발전기 정보가 없는 경우 이름에서 유형 추론
+    # 캐리어 정보가 있으면 사용하고, 없으면 이름에서 유형 추론 (벡터화)
     renewable_carriers = ['solar', 'wind', 'hydro', 'biomass']
-    renewable_gens = []
-    
-    if gen_info is not None and 'carrier' in gen_info.columns:
-        for idx, row in gen_info.iterrows():
-            carrier = row.get('carrier', '').lower()
-            name = row.get('name', '')
-            
-            # 발전기 정보에서 캐리어가 있는 경우
-            if carrier in renewable_carriers:
-                renewable_gens.append(name)
-            # 캐리어 정보가 없는 경우 이름에서 추론
-            elif infer_carrier_from_name(name) in renewable_carriers:
-                renewable_gens.append(name)
-    else:
-        # 발전기 정보가 없는 경우 이름에서 유형 추론
-        for col in gen_output.columns:
-            if infer_carrier_from_name(col) in renewable_carriers:
-                renewable_gens.append(col)
+    static = _generator_static(gen_output, gen_info)
+    carriers = normalize_carrier(static.index, static['carrier'] if 'carrier' in static.columns else None)
+    renewable_mask = np.isin(carriers, renewable_carriers)
     
-    if not renewable_gens:
+    if not renewable_mask.any():
         print("재생에너지 발전기를 찾을 수 없습니다.")
         return None
     
-    print(f"{len(renewable_gens)}개의 재생에너지 발전기를 찾았습니다.")
+    print(f"{int(renewable_mask.sum())}개의 재생에너지 발전기를 찾았습니다.")
     
-    # 발전기 용량 정보 확인
-    gen_capacity = {}
-    if gen_info is not None and 'p_nom' in gen_info.columns and 'name' in gen_info.columns:
-        for _, row in gen_info.iterrows():
-            if row['name'] in gen_output.columns:
-                gen_capacity[row['name']] = row['p_nom']
+    renewable_static = static[renewable_mask]
+    renewable_output = gen_output[renewable_static.index]
+    has_capacity = ('p_nom' in renewable_static.columns) or ('p_nom_opt' in renewable_static.columns)
     
-    if not gen_capacity:
+    if not has_capacity:
         print("발전기 용량 정보가 없어 정확한 용량 사용률을 계산할 수 없습니다.")
         print("최대 출력값을 기준으로 상대적인 용량 사용률을 계산합니다.")
     
-    # 재생에너지 발전기별 용량 사용률 계산
-    capacity_factors = {}
-    total_renewable_output = 0
-    
-    for gen in renewable_gens:
-        if gen in gen_output.columns:
-            # 발전량 계산
-            output = gen_output[gen]
-            total_output = output.sum()
-            total_renewable_output += total_output
-            
-            # 발전기 용량
-            if gen in gen_capacity:
-                capacity = gen_capacity[gen]
-                # 용량 사용률 = 발전량 / (용량 * 시간)
-                time_hours = len(output)  # 시간 단위로 가정
-                max_possible_output = capacity * time_hours
-                cf = total_output / max_possible_output if max_possible_output > 0 else 0
-                capacity_factors[gen] = {
-                    'capacity': capacity,
-                    'total_output': total_output,
-                    'capacity_factor': cf,
-                    'avg_output': output.mean(),
-                    'max_output': output.max(),
-                    'carrier': infer_carrier_from_name(gen)
-                }
-            else:
-                # 용량 정보가 없는 경우 최대 출력을 용량으로 가정
-                max_output = output.max()
-                avg_output = output.mean()
-                relative_cf = avg_output / max_output if max_output > 0 else 0
-                capacity_factors[gen] = {
-                    'capacity': '알 수 없음',
-                    'total_output': total_output,
-                    'relative_capacity_factor': relative_cf,
-                    'avg_output': avg_output,
-                    'max_output': max_output,
-                    'carrier': infer_carrier_from_name(gen)
-                }
+    # 발전기별 지표를 한 번의 행렬 연산으로 계산
+    metrics = compute_generation_metrics(renewable_output, renewable_static, hourly_groups=False)['generators']
+    metrics = metrics.set_index('name')
+    metrics['carrier'] = carriers[renewable_mask]
+    metrics['avg_output'] = metrics['dispatched_mwh'] / len(renewable_output) if len(renewable_output) else 0.0
+    
+    if has_capacity:
+        table = pd.DataFrame({
+            'capacity': metrics['p_nom_opt'],
+            'total_output': metrics['dispatched_mwh'],
+            'capacity_factor': metrics['capacity_factor'].fillna(0.0),
+            'avg_output': metrics['avg_output'],
+            'max_output': metrics['max_output_mw'],
+            'carrier': metrics['carrier'],
+        })
+    else:
+        # 용량 정보가 없는 경우 최대 출력을 용량으로 가정
+        max_output = metrics['max_output_mw']
+        table = pd.DataFrame({
+            'capacity': '알 수 없음',
+            'total_output': metrics['dispatched_mwh'],
+            'relative_capacity_factor': np.where(max_output > 0, metrics['avg_output'] / max_output.where(max_output > 0, 1.0), 0.0),
+            'avg_output': metrics['avg_output'],
+            'max_output': max_output,
+            'carrier': metrics['carrier'],
+        })
+    capacity_factors = table.to_dict('index')
+    total_renewable_output = table['total_output'].sum()
     
     # 결과 요약
     print(f"\n재생에너지 발전 비중 분석 결과:")
     print(f"- 총 재생에너지 발전량: {total_renewable_output:.2f} MWh")
     
-    # 발전기별 용량 사용률 요약
-    carrier_output = {}
-    carrier_count = {}
-    
-    for gen, data in capacity_factors.items():
-        carrier = data['carrier']
-        if carrier not in carrier_output:
-            carrier_output[carrier] = 0
-            carrier_count[carrier] = 0
-        
-        carrier_output[carrier] += data['total_output']
-        carrier_count[carrier] += 1
+    # 에너지원별 발전량 요약
+    carrier_summary = table.groupby('carrier', sort=False)['total_output'].agg(['sum', 'size'])
     
     print("\n에너지원별 발전량:")
-    for carrier, output in carrier_output.items():
-        print(f"- {carrier}: {output:.2f} MWh ({carrier_count[carrier]}개 발전기)")
+    for carrier, row in carrier_summary.iterrows():
+        print(f"- {carrier}: {row['sum']:.2f} MWh ({int(row['size'])}개 발전기)")
     
     return capacity_factors
 
@@ -255,13 +275,12 @@ def analyze_renewable_patterns(gen_output, gen_info=None):
     renewable_carriers = ['solar', 'wind']
     renewable_gens = {}
     
-    # 발전기 이름으로 유형 추론
-    for col in gen_output.columns:
-        carrier = infer_carrier_from_name(col)
-        if carrier in renewable_carriers:
-            if carrier not in renewable_gens:
-                renewable_gens[carrier] = []
-            renewable_gens[carrier].append(col)
+    # 발전기 이름으로 유형 추론 (벡터화)
+    carriers = pd.Series(normalize_carrier(gen_output.columns), index=gen_output.columns)
+    for carrier in renewable_carriers:
+        gens = carriers.index[carriers == carrier].tolist()
+        if gens:
+            renewable_gens[carrier] = gens
     
     if not renewable_gens:
         print("재생에너지 발전기를 찾을 수 없습니다.")
@@ -330,126 +349,83 @@ def analyze_renewable_patterns(gen_output, gen_info=None):
             print("출력 데이터의 인덱스가 시간 형식이 아니므로 시간별 패턴을 분석할 수 없습니다.")
 
 
+def _classify_generators(names, carriers):
+    """발전기 분류: 'virtual'(가상), 'renewable'(태양광/풍력), 'conventional'(기타) (벡터화)"""
+    names = pd.Series(pd.Index(names).astype(str))
+    carriers = pd.Series(carriers).fillna('').astype(str).str.lower().reset_index(drop=True)
+    lower = names.str.lower()
+    virtual = names.str.startswith('Virt_') | carriers.str.contains('virtual', regex=False)
+    renewable = (lower.str.contains(r'pv|solar|태양|wt|wind|풍력', regex=True) |
+                 carriers.str.contains(r'solar|wind', regex=True))
+    return np.where(virtual, 'virtual', np.where(renewable, 'renewable', 'conventional'))
+
+
 def analyze_expansion_results(gen_output, gen_info=None):
     """발전기 확장 결과를 분석합니다."""
     if gen_output is None or gen_info is None:
         print("발전기 출력 또는 정보 데이터가 없어 확장 결과를 분석할 수 없습니다.")
         return None
     
-    # 가상 발전기 및 재생에너지 발전기 식별
-    virtual_gens = []
-    renewable_gens = []
-    conventional_gens = []
+    # 가상 발전기 및 재생에너지 발전기 식별 (출력 데이터에 있는 발전기만)
+    info = gen_info[gen_info['name'].isin(gen_output.columns)].drop_duplicates('name')
+    carriers = info['carrier'] if 'carrier' in info.columns else pd.Series('', index=info.index)
+    categories = pd.Series(_classify_generators(info['name'], carriers), index=info['name'].to_numpy())
     
-    for idx, gen in gen_info.iterrows():
-        gen_name = gen.get('name', '')
-        if gen_name not in gen_output.columns:
-            continue
-            
-        carrier = gen.get('carrier', '').lower()
-        gen_name_lower = gen_name.lower()
-        
-        # 가상 발전기 확인
-        if gen_name.startswith('Virt_') or 'virtual' in carrier:
-            virtual_gens.append(gen_name)
-        # 재생에너지 발전기 확인
-        elif ('pv' in gen_name_lower or 'solar' in gen_name_lower or 'solar' in carrier or '태양' in gen_name_lower or
-              'wt' in gen_name_lower or 'wind' in gen_name_lower or 'wind' in carrier or '풍력' in gen_name_lower):
-            renewable_gens.append(gen_name)
-        else:
-            conventional_gens.append(gen_name)
+    virtual_gens = categories.index[categories == 'virtual'].tolist()
+    renewable_gens = categories.index[categories == 'renewable'].tolist()
+    conventional_gens = categories.index[categories == 'conventional'].tolist()
     
     print(f"\n발전기 확장 결과 분석:")
     print(f"- 가상 발전기: {len(virtual_gens)}개")
     print(f"- 재생에너지 발전기: {len(renewable_gens)}개")
     print(f"- 기타 발전기: {len(conventional_gens)}개")
     
-    # 발전량 분석
-    if gen_output is not None:
-        # 가상 발전기 사용량
-        virtual_output = gen_output[virtual_gens].sum().sum() if virtual_gens else 0
-        renewable_output = gen_output[renewable_gens].sum().sum() if renewable_gens else 0
-        conventional_output = gen_output[conventional_gens].sum().sum() if conventional_gens else 0
-        total_output = gen_output.sum().sum()
-        
-        print(f"\n발전량 분석:")
-        print(f"- 총 발전량: {total_output:.2f} MWh")
-        print(f"- 가상 발전기 발전량: {virtual_output:.2f} MWh ({(virtual_output/total_output*100):.2f}%)")
-        print(f"- 재생에너지 발전량: {renewable_output:.2f} MWh ({(renewable_output/total_output*100):.2f}%)")
-        print(f"- 기타 발전기 발전량: {conventional_output:.2f} MWh ({(conventional_output/total_output*100):.2f}%)")
-        
-        # 가상 발전기 상위 사용량
-        if virtual_gens and virtual_output > 0:
-            virtual_outputs = {}
-            for gen in virtual_gens:
-                if gen in gen_output.columns:
-                    virtual_outputs[gen] = gen_output[gen].sum()
-            
-            virtual_outputs = sorted(virtual_outputs.items(), key=lambda x: x[1], reverse=True)
-            print("\n가상 발전기 상위 사용량:")
-            for i, (gen, output) in enumerate(virtual_outputs[:10]):  # 상위 10개만
-                if output > 0:
-                    print(f"  {i+1}. {gen}: {output:.2f} MWh ({(output/virtual_output*100):.2f}%)")
-        
-        # 재생에너지 발전기 상위 사용량
-        if renewable_gens and renewable_output > 0:
-            renewable_outputs = {}
-            for gen in renewable_gens:
-                if gen in gen_output.columns:
-                    renewable_outputs[gen] = gen_output[gen].sum()
-            
-            renewable_outputs = sorted(renewable_outputs.items(), key=lambda x: x[1], reverse=True)
-            print("\n재생에너지 발전기 상위 사용량:")
-            for i, (gen, output) in enumerate(renewable_outputs[:10]):  # 상위 10개만
-                print(f"  {i+1}. {gen}: {output:.2f} MWh ({(output/renewable_output*100):.2f}%)")
-    
-    # 확장 결과 분석 (p_nom_opt - p_nom)
-    if gen_info is not None and 'p_nom' in gen_info.columns and 'p_nom_opt' in gen_info.columns:
-        # 확장된 발전기 수
-        expanded_gens = gen_info[gen_info['p_nom_opt'] > gen_info['p_nom']]
-        renewable_expanded = []
-        virtual_expanded = []
-        conventional_expanded = []
-        
-        for idx, gen in expanded_gens.iterrows():
-            gen_name = gen.get('name', '')
-            carrier = gen.get('carrier', '').lower()
-            gen_name_lower = gen_name.lower()
-            
-            # 가상 발전기 확인
-            if gen_name.startswith('Virt_') or 'virtual' in carrier:
-                virtual_expanded.append(gen_name)
-            # 재생에너지 발전기 확인
-            elif ('pv' in gen_name_lower or 'solar' in gen_name_lower or 'solar' in carrier or '태양' in gen_name_lower or
-                  'wt' in gen_name_lower or 'wind' in gen_name_lower or 'wind' in carrier or '풍력' in gen_name_lower):
-                renewable_expanded.append(gen_name)
-            else:
-                conventional_expanded.append(gen_name)
+    # 발전량 분석 (발전기별 합계 1회 계산 후 분류별 집계)
+    gen_totals = gen_output.sum()
+    virtual_output = gen_totals[virtual_gens].sum() if virtual_gens else 0
+    renewable_output = gen_totals[renewable_gens].sum() if renewable_gens else 0
+    conventional_output = gen_totals[conventional_gens].sum() if conventional_gens else 0
+    total_output = gen_totals.sum()
+    
+    print(f"\n발전량 분석:")
+    print(f"- 총 발전량: {total_output:.2f} MWh")
+    print(f"- 가상 발전기 발전량: {virtual_output:.2f} MWh ({(virtual_output/total_output*100):.2f}%)")
+    print(f"- 재생에너지 발전량: {renewable_output:.2f} MWh ({(renewable_output/total_output*100):.2f}%)")
+    print(f"- 기타 발전기 발전량: {conventional_output:.2f} MWh ({(conventional_output/total_output*100):.2f}%)")
+    
+    # 가상 발전기 상위 사용량
+    if virtual_gens and virtual_output > 0:
+        print("\n가상 발전기 상위 사용량:")
+        top_virtual = gen_totals[virtual_gens].sort_values(ascending=False).head(10)  # 상위 10개만
+        for i, (gen, output) in enumerate(top_virtual.items()):
+            if output > 0:
+                print(f"  {i+1}. {gen}: {output:.2f} MWh ({(output/virtual_output*100):.2f}%)")
+    
+    # 재생에너지 발전기 상위 사용량
+    if renewable_gens and renewable_output > 0:
+        print("\n재생에너지 발전기 상위 사용량:")
+        top_renewable = gen_totals[renewable_gens].sort_values(ascending=False).head(10)  # 상위 10개만
+        for i, (gen, output) in enumerate(top_renewable.items()):
+            print(f"  {i+1}. {gen}: {output:.2f} MWh ({(output/renewable_output*100):.2f}%)")
+    
+    # 확장 결과 분석 (p_nom_opt - p_nom, p_nom_min 대비 포함)
+    if 'p_nom' in info.columns and 'p_nom_opt' in info.columns:
+        static = info.set_index('name')
+        metrics = compute_generation_metrics(gen_output[static.index], static, hourly_groups=False)['generators']
+        metrics['type'] = categories.reindex(metrics['name']).to_numpy()
+        expanded = metrics[metrics['p_nom_opt'] > metrics['p_nom']].copy()
         
         print(f"\n확장된 발전기 분석:")
-        print(f"- 총 확장된 발전기: {len(expanded_gens)}개 중")
-        print(f"  - 가상 발전기: {len(virtual_expanded)}개")
-        print(f"  - 재생에너지 발전기: {len(renewable_expanded)}개")
-        print(f"  - 기타 발전기: {len(conventional_expanded)}개")
+        print(f"- 총 확장된 발전기: {len(expanded)}개 중")
+        print(f"  - 가상 발전기: {int((expanded['type'] == 'virtual').sum())}개")
+        print(f"  - 재생에너지 발전기: {int((expanded['type'] == 'renewable').sum())}개")
+        print(f"  - 기타 발전기: {int((expanded['type'] == 'conventional').sum())}개")
         
         # 확장 규모 분석
-        renewable_expansion = 0
-        virtual_expansion = 0
-        conventional_expansion = 0
-        
-        for idx, gen in expanded_gens.iterrows():
-            gen_name = gen.get('name', '')
-            p_nom = gen.get('p_nom', 0)
-            p_nom_opt = gen.get('p_nom_opt', 0)
-            expansion = p_nom_opt - p_nom
-            
-            if gen_name in virtual_gens:
-                virtual_expansion += expansion
-            elif gen_name in renewable_gens:
-                renewable_expansion += expansion
-            else:
-                conventional_expansion += expansion
-        
+        expansion_by_type = expanded.groupby('type')['expansion_mw'].sum()
+        virtual_expansion = expansion_by_type.get('virtual', 0.0)
+        renewable_expansion = expansion_by_type.get('renewable', 0.0)
+        conventional_expansion = expansion_by_type.get('conventional', 0.0)
         total_expansion = renewable_expansion + virtual_expansion + conventional_expansion
         
         print(f"\n확장 규모 분석:")
@@ -460,42 +436,30 @@ def analyze_expansion_results(gen_output, gen_info=None):
             print(f"  - 기타 발전기 확장: {conventional_expansion:.2f} MW ({(conventional_expansion/total_expansion*100):.2f}%)")
         
         # 상위 확장된 발전기 출력
-        if len(expanded_gens) > 0:
-            expansion_data = []
-            for idx, gen in expanded_gens.iterrows():
-                gen_name = gen.get('name', '')
-                p_nom = gen.get('p_nom', 0)
-                p_nom_opt = gen.get('p_nom_opt', 0)
-                expansion = p_nom_opt - p_nom
-                expansion_ratio = expansion / p_nom if p_nom > 0 else float('inf')
-                
-                gen_type = "가상" if gen_name in virtual_gens else "재생" if gen_name in renewable_gens else "기타"
-                
-                expansion_data.append({
-                    'name': gen_name,
-                    'type': gen_type,
-                    'p_nom': p_nom,
-                    'p_nom_opt': p_nom_opt,
-                    'expansion': expansion,
-                    'expansion_ratio': expansion_ratio
-                })
+        if len(expanded) > 0:
+            type_label = {'virtual': '가상', 'renewable': '재생', 'conventional': '기타'}
+            expanded['type_label'] = expanded['type'].map(type_label)
+            expanded['expansion_ratio'] = np.where(expanded['p_nom'] > 0,
+                                                   expanded['expansion_mw'] / expanded['p_nom'].where(expanded['p_nom'] > 0, 1.0),
+                                                   float('inf'))
             
-            # 확장 규모 기준으로 정렬
-            expansion_data.sort(key=lambda x: x['expansion'], reverse=True)
+            def _print_rows(rows):
+                for i, (_, data) in enumerate(rows.iterrows()):
+                    print(f"  {i+1}. {data['name']} ({data['type_label']}): {data['p_nom']:.2f} MW → {data['p_nom_opt']:.2f} MW " +
+                          f"(+{data['expansion_mw']:.2f} MW, {(data['expansion_ratio']*100):.2f}% 증가)")
             
+            # 확장 규모 기준으로 정렬
             print("\n상위 확장된 발전기(확장 규모 기준):")
-            for i, data in enumerate(expansion_data[:10]):  # 상위 10개만
-                print(f"  {i+1}. {data['name']} ({data['type']}): {data['p_nom']:.2f} MW → {data['p_nom_opt']:.2f} MW " +
-                      f"(+{data['expansion']:.2f} MW, {(data['expansion_ratio']*100):.2f}% 증가)")
-            
-            # 확장 비율 기준으로 정렬
-            expansion_data.sort(key=lambda x: x['expansion_ratio'], reverse=True)
+            _print_rows(expanded.sort_values('expansion_mw', ascending=False).head(10))  # 상위 10개만
             
+            # 확장 비율 기준으로 정렬 (0으로 나누기 방지)
             print("\n상위 확장된 발전기(확장 비율 기준):")
-            for i, data in enumerate(expansion_data[:10]):  # 상위 10개만
-                if data['p_nom'] > 0:  # 0으로 나누기 방지
-                    print(f"  {i+1}. {data['name']} ({data['type']}): {data['p_nom']:.2f} MW → {data['p_nom_opt']:.2f} MW " +
-                          f"(+{data['expansion']:.2f} MW, {(data['expansion_ratio']*100):.2f}% 증가)")
+            _print_rows(expanded[expanded['p_nom'] > 0].sort_values('expansion_ratio', ascending=False).head(10))
+            
+            # p_nom_min 대비 확장 (최소 용량 제약에 걸린 발전기 확인용)
+            at_min = metrics[(metrics['p_nom_min'] > 0) & np.isclose(metrics['p_nom_opt'], metrics['p_nom_min'])]
+            if len(at_min) > 0:
+                print(f"\n최소 용량(p_nom_min)에 머문 발전기: {len(at_min)}개 ({at_min['p_nom_min'].sum():.2f} MW)")
     
     return {
         'virtual_gens': virtual_gens,
@@ -531,13 +495,9 @@ def analyze_generator_results():
     total_generation = gen_output.sum().sum()
     print(f"총 발전량: {total_generation:.2f} MWh")
     
-    # 발전기별 에너지원 추론
-    carrier_output = {}
-    for col in gen_output.columns:
-        carrier = infer_carrier_from_name(col)
-        if carrier not in carrier_output:
-            carrier_output[carrier] = 0
-        carrier_output[carrier] += gen_output[col].sum()
+    # 발전기별 에너지원 추론 (발전기별 합계 1회 계산 후 에너지원별 집계)
+    gen_totals = gen_output.sum()
+    carrier_output = gen_totals.groupby(normalize_carrier(gen_output.columns), sort=False).sum().to_dict()
     
     # 에너지원별 발전량 저장
     carrier_df = pd.DataFrame({
@@ -556,15 +516,8 @@ def analyze_generator_results():
     
     # 지역별 발전량 분석 - 발전기 이름에서 지역 추출
     region_pattern = r'([A-Za-z가-힣]+)_'  # 지역명_나머지 패턴 가정
-    region_output = {}
-    
-    for col in gen_output.columns:
-        match = re.match(region_pattern, col)
-        region = match.group(1) if match else "기타"
-        
-        if region not in region_output:
-            region_output[region] = 0
-        region_output[region] += gen_output[col].sum()
+    regions = pd.Series(gen_output.columns.astype(str)).str.extract('^' + region_pattern)[0].fillna("기타")
+    region_output = gen_totals.groupby(regions.to_numpy(), sort=False).sum().to_dict()
     
     # 지역별 발전량 저장
     region_df = pd.DataFrame({
@@ -16,6 +16,7 @@ import re
 from matplotlib import font_manager
 import sys
 import traceback
+from types import SimpleNamespace
 
 warnings.filterwarnings('ignore')
 
@@ -37,6 +38,69 @@ except Exception as e:
 # 결과 파일이 저장된 디렉토리
 RESULTS_DIR = 'results'
 
+# 특정 연도의 최신 실행을 분석하려면 ANALYSIS_YEAR 환경변수 지정 (예: 2030)
+ANALYSIS_YEAR = int(os.environ['ANALYSIS_YEAR']) if os.environ.get('ANALYSIS_YEAR', '').isdigit() else None
+
+# 실행 카탈로그(SQLite) 조회: results_multi/<timestamp>/<year> 등 모든 결과 폴더를 색인
+try:
+    from run_catalog import find_latest_artifact
+except Exception:
+    find_latest_artifact = None
+
+# glob 패턴 → 카탈로그 아티팩트 종류
+_PATTERN_TO_ARTIFACT = {
+    'optimization_result_*.nc': 'netcdf',
+    'optimization_result_*.xlsx': 'excel',
+    'optimization_result_*_generator_output.csv': 'generator_output',
+    'optimization_result_*_line_usage.csv': 'line_usage',
+    'optimization_result_*_load.csv': 'load',
+    'optimization_result_*_storage.csv': 'storage',
+}
+
+def _latest_from_catalog(pattern):
+    """실행 카탈로그에서 최신 결과 파일 조회 (없으면 None → glob 폴백)"""
+    kind = _PATTERN_TO_ARTIFACT.get(pattern)
+    if kind is None or find_latest_artifact is None:
+        return None
+    return find_latest_artifact(kind, year=ANALYSIS_YEAR)
+
+# 지연 로딩 결과 리더: netCDF에서 필요한 속성/시계열만 읽음 (없으면 pypsa.Network 전체 로드)
+try:
+    from result_reader import LazyResultReader
+except Exception:
+    LazyResultReader = None
+
+def load_network_tables(network_file, tables):
+    """네트워크 파일에서 필요한 구성요소의 정적 속성만 로드
+
+    Args:
+        network_file (str): optimization_result_*.nc 경로
+        tables (dict): {'generators': ['bus', 'carrier'], ...}
+
+    Returns:
+        SimpleNamespace: n.generators, n.lines 처럼 접근 가능한 속성 테이블 묶음
+    """
+    if LazyResultReader is not None:
+        try:
+            with LazyResultReader(network_file) as reader:
+                return SimpleNamespace(**{comp: reader.static(comp, attrs) for comp, attrs in tables.items()})
+        except Exception as e:
+            print(f"지연 로딩 경고: {str(e)} - 전체 네트워크 로드로 대체")
+    n = pypsa.Network(network_file)
+    return SimpleNamespace(**{comp: getattr(n, comp)[attrs] for comp, attrs in tables.items()})
+
+def load_series_totals(network_file, component, attr, absolute=False):
+    """netCDF 시계열의 구성요소별 연간 합계 (청크 단위 집계, 실패/미저장 시 None → CSV 폴백)"""
+    if LazyResultReader is None:
+        return None
+    try:
+        with LazyResultReader(network_file) as reader:
+            totals = reader.aggregate(component, attr, how='sum', absolute=absolute)
+        return totals if not totals.empty else None
+    except Exception as e:
+        print(f"지연 로딩 경고: {str(e)} - CSV 파일로 대체")
+        return None
+
 def get_latest_timestamp():
     """최신 타임스탬프 가져오기"""
     timestamp_file = os.path.join(RESULTS_DIR, "latest_timestamp.txt")
@@ -70,6 +134,11 @@ def get_results_dir():
 
 def get_latest_result_file(pattern='optimization_result_*.nc'):
     """최신 최적화 결과 파일 가져오기"""
+    # 실행 카탈로그 색인 조회 우선
+    catalog_file = _latest_from_catalog(pattern)
+    if catalog_file:
+        return catalog_file
+
     # 먼저 최신 결과 폴더에서 검색
     results_dir = get_results_dir()
     result_files = glob.glob(os.path.join(results_dir, pattern))
@@ -89,6 +158,11 @@ def get_latest_result_file(pattern='optimization_result_*.nc'):
 
 def get_latest_generator_output():
     """최신 발전기 출력 결과 파일 가져오기"""
+    # 실행 카탈로그 색인 조회 우선
+    catalog_file = _latest_from_catalog('optimization_result_*_generator_output.csv')
+    if catalog_file:
+        return catalog_file
+
     # 먼저 최신 결과 폴더에서 검색
     results_dir = get_results_dir()
     result_files = glob.glob(os.path.join(results_dir, 'optimization_result_*_generator_output.csv'))
@@ -108,6 +182,11 @@ def get_latest_generator_output():
 
 def get_latest_line_usage():
     """최신 라인 사용률 결과 파일 가져오기"""
+    # 실행 카탈로그 색인 조회 우선
+    catalog_file = _latest_from_catalog('optimization_result_*_line_usage.csv')
+    if catalog_file:
+        return catalog_file
+
     # 먼저 최신 결과 폴더에서 검색
     results_dir = get_results_dir()
     result_files = glob.glob(os.path.join(results_dir, 'optimization_result_*_line_usage.csv'))
@@ -127,6 +206,11 @@ def get_latest_line_usage():
 
 def get_latest_load_data():
     """최신 부하 데이터 파일 가져오기"""
+    # 실행 카탈로그 색인 조회 우선
+    catalog_file = _latest_from_catalog('optimization_result_*_load.csv')
+    if catalog_file:
+        return catalog_file
+
     # 먼저 최신 결과 폴더에서 검색
     results_dir = get_results_dir()
     result_files = glob.glob(os.path.join(results_dir, 'optimization_result_*_load.csv'))
@@ -181,17 +265,21 @@ def analyze_regional_energy_balance(output_dir=None):
         # 최신 네트워크 파일 로드
         network = get_latest_result_file()
         print(f"네트워크 파일 로드 중: {network}")
-        n = pypsa.Network(network)
-        
-        # 발전기 출력 데이터 로드
-        generator_output = get_latest_generator_output()
-        print(f"발전기 출력 파일 로드 중: {generator_output}")
-        generator_df = pd.read_csv(generator_output)
-        
-        # 부하 데이터 로드
-        load_data = get_latest_load_data()
-        print(f"부하 데이터 파일 로드 중: {load_data}")
-        load_df = pd.read_csv(load_data)
+        n = load_network_tables(network, {'buses': [], 'loads': ['bus'], 'generators': ['bus', 'carrier']})
+        
+        # 발전기 출력 합계 (netCDF 청크 집계 우선, 없으면 CSV)
+        generator_totals = load_series_totals(network, 'generators', 'p')
+        if generator_totals is None:
+            generator_output = get_latest_generator_output()
+            print(f"발전기 출력 파일 로드 중: {generator_output}")
+            generator_totals = pd.read_csv(generator_output, index_col=0).sum()
+        
+        # 부하 합계 (netCDF 청크 집계 우선, 없으면 CSV)
+        load_totals = load_series_totals(network, 'loads', 'p')
+        if load_totals is None:
+            load_data = get_latest_load_data()
+            print(f"부하 데이터 파일 로드 중: {load_data}")
+            load_totals = pd.read_csv(load_data, index_col=0).sum()
 
         # 결과를 저장할 디렉토리 설정
         if output_dir is None:
@@ -212,21 +300,23 @@ def analyze_regional_energy_balance(output_dir=None):
                 }
         
         # 부하 데이터 처리 (지역별 수요 계산)
-        for load in load_df.columns:
+        for load, load_sum in load_totals.items():
+            if load not in n.loads.index:
+                continue
             bus = n.loads.at[load, 'bus']
             region_code = extract_region_code(bus)
-            load_sum = load_df[load].sum()
+            regions.setdefault(region_code, {'demand': 0.0, 'generation': 0.0, 'renewable_gen': 0.0})
             regions[region_code]['demand'] += load_sum
         
         # 발전기 데이터 처리 (지역별 발전량 계산)
-        for gen in generator_df.columns:
+        for gen, generation in generator_totals.items():
             if gen not in n.generators.index:
                 continue  # 발전기가 네트워크에 없으면 건너뛰기
                 
             bus = n.generators.at[gen, 'bus']
             region_code = extract_region_code(bus)
             
-            generation = generator_df[gen].sum()
+            regions.setdefault(region_code, {'demand': 0.0, 'generation': 0.0, 'renewable_gen': 0.0})
             regions[region_code]['generation'] += generation
             
             # 재생에너지 발전량 집계
@@ -349,20 +439,22 @@ def analyze_transmission_flow(output_dir=None):
         # 최신 결과 파일 로드
         network_file = get_latest_result_file()
         print(f"네트워크 파일 로드 중: {network_file}")
-        network = pypsa.Network(network_file)
+        network = load_network_tables(network_file, {'lines': ['bus0', 'bus1']})
         
-        # 라인 사용률 데이터 로드
-        line_usage_file = get_latest_line_usage()
-        print(f"라인 사용률 파일 로드 중: {line_usage_file}")
-        line_usage = pd.read_csv(line_usage_file, index_col=0)
+        # 라인별 절대값 흐름 합계 (netCDF 청크 집계 우선, 없으면 라인 사용률 CSV)
+        line_totals = load_series_totals(network_file, 'lines', 'p0', absolute=True)
+        if line_totals is None:
+            line_usage_file = get_latest_line_usage()
+            print(f"라인 사용률 파일 로드 중: {line_usage_file}")
+            line_totals = pd.read_csv(line_usage_file, index_col=0).abs().sum()
         
         # 라인별 총 전력 흐름 계산
         line_flow_data = []
         
         for line in network.lines.index:
-            if line in line_usage.columns:
+            if line in line_totals.index:
                 # 절대값의 합 계산 (양방향 흐름의 총량)
-                total_flow = line_usage[line].abs().sum()
+                total_flow = line_totals[line]
                 
                 bus0 = network.lines.at[line, 'bus0']
                 bus1 = network.lines.at[line, 'bus1']
@@ -626,18 +718,20 @@ def analyze_generators_by_region_and_carrier(output_dir=None):
         # 최신 결과 파일 로드
         network_file = get_latest_result_file()
         print(f"발전기 분석: 네트워크 파일 로드 중: {network_file}")
-        network = pypsa.Network(network_file)
+        network = load_network_tables(network_file, {'generators': ['bus', 'carrier']})
         
-        # 발전기 출력 데이터 로드
-        gen_output_file = get_latest_generator_output()
-        print(f"발전기 분석: 발전기 출력 파일 로드 중: {gen_output_file}")
-        gen_output = pd.read_csv(gen_output_file, index_col=0)
+        # 발전기별 총 발전량 (netCDF 청크 집계 우선, 없으면 발전기 출력 CSV)
+        gen_totals = load_series_totals(network_file, 'generators', 'p')
+        if gen_totals is None:
+            gen_output_file = get_latest_generator_output()
+            print(f"발전기 분석: 발전기 출력 파일 로드 중: {gen_output_file}")
+            gen_totals = pd.read_csv(gen_output_file, index_col=0).sum()
         
         # 지역별 발전원별 발전량 분석
         region_carrier_data = []
         
         # 발전기별 총 발전량 계산
-        gen_total = {col: gen_output[col].sum() for col in gen_output.columns if col in network.generators.index}
+        gen_total = {gen: total for gen, total in gen_totals.items() if gen in network.generators.index}
         
         # 각 발전기에 대해 지역과 에너지원 확인
         for gen_name, total_output in gen_total.items():
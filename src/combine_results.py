@@ -54,14 +54,36 @@ print("주의: 파일 크기가 매우 클 수 있으므로 시간이 오래 걸
 # 최신 타임스탬프 (가장 최근 결과 파일의 타임스탬프)
 latest_timestamp = get_latest_timestamp()
 
+# 실행 카탈로그(SQLite)에 등록된 최신 실행이 있으면 그 산출물 경로를 그대로 사용
+# (results_multi/<timestamp>/<year> 처럼 results/<timestamp> 규칙을 벗어난 폴더도 처리)
+catalog_run = None
+try:
+    from run_catalog import RunCatalog, get_catalog_path
+    if os.path.exists(get_catalog_path()):
+        with RunCatalog() as _catalog:
+            catalog_run = _catalog.latest_run()
+        if catalog_run:
+            print(f"실행 카탈로그의 최신 실행 사용: {catalog_run['run_id']} ({catalog_run['results_dir']})")
+except Exception as e:
+    print(f"실행 카탈로그 조회 경고: {str(e)}")
+
+def resolve_result_file(kind, suffix):
+    """결과 파일 경로: 카탈로그 아티팩트 우선, 없으면 기존 results/<timestamp> 규칙"""
+    if catalog_run:
+        path = catalog_run['artifacts'].get(kind)
+        if path and os.path.exists(path):
+            return path
+    path = os.path.join('results', latest_timestamp, f'optimization_result_{latest_timestamp}_{suffix}')
+    if not os.path.exists(path):
+        path = os.path.join('results', f'optimization_result_{latest_timestamp}_{suffix}')
+    return path
+
 # Excel 작성기 생성
 with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
     
     # 1. 최신 결과 파일 처리 (results 폴더에서)
     # 1-1. 발전기 출력 데이터
-    generator_file = os.path.join('results', latest_timestamp, f'optimization_result_{latest_timestamp}_generator_output.csv')
-    if not os.path.exists(generator_file):
-        generator_file = os.path.join('results', f'optimization_result_{latest_timestamp}_generator_output.csv')
+    generator_file = resolve_result_file('generator_output', 'generator_output.csv')
     
     if os.path.exists(generator_file):
         print(f"\n파일 처리 중: {generator_file}")
@@ -74,9 +96,7 @@ with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
             print(f"  - 오류 발생: {str(e)}")
     
     # 1-2. 부하 데이터
-    load_file = os.path.join('results', latest_timestamp, f'optimization_result_{latest_timestamp}_load.csv')
-    if not os.path.exists(load_file):
-        load_file = os.path.join('results', f'optimization_result_{latest_timestamp}_load.csv')
+    load_file = resolve_result_file('load', 'load.csv')
     
     if os.path.exists(load_file):
         print(f"\n파일 처리 중: {load_file}")
@@ -89,9 +109,7 @@ with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
             print(f"  - 오류 발생: {str(e)}")
     
     # 1-3. 라인 사용률 데이터
-    line_file = os.path.join('results', latest_timestamp, f'optimization_result_{latest_timestamp}_line_usage.csv')
-    if not os.path.exists(line_file):
-        line_file = os.path.join('results', f'optimization_result_{latest_timestamp}_line_usage.csv')
+    line_file = resolve_result_file('line_usage', 'line_usage.csv')
     
     if os.path.exists(line_file):
         print(f"\n파일 처리 중: {line_file}")
@@ -104,9 +122,7 @@ with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
             print(f"  - 오류 발생: {str(e)}")
     
     # 1-4. 저장장치 데이터
-    storage_file = os.path.join('results', latest_timestamp, f'optimization_result_{latest_timestamp}_storage.csv')
-    if not os.path.exists(storage_file):
-        storage_file = os.path.join('results', f'optimization_result_{latest_timestamp}_storage.csv')
+    storage_file = resolve_result_file('storage', 'storage.csv')
     
     if os.path.exists(storage_file):
         print(f"\n파일 처리 중: {storage_file}")
@@ -148,10 +164,10 @@ with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
     
     # 각 분석 결과에 대한 파일 경로 패턴을 정의합니다
     analysis_file_patterns = [
-        {'name': '지역별_발전원별_발전량', 'sheet': '지역별_발전원별_발전량'},
-        {'name': '지역별_발전량', 'sheet': '지역별_발전량'},
-        {'name': '발전원별_발전량', 'sheet': '발전원별_발전량'},
-        {'name': '상위발전기_발전량', 'sheet': '상위발전기_발전량'}
+        {'name': '지역별_발전원별_발전량', 'sheet': '지역별_발전원별_발전량', 'kind': 'regional_generation_by_type'},
+        {'name': '지역별_발전량', 'sheet': '지역별_발전량', 'kind': 'regional_generation'},
+        {'name': '발전원별_발전량', 'sheet': '발전원별_발전량', 'kind': 'generation_by_type'},
+        {'name': '상위발전기_발전량', 'sheet': '상위발전기_발전량', 'kind': 'top_generators'}
     ]
     
     # 각 분석 결과 파일에 대해 처리
@@ -159,8 +175,10 @@ with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
         file_name = pattern['name']
         sheet_name = pattern['sheet']
         
-        # 타임스탬프 폴더 내의 파일 경로
-        file_path = os.path.join(results_dir, f'optimization_result_{analysis_timestamp}_{file_name}.csv')
+        # 타임스탬프 폴더 내의 파일 경로 (카탈로그 아티팩트 우선)
+        file_path = (catalog_run or {}).get('artifacts', {}).get(pattern['kind'])
+        if not file_path:
+            file_path = os.path.join(results_dir, f'optimization_result_{analysis_timestamp}_{file_name}.csv')
         
         if os.path.exists(file_path):
             print(f"\n파일 처리 중: {file_path}")
@@ -174,5 +192,19 @@ with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
         else:
             print(f"\n  - '{file_name}' 분석 결과 파일을 찾을 수 없습니다.")
 
+    # 5. 연도/실행 통합 결과 큐브가 있으면 연도별 용량 궤적과 연간 발전량 추가
+    try:
+        from results_cube import ResultsCube
+        cube = ResultsCube()
+        if cube.dataset('capacities') is not None:
+            print(f"\n결과 큐브 처리 중: {cube.root}")
+            trajectory = cube.capacity_trajectory(component='generators')
+            trajectory.to_excel(writer, sheet_name='Capacity_Trajectory')
+            totals = cube.annual_totals('dispatch', by=('run_group', 'year', 'carrier'))
+            totals.to_excel(writer, sheet_name='Annual_Dispatch', index=False)
+            print(f"  - 연도별 용량 궤적/연간 발전량 처리 완료 (연도 수: {len(trajectory)})")
+    except Exception as e:
+        print(f"  - 결과 큐브 처리 경고: {str(e)}")
+
 print(f"\n모든 데이터가 '{output_file}'에 통합되었습니다.")
 print(f"결과 파일이 '{results_dir}' 폴더에 저장되었습니다.") 
\ No newline at end of file
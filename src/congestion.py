@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+송전 혼잡 분석 모듈
+
+lines_t.p0 / links_t.p0를 (스냅샷 × 선로) 행렬로 한 번에 계산하여
+모든 송전선로와 지역 간 링크의 혼잡 지표를 산출합니다.
+
+지표:
+    - 한계 도달 시간 (이용률 ≥ 허용 기준)
+    - 이용률 백분위수 / 평균 / 최대
+    - 방향별 송전 에너지 (순방향, 역방향, 순 송전량)
+    - 혼잡 비용(congestion rent): 양단 한계가격 차이 × 흐름
+    - 이용률 지속곡선 (선로별 고정 개수 점으로 샘플링)
+
+결과는 작은 Parquet 테이블로 저장합니다.
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+# 한계 도달 판정 기준 (용량 대비 이용률)
+DEFAULT_LIMIT_TOLERANCE = 0.99
+DEFAULT_PERCENTILES = (50, 90, 95, 99)
+# 지속곡선 샘플 점 개수 (0%, 1%, ..., 100%)
+DEFAULT_DURATION_POINTS = 101
+
+
+def region_of(bus):
+    """버스 이름에서 지역 코드 추출 (예: SEL_EL → SEL)"""
+    bus = str(bus)
+    return bus.split('_')[0] if '_' in bus else bus
+
+
+def _branch_metrics(component, static, p0, p1=None, prices=None, weights=None,
+                    tolerance=DEFAULT_LIMIT_TOLERANCE, percentiles=DEFAULT_PERCENTILES,
+                    duration_points=DEFAULT_DURATION_POINTS):
+    """선로 묶음 하나에 대한 혼잡 지표 (행렬 연산 한 번)
+
+    Args:
+        component (str): 'lines' 또는 'links'
+        static (pd.DataFrame): 인덱스=선로명, 컬럼 bus0, bus1, capacity
+        p0 (pd.DataFrame): 스냅샷 × 선로 bus0 측 흐름
+        p1 (pd.DataFrame, optional): bus1 측 흐름 (없으면 -p0, 무손실 선로)
+        prices (pd.DataFrame, optional): 스냅샷 × 버스 한계가격
+        weights (np.ndarray, optional): 스냅샷 가중치 (시간)
+
+    Returns:
+        tuple: (summary DataFrame, duration DataFrame)
+    """
+    names = static.index
+    flows = p0.reindex(columns=names).to_numpy(dtype=np.float64, na_value=0.0)
+    n_steps = flows.shape[0]
+    w = np.ones(n_steps) if weights is None else np.asarray(weights, dtype=np.float64)
+    capacity = static['capacity'].to_numpy(dtype=np.float64)
+    safe_cap = np.where(capacity > 0, capacity, np.nan)
+
+    loading = np.abs(flows) / safe_cap
+    at_limit = loading >= tolerance
+    forward = np.clip(flows, 0.0, None)
+    reverse = np.clip(-flows, 0.0, None)
+
+    summary = pd.DataFrame({
+        'component': component,
+        'name': names,
+        'bus0': static['bus0'].to_numpy(),
+        'bus1': static['bus1'].to_numpy(),
+        'region0': [region_of(b) for b in static['bus0']],
+        'region1': [region_of(b) for b in static['bus1']],
+        'capacity_mw': capacity,
+        'hours_at_limit': w @ at_limit,
+        'hours_at_limit_forward': w @ (at_limit & (flows > 0)),
+        'hours_at_limit_reverse': w @ (at_limit & (flows < 0)),
+        'mean_loading': np.nanmean(loading, axis=0) if n_steps else np.nan,
+        'max_loading': np.nanmax(loading, axis=0) if n_steps else np.nan,
+        'energy_forward_mwh': w @ forward,
+        'energy_reverse_mwh': w @ reverse,
+    })
+    summary['energy_net_mwh'] = summary['energy_forward_mwh'] - summary['energy_reverse_mwh']
+    if n_steps:
+        pct = np.nanpercentile(loading, percentiles, axis=0)
+        for q, values in zip(percentiles, pct):
+            summary[f'p{q}_loading'] = values
+
+    # 혼잡 비용: -(p0·λ0 + p1·λ1) = 수신단 가격 × 수신 전력 - 송신단 가격 × 송신 전력
+    if prices is not None and not prices.empty:
+        lam0 = prices.reindex(columns=static['bus0']).to_numpy(dtype=np.float64, na_value=0.0)
+        lam1 = prices.reindex(columns=static['bus1']).to_numpy(dtype=np.float64, na_value=0.0)
+        if p1 is not None and not p1.empty:
+            flows1 = p1.reindex(columns=names).to_numpy(dtype=np.float64, na_value=0.0)
+        else:
+            flows1 = -flows
+        rent = -(flows * lam0 + flows1 * lam1)
+        summary['congestion_rent'] = w @ rent
+        summary['mean_price_spread'] = np.nanmean(lam1 - lam0, axis=0) if n_steps else np.nan
+    else:
+        summary['congestion_rent'] = np.nan
+        summary['mean_price_spread'] = np.nan
+
+    # 이용률 지속곡선: 선로별 내림차순 정렬 후 고정 점에서 샘플링
+    if n_steps and len(names):
+        ordered = -np.sort(-np.nan_to_num(loading, nan=0.0), axis=0)
+        fractions = np.linspace(0.0, 1.0, duration_points)
+        positions = np.minimum((fractions * (n_steps - 1)).round().astype(int), n_steps - 1)
+        sampled = ordered[positions, :]
+        duration = pd.DataFrame({
+            'component': component,
+            'name': np.tile(np.asarray(names, dtype=object), len(fractions)),
+            'duration_fraction': np.repeat(fractions, len(names)).astype(np.float32),
+            'loading': sampled.ravel().astype(np.float32),
+        })
+    else:
+        duration = pd.DataFrame(columns=['component', 'name', 'duration_fraction', 'loading'])
+    return summary, duration
+
+
+def _static_with_capacity(static, nom_attr, opt_attr, max_pu_attr):
+    """bus0, bus1, capacity(최적 용량 × 최대 출력비) 테이블"""
+    nom = pd.to_numeric(static[nom_attr], errors='coerce') if nom_attr in static.columns \
+        else pd.Series(np.nan, index=static.index)
+    if opt_attr in static.columns:
+        opt = pd.to_numeric(static[opt_attr], errors='coerce')
+        cap = opt.where(opt > 0, nom)
+    else:
+        cap = nom
+    if max_pu_attr in static.columns:
+        cap = cap * pd.to_numeric(static[max_pu_attr], errors='coerce').fillna(1.0)
+    return pd.DataFrame({'bus0': static['bus0'].astype(str), 'bus1': static['bus1'].astype(str),
+                         'capacity': cap.fillna(0.0)}, index=static.index)
+
+
+def _inter_regional(static):
+    """양단 지역 코드가 다른 항목만 선택"""
+    if static.empty:
+        return static
+    mask = [region_of(b0) != region_of(b1) for b0, b1 in zip(static['bus0'], static['bus1'])]
+    return static[mask]
+
+
+def compute_congestion(lines, links, lines_p0, links_p0, links_p1=None, prices=None, weights=None,
+                       tolerance=DEFAULT_LIMIT_TOLERANCE, percentiles=DEFAULT_PERCENTILES,
+                       duration_points=DEFAULT_DURATION_POINTS):
+    """선로 + 지역 간 링크 혼잡 지표 계산 (정적 테이블/시계열 입력)
+
+    Returns:
+        dict: {'summary': DataFrame, 'duration': DataFrame}
+    """
+    summaries, durations = [], []
+    line_static = _static_with_capacity(lines, 's_nom', 's_nom_opt', 's_max_pu') if lines is not None and not lines.empty else None
+    if line_static is not None and lines_p0 is not None:
+        s, d = _branch_metrics('lines', line_static, lines_p0, None, prices, weights,
+                               tolerance, percentiles, duration_points)
+        summaries.append(s)
+        durations.append(d)
+    link_static = _static_with_capacity(links, 'p_nom', 'p_nom_opt', 'p_max_pu') if links is not None and not links.empty else None
+    if link_static is not None:
+        link_static = _inter_regional(link_static)
+    if link_static is not None and not link_static.empty and links_p0 is not None:
+        s, d = _branch_metrics('links', link_static, links_p0, links_p1, prices, weights,
+                               tolerance, percentiles, duration_points)
+        summaries.append(s)
+        durations.append(d)
+    summary = pd.concat(summaries, ignore_index=True) if summaries else pd.DataFrame()
+    duration = pd.concat(durations, ignore_index=True) if durations else pd.DataFrame()
+    if not summary.empty:
+        summary = summary.sort_values(['hours_at_limit', 'congestion_rent'], ascending=False, ignore_index=True)
+    return {'summary': summary, 'duration': duration}
+
+
+def _weights_of(network):
+    """스냅샷 가중치 (없으면 1시간)"""
+    try:
+        return network.snapshot_weightings['generators'].to_numpy(dtype=np.float64)
+    except Exception:
+        return np.ones(len(network.snapshots))
+
+
+def analyze_network(network, **kwargs):
+    """최적화된 pypsa.Network에서 혼잡 지표 계산"""
+    prices = getattr(network.buses_t, 'marginal_price', None)
+    links_t = network.links_t
+    return compute_congestion(
+        network.lines, network.links,
+        network.lines_t.p0 if not network.lines_t.p0.empty else None,
+        links_t.p0 if not links_t.p0.empty else None,
+        links_t.p1 if not links_t.p1.empty else None,
+        prices, _weights_of(network), **kwargs)
+
+
+def analyze_netcdf(path, **kwargs):
+    """저장된 .nc 결과에서 필요한 변수만 지연 로딩하여 혼잡 지표 계산"""
+    from result_reader import LazyResultReader
+    with LazyResultReader(path) as reader:
+        lines = reader.static('lines', ['bus0', 'bus1', 's_nom', 's_nom_opt', 's_max_pu'])
+        links = reader.static('links', ['bus0', 'bus1', 'p_nom', 'p_nom_opt', 'p_max_pu'])
+        links = _inter_regional(links.dropna(subset=['bus0', 'bus1'])) if not links.empty else links
+        link_names = list(links.index) if not links.empty else []
+        lines_p0 = reader.series('lines', 'p0')
+        links_p0 = reader.series('links', 'p0', names=link_names) if link_names else None
+        links_p1 = reader.series('links', 'p1', names=link_names) if link_names else None
+        prices = reader.series('buses', 'marginal_price')
+        weights = None
+        if 'snapshots_generators' in reader.ds:
+            weights = reader.ds['snapshots_generators'].values
+    # 기본값이라 저장되지 않은 속성 보정
+    if not lines.empty:
+        lines['s_max_pu'] = lines['s_max_pu'].fillna(1.0)
+    if not links.empty:
+        links['p_max_pu'] = links['p_max_pu'].fillna(1.0)
+    return compute_congestion(lines, links, lines_p0 if not lines_p0.empty else None,
+                              links_p0, links_p1, prices, weights, **kwargs)
+
+
+def save_congestion_tables(tables, prefix, year=None):
+    """혼잡 지표를 Parquet으로 저장 (pyarrow 없으면 CSV)
+
+    Args:
+        tables (dict): compute_congestion 결과
+        prefix (str): 파일 경로 접두어 (예: results/<ts>/optimization_result_<ts>)
+        year (int, optional): 멀티년 결합을 위한 연도 컬럼
+
+    Returns:
+        dict: {'summary': 경로, 'duration': 경로}
+    """
+    paths = {}
+    for key, suffix in (('summary', 'congestion'), ('duration', 'loading_duration')):
+        df = tables.get(key)
+        if df is None or df.empty:
+            continue
+        df = df.copy()
+        if year is not None:
+            df['year'] = np.int32(year)
+        for col in ('component', 'name', 'bus0', 'bus1', 'region0', 'region1'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        try:
+            path = f"{prefix}_{suffix}.parquet"
+            df.to_parquet(path, index=False)
+        except Exception:
+            path = f"{prefix}_{suffix}.csv"
+            df.to_csv(path, index=False, encoding='utf-8-sig')
+        paths[key] = path
+    return paths
+
+
+def main():
+    """명령줄 진입점: .nc 결과 파일(여러 연도 가능)의 혼잡 지표 계산"""
+    parser = argparse.ArgumentParser(description='송전 혼잡 분석')
+    parser.add_argument('netcdf', nargs='+', help='optimization_result_*.nc 파일')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_LIMIT_TOLERANCE, help='한계 도달 이용률 기준')
+    parser.add_argument('--top', type=int, default=15, help='출력할 상위 선로 수')
+    args = parser.parse_args()
+
+    pd.set_option('display.width', 200)
+    for path in args.netcdf:
+        tables = analyze_netcdf(path, tolerance=args.tolerance)
+        prefix = path[:-3] if path.endswith('.nc') else path
+        paths = save_congestion_tables(tables, prefix)
+        print(f"\n[{path}] 저장: {', '.join(paths.values())}")
+        cols = ['component', 'name', 'region0', 'region1', 'capacity_mw', 'hours_at_limit',
+                'p95_loading', 'energy_net_mwh', 'congestion_rent']
+        summary = tables['summary']
+        if not summary.empty:
+            print(summary[[c for c in cols if c in summary.columns]].head(args.top).to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -9,9 +9,10 @@
 
 import pandas as pd
 import numpy as np
-import math
 import os
 
+from region_distance import get_distance_service
+
 # 한국 행정구역 정보
 KOREA_REGIONS = {
     'SEL': {
@@ -186,74 +187,40 @@ def calculate_distance(region_code1, region_code2):
     if region_code1 not in KOREA_REGIONS or region_code2 not in KOREA_REGIONS:
         return None
     
-    # 두 지역의 중심 좌표
-    lon1, lat1 = KOREA_REGIONS[region_code1]['center']
-    lon2, lat2 = KOREA_REGIONS[region_code2]['center']
-    
-    # 하버사인 공식
-    R = 6371.0  # 지구 반지름 (km)
-    
-    lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
-    lat2_rad = math.radians(lat2)
-    lon2_rad = math.radians(lon2)
-    
-    dlon = lon2_rad - lon1_rad
-    dlat = lat2_rad - lat1_rad
-    
-    a = math.sin(dlat / 2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2)**2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    
-    distance = R * c
+    distance = get_distance_service(KOREA_REGIONS).distance(region_code1, region_code2)
     return round(distance, 1)  # 소수점 첫째자리까지 반올림
 
 def create_lines_data():
     """지역 간 송전선 데이터 생성"""
-    lines_data = []
+    # 모든 인접 지역 쌍 (중복 방지: A-B와 B-A는 동일한 연결)
+    pairs = [(region1, region2)
+             for region1, adjacent_regions in ADJACENT_REGIONS.items()
+             for region2 in adjacent_regions
+             if region1 < region2]
     
-    # 모든 인접 지역 쌍에 대해 송전선 생성
-    for region1, adjacent_regions in ADJACENT_REGIONS.items():
-        for region2 in adjacent_regions:
-            # 중복 방지 (A-B와 B-A는 동일한 연결)
-            if region1 < region2:
-                distance = calculate_distance(region1, region2)
-                
-                # 송전선 데이터 생성
-                line_data = {
-                    'name': f"{region1}_{region2}",
-                    'region': region1,
-                    'bus0': f"{region1}_Main_EL",
-                    'bus1': f"{region2}_Main_EL",
-                    'carrier': 'AC',
-                    'x': round(0.0004 * distance, 5),  # 리액턴스 (거리에 비례)
-                    'r': round(0.0001 * distance, 5),  # 저항 (거리에 비례)
-                    'length': distance,
-                    's_nom': '',  # 공란으로 처리
-                    'v_nom': '',  # 공란으로 처리
-                    's_nom_extendable': True,  # 용량 확장 가능
-                    'capital_cost': 0.01 * distance  # 건설 비용 (거리에 비례)
-                }
-                lines_data.append(line_data)
+    # 제주도는 해저 케이블(DC)로 육지와 연결 (전남과 연결)
+    region0 = [p[0] for p in pairs] + ['JJD']
+    region1 = [p[1] for p in pairs] + ['JND']
+    carriers = ['AC'] * len(pairs) + ['DC']
     
-    # 제주도는 해저 케이블로 육지와 연결 (전남과 연결)
-    jeju_haenam_distance = calculate_distance('JJD', 'JND')
-    jeju_line = {
-        'name': "JJD_JND",
-        'region': 'JJD',
-        'bus0': "JJD_Main_EL",
-        'bus1': "JND_Main_EL",
-        'carrier': 'DC',  # 해저 케이블은 DC
-        'x': 0,  # DC는 리액턴스 없음
-        'r': round(0.0002 * jeju_haenam_distance, 5),  # DC 해저 케이블 저항
-        'length': jeju_haenam_distance,
-        's_nom': '',
-        'v_nom': '',
-        's_nom_extendable': True,
-        'capital_cost': 0.05 * jeju_haenam_distance  # 해저 케이블은 더 비쌈
-    }
-    lines_data.append(jeju_line)
+    # 거리/리액턴스/저항/건설비 일괄 계산 (거리는 소수점 첫째자리까지 반올림)
+    params = get_distance_service(KOREA_REGIONS).line_parameters(region0, region1, carrier=carriers, decimals=1)
     
-    return pd.DataFrame(lines_data)
+    lines_df = pd.DataFrame({
+        'name': params['region0'] + '_' + params['region1'],
+        'region': params['region0'],
+        'bus0': params['region0'] + '_Main_EL',
+        'bus1': params['region1'] + '_Main_EL',
+        'carrier': params['carrier'],
+        'x': params['x'].round(5),
+        'r': params['r'].round(5),
+        'length': params['length'],
+        's_nom': '',  # 공란으로 처리
+        'v_nom': '',  # 공란으로 처리
+        's_nom_extendable': True,  # 용량 확장 가능
+        'capital_cost': params['capital_cost']
+    })
+    return lines_df
 
 def add_lines_to_integrated_data():
     """송전선 데이터를 통합 데이터 파일에 추가"""
@@ -0,0 +1,611 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+정적 HTML 결과 대시보드 모듈
+
+최적화된 네트워크(또는 optimization_result_*.nc)에서 지역/기술/에너지원/선로 뷰를 가진
+단일 HTML 파일을 만듭니다. 외부 CDN이나 라이브러리 없이 오프라인에서 열립니다.
+
+시계열 저장 방식:
+    - 각 시계열은 한 번만 저장 (여러 차트가 같은 시계열을 공유)
+    - 줌 레벨별 min/max 피라미드 (버킷 1, 4, 16, 64 시간) → 화면 폭에 맞는 레벨만 그림
+    - uint16 양자화 + 델타 인코딩 + zlib 압축 후 base64 (브라우저 DecompressionStream으로 복원)
+    - 처음 보이는 탭의 시계열만 풀고 나머지는 탭/선택 시 지연 복원 → 1년 × 17개 지역도 즉시 열림
+
+사용 예:
+    build_dashboard(network, 'results/dashboard.html')
+    python src/dashboard.py results/optimization_result_20250101_000000.nc
+"""
+
+import os
+import sys
+import json
+import zlib
+import base64
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from generation_metrics import region_of, normalize_carrier
+
+# 줌 레벨 (min/max 버킷 크기, 1 = 원본 해상도)
+DEFAULT_LEVELS = (1, 4, 16, 64)
+
+# 전력 버스로 간주하는 캐리어
+ELECTRIC_CARRIERS = ('AC', 'DC', 'electricity', '')
+
+# 양자화 결측 표시값
+_NAN_CODE = 65535
+
+
+# ---------------------------------------------------------------------------
+# 입력 어댑터 (pypsa.Network 또는 netCDF 지연 리더)
+# ---------------------------------------------------------------------------
+
+class _NetworkSource:
+    """pypsa.Network 입력"""
+
+    def __init__(self, network):
+        self.network = network
+
+    @property
+    def snapshots(self):
+        snapshots = self.network.snapshots
+        if isinstance(snapshots, pd.MultiIndex):
+            snapshots = snapshots.get_level_values(-1)
+        return pd.DatetimeIndex(snapshots)
+
+    @property
+    def weights(self):
+        weightings = self.network.snapshot_weightings
+        column = 'generators' if 'generators' in weightings.columns else weightings.columns[0]
+        return weightings[column].to_numpy(dtype=float)
+
+    def static(self, component):
+        return getattr(self.network, component, pd.DataFrame())
+
+    def series(self, component, attr):
+        series = getattr(self.network, f'{component}_t', {})
+        try:
+            df = series[attr]
+        except Exception:
+            return pd.DataFrame()
+        return df if df is not None else pd.DataFrame()
+
+
+class _ReaderSource:
+    """result_reader.LazyResultReader 입력 (netCDF)"""
+
+    def __init__(self, reader):
+        self.reader = reader
+
+    @property
+    def snapshots(self):
+        return pd.DatetimeIndex(self.reader.snapshots)
+
+    @property
+    def weights(self):
+        ds = self.reader.ds
+        if 'snapshots_generators' in ds:
+            return np.asarray(ds['snapshots_generators'].values, dtype=float)
+        return np.ones(len(self.reader.snapshots))
+
+    def static(self, component):
+        return self.reader.static(component)
+
+    def series(self, component, attr):
+        return self.reader.series(component, attr)
+
+
+# ---------------------------------------------------------------------------
+# 시계열 인코딩
+# ---------------------------------------------------------------------------
+
+def _minmax_level(values, bucket):
+    """버킷 단위 min/max (마지막 버킷은 남은 값만)"""
+    n = len(values)
+    m = -(-n // bucket)
+    padded = np.full(m * bucket, np.nan)
+    padded[:n] = values
+    blocks = padded.reshape(m, bucket)
+    with np.errstate(all='ignore'):
+        import warnings
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return np.nanmin(blocks, axis=1), np.nanmax(blocks, axis=1)
+
+
+def _pack(raw, compress=True):
+    """바이트 → (zlib) → base64 문자열"""
+    if compress:
+        raw = zlib.compress(raw, 6)
+    return base64.b64encode(raw).decode('ascii')
+
+
+def encode_series(values, levels=DEFAULT_LEVELS, compress=True):
+    """시계열 하나를 줌 레벨 피라미드로 인코딩
+
+    레이아웃: [원본 n개] + 레벨별 [min m개, max m개] (m = ceil(n / 버킷))
+
+    Returns:
+        dict: {'lo': 최소값, 'scale': 양자화 간격, 'd': base64 데이터}
+    """
+    values = np.asarray(values, dtype=float)
+    parts = [values]
+    for bucket in levels:
+        if bucket > 1:
+            parts.extend(_minmax_level(values, bucket))
+    flat = np.concatenate(parts)
+
+    finite = np.isfinite(flat)
+    lo = float(flat[finite].min()) if finite.any() else 0.0
+    hi = float(flat[finite].max()) if finite.any() else 0.0
+    scale = (hi - lo) / (_NAN_CODE - 1) if hi > lo else 1.0
+
+    codes = np.full(len(flat), _NAN_CODE, dtype=np.int64)
+    codes[finite] = np.rint((flat[finite] - lo) / scale)
+    # 델타 인코딩 (uint16 순환) → 완만한 전력 시계열 압축률 향상
+    delta = (np.diff(codes, prepend=0) % 65536).astype('<u2')
+    return {'lo': lo, 'scale': scale, 'd': _pack(delta.tobytes(), compress)}
+
+
+class _SeriesStore:
+    """시계열 저장소 (같은 시계열은 한 번만 저장)"""
+
+    def __init__(self, levels, compress):
+        self.levels = levels
+        self.compress = compress
+        self.series = {}
+
+    def add(self, key, values):
+        if key not in self.series:
+            self.series[key] = encode_series(values, self.levels, self.compress)
+        return key
+
+
+# ---------------------------------------------------------------------------
+# 뷰 데이터 구성 (벡터화 집계)
+# ---------------------------------------------------------------------------
+
+def _group_sum(df, keys):
+    """T × N 시계열을 열 키별 합계 (T × K)"""
+    if df.empty:
+        return pd.DataFrame(index=df.index)
+    return df.T.groupby(np.asarray(keys)).sum().T
+
+
+def _column(static, column, default, index):
+    if column in static.columns:
+        return static[column].reindex(index)
+    return pd.Series(default, index=index)
+
+
+def _numeric_column(static, columns, index):
+    """여러 후보 컬럼 중 첫 번째 유효 값 (예: p_nom_opt → p_nom)"""
+    result = pd.Series(np.nan, index=index)
+    for column in columns:
+        if column in static.columns:
+            result = result.fillna(pd.to_numeric(static[column].reindex(index), errors='coerce'))
+    return result.fillna(0.0)
+
+
+def _bus_carrier(buses, bus_names):
+    """버스 이름 → 버스 캐리어 (없으면 AC)"""
+    carriers = buses['carrier'] if 'carrier' in buses.columns else pd.Series(dtype=object)
+    mapped = pd.Series(pd.Index(bus_names).astype(str)).map(carriers.astype(str))
+    return mapped.fillna('AC').replace({'nan': 'AC'}).to_numpy(dtype=object)
+
+
+def _weighted_sum(df, weights):
+    if df.empty:
+        return pd.Series(dtype=float)
+    return pd.Series(weights @ np.nan_to_num(df.to_numpy(dtype=float)), index=df.columns)
+
+
+def _build_payload(source, title, levels, compress, limit_tolerance=0.99):
+    """입력에서 대시보드 데이터(JSON 직렬화 가능) 생성"""
+    store = _SeriesStore(levels, compress)
+    snapshots = source.snapshots
+    weights = np.asarray(source.weights, dtype=float)
+    if len(weights) != len(snapshots):
+        weights = np.ones(len(snapshots))
+
+    buses = source.static('buses')
+    generators = source.static('generators')
+    loads = source.static('loads')
+    stores = source.static('stores')
+    lines = source.static('lines')
+    links = source.static('links')
+
+    # 발전기: 지역 × 기술
+    gen_p = source.series('generators', 'p')
+    gen_p = gen_p.reindex(columns=[c for c in gen_p.columns if c in generators.index]) if not gen_p.empty else gen_p
+    gen_bus = _column(generators, 'bus', '', gen_p.columns).astype(str)
+    gen_region = region_of(gen_bus)
+    gen_tech = normalize_carrier(gen_p.columns, _column(generators, 'carrier', None, gen_p.columns))
+    gen_bus_carrier = _bus_carrier(buses, gen_bus)
+    gen_capacity = _numeric_column(generators, ['p_nom_opt', 'p_nom'], gen_p.columns)
+
+    # 부하: 지역 × 버스 캐리어
+    load_p = source.series('loads', 'p')
+    if load_p.empty:
+        load_p = source.series('loads', 'p_set')
+    load_bus = _column(loads, 'bus', '', load_p.columns).astype(str)
+    load_region = region_of(load_bus)
+    load_bus_carrier = _bus_carrier(buses, load_bus)
+
+    # 한계가격: 지역 전력 버스 평균
+    prices = source.series('buses', 'marginal_price')
+    price_region = region_of(prices.columns) if not prices.empty else np.array([])
+    price_carrier = _bus_carrier(buses, prices.columns) if not prices.empty else np.array([])
+
+    electric = lambda carriers: np.isin(carriers, ELECTRIC_CARRIERS)  # noqa: E731
+    regions = sorted(set(gen_region) | set(load_region[electric(load_bus_carrier)]))
+
+    # --- 지역 뷰 ---
+    el_gen = gen_p.loc[:, electric(gen_bus_carrier)] if not gen_p.empty else gen_p
+    el_keys = [f"{r}|{t}" for r, t in zip(gen_region[electric(gen_bus_carrier)], gen_tech[electric(gen_bus_carrier)])]
+    region_tech = _group_sum(el_gen, el_keys)
+    el_load = load_p.loc[:, electric(load_bus_carrier)] if not load_p.empty else load_p
+    region_load = _group_sum(el_load, load_region[electric(load_bus_carrier)])
+    el_prices = prices.loc[:, electric(price_carrier)] if not prices.empty else prices
+    region_price = el_prices.T.groupby(price_region[electric(price_carrier)]).mean().T if not el_prices.empty else pd.DataFrame()
+
+    region_view = {'regions': regions, 'items': {}, 'table': []}
+    region_gen_total = _group_sum(el_gen, gen_region[electric(gen_bus_carrier)])
+    for region in regions:
+        techs = sorted(k.split('|', 1)[1] for k in region_tech.columns if k.split('|', 1)[0] == region)
+        item = {'gen': [{'name': t, 'sid': store.add(f"gen|{region}|{t}", region_tech[f"{region}|{t}"].to_numpy())}
+                        for t in techs]}
+        if region in region_load.columns:
+            item['load'] = store.add(f"load|{region}", region_load[region].to_numpy())
+        if region in region_price.columns:
+            item['price'] = store.add(f"price|{region}", region_price[region].to_numpy())
+        region_view['items'][region] = item
+
+        generation = float(weights @ region_gen_total[region].to_numpy()) if region in region_gen_total.columns else 0.0
+        demand = float(weights @ region_load[region].to_numpy()) if region in region_load.columns else 0.0
+        mean_price = float(np.nanmean(region_price[region].to_numpy())) if region in region_price.columns else None
+        region_view['table'].append({'지역': region, '발전량(MWh)': generation, '부하량(MWh)': demand,
+                                     '순수출(MWh)': generation - demand, '평균가격': mean_price})
+
+    # --- 기술 뷰 (전국, 전력) ---
+    tech_total = _group_sum(el_gen, gen_tech[electric(gen_bus_carrier)])
+    tech_energy = _weighted_sum(tech_total, weights)
+    tech_capacity = gen_capacity[electric(gen_bus_carrier)].groupby(gen_tech[electric(gen_bus_carrier)]).sum()
+    hours = float(weights.sum()) or 1.0
+    technology_view = {'series': [], 'table': []}
+    for tech in sorted(tech_total.columns, key=lambda t: -tech_energy.get(t, 0.0)):
+        technology_view['series'].append({'name': tech, 'sid': store.add(f"tech|{tech}", tech_total[tech].to_numpy())})
+        capacity = float(tech_capacity.get(tech, 0.0))
+        energy = float(tech_energy.get(tech, 0.0))
+        technology_view['table'].append({'기술': tech, '설비용량(MW)': capacity, '발전량(MWh)': energy,
+                                         '이용률(%)': energy / (capacity * hours) * 100 if capacity > 0 else None})
+
+    # --- 에너지원(버스 캐리어) 뷰 ---
+    store_e = source.series('stores', 'e')
+    store_bus_carrier = _bus_carrier(buses, _column(stores, 'bus', '', store_e.columns).astype(str)) if not store_e.empty else np.array([])
+    carrier_supply = _group_sum(gen_p, gen_bus_carrier)
+    # 변환 링크(전해조, 히트펌프 등) 유입량: -p1을 bus1 캐리어별로 합산
+    link_p1 = source.series('links', 'p1')
+    if not link_p1.empty and not links.empty:
+        link_p1 = link_p1.reindex(columns=[c for c in link_p1.columns if c in links.index])
+        link_bus1_carrier = _bus_carrier(buses, _column(links, 'bus1', '', link_p1.columns).astype(str))
+        carrier_conversion = _group_sum(-link_p1, link_bus1_carrier)
+    else:
+        carrier_conversion = pd.DataFrame()
+    carrier_load = _group_sum(load_p, load_bus_carrier)
+    carrier_store = _group_sum(store_e, store_bus_carrier)
+    carrier_price = prices.T.groupby(price_carrier).mean().T if not prices.empty else pd.DataFrame()
+    carriers = sorted(set(carrier_supply.columns) | set(carrier_load.columns) | set(carrier_store.columns))
+    carrier_view = {'carriers': carriers, 'items': {}, 'table': []}
+    for carrier in carriers:
+        item = {}
+        for key, frame in (('supply', carrier_supply), ('conversion', carrier_conversion), ('load', carrier_load),
+                           ('store', carrier_store), ('price', carrier_price)):
+            if carrier in frame.columns:
+                item[key] = store.add(f"carrier|{key}|{carrier}", frame[carrier].to_numpy())
+        carrier_view['items'][carrier] = item
+        carrier_view['table'].append({
+            '에너지원': carrier,
+            '공급(MWh)': float(weights @ carrier_supply[carrier].to_numpy()) if carrier in carrier_supply.columns else 0.0,
+            '변환유입(MWh)': float(weights @ carrier_conversion[carrier].to_numpy()) if carrier in carrier_conversion.columns else 0.0,
+            '수요(MWh)': float(weights @ carrier_load[carrier].to_numpy()) if carrier in carrier_load.columns else 0.0,
+            '최대저장(MWh)': float(np.nanmax(carrier_store[carrier].to_numpy())) if carrier in carrier_store.columns else None,
+        })
+
+    # --- 선로 뷰 (선로 + 지역간 링크) ---
+    line_items = []
+    for component, cap_columns in (('lines', ['s_nom_opt', 's_nom']), ('links', ['p_nom_opt', 'p_nom'])):
+        static = lines if component == 'lines' else links
+        flows = source.series(component, 'p0')
+        if flows.empty or static.empty:
+            continue
+        flows = flows.reindex(columns=[c for c in flows.columns if c in static.index])
+        bus0 = _column(static, 'bus0', '', flows.columns).astype(str)
+        bus1 = _column(static, 'bus1', '', flows.columns).astype(str)
+        region0, region1 = region_of(bus0), region_of(bus1)
+        if component == 'links':
+            keep = region0 != region1
+            flows, bus0, bus1 = flows.loc[:, keep], bus0[keep], bus1[keep]
+            region0, region1 = region0[keep], region1[keep]
+        capacity = _numeric_column(static, cap_columns, flows.columns).to_numpy()
+        values = flows.to_numpy(dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            loading = np.where(capacity > 0, np.abs(values) / capacity * 100, np.nan)
+        mean_loading = np.nanmean(loading, axis=0) if len(values) else np.zeros(len(capacity))
+        max_loading = np.nanmax(loading, axis=0) if len(values) else np.zeros(len(capacity))
+        hours_at_limit = weights @ (loading >= limit_tolerance * 100) if len(values) else np.zeros(len(capacity))
+        energy = weights @ np.abs(np.nan_to_num(values))
+        for k, name in enumerate(flows.columns):
+            line_items.append({
+                'name': str(name), 'kind': 'line' if component == 'lines' else 'link',
+                'from': str(region0[k]), 'to': str(region1[k]),
+                'cap': float(capacity[k]),
+                'sid': store.add(f"{component}|{name}", values[:, k]),
+                '평균이용률(%)': None if np.isnan(mean_loading[k]) else float(mean_loading[k]),
+                '최대이용률(%)': None if np.isnan(max_loading[k]) else float(max_loading[k]),
+                '한계도달시간(h)': float(hours_at_limit[k]),
+                '송전량(MWh)': float(energy[k]),
+            })
+    line_items.sort(key=lambda item: -(item['평균이용률(%)'] or 0.0))
+
+    times_ms = snapshots.as_unit('ms').asi8.astype('<f8') if len(snapshots) else np.array([], dtype='<f8')
+    return {
+        'title': title,
+        'created': datetime.now().strftime('%Y-%m-%d %H:%M'),
+        'n': int(len(snapshots)),
+        'levels': [int(b) for b in levels],
+        'nanCode': _NAN_CODE,
+        'compressed': bool(compress),
+        'times': _pack(times_ms.tobytes(), compress),
+        'series': store.series,
+        'views': {
+            'region': region_view,
+            'technology': technology_view,
+            'carrier': carrier_view,
+            'lines': {'items': line_items},
+        },
+    }
+
+
+def build_dashboard(source, output_path, title=None, levels=DEFAULT_LEVELS, compress=True):
+    """대시보드 HTML 생성
+
+    Args:
+        source: 최적화된 pypsa.Network, LazyResultReader 또는 .nc 파일 경로
+        output_path (str): 저장할 HTML 경로
+        title (str, optional): 제목
+        levels (tuple): min/max 줌 레벨 버킷 크기 (1 포함)
+        compress (bool): zlib 압축 여부 (끄면 구형 브라우저 호환, 파일 크기 증가)
+
+    Returns:
+        str: 저장된 HTML 경로
+    """
+    reader = None
+    if isinstance(source, str):
+        from result_reader import LazyResultReader
+        reader = LazyResultReader(source)
+        adapter = _ReaderSource(reader)
+        title = title or os.path.splitext(os.path.basename(source))[0]
+    elif hasattr(source, 'ds') and hasattr(source, 'series'):
+        adapter = _ReaderSource(source)
+    else:
+        adapter = _NetworkSource(source)
+    levels = tuple(sorted(set([1] + [int(b) for b in levels])))
+
+    try:
+        payload = _build_payload(adapter, title or 'PyPSA 결과 대시보드', levels, compress)
+    finally:
+        if reader is not None:
+            reader.close()
+
+    data = json.dumps(payload, ensure_ascii=False, separators=(',', ':'), allow_nan=False,
+                      default=lambda o: None)
+    # </script> 조기 종료 방지
+    data = data.replace('</', '<\\/')
+    html = _HTML_TEMPLATE.replace('__TITLE__', payload['title']).replace('/*__DATA__*/null', data)
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(html)
+    size_mb = os.path.getsize(output_path) / 1e6
+    print(f"대시보드 저장: {output_path} ({size_mb:.1f} MB, 시계열 {len(payload['series'])}개)")
+    return output_path
+
+
+_HTML_TEMPLATE = r"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>__TITLE__</title>
+<style>
+body{font-family:'Malgun Gothic','Apple SD Gothic Neo',sans-serif;margin:0;background:#f5f6f8;color:#222}
+header{background:#1f3a5f;color:#fff;padding:10px 18px;display:flex;align-items:baseline;gap:16px}
+header h1{font-size:18px;margin:0}header span{font-size:12px;opacity:.8}
+nav{display:flex;gap:4px;padding:8px 18px;background:#e4e8ee}
+nav button{border:0;background:#fff;padding:6px 14px;cursor:pointer;border-radius:4px}
+nav button.active{background:#1f3a5f;color:#fff}
+section{display:none;padding:12px 18px}section.active{display:block}
+.controls{margin-bottom:8px}select{padding:3px 6px}
+.chart{background:#fff;border:1px solid #d5d9e0;border-radius:4px;margin-bottom:10px;position:relative}
+.chart h3{font-size:13px;margin:6px 10px}
+.chart canvas{display:block;width:100%;height:260px;cursor:crosshair}
+.legend{font-size:12px;padding:0 10px 6px}.legend span{margin-right:10px;cursor:pointer;user-select:none}
+.legend span.off{opacity:.35}.legend i{display:inline-block;width:10px;height:10px;margin-right:3px}
+.tip{position:absolute;pointer-events:none;background:rgba(255,255,255,.95);border:1px solid #999;font-size:11px;padding:4px 6px;display:none;white-space:nowrap}
+table{border-collapse:collapse;background:#fff;font-size:12px;margin-bottom:12px}
+th,td{border:1px solid #d5d9e0;padding:3px 8px;text-align:right}th{background:#eef1f5;cursor:pointer}
+td:first-child,th:first-child{text-align:left}tr.sel{background:#fff5cc}tbody tr{cursor:pointer}
+.hint{font-size:11px;color:#666}.err{color:#b00;padding:18px}
+</style>
+</head>
+<body>
+<header><h1 id="title"></h1><span id="meta"></span></header>
+<nav id="tabs"></nav>
+<div id="root"></div>
+<script>
+const DATA=/*__DATA__*/null;
+const PALETTE=['#1f77b4','#ff7f0e','#2ca02c','#d62728','#9467bd','#8c564b','#e377c2','#7f7f7f','#bcbd22','#17becf','#393b79','#ad494a','#8ca252','#637939','#d6616b'];
+const KNOWN={solar:'#f2b701',pv:'#f2b701',wind:'#3a9bdc',onwind:'#3a9bdc',offwind:'#1b5e8c',nuclear:'#8e44ad',coal:'#4d4d4d',lng:'#e67e22',gas:'#e67e22',hydro:'#2e86c1',load:'#000000',price:'#c0392b'};
+function colorOf(name,i){const k=String(name).toLowerCase();return KNOWN[k]||PALETTE[i%PALETTE.length];}
+
+// ---- 데이터 복원 (지연, 캐시) ----
+function b64bytes(s){const b=atob(s);const u=new Uint8Array(b.length);for(let i=0;i<b.length;i++)u[i]=b.charCodeAt(i);return u;}
+async function inflate(s){
+  const bytes=b64bytes(s);
+  if(!DATA.compressed)return bytes.buffer;
+  if(typeof DecompressionStream==='undefined')throw new Error('이 브라우저는 DecompressionStream을 지원하지 않습니다. compress=False로 다시 생성하세요.');
+  const stream=new Blob([bytes]).stream().pipeThrough(new DecompressionStream('deflate'));
+  return await new Response(stream).arrayBuffer();
+}
+let TIMES=null;const CACHE={};
+async function times(){if(!TIMES)TIMES=new Float64Array(await inflate(DATA.times));return TIMES;}
+function series(sid){
+  if(!CACHE[sid])CACHE[sid]=(async()=>{
+    const meta=DATA.series[sid];const d=new Uint16Array(await inflate(meta.d));
+    const out=new Float64Array(d.length);let acc=0;
+    for(let i=0;i<d.length;i++){acc=(acc+d[i])&0xFFFF;out[i]=acc===DATA.nanCode?NaN:meta.lo+acc*meta.scale;}
+    const n=DATA.n;const lv={1:{min:out.subarray(0,n),max:out.subarray(0,n)}};let off=n;
+    for(const b of DATA.levels){if(b===1)continue;const m=Math.ceil(n/b);lv[b]={min:out.subarray(off,off+m),max:out.subarray(off+m,off+2*m)};off+=2*m;}
+    return lv;})();
+  return CACHE[sid];
+}
+function mapLevels(lv,f){const r={};for(const b in lv){r[b]={min:lv[b].min.map(f),max:lv[b].max.map(f)};
+  if(+b>1){for(let i=0;i<r[b].min.length;i++){const a=r[b].min[i],c=r[b].max[i];if(a>c){r[b].min[i]=c;r[b].max[i]=a;}}}}return r;}
+
+// ---- 캔버스 차트 (min/max 레벨 자동 선택, 드래그 확대, 휠 확대/축소, 더블클릭 초기화) ----
+function fmtNum(v){if(v===null||v===undefined||isNaN(v))return '-';const a=Math.abs(v);
+  if(a>=1e6)return (v/1e6).toFixed(2)+'M';if(a>=1e3)return (v/1e3).toFixed(1)+'k';return a>=10?v.toFixed(0):v.toFixed(2);}
+function pad(x){return String(x).padStart(2,'0');}
+function fmtTime(ms,span){const d=new Date(ms);
+  return span>90*864e5?`${d.getUTCFullYear()}-${pad(d.getUTCMonth()+1)}`:span>3*864e5?`${pad(d.getUTCMonth()+1)}-${pad(d.getUTCDate())}`:`${pad(d.getUTCMonth()+1)}-${pad(d.getUTCDate())} ${pad(d.getUTCHours())}시`;}
+// 스냅샷은 시간대 없는 시각 → UTC 기준으로 그대로 표시
+function fullTime(ms){return new Date(ms).toISOString().slice(0,16).replace('T',' ');}
+class Chart{
+  constructor(parent,title,unit){
+    this.box=document.createElement('div');this.box.className='chart';
+    this.box.innerHTML=`<h3>${title}${unit?` (${unit})`:''}</h3><canvas></canvas><div class="legend"></div><div class="tip"></div>`;
+    parent.appendChild(this.box);
+    this.canvas=this.box.querySelector('canvas');this.legend=this.box.querySelector('.legend');this.tip=this.box.querySelector('.tip');
+    this.traces=[];this.x0=0;this.x1=DATA.n;this.drag=null;this.bind();
+  }
+  async set(traces){
+    this.x0=0;this.x1=DATA.n;
+    const t=await times();this.t=t;
+    this.traces=await Promise.all(traces.map(async(tr,i)=>{let lv=await series(tr.sid);if(tr.map)lv=mapLevels(lv,tr.map);return {name:tr.name,color:tr.color||colorOf(tr.name,i),lv,on:true};}));
+    this.legend.innerHTML='';
+    this.traces.forEach(tr=>{const s=document.createElement('span');s.innerHTML=`<i style="background:${tr.color}"></i>${tr.name}`;
+      s.onclick=()=>{tr.on=!tr.on;s.classList.toggle('off',!tr.on);this.draw();};this.legend.appendChild(s);});
+    this.draw();
+  }
+  level(){const w=this.canvas.clientWidth||800;const span=this.x1-this.x0;
+    for(const b of DATA.levels){if(span/b<=w)return b;}return DATA.levels[DATA.levels.length-1];}
+  draw(){
+    const c=this.canvas,dpr=window.devicePixelRatio||1,W=c.clientWidth,H=c.clientHeight;
+    if(!W)return;c.width=W*dpr;c.height=H*dpr;const g=c.getContext('2d');g.setTransform(dpr,0,0,dpr,0,0);g.clearRect(0,0,W,H);
+    const L=60,R=10,T=8,B=24,pw=W-L-R,ph=H-T-B;this.plot={L,T,pw,ph};
+    const b=this.level(),i0=Math.floor(this.x0/b),i1=Math.min(Math.ceil(this.x1/b),Math.ceil(DATA.n/b));this.b=b;
+    let lo=Infinity,hi=-Infinity;
+    for(const tr of this.traces){if(!tr.on)continue;const m=tr.lv[b];for(let i=i0;i<i1;i++){const a=m.min[i],z=m.max[i];if(a<lo)lo=a;if(z>hi)hi=z;}}
+    if(!isFinite(lo)){lo=0;hi=1;}if(hi===lo){hi+=1;lo-=1;}const padY=(hi-lo)*0.05;lo-=padY;hi+=padY;this.lo=lo;this.hi=hi;
+    const X=i=>L+(i*b-this.x0)/(this.x1-this.x0)*pw,Y=v=>T+(hi-v)/(hi-lo)*ph;
+    g.strokeStyle='#e3e6ea';g.fillStyle='#555';g.font='11px sans-serif';g.lineWidth=1;
+    for(let k=0;k<=4;k++){const v=lo+(hi-lo)*k/4,y=Y(v);g.beginPath();g.moveTo(L,y);g.lineTo(L+pw,y);g.stroke();g.fillText(fmtNum(v),4,y+4);}
+    const t=this.t,span=t[Math.min(DATA.n-1,Math.floor(this.x1))]-t[Math.floor(this.x0)];
+    for(let k=0;k<=6;k++){const idx=Math.min(DATA.n-1,Math.floor(this.x0+(this.x1-this.x0)*k/6));g.fillText(fmtTime(t[idx],span),L+pw*k/6-20,H-6);}
+    g.save();g.beginPath();g.rect(L,T,pw,ph);g.clip();
+    for(const tr of this.traces){if(!tr.on)continue;const m=tr.lv[b];g.strokeStyle=tr.color;g.fillStyle=tr.color;
+      if(b===1){g.lineWidth=1.2;g.beginPath();let pen=false;for(let i=i0;i<i1;i++){const v=m.max[i];if(isNaN(v)){pen=false;continue;}
+        const x=X(i+0.5),y=Y(v);pen?g.lineTo(x,y):g.moveTo(x,y);pen=true;}g.stroke();}
+      else{g.globalAlpha=0.45;g.beginPath();for(let i=i0;i<i1;i++)g.lineTo(X(i+0.5),Y(m.max[i]));for(let i=i1-1;i>=i0;i--)g.lineTo(X(i+0.5),Y(m.min[i]));
+        g.closePath();g.fill();g.globalAlpha=1;g.lineWidth=0.8;g.stroke();}}
+    g.restore();
+    if(this.drag&&this.drag.x!==undefined){g.fillStyle='rgba(31,58,95,0.15)';g.fillRect(Math.min(this.drag.s,this.drag.x),T,Math.abs(this.drag.x-this.drag.s),ph);}
+  }
+  idx(px){const p=this.plot;return this.x0+(px-p.L)/p.pw*(this.x1-this.x0);}
+  bind(){
+    const c=this.canvas;
+    c.addEventListener('mousedown',e=>{this.drag={s:e.offsetX};});
+    c.addEventListener('mousemove',e=>{if(this.drag){this.drag.x=e.offsetX;this.draw();}this.hover(e);});
+    c.addEventListener('mouseup',e=>{if(this.drag&&Math.abs(e.offsetX-this.drag.s)>5){const a=this.idx(Math.min(e.offsetX,this.drag.s)),z=this.idx(Math.max(e.offsetX,this.drag.s));
+      this.x0=Math.max(0,a);this.x1=Math.min(DATA.n,Math.max(z,a+4));}this.drag=null;this.draw();});
+    c.addEventListener('mouseleave',()=>{this.tip.style.display='none';if(this.drag){this.drag=null;this.draw();}});
+    c.addEventListener('dblclick',()=>{this.x0=0;this.x1=DATA.n;this.draw();});
+    c.addEventListener('wheel',e=>{e.preventDefault();const m=this.idx(e.offsetX),f=e.deltaY>0?1.4:1/1.4;
+      this.x0=Math.max(0,m-(m-this.x0)*f);this.x1=Math.min(DATA.n,Math.max(this.x0+4,m+(this.x1-m)*f));this.draw();},{passive:false});
+    window.addEventListener('resize',()=>this.draw());
+  }
+  hover(e){
+    if(!this.plot||!this.traces.length)return;const i=Math.floor(this.idx(e.offsetX));if(i<0||i>=DATA.n){this.tip.style.display='none';return;}
+    const b=this.b,k=Math.floor(i/b);let html=`<b>${fullTime(this.t[i])}</b>${b>1?` (${b}시간 범위)`:''}`;
+    for(const tr of this.traces){if(!tr.on)continue;const m=tr.lv[b];html+=`<br><span style="color:${tr.color}">■</span> ${tr.name}: `+(b>1?`${fmtNum(m.min[k])} ~ ${fmtNum(m.max[k])}`:fmtNum(m.max[k]));}
+    this.tip.innerHTML=html;this.tip.style.display='block';this.tip.style.left=Math.min(e.offsetX+14,this.canvas.clientWidth-180)+'px';this.tip.style.top=(e.offsetY+30)+'px';
+  }
+}
+
+// ---- 표 ----
+function table(parent,rows,onClick,hidden){
+  const cols=rows.length?Object.keys(rows[0]).filter(c=>!(hidden||[]).includes(c)):[];
+  const el=document.createElement('table');parent.appendChild(el);let key=null,asc=false;
+  const render=()=>{const data=rows.slice();if(key)data.sort((a,b)=>{const x=a[key],y=b[key];const r=(x===null)-(y===null)||(x>y?1:x<y?-1:0);return asc?r:-r;});
+    el.innerHTML='<thead><tr>'+cols.map(c=>`<th>${c}</th>`).join('')+'</tr></thead><tbody>'+
+      data.map((r,i)=>'<tr>'+cols.map(c=>`<td>${typeof r[c]==='number'?fmtNum(r[c]):(r[c]??'-')}</td>`).join('')+'</tr>').join('')+'</tbody>';
+    el.querySelectorAll('th').forEach((th,j)=>th.onclick=()=>{asc=key===cols[j]?!asc:false;key=cols[j];render();});
+    if(onClick)el.querySelectorAll('tbody tr').forEach((tr,j)=>tr.onclick=()=>{el.querySelectorAll('tr.sel').forEach(x=>x.classList.remove('sel'));tr.classList.add('sel');onClick(data[j]);});};
+  render();return el;
+}
+function selector(parent,label,options,onChange){
+  const d=document.createElement('div');d.className='controls';d.innerHTML=`${label} <select>${options.map(o=>`<option>${o}</option>`).join('')}</select> <span class="hint">드래그: 확대 · 휠: 확대/축소 · 더블클릭: 전체 보기 · 범례 클릭: 표시 전환</span>`;
+  parent.appendChild(d);const s=d.querySelector('select');s.onchange=()=>onChange(s.value);return s;
+}
+
+// ---- 뷰 ----
+const VIEWS={
+  region:{label:'지역',build(el){const v=DATA.views.region;if(!v.regions.length){el.textContent='데이터 없음';return;}
+    const c1=new Chart(el,'지역 발전량(기술별) 및 부하','MW'),c2=new Chart(el,'지역 평균 한계가격','');
+    const show=r=>{const it=v.items[r]||{};const tr=(it.gen||[]).slice();if(it.load)tr.push({name:'부하',sid:it.load,color:'#000'});c1.set(tr);c2.set(it.price?[{name:'가격',sid:it.price,color:'#c0392b'}]:[]);};
+    const s=selector(el,'지역',v.regions,show);el.insertBefore(s.parentNode,el.firstChild);
+    table(el,v.table,r=>{s.value=r['지역'];show(r['지역']);});show(v.regions[0]);}},
+  technology:{label:'기술',build(el){const v=DATA.views.technology;const c=new Chart(el,'전국 기술별 발전량','MW');c.set(v.series);table(el,v.table);}},
+  carrier:{label:'에너지원',build(el){const v=DATA.views.carrier;if(!v.carriers.length){el.textContent='데이터 없음';return;}
+    const c1=new Chart(el,'공급 / 수요','MW'),c2=new Chart(el,'저장량','MWh'),c3=new Chart(el,'평균 한계가격','');
+    const show=k=>{const it=v.items[k]||{};const tr=[];if(it.supply)tr.push({name:'발전기 공급',sid:it.supply});if(it.conversion)tr.push({name:'변환 유입',sid:it.conversion});if(it.load)tr.push({name:'수요',sid:it.load,color:'#000'});
+      c1.set(tr);c2.set(it.store?[{name:'저장량',sid:it.store}]:[]);c3.set(it.price?[{name:'가격',sid:it.price,color:'#c0392b'}]:[]);};
+    const s=selector(el,'에너지원',v.carriers,show);el.insertBefore(s.parentNode,el.firstChild);table(el,v.table,r=>{s.value=r['에너지원'];show(r['에너지원']);});show(v.carriers[0]);}},
+  lines:{label:'선로',build(el){const items=DATA.views.lines.items;if(!items.length){el.textContent='데이터 없음';return;}
+    const c1=new Chart(el,'조류 (p0)','MW'),c2=new Chart(el,'이용률','%');
+    const show=name=>{const it=items.find(x=>x.name===name);if(!it)return;c1.set([{name:it.name,sid:it.sid}]);
+      c2.set(it.cap>0?[{name:it.name,sid:it.sid,map:v=>Math.abs(v)/it.cap*100,color:'#d62728'}]:[]);};
+    const s=selector(el,'선로',items.map(x=>x.name),show);el.insertBefore(s.parentNode,el.firstChild);
+    table(el,items,r=>{s.value=r.name;show(r.name);},['sid']);show(items[0].name);}}
+};
+
+function main(){
+  document.getElementById('title').textContent=DATA.title;
+  document.getElementById('meta').textContent=`생성: ${DATA.created} · 스냅샷 ${DATA.n}개 · 시계열 ${Object.keys(DATA.series).length}개`;
+  const tabs=document.getElementById('tabs'),root=document.getElementById('root');const built={};
+  const open=k=>{tabs.querySelectorAll('button').forEach(b=>b.classList.toggle('active',b.dataset.k===k));
+    root.querySelectorAll('section').forEach(s=>s.classList.toggle('active',s.dataset.k===k));
+    if(!built[k]){built[k]=true;VIEWS[k].build(root.querySelector(`section[data-k="${k}"]`));}};
+  for(const k in VIEWS){const b=document.createElement('button');b.textContent=VIEWS[k].label;b.dataset.k=k;b.onclick=()=>open(k);tabs.appendChild(b);
+    const s=document.createElement('section');s.dataset.k=k;root.appendChild(s);}
+  open('region');
+}
+try{main();}catch(e){document.getElementById('root').innerHTML=`<div class="err">${e}</div>`;}
+window.addEventListener('unhandledrejection',e=>{document.getElementById('root').insertAdjacentHTML('afterbegin',`<div class="err">${e.reason}</div>`);});
+</script>
+</body>
+</html>
+"""
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("사용법: python src/dashboard.py <optimization_result.nc> [출력.html]")
+        sys.exit(1)
+    nc_path = sys.argv[1]
+    out_path = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(nc_path)[0] + '_dashboard.html'
+    build_dashboard(nc_path, out_path)
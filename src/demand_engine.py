@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+수요 엔진 모듈 - (부하·연도별 연간 수요) × (지역·에너지별 시간 패턴)
+
+연도별 수요는 시나리오_에너지수요 값을 loads.p_set에 쓰고(연도 시트 반영은 행 순서로 매칭),
+create_network에서 부하마다 패턴을 다시 읽어 8760 × 패턴을 곱해 시계열을 만들었습니다.
+이 모듈은 수요를 두 개의 작은 표로 보관하고 시계열(스냅샷 × 부하)은 네트워크를 만들 때만 한 번에 계산합니다.
+
+    annual_p_set(years)    부하 × 연도 p_set (기준 loads.p_set 위에 시나리오 값을 이름 기준으로 덮어씀)
+    annual_totals(years)   부하 × 연도 연간 수요(MWh) = p_set × 8760
+    group_totals(years)    (지역, 에너지) × 연도 합계
+    matrix(snapshots)      스냅샷 × 부하 시계열 = p_set × 8760 × 패턴 (패턴이 없는 부하는 일정 부하 p_set)
+
+패턴은 _get_load_pattern 결과(연간 합 ≈ 1인 시간별 비중)를 (지역, 에너지)별로 한 번만 읽어 재사용합니다.
+시나리오 시트는 interface.xlsx 경로·수정 시간 기준으로 한 번만 읽습니다.
+
+사용 예:
+    engine = DemandEngine(input_data, interface_path)
+    engine.group_totals([2030, 2035, 2040])     # 네트워크 생성 없이 연도별 수요 조회
+    p_set = engine.matrix(network.snapshots)    # create_network에서 부하 시계열 생성
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCENARIO_SHEET = '시나리오_에너지수요'
+HOURS_PER_YEAR = 8760.0
+
+_scenario_cache = {}
+
+
+def _gui():
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+    import PyPSA_GUI
+    return PyPSA_GUI
+
+
+def load_key(name):
+    """부하 이름 → (지역, 에너지) (create_network의 이름 규칙: <지역>_Demand_<EL|H|H2>, 그 외 에너지는 None)"""
+    name = str(name)
+    region = name.split('_')[0] if '_' in name else None
+    dtype = 'EL' if '_Demand_EL' in name else ('H2' if '_Demand_H2' in name else ('H' if '_Demand_H' in name else None))
+    return region, dtype
+
+
+def read_scenario_demand(interface_path):
+    """interface.xlsx 시나리오_에너지수요 → 부하 이름 × 연도 표 (경로·수정 시간 기준 캐시)
+
+    이름(이름/name) 컬럼 값을 우선 사용하고, 그 연도 값이 없는 이름은 버스(버스/bus) 컬럼에서 만든
+    '<지역>_Demand_<에너지>' 이름의 값으로 보강합니다.
+
+    Returns:
+        pd.DataFrame: index=부하 이름, columns=연도(int) (시트가 없으면 빈 표)
+    """
+    if not interface_path or not os.path.exists(interface_path):
+        return pd.DataFrame()
+    key = (os.path.abspath(interface_path), os.path.getmtime(interface_path))
+    if key in _scenario_cache:
+        return _scenario_cache[key]
+    try:
+        df = pd.read_excel(interface_path, sheet_name=SCENARIO_SHEET)
+    except Exception:
+        df = None
+    table = pd.DataFrame()
+    if df is not None and not df.empty:
+        df.columns = [str(c).strip() for c in df.columns]
+        year_cols = [c for c in df.columns if c.isdigit() and len(c) == 4]
+        name_col = next((c for c in df.columns if c.lower() in ['name', '이름']), None)
+        bus_col = next((c for c in df.columns if c.lower() in ['bus', '버스']), None)
+        if year_cols and (name_col or bus_col):
+            values = df[year_cols].apply(pd.to_numeric, errors='coerce')
+            values.columns = [int(c) for c in year_cols]
+            by_name = pd.DataFrame(columns=values.columns, dtype=float)
+            by_bus = by_name
+            if name_col is not None:
+                names = pd.Series([str(v).strip() for v in df[name_col]], index=df.index)
+                valid = (names != '') & (names.str.lower() != 'nan')
+                by_name = values[valid.values].set_axis(names[valid])
+                by_name = by_name[~by_name.index.duplicated(keep='last')]
+            if bus_col is not None:
+                parts = pd.Series([[t for t in str(v).strip().split('_') if t] for v in df[bus_col]], index=df.index)
+                valid = parts.str.len() >= 2
+                derived = parts[valid].str[0] + '_Demand_' + parts[valid].str[-1]
+                by_bus = values[valid.values].set_axis(derived)
+                by_bus = by_bus[~by_bus.index.duplicated(keep='first')]
+            # 연도별로 이름 값이 우선, 없으면 버스 파생 이름 값으로 보강
+            table = by_name.combine_first(by_bus)
+            table.index.name = 'name'
+    _scenario_cache.clear()
+    _scenario_cache[key] = table
+    return table
+
+
+def scenario_values(interface_path, year):
+    """해당 연도 시나리오 수요 {부하 이름: 값} (값이 있는 이름만)"""
+    table = read_scenario_demand(interface_path)
+    if table.empty or int(year) not in table.columns:
+        return pd.Series(dtype=float)
+    return table[int(year)].dropna()
+
+
+def scale_to_targets(p_set, targets):
+    """(지역, 에너지) 그룹별 시계열 합계를 목표값에 맞추는 배율 (벡터 연산)
+
+    Args:
+        p_set (pd.DataFrame): 스냅샷 × 부하 시계열
+        targets (dict): {(지역, 에너지): 목표 합계}
+
+    Returns:
+        tuple: (부하별 배율 Series(대상이 아니거나 현재 합계가 0이면 1.0),
+                그룹별 current/target/scale DataFrame(목표가 있는 그룹만, 현재 합계가 0이면 scale=NaN))
+    """
+    keys = pd.Series([load_key(name) for name in p_set.columns], index=p_set.columns, dtype=object)
+    keys = keys[[region is not None and dtype is not None for region, dtype in keys]]
+    current = pd.Series(np.nansum(p_set[keys.index].to_numpy(dtype=float), axis=0), index=keys.index).groupby(keys).sum()
+    groups = pd.DataFrame({'current': current, 'target': pd.Series(targets, dtype=float).reindex(current.index)})
+    groups = groups.dropna(subset=['target'])
+    groups['scale'] = groups['target'] / groups['current'].where(groups['current'] > 0)
+    factors = keys.map(groups['scale'].dropna()).reindex(p_set.columns).fillna(1.0)
+    return factors, groups
+
+
+class DemandEngine:
+    """부하별 연간 수요와 (지역, 에너지)별 패턴으로 수요를 보관하고 시계열은 필요할 때만 계산"""
+
+    def __init__(self, input_data, interface_path=None):
+        """초기화 함수
+
+        Args:
+            input_data (dict): read_input_data / prepare_year_input 결과 (loads, load_patterns 시트 사용)
+            interface_path (str): interface.xlsx (시나리오_에너지수요 연도 값, 없으면 loads.p_set만 사용)
+        """
+        self.input_data = input_data
+        self.interface_path = interface_path
+        loads = input_data.get('loads') if input_data is not None else None
+        if loads is None or loads.empty or 'name' not in loads.columns:
+            loads = pd.DataFrame(columns=['name', 'bus', 'p_set'])
+        names = loads['name'].astype(str)
+        duplicated = names.duplicated(keep='first')
+        if duplicated.any():
+            print(f"경고: 중복된 부하 이름 {names[duplicated].tolist()}는 첫 행만 사용합니다.")
+        loads = loads[~duplicated.values]
+        self.loads = pd.DataFrame({
+            'bus': loads['bus'].astype(str).values if 'bus' in loads.columns else None,
+            'p_set': pd.to_numeric(loads['p_set'], errors='coerce').values if 'p_set' in loads.columns else np.nan,
+        }, index=pd.Index(names[~duplicated].values, name='name'))
+        keys = [load_key(name) for name in self.loads.index]
+        self.loads['region'] = [k[0] for k in keys]
+        self.loads['dtype'] = [k[1] for k in keys]
+        self._patterns = {}
+
+    # ---- 연도별 수요 (네트워크 없이 조회) ----
+
+    def annual_p_set(self, years=None):
+        """부하 × 연도 p_set (시나리오 값이 없는 부하/연도는 기준 loads.p_set)
+
+        Args:
+            years (list[int]): 조회 연도 (None이면 기준 loads.p_set 한 열)
+
+        Returns:
+            pd.DataFrame: index=부하 이름, columns=연도 (years=None이면 'p_set')
+        """
+        base = self.loads['p_set']
+        if years is None:
+            return base.to_frame('p_set')
+        table = read_scenario_demand(self.interface_path)
+        columns = {}
+        for year in years:
+            values = table[int(year)].reindex(self.loads.index.str.strip()).set_axis(self.loads.index) \
+                if int(year) in table.columns else None
+            columns[int(year)] = base if values is None else values.fillna(base)
+        return pd.DataFrame(columns, index=self.loads.index)
+
+    def annual_totals(self, years=None):
+        """부하 × 연도 연간 수요(MWh) = p_set × 8760"""
+        return self.annual_p_set(years) * HOURS_PER_YEAR
+
+    def group_totals(self, years=None):
+        """(지역, 에너지) × 연도 연간 수요 합계(MWh) (에너지를 알 수 없는 부하는 'other')"""
+        totals = self.annual_totals(years)
+        keys = [self.loads['region'].fillna('unknown'), self.loads['dtype'].fillna('other')]
+        return totals.groupby(keys).sum().rename_axis(['region', 'dtype'])
+
+    # ---- 시계열 (네트워크 생성 시) ----
+
+    def pattern(self, region, dtype, length):
+        """(지역, 에너지) 시간 패턴 (길이별로 한 번만 계산, 없으면 None)"""
+        key = (region, dtype, int(length))
+        if key not in self._patterns:
+            pattern = None
+            if region and dtype and 'load_patterns' in self.input_data:
+                pattern = _gui()._get_load_pattern(self.input_data, region, dtype, int(length))
+            self._patterns[key] = None if pattern is None else np.asarray(pattern, dtype=float)
+        return self._patterns[key]
+
+    def matrix(self, snapshots, year=None):
+        """스냅샷 × 부하 시계열 (패턴이 있으면 p_set × 8760 × 패턴, 없으면 일정 부하 p_set)
+
+        Args:
+            snapshots (pd.Index): 네트워크 스냅샷
+            year (int): 시나리오 연도 (None이면 입력의 loads.p_set)
+
+        Returns:
+            pd.DataFrame: index=snapshots, columns=부하 이름 (속성 patterned: 패턴 적용 부하 이름)
+        """
+        length = len(snapshots)
+        p_set = self.annual_p_set(None if year is None else [year]).iloc[:, 0].to_numpy(dtype=float)
+        groups = self.loads.groupby(['region', 'dtype'], sort=False).indices
+        shape = np.ones((length, len(self.loads)))
+        patterned = np.zeros(len(self.loads), dtype=bool)
+        for (region, dtype), positions in groups.items():
+            pattern = self.pattern(region, dtype, length)
+            if pattern is not None:
+                shape[:, positions] = HOURS_PER_YEAR * pattern[:, None]
+                patterned[positions] = True
+        frame = pd.DataFrame(shape * p_set, index=snapshots, columns=self.loads.index)
+        frame.attrs['patterned'] = self.loads.index[patterned].tolist()
+        return frame
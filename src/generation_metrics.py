@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+발전기 이용률/출력제한 지표 모듈
+
+최적화된 네트워크(또는 발전기 출력/정보 테이블)에서 발전기별 가용 발전량
+(p_max_pu × p_nom_opt), 실제 발전량, 출력제한(curtailment), 이용률,
+p_nom / p_nom_min 대비 확장량을 행렬 연산으로 한 번에 계산합니다.
+
+집계 수준:
+    generators          - 발전기별 연간
+    generators_monthly  - 발전기별 월간
+    groups_annual       - 지역 × 발전원 연간
+    groups_monthly      - 지역 × 발전원 월간
+    groups_hourly       - 지역 × 발전원 시간별
+
+발전기 수천 개 × 8760시간도 열 블록 단위로 처리하여 메모리 사용을 제한합니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+# 한 번에 처리할 발전기 열 수 (T × 블록 크기 행렬만 메모리에 유지)
+DEFAULT_BLOCK_SIZE = 512
+
+RENEWABLE_CARRIERS = ('solar', 'wind', 'hydro', 'biomass')
+
+# 캐리어 추론 규칙 (순서대로 적용, analyze_generator_results.infer_carrier_from_name과 동일)
+# (create_network가 추가하는 {bus}_Fallback_Gen/_LNG_Fallback_Gen/_Slack_Failsafe와 입력의 *_Slack은 'slack')
+_CARRIER_PATTERNS = [
+    ('slack', r'slack|fallback|failsafe'),
+    ('solar', r'pv|solar|태양'),
+    ('wind', r'wind|wt|풍력'),
+    ('nuclear', r'nuclear|원자력'),
+    ('coal', r'coal|석탄'),
+    ('gas', r'gas|lng|가스'),
+    ('oil', r'oil|석유'),
+    ('hydro', r'hydro|수력'),
+    ('biomass', r'biomass|바이오'),
+    ('battery', r'battery|배터리'),
+    ('hydrogen', r'hydrogen|h2|수소'),
+]
+_KNOWN_CARRIERS = {c for c, _ in _CARRIER_PATTERNS}
+
+
+def region_of(names):
+    """버스/발전기 이름에서 지역 코드 추출 (예: SEL_EL → SEL)"""
+    names = pd.Index(names).astype(str)
+    return np.where(names.str.contains('_'), names.str.split('_').str[0], names)
+
+
+def normalize_carrier(names, carriers=None):
+    """캐리어 표준화: 알려진 캐리어는 유지, 그 외에는 이름에서 추론 (벡터화)"""
+    names = pd.Series(pd.Index(names).astype(str), dtype=object)
+    result = pd.Series('unknown', index=names.index, dtype=object)
+    assigned = np.zeros(len(names), dtype=bool)
+    lower = names.str.lower()
+    for carrier, pattern in _CARRIER_PATTERNS:
+        hit = (~assigned) & lower.str.contains(pattern, regex=True).to_numpy()
+        result[hit] = carrier
+        assigned |= hit
+    if carriers is not None:
+        given = pd.Series(carriers, dtype=object).fillna('').astype(str).str.lower().to_numpy()
+        known = np.isin(given, list(_KNOWN_CARRIERS))
+        result[known] = given[known]
+    return result.to_numpy()
+
+
+def _numeric(static, column, default):
+    """정적 테이블 컬럼을 숫자 배열로 (없으면 기본값)"""
+    if column in static.columns:
+        return pd.to_numeric(static[column], errors='coerce').fillna(default).to_numpy(dtype=np.float64)
+    return np.full(len(static), default, dtype=np.float64)
+
+
+def _group_hourly(values, group_codes, n_groups):
+    """T × G 행렬을 그룹 지시행렬과 곱해 T × K 그룹 합계로"""
+    indicator = np.zeros((values.shape[1], n_groups))
+    indicator[np.arange(values.shape[1]), group_codes] = 1.0
+    return values @ indicator
+
+
+def compute_generation_metrics(p, static, p_max_pu=None, weights=None, block_size=DEFAULT_BLOCK_SIZE,
+                               hourly_groups=True):
+    """발전기 지표 계산 (행렬 연산)
+
+    Args:
+        p (pd.DataFrame): 스냅샷 × 발전기 출력 (MW)
+        static (pd.DataFrame): 인덱스=발전기명, 컬럼 bus, carrier, p_nom, p_nom_opt, p_nom_min, p_max_pu
+        p_max_pu (pd.DataFrame, optional): 시변 최대 출력비 (없는 발전기는 정적 p_max_pu 사용)
+        weights (np.ndarray, optional): 스냅샷 가중치 (시간)
+        block_size (int, optional): 열 블록 크기
+        hourly_groups (bool, optional): 지역 × 발전원 시간별 집계 포함 여부
+
+    Returns:
+        dict: generators, generators_monthly, groups_annual, groups_monthly, groups_hourly
+    """
+    names = pd.Index([g for g in static.index if g in p.columns])
+    static = static.reindex(names)
+    snapshots = p.index
+    n_steps, n_gens = len(snapshots), len(names)
+    w = np.ones(n_steps) if weights is None else np.asarray(weights, dtype=np.float64)
+
+    # 정적 속성 (p_nom_opt가 없거나 NaN이면 p_nom 사용)
+    p_nom = _numeric(static, 'p_nom', 0.0)
+    p_nom_opt = _numeric(static, 'p_nom_opt', np.nan)
+    p_nom_opt = np.where(np.isnan(p_nom_opt), p_nom, p_nom_opt)
+    p_nom_min = _numeric(static, 'p_nom_min', 0.0)
+    static_pu = _numeric(static, 'p_max_pu', 1.0)
+    bus = static['bus'].astype(str).to_numpy() if 'bus' in static.columns else names.to_numpy()
+    region = region_of(bus)
+    carrier = normalize_carrier(names, static['carrier'] if 'carrier' in static.columns else None)
+
+    # 월 지시행렬 (12 × T, 가중치 포함) - 시간 인덱스가 아니면 월 집계 생략
+    try:
+        months = pd.DatetimeIndex(snapshots).month.to_numpy()
+    except Exception:
+        months = None
+    month_list = np.unique(months) if months is not None else np.array([], dtype=int)
+    month_weight = (months[None, :] == month_list[:, None]) * w[None, :] if months is not None else None
+
+    # 지역 × 발전원 그룹 코드
+    group_keys = pd.MultiIndex.from_arrays([region, carrier], names=['region', 'carrier'])
+    group_codes, group_index = pd.factorize(group_keys)
+    n_groups = len(group_index)
+
+    annual = {k: np.zeros(n_gens) for k in ('available', 'dispatched', 'curtailed', 'max_output')}
+    monthly = {k: np.zeros((len(month_list), n_gens)) for k in ('available', 'dispatched', 'curtailed')}
+    hourly = {k: np.zeros((n_steps, n_groups)) for k in ('available', 'dispatched', 'curtailed')} if hourly_groups else None
+
+    pu_frame = p_max_pu if p_max_pu is not None else pd.DataFrame(index=snapshots)
+    # 출력제한은 재생 캐리어 중 p_max_pu가 1 미만인 시간이 있는 발전기에만 적용
+    # (create_network는 모든 발전기에 p_max_pu=1 시계열을 넣으므로 시계열 보유 여부로는 판단하지 않음.
+    #  화력/슬랙의 미사용 여유 용량은 출력제한이 아님)
+    renewable = np.isin(carrier, RENEWABLE_CARRIERS)
+    variable = np.zeros(n_gens, dtype=bool)
+    for start in range(0, n_gens, max(1, block_size)):
+        block = slice(start, min(start + block_size, n_gens))
+        cols = names[block]
+        dispatched = p[cols].to_numpy(dtype=np.float64, na_value=0.0)
+        # 시변 p_max_pu가 없는 발전기는 정적 값으로 채움
+        pu = pu_frame.reindex(index=snapshots, columns=cols).to_numpy(dtype=np.float64, na_value=np.nan)
+        pu = np.where(np.isnan(pu), static_pu[block][None, :], pu)
+        variable[block] = renewable[block] & (pu < 1.0).any(axis=0)
+        available = pu * p_nom_opt[block][None, :]
+        # 가용량보다 큰 출력(수치 오차, 가용량 정보 부족)은 가용량을 출력으로 보정
+        available = np.maximum(available, dispatched)
+        curtailed = (available - dispatched) * variable[block][None, :]
+
+        for key, values in (('available', available), ('dispatched', dispatched), ('curtailed', curtailed)):
+            annual[key][block] = w @ values
+            if month_weight is not None:
+                monthly[key][:, block] = month_weight @ values
+            if hourly is not None:
+                hourly[key] += _group_hourly(values, group_codes[block], n_groups)
+        annual['max_output'][block] = dispatched.max(axis=0) if n_steps else 0.0
+
+    total_hours = w.sum()
+    generators = pd.DataFrame({
+        'name': names,
+        'bus': bus,
+        'region': region,
+        'carrier': carrier,
+        'variable': variable,
+        'p_nom': p_nom,
+        'p_nom_min': p_nom_min,
+        'p_nom_opt': p_nom_opt,
+        'expansion_mw': p_nom_opt - p_nom,
+        'expansion_over_min_mw': p_nom_opt - p_nom_min,
+        'available_mwh': annual['available'],
+        'dispatched_mwh': annual['dispatched'],
+        'curtailed_mwh': annual['curtailed'],
+        'max_output_mw': annual['max_output'],
+    })
+    capacity_hours = generators['p_nom_opt'] * total_hours
+    generators['capacity_factor'] = np.where(capacity_hours > 0, generators['dispatched_mwh'] / capacity_hours, np.nan)
+    generators['available_factor'] = np.where(capacity_hours > 0, generators['available_mwh'] / capacity_hours, np.nan)
+    generators['curtailment_ratio'] = np.where(generators['available_mwh'] > 0,
+                                               generators['curtailed_mwh'] / generators['available_mwh'], 0.0)
+
+    # 발전기별 월간 (긴 형식)
+    if len(month_list):
+        generators_monthly = pd.DataFrame({
+            'name': np.tile(names.to_numpy(), len(month_list)),
+            'region': np.tile(region, len(month_list)),
+            'carrier': np.tile(carrier, len(month_list)),
+            'month': np.repeat(month_list, n_gens),
+            'available_mwh': monthly['available'].ravel(),
+            'dispatched_mwh': monthly['dispatched'].ravel(),
+            'curtailed_mwh': monthly['curtailed'].ravel(),
+        })
+    else:
+        generators_monthly = pd.DataFrame(columns=['name', 'region', 'carrier', 'month',
+                                                   'available_mwh', 'dispatched_mwh', 'curtailed_mwh'])
+
+    # 지역 × 발전원 집계 (발전기별 결과에서 합산)
+    sums = ['p_nom', 'p_nom_min', 'p_nom_opt', 'expansion_mw', 'available_mwh', 'dispatched_mwh', 'curtailed_mwh']
+    groups_annual = generators.groupby(['region', 'carrier'], sort=True)[sums].sum().reset_index()
+    groups_annual['units'] = generators.groupby(['region', 'carrier'], sort=True).size().to_numpy()
+    cap_hours = groups_annual['p_nom_opt'] * total_hours
+    groups_annual['capacity_factor'] = np.where(cap_hours > 0, groups_annual['dispatched_mwh'] / cap_hours, np.nan)
+    groups_annual['curtailment_ratio'] = np.where(groups_annual['available_mwh'] > 0,
+                                                  groups_annual['curtailed_mwh'] / groups_annual['available_mwh'], 0.0)
+    groups_monthly = generators_monthly.groupby(['region', 'carrier', 'month'], sort=True)[
+        ['available_mwh', 'dispatched_mwh', 'curtailed_mwh']].sum().reset_index()
+
+    if hourly is not None and n_groups:
+        groups_hourly = pd.DataFrame({
+            'snapshot': np.repeat(np.asarray(snapshots), n_groups),
+            'region': np.tile(group_index.get_level_values(0).to_numpy(), n_steps),
+            'carrier': np.tile(group_index.get_level_values(1).to_numpy(), n_steps),
+            'available_mw': hourly['available'].ravel(),
+            'dispatched_mw': hourly['dispatched'].ravel(),
+            'curtailed_mw': hourly['curtailed'].ravel(),
+        })
+    else:
+        groups_hourly = pd.DataFrame(columns=['snapshot', 'region', 'carrier',
+                                              'available_mw', 'dispatched_mw', 'curtailed_mw'])
+
+    return {
+        'generators': generators,
+        'generators_monthly': generators_monthly,
+        'groups_annual': groups_annual,
+        'groups_monthly': groups_monthly,
+        'groups_hourly': groups_hourly,
+    }
+
+
+def analyze_network(network, **kwargs):
+    """최적화된 pypsa.Network에서 발전기 지표 계산"""
+    try:
+        weights = network.snapshot_weightings['generators'].to_numpy(dtype=np.float64)
+    except Exception:
+        weights = None
+    p_max_pu = network.generators_t.p_max_pu if not network.generators_t.p_max_pu.empty else None
+    return compute_generation_metrics(network.generators_t.p, network.generators, p_max_pu, weights, **kwargs)
+
+
+def save_generation_metrics(tables, prefix, keys=('generators', 'generators_monthly', 'groups_annual', 'groups_monthly')):
+    """지표 테이블을 Parquet으로 저장 (pyarrow 없으면 CSV)
+
+    Args:
+        tables (dict): compute_generation_metrics 결과
+        prefix (str): 파일 경로 접두어 (예: results/<ts>/optimization_result_<ts>)
+        keys (tuple, optional): 저장할 테이블 (시간별 그룹 집계는 기본 제외)
+
+    Returns:
+        dict: 테이블별 저장 경로
+    """
+    paths = {}
+    for key in keys:
+        df = tables.get(key)
+        if df is None or df.empty:
+            continue
+        df = df.copy()
+        for col in ('name', 'bus', 'region', 'carrier'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        try:
+            path = f"{prefix}_gen_{key}.parquet"
+            df.to_parquet(path, index=False)
+        except Exception:
+            path = f"{prefix}_gen_{key}.csv"
+            df.to_csv(path, index=False, encoding='utf-8-sig')
+        paths[key] = path
+    return paths
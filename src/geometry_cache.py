@@ -0,0 +1,373 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+한국 행정구역 지오메트리 캐시 모듈
+
+BND_SIDO_PG 셰이프파일을 한 번만 geopandas로 읽어
+    - 여러 줌 레벨로 단순화한 경계(Web Mercator, EPSG:3857)
+    - 원본 경계 기준 중심점 (EPSG:3857 / 경위도)
+    - 중심점 간 거리 행렬 (km)
+    - 속성 테이블의 문자열 컬럼 (SIDO_NM 등)
+을 압축 NumPy(.npz) 파일로 저장합니다.
+
+로드는 NumPy만 사용하므로 GDAL/PROJ(geopandas, pyproj, fiona) 임포트 없이
+수 밀리초 안에 끝나며, 셰이프파일이 바뀌면(크기/수정시각) 다시 빌드합니다.
+
+사용 예:
+    python src/geometry_cache.py data/BND_SIDO_PG.shp      # 캐시 미리 생성
+    geometry = load_geometry_cache()
+    geometry.plot(ax=ax, level='medium', color='lightgray', edgecolor='black')
+    geometry.centroids('SIDO_NM')          # {'서울특별시': (x, y), ...}
+"""
+
+import os
+import sys
+import json
+
+import numpy as np
+import pandas as pd
+
+from region_distance import euclidean_matrix
+
+CACHE_VERSION = 1
+
+DEFAULT_SHAPEFILE = os.path.join('data', 'BND_SIDO_PG.shp')
+
+# 줌 레벨별 단순화 허용오차 (EPSG:3857 미터)
+SIMPLIFY_LEVELS = {
+    'high': 50.0,     # 상세 지도 (시군구 수준 확대)
+    'medium': 250.0,  # 전국 지도 기본값
+    'low': 1000.0     # 썸네일/대시보드
+}
+DEFAULT_LEVEL = 'medium'
+
+# Web Mercator 구 반지름 (m)
+_MERCATOR_RADIUS = 6378137.0
+
+# 프로세스 내 로드 결과 재사용 (경로, 수정시각) → KoreaGeometry
+_LOADED = {}
+
+
+def default_cache_path(shapefile_path=DEFAULT_SHAPEFILE):
+    """셰이프파일 옆에 두는 캐시 파일 경로 (예: data/BND_SIDO_PG_geometry.npz)"""
+    return os.path.splitext(shapefile_path)[0] + '_geometry.npz'
+
+
+def _source_signature(shapefile_path):
+    """셰이프파일 구성 파일(.shp/.dbf)의 크기/수정시각 (변경 감지용)"""
+    signature = {}
+    base = os.path.splitext(shapefile_path)[0]
+    for ext in ('.shp', '.dbf'):
+        path = base + ext
+        if os.path.exists(path):
+            stat = os.stat(path)
+            signature[ext] = [stat.st_size, int(stat.st_mtime)]
+    return signature
+
+
+def mercator_to_lonlat(x, y):
+    """EPSG:3857 좌표 → 경도/위도 (NumPy 닫힌 식, PROJ 불필요)"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    lon = np.degrees(x / _MERCATOR_RADIUS)
+    lat = np.degrees(2.0 * np.arctan(np.exp(y / _MERCATOR_RADIUS)) - np.pi / 2.0)
+    return lon, lat
+
+
+def _pack_rings(geometries, tolerance):
+    """지오메트리 목록 → 좌표/링 오프셋 배열 (외곽선 반시계, 구멍 시계 방향)"""
+    from shapely.geometry import Polygon, MultiPolygon
+    from shapely.geometry.polygon import orient
+
+    coords, offsets, ring_region, ring_part, ring_hole = [], [0], [], [], []
+    part_id = 0
+    for region_idx, geom in enumerate(geometries):
+        if geom is None or geom.is_empty:
+            continue
+        if tolerance > 0:
+            geom = geom.simplify(tolerance, preserve_topology=True)
+        if isinstance(geom, Polygon):
+            parts = [geom]
+        elif isinstance(geom, MultiPolygon):
+            parts = list(geom.geoms)
+        else:
+            parts = [g for g in getattr(geom, 'geoms', []) if isinstance(g, Polygon)]
+        for part in parts:
+            if part.is_empty:
+                continue
+            part = orient(part, sign=1.0)
+            for ring, is_hole in [(part.exterior, False)] + [(r, True) for r in part.interiors]:
+                xy = np.asarray(ring.coords, dtype=float)[:, :2]
+                coords.append(xy)
+                offsets.append(offsets[-1] + len(xy))
+                ring_region.append(region_idx)
+                ring_part.append(part_id)
+                ring_hole.append(is_hole)
+            part_id += 1
+    stacked = np.vstack(coords) if coords else np.empty((0, 2))
+    return (stacked, np.asarray(offsets, dtype=np.int64), np.asarray(ring_region, dtype=np.int32),
+            np.asarray(ring_part, dtype=np.int32), np.asarray(ring_hole, dtype=bool))
+
+
+def build_geometry_cache(shapefile_path=DEFAULT_SHAPEFILE, cache_path=None, levels=None, encoding='cp949'):
+    """셰이프파일을 읽어 지오메트리 캐시 생성 (geopandas 필요, 1회성 전처리)
+
+    Args:
+        shapefile_path (str): 행정구역 셰이프파일 경로
+        cache_path (str, optional): 저장 경로 (기본: 셰이프파일 옆 *_geometry.npz)
+        levels (dict, optional): {레벨 이름: 단순화 허용오차(m)}
+        encoding (str): 속성 테이블 인코딩
+
+    Returns:
+        str: 저장된 캐시 파일 경로
+    """
+    import geopandas as gpd
+
+    cache_path = cache_path or default_cache_path(shapefile_path)
+    levels = levels or SIMPLIFY_LEVELS
+
+    gdf = gpd.read_file(shapefile_path, encoding=encoding)
+    gdf = gdf.to_crs(epsg=3857)  # Web Mercator로 변환
+
+    # 원본 경계 기준 중심점 (기존 row.geometry.centroid와 동일)
+    centroid = gdf.geometry.centroid
+    cx = centroid.x.to_numpy(dtype=float)
+    cy = centroid.y.to_numpy(dtype=float)
+    lon, lat = mercator_to_lonlat(cx, cy)
+
+    # 중심점 간 유클리드 거리 (km)
+    distance_km = euclidean_matrix(np.stack([cx, cy], axis=1), scale=1 / 1000.0)
+
+    arrays = {
+        'centroid_xy': np.stack([cx, cy], axis=1),
+        'centroid_lonlat': np.stack([lon, lat], axis=1),
+        'distance_km': distance_km,
+        'bounds': np.asarray(gdf.total_bounds, dtype=float),
+    }
+
+    # 문자열 속성 컬럼 (이름/코드)
+    attributes = []
+    for col in gdf.columns:
+        if col == gdf.geometry.name:
+            continue
+        if gdf[col].dtype == object or pd.api.types.is_string_dtype(gdf[col]):
+            arrays[f'attr_{col}'] = gdf[col].astype(str).to_numpy(dtype=str)
+            attributes.append(col)
+
+    # 줌 레벨별 단순화 경계 (원점 기준 float32로 저장해 용량 축소)
+    origin = arrays['bounds'][:2]
+    for level, tolerance in levels.items():
+        coords, offsets, ring_region, ring_part, ring_hole = _pack_rings(gdf.geometry, tolerance)
+        arrays[f'{level}_coords'] = (coords - origin).astype(np.float32)
+        arrays[f'{level}_offsets'] = offsets
+        arrays[f'{level}_ring_region'] = ring_region
+        arrays[f'{level}_ring_part'] = ring_part
+        arrays[f'{level}_ring_hole'] = ring_hole
+
+    meta = {
+        'version': CACHE_VERSION,
+        'source': os.path.abspath(shapefile_path),
+        'signature': _source_signature(shapefile_path),
+        'levels': {k: float(v) for k, v in levels.items()},
+        'attributes': attributes,
+        'count': int(len(gdf)),
+    }
+    arrays['meta'] = np.asarray(json.dumps(meta, ensure_ascii=False))
+
+    os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+    tmp_path = cache_path + '.tmp.npz'
+    np.savez_compressed(tmp_path, **arrays)
+    os.replace(tmp_path, cache_path)
+    _LOADED.clear()
+    print(f"지오메트리 캐시 생성: {cache_path} ({len(gdf)}개 지역, 레벨 {', '.join(levels)})")
+    return cache_path
+
+
+class KoreaGeometry:
+    """캐시된 행정구역 지오메트리 (NumPy 배열만 사용)"""
+
+    def __init__(self, cache_path):
+        """초기화 함수
+
+        Args:
+            cache_path (str): build_geometry_cache로 만든 .npz 경로
+        """
+        self.path = cache_path
+        with np.load(cache_path, allow_pickle=False) as data:
+            self._arrays = {key: data[key] for key in data.files}
+        self.meta = json.loads(str(self._arrays.pop('meta')))
+        self.levels = list(self.meta.get('levels', {}))
+        self.origin = self._arrays['bounds'][:2]
+
+    def __len__(self):
+        return int(self.meta.get('count', len(self._arrays['centroid_xy'])))
+
+    @property
+    def attributes(self):
+        """저장된 속성 컬럼 이름 목록"""
+        return list(self.meta.get('attributes', []))
+
+    def attribute(self, column):
+        """속성 컬럼 값 (없으면 None)"""
+        values = self._arrays.get(f'attr_{column}')
+        return None if values is None else [str(v) for v in values]
+
+    def name_column(self, candidates=('SIDO_NM', 'CTP_KOR_NM', 'SIG_KOR_NM', 'CTPRVN_NM', 'NAME', 'KOR_NM')):
+        """지역 이름 컬럼 찾기"""
+        for column in candidates:
+            if f'attr_{column}' in self._arrays:
+                return column
+        return None
+
+    def names(self, column=None):
+        """지역 이름 목록"""
+        column = column or self.name_column()
+        names = self.attribute(column) if column else None
+        return names if names is not None else [str(i) for i in range(len(self))]
+
+    def centroids(self, column=None, lonlat=False):
+        """지역 이름 → 중심점 좌표 (기본 EPSG:3857, lonlat=True면 경도/위도)"""
+        xy = self._arrays['centroid_lonlat' if lonlat else 'centroid_xy']
+        return {name: (float(x), float(y)) for name, (x, y) in zip(self.names(column), xy)}
+
+    def distance_matrix(self, column=None):
+        """중심점 간 거리 행렬 (km, DataFrame)"""
+        names = self.names(column)
+        return pd.DataFrame(self._arrays['distance_km'], index=names, columns=names)
+
+    def _level(self, level):
+        level = level or DEFAULT_LEVEL
+        if level not in self.levels:
+            level = self.levels[0]
+        return level
+
+    def rings(self, level=None, lonlat=False):
+        """레벨별 링 목록 [(지역 인덱스, 파트 인덱스, 구멍 여부, (N, 2) 좌표), ...]"""
+        level = self._level(level)
+        coords = self._arrays[f'{level}_coords'].astype(float) + self.origin
+        if lonlat:
+            coords = np.stack(mercator_to_lonlat(coords[:, 0], coords[:, 1]), axis=1)
+        offsets = self._arrays[f'{level}_offsets']
+        regions = self._arrays[f'{level}_ring_region']
+        parts = self._arrays[f'{level}_ring_part']
+        holes = self._arrays[f'{level}_ring_hole']
+        return [(int(regions[i]), int(parts[i]), bool(holes[i]), coords[offsets[i]:offsets[i + 1]])
+                for i in range(len(regions))]
+
+    def paths(self, level=None, lonlat=False):
+        """지역별 matplotlib Path 목록 (외곽선과 구멍을 하나의 복합 경로로)"""
+        from matplotlib.path import Path
+
+        per_region = [[] for _ in range(len(self))]
+        for region_idx, _, _, xy in self.rings(level, lonlat):
+            per_region[region_idx].append(xy)
+        paths = []
+        for ring_list in per_region:
+            if not ring_list:
+                paths.append(None)
+                continue
+            vertices, codes = [], []
+            for xy in ring_list:
+                ring_codes = np.full(len(xy), Path.LINETO, dtype=Path.code_type)
+                ring_codes[0] = Path.MOVETO
+                ring_codes[-1] = Path.CLOSEPOLY
+                vertices.append(xy)
+                codes.append(ring_codes)
+            paths.append(Path(np.vstack(vertices), np.concatenate(codes)))
+        return paths
+
+    def plot(self, ax=None, level=None, lonlat=False, color='lightgray', edgecolor='black',
+             linewidth=0.5, alpha=None, facecolor=None, zorder=None):
+        """경계 그리기 (GeoDataFrame.plot과 같은 주요 인자)
+
+        Returns:
+            matplotlib.axes.Axes: 그린 축
+        """
+        import matplotlib.pyplot as plt
+        from matplotlib.patches import PathPatch
+        from matplotlib.collections import PatchCollection
+
+        if ax is None:
+            _, ax = plt.subplots()
+        patches = [PathPatch(path) for path in self.paths(level, lonlat) if path is not None]
+        collection = PatchCollection(patches, facecolor=facecolor if facecolor is not None else color,
+                                     edgecolor=edgecolor, linewidth=linewidth, alpha=alpha)
+        if zorder is not None:
+            collection.set_zorder(zorder)
+        ax.add_collection(collection)
+        ax.autoscale_view()
+        ax.set_aspect('equal')
+        return ax
+
+    def to_geodataframe(self, level=None):
+        """GeoDataFrame 복원 (shapely/geopandas 필요, 기존 코드 호환용)"""
+        import geopandas as gpd
+        from shapely.geometry import Polygon, MultiPolygon
+
+        parts = {}
+        for region_idx, part_idx, is_hole, xy in self.rings(level):
+            entry = parts.setdefault(part_idx, [region_idx, None, []])
+            if is_hole:
+                entry[2].append(xy)
+            else:
+                entry[1] = xy
+        polygons = [[] for _ in range(len(self))]
+        for region_idx, shell, holes in parts.values():
+            if shell is not None:
+                polygons[region_idx].append(Polygon(shell, holes))
+        geometry = [None if not p else (p[0] if len(p) == 1 else MultiPolygon(p)) for p in polygons]
+        data = {column: self.attribute(column) for column in self.attributes}
+        return gpd.GeoDataFrame(data, geometry=geometry, crs='EPSG:3857')
+
+
+def _is_stale(geometry, shapefile_path):
+    """캐시가 셰이프파일보다 오래되었는지 확인 (셰이프파일이 없으면 캐시를 그대로 사용)"""
+    if geometry.meta.get('version') != CACHE_VERSION:
+        return True
+    signature = _source_signature(shapefile_path)
+    if not signature:
+        return False
+    return signature != geometry.meta.get('signature')
+
+
+def load_geometry_cache(shapefile_path=DEFAULT_SHAPEFILE, cache_path=None, build=True):
+    """지오메트리 캐시 로드 (없거나 오래되었으면 build=True일 때 다시 생성)
+
+    Args:
+        shapefile_path (str): 원본 셰이프파일 경로
+        cache_path (str, optional): 캐시 경로 (기본: 셰이프파일 옆, KOREA_GEOMETRY_CACHE 환경변수 우선)
+        build (bool): 캐시가 없거나 오래되었을 때 생성 여부 (geopandas 필요)
+
+    Returns:
+        KoreaGeometry or None: 로드 실패 시 None
+    """
+    cache_path = cache_path or os.environ.get('KOREA_GEOMETRY_CACHE') or default_cache_path(shapefile_path)
+    geometry = None
+    if os.path.exists(cache_path):
+        key = (os.path.abspath(cache_path), os.path.getmtime(cache_path))
+        geometry = _LOADED.get(key)
+        if geometry is None:
+            try:
+                geometry = KoreaGeometry(cache_path)
+                _LOADED[key] = geometry
+            except Exception as e:
+                print(f"지오메트리 캐시 로드 경고: {str(e)}")
+                geometry = None
+        if geometry is not None and not _is_stale(geometry, shapefile_path):
+            return geometry
+
+    if build and os.path.exists(shapefile_path):
+        try:
+            build_geometry_cache(shapefile_path, cache_path)
+            geometry = KoreaGeometry(cache_path)
+            _LOADED[(os.path.abspath(cache_path), os.path.getmtime(cache_path))] = geometry
+        except Exception as e:
+            print(f"지오메트리 캐시 생성 경고: {str(e)}")
+    return geometry
+
+
+if __name__ == '__main__':
+    source = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_SHAPEFILE
+    target = sys.argv[2] if len(sys.argv) > 2 else None
+    build_geometry_cache(source, target)
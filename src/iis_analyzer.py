@@ -0,0 +1,515 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+최적화 실패(infeasible) 원인 분석 모듈 - IIS 추출 및 컴포넌트 매핑
+
+생성된 linopy 모델에서 IIS(Irreducible Infeasible Subsystem, 더 줄일 수 없는 모순 제약 집합)를 구하고,
+각 제약/변수 경계를 PyPSA 컴포넌트, 스냅샷, 입력 Excel 시트 행으로 되돌려 매핑합니다.
+슬랙 발전기를 더 붙이는 대신 "어느 행을 고쳐야 하는지"를 알려주는 것이 목적입니다.
+
+IIS 계산:
+    cplex   - CPLEX conflict refiner (cplex 파이썬 API가 있을 때)
+    highs   - HiGHS 쌍대 광선(Farkas 증명서)의 지지 집합을 후보로 잡고, 후보를 하나씩(먼저 묶음으로)
+              제거해 보며 여전히 infeasible이면 버리는 deletion filter로 최소화
+
+사용 예:
+    result = analyze_infeasible_network(network, input_file='integrated_input_data.xlsx')
+    python src/iis_analyzer.py [integrated_input_data.xlsx]
+"""
+
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# PyPSA 컴포넌트 → 입력 Excel 시트
+COMPONENT_SHEETS = {
+    'Bus': 'buses',
+    'Generator': 'generators',
+    'Load': 'loads',
+    'Line': 'lines',
+    'Link': 'links',
+    'Store': 'stores',
+    'StorageUnit': 'storage_units',
+    'Transformer': 'transformers',
+}
+
+# 시간 차원 이름
+TIME_DIMS = ('snapshot', 'period', 'timestep')
+
+# create_network에서 자동으로 추가하는 요소 (입력 시트에 행이 없음)
+AUTO_PATTERN = r'_Slack_|_Fallback_Gen'
+
+# deletion filter 설정
+DEFAULT_TIME_LIMIT = 600
+BLOCK_SIZE = 64
+RAY_TOLERANCE = 1e-9
+
+
+# ---------------------------------------------------------------------------
+# 행렬 형태 LP (linopy 모델 → 배열)
+# ---------------------------------------------------------------------------
+
+class _LinearProgram:
+    """IIS 탐색용 LP: 행 경계 [row_lower, row_upper], 열 경계 [col_lower, col_upper]"""
+
+    def __init__(self, model):
+        matrices = model.matrices
+        self.A = matrices.A.tocsr()
+        self.clabels = np.asarray(matrices.clabels)
+        self.vlabels = np.asarray(matrices.vlabels)
+        sense = np.asarray(matrices.sense).astype(str)
+        b = np.asarray(matrices.b, dtype=float)
+        self.row_lower = np.where(sense == '<', -np.inf, b)
+        self.row_upper = np.where(sense == '>', np.inf, b)
+        self.col_lower = np.asarray(matrices.lb, dtype=float)
+        self.col_upper = np.asarray(matrices.ub, dtype=float)
+
+    @property
+    def shape(self):
+        return self.A.shape
+
+
+def _highs_instance(lp, rows, columns, col_lower, col_upper):
+    """부분 LP(행/열 부분집합, 목적함수 0)를 담은 Highs 객체"""
+    import highspy
+
+    sub = lp.A[rows][:, columns].tocsc()
+    model = highspy.HighsLp()
+    model.num_col_ = len(columns)
+    model.num_row_ = len(rows)
+    model.col_cost_ = np.zeros(len(columns))
+    model.col_lower_ = np.where(np.isfinite(col_lower), col_lower, -highspy.kHighsInf)
+    model.col_upper_ = np.where(np.isfinite(col_upper), col_upper, highspy.kHighsInf)
+    model.row_lower_ = np.where(np.isfinite(lp.row_lower[rows]), lp.row_lower[rows], -highspy.kHighsInf)
+    model.row_upper_ = np.where(np.isfinite(lp.row_upper[rows]), lp.row_upper[rows], highspy.kHighsInf)
+    model.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+    model.a_matrix_.start_ = sub.indptr
+    model.a_matrix_.index_ = sub.indices
+    model.a_matrix_.value_ = sub.data
+
+    highs = highspy.Highs()
+    highs.setOptionValue('output_flag', False)
+    highs.setOptionValue('presolve', 'off')
+    highs.passModel(model)
+    return highs
+
+
+def _independent_blocks(lp):
+    """변수를 공유하지 않는 독립 블록(행, 열) 목록, 작은 블록부터
+
+    시간 결합(저장장치, 확장 용량)이 없으면 스냅샷별로 나뉘어 전체 LP 대신 작은 LP만 풉니다.
+    """
+    from scipy import sparse
+    from scipy.sparse.csgraph import connected_components
+
+    n_rows, n_cols = lp.shape
+    coo = lp.A.tocoo()
+    graph = sparse.coo_matrix((np.ones(len(coo.row)), (coo.row, n_rows + coo.col)),
+                              shape=(n_rows + n_cols, n_rows + n_cols))
+    _, labels = connected_components(graph, directed=False)
+    row_labels, col_labels = labels[:n_rows], labels[n_rows:]
+    row_order = np.argsort(row_labels, kind='stable')
+    col_order = np.argsort(col_labels, kind='stable')
+    row_groups = np.split(row_order, np.searchsorted(row_labels[row_order], np.unique(row_labels))[1:])
+    col_starts = np.searchsorted(col_labels[col_order], np.unique(col_labels))
+    col_groups = dict(zip(col_labels[col_order][col_starts], np.split(col_order, col_starts[1:])))
+    blocks = [(group, col_groups.get(row_labels[group[0]], np.array([], dtype=int)))
+              for group in row_groups if len(group)]
+    # 제약 없이 경계만 있는 열(하한 > 상한)도 블록으로 포함
+    lonely = np.flatnonzero((np.bincount(coo.col, minlength=n_cols) == 0) & (lp.col_lower > lp.col_upper))
+    blocks += [(np.array([], dtype=int), np.array([j])) for j in lonely]
+    return sorted(blocks, key=lambda block: len(block[0]) + len(block[1]))
+
+
+def _is_infeasible(highs):
+    import highspy
+
+    highs.run()
+    return highs.getModelStatus() == highspy.HighsModelStatus.kInfeasible
+
+
+# ---------------------------------------------------------------------------
+# IIS 계산
+# ---------------------------------------------------------------------------
+
+def _iis_highs(lp, time_limit=DEFAULT_TIME_LIMIT):
+    """HiGHS 쌍대 광선 + deletion filter IIS
+
+    Returns:
+        dict: rows(제약 위치), bounds([(열 위치, 'lower'|'upper')]), irreducible, elapsed
+    """
+    started = time.perf_counter()
+
+    # 1) 독립 블록별 풀이 → 처음 찾은 infeasible 블록의 쌍대 광선(Farkas 증명서)
+    highs, block_rows, block_cols = None, None, None
+    for block_rows, block_cols in _independent_blocks(lp):
+        highs = _highs_instance(lp, block_rows, block_cols, lp.col_lower[block_cols], lp.col_upper[block_cols])
+        if _is_infeasible(highs):
+            break
+        highs = None
+    if highs is None:
+        return {'rows': [], 'bounds': [], 'irreducible': False, 'feasible': True,
+                'elapsed': time.perf_counter() - started}
+    _, has_ray, ray = highs.getDualRay()
+    del highs
+
+    if has_ray:
+        ray = np.asarray(ray, dtype=float)
+        support = np.flatnonzero(np.abs(ray) > RAY_TOLERANCE)
+        rows = block_rows[support]
+        reduced = lp.A[rows].T @ ray[support]
+        bound_cols = np.flatnonzero(np.abs(reduced) > RAY_TOLERANCE)
+    else:
+        rows, bound_cols = block_rows, block_cols
+
+    # 2) 후보 부분 LP: 광선 지지 행 + 해당 열 경계 (나머지 열 경계는 해제)
+    columns = np.unique(lp.A[rows].indices) if len(rows) else np.array([], dtype=int)
+    columns = np.union1d(columns, bound_cols)
+    keep_bound = np.isin(columns, bound_cols)
+    col_lower = np.where(keep_bound, lp.col_lower[columns], -np.inf)
+    col_upper = np.where(keep_bound, lp.col_upper[columns], np.inf)
+    highs = _highs_instance(lp, rows, columns, col_lower, col_upper)
+    if not _is_infeasible(highs):
+        # 수치 오차로 광선이 불완전하면 열 경계를 모두 포함, 그래도 안 되면 블록 전체
+        col_lower, col_upper = lp.col_lower[columns], lp.col_upper[columns]
+        highs = _highs_instance(lp, rows, columns, col_lower, col_upper)
+        if not _is_infeasible(highs):
+            rows, columns = block_rows, block_cols
+            col_lower, col_upper = lp.col_lower[columns], lp.col_upper[columns]
+            highs = _highs_instance(lp, rows, columns, col_lower, col_upper)
+
+    # 3) deletion filter: 후보 (행, 하한, 상한)을 제거해도 infeasible이면 영구 제거
+    import highspy
+    inf = highspy.kHighsInf
+    row_bounds = [(float(v) if np.isfinite(v) else -inf, float(u) if np.isfinite(u) else inf)
+                  for v, u in zip(lp.row_lower[rows], lp.row_upper[rows])]
+    col_bounds = [[float(v) if np.isfinite(v) else -inf, float(u) if np.isfinite(u) else inf]
+                  for v, u in zip(col_lower, col_upper)]
+    candidates = [('row', k) for k in range(len(rows))]
+    candidates += [('lower', j) for j in range(len(columns)) if np.isfinite(col_lower[j])]
+    candidates += [('upper', j) for j in range(len(columns)) if np.isfinite(col_upper[j])]
+
+    def relax(item):
+        kind, k = item
+        if kind == 'row':
+            highs.changeRowBounds(k, -inf, inf)
+        elif kind == 'lower':
+            highs.changeColBounds(k, -inf, col_bounds[k][1])
+            col_bounds[k][0] = -inf
+        else:
+            highs.changeColBounds(k, col_bounds[k][0], inf)
+            col_bounds[k][1] = inf
+
+    def restore(item, saved):
+        kind, k = item
+        if kind == 'row':
+            highs.changeRowBounds(k, *row_bounds[k])
+        else:
+            col_bounds[k] = list(saved)
+            highs.changeColBounds(k, *saved)
+
+    kept = []
+    irreducible = True
+    position = 0
+    while position < len(candidates):
+        if time.perf_counter() - started > time_limit:
+            kept.extend(candidates[position:])
+            irreducible = False
+            break
+        block = candidates[position:position + BLOCK_SIZE]
+        position += len(block)
+        # 묶음 전체 제거 시도 → 여전히 infeasible이면 묶음 전체 버림
+        saved = [tuple(col_bounds[k]) if kind != 'row' else None for kind, k in block]
+        for item in block:
+            relax(item)
+        if len(block) > 1 and _is_infeasible(highs):
+            continue
+        for item, state in zip(block, saved):
+            restore(item, state)
+        # 하나씩 제거 시도
+        for item in block:
+            state = tuple(col_bounds[item[1]]) if item[0] != 'row' else None
+            relax(item)
+            if _is_infeasible(highs):
+                continue
+            restore(item, state)
+            kept.append(item)
+
+    iis_rows = [int(rows[k]) for kind, k in kept if kind == 'row']
+    iis_bounds = [(int(columns[k]), kind) for kind, k in kept if kind != 'row']
+    return {'rows': iis_rows, 'bounds': iis_bounds, 'irreducible': irreducible, 'feasible': False,
+            'elapsed': time.perf_counter() - started}
+
+
+def _iis_cplex(model, lp, time_limit=DEFAULT_TIME_LIMIT):
+    """CPLEX conflict refiner IIS (linopy LP 파일: 제약 c{label}, 변수 x{label})"""
+    import tempfile
+    import cplex
+
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'model.lp')
+        model.to_file(path)
+        cpx = cplex.Cplex(path)
+    cpx.set_log_stream(None)
+    cpx.set_results_stream(None)
+    cpx.set_warning_stream(None)
+    cpx.parameters.timelimit.set(time_limit)
+    cpx.conflict.refine(cpx.conflict.all_constraints())
+
+    row_position = pd.Index(lp.clabels)
+    col_position = pd.Index(lp.vlabels)
+    members = (cpx.conflict.group_status.member, cpx.conflict.group_status.possible_member)
+    types = cpx.conflict.constraint_type
+    rows, bounds = [], []
+    for status, (_, group) in zip(cpx.conflict.get(), cpx.conflict.get_groups()):
+        if status not in members:
+            continue
+        for ctype, index in group:
+            if ctype == types.linear:
+                label = int(cpx.linear_constraints.get_names(index)[1:])
+                rows.append(int(row_position.get_loc(label)))
+            elif ctype in (types.lower_bound, types.upper_bound):
+                label = int(cpx.variables.get_names(index)[1:])
+                bounds.append((int(col_position.get_loc(label)), 'lower' if ctype == types.lower_bound else 'upper'))
+    return {'rows': rows, 'bounds': bounds, 'irreducible': True, 'feasible': False,
+            'elapsed': time.perf_counter() - started}
+
+
+def compute_iis(model, solver='auto', time_limit=DEFAULT_TIME_LIMIT):
+    """linopy 모델의 IIS 계산
+
+    Args:
+        model (linopy.Model): network.optimize.create_model()로 만든 모델
+        solver (str): 'auto'(CPLEX 있으면 CPLEX, 없으면 HiGHS), 'cplex', 'highs'
+        time_limit (float): 제한 시간(초). 초과 시 최소화가 끝나지 않은 모순 집합 반환
+
+    Returns:
+        dict: rows, bounds, irreducible, feasible, elapsed, solver, lp
+    """
+    lp = _LinearProgram(model)
+    if solver in ('auto', 'cplex'):
+        try:
+            result = _iis_cplex(model, lp, time_limit)
+            result.update(solver='cplex', lp=lp)
+            return result
+        except ImportError:
+            if solver == 'cplex':
+                raise
+    result = _iis_highs(lp, time_limit)
+    result.update(solver='highs', lp=lp)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# 컴포넌트/스냅샷/입력 시트 행 매핑
+# ---------------------------------------------------------------------------
+
+def _split_coords(coords):
+    """좌표 → (요소 이름, 스냅샷)"""
+    element, snapshot = None, None
+    for dim, value in coords.items():
+        if dim in TIME_DIMS:
+            snapshot = value if snapshot is None else snapshot
+        elif element is None:
+            element = value
+    return element, snapshot
+
+
+def _format_snapshot(value):
+    if value is None:
+        return ''
+    if isinstance(value, tuple):
+        return ' / '.join(_format_snapshot(v) for v in value)
+    try:
+        return pd.Timestamp(value).strftime('%Y-%m-%d %H:%M')
+    except Exception:
+        return str(value)
+
+
+def _variable_text(model, label):
+    name, coords = model.variables.get_label_position(int(label))
+    element, snapshot = _split_coords(coords)
+    inside = ', '.join(str(v) for v in (element, _format_snapshot(snapshot) if snapshot is not None else None) if v)
+    return f"{name}[{inside}]"
+
+
+def _row_text(model, lp, row, max_terms=6):
+    """제약식 문자열 (예: +1 Generator-p[SEL_PV, 2030-01-01 00:00] ... <= 100)"""
+    start, end = lp.A.indptr[row], lp.A.indptr[row + 1]
+    terms = [f"{coef:+g} {_variable_text(model, lp.vlabels[col])}"
+             for coef, col in zip(lp.A.data[start:end][:max_terms], lp.A.indices[start:end][:max_terms])]
+    if end - start > max_terms:
+        terms.append(f"... (+{end - start - max_terms}항)")
+    lower, upper = lp.row_lower[row], lp.row_upper[row]
+    if lower == upper:
+        rhs = f"= {lower:g}"
+    elif np.isfinite(upper):
+        rhs = f"<= {upper:g}"
+    else:
+        rhs = f">= {lower:g}"
+    return f"{' '.join(terms)} {rhs}"
+
+
+def _sheet_rows(input_data=None, input_file=None, sheets=()):
+    """시트별 name → Excel 행 번호(헤더 1행 기준 2부터)"""
+    lookup = {}
+    for sheet in sheets:
+        df = None
+        if input_data is not None and sheet in input_data:
+            df = input_data[sheet]
+        elif input_file and os.path.exists(input_file):
+            try:
+                df = pd.read_excel(input_file, sheet_name=sheet)
+            except Exception:
+                df = None
+        if df is None or 'name' not in getattr(df, 'columns', []):
+            continue
+        names = df['name'].astype(str).reset_index(drop=True)
+        lookup[sheet] = pd.Series(names.index + 2, index=names).groupby(level=0).first().to_dict()
+    return lookup
+
+
+def map_iis(model, iis, network=None, input_data=None, input_file=None):
+    """IIS 제약/경계를 컴포넌트, 스냅샷, 입력 시트 행으로 매핑
+
+    Args:
+        model (linopy.Model): IIS를 계산한 모델
+        iis (dict): compute_iis 결과
+        network (pypsa.Network, optional): 버스 제약의 연결 요소(부하/발전기) 표시용
+        input_data (dict, optional): read_input_data 결과 (시트별 DataFrame)
+        input_file (str, optional): input_data가 없을 때 행 번호를 찾을 Excel 경로
+
+    Returns:
+        pd.DataFrame: kind, constraint, component, element, snapshot, sheet, excel_row, related, expression
+    """
+    lp = iis['lp']
+    records = []
+    for row in iis['rows']:
+        name, coords = model.constraints.get_label_position(int(lp.clabels[row]))
+        element, snapshot = _split_coords(coords)
+        records.append({'kind': 'constraint', 'constraint': name, 'element': element, 'snapshot': snapshot,
+                        'expression': _row_text(model, lp, row)})
+    for col, side in iis['bounds']:
+        name, coords = model.variables.get_label_position(int(lp.vlabels[col]))
+        element, snapshot = _split_coords(coords)
+        value = lp.col_lower[col] if side == 'lower' else lp.col_upper[col]
+        records.append({'kind': f'{side}_bound', 'constraint': name, 'element': element, 'snapshot': snapshot,
+                        'expression': f"{_variable_text(model, lp.vlabels[col])} {'>=' if side == 'lower' else '<='} {value:g}"})
+
+    columns = ['kind', 'constraint', 'component', 'element', 'snapshot', 'sheet', 'excel_row', 'related', 'expression']
+    table = pd.DataFrame(records)
+    if table.empty:
+        return pd.DataFrame(columns=columns)
+
+    table['component'] = table['constraint'].str.split('-').str[0]
+    table.loc[table['component'] == 'Kirchhoff', 'component'] = 'Line'
+    table['sheet'] = table['component'].map(COMPONENT_SHEETS)
+    table['element'] = table['element'].astype(object).where(table['element'].notna(), '')
+    table['snapshot'] = table['snapshot'].map(_format_snapshot)
+
+    # 버스 제약은 연결된 부하/발전기 이름도 함께 표시 (수요/공급 측 입력 행 확인용)
+    related = pd.Series('', index=table.index, dtype=object)
+    if network is not None:
+        attached = {}
+        for list_name in ('loads', 'generators', 'stores', 'storage_units'):
+            static = getattr(network, list_name)
+            if len(static):
+                for bus, names in static.groupby('bus').groups.items():
+                    attached.setdefault(str(bus), []).extend(str(n) for n in names)
+        is_bus = table['component'] == 'Bus'
+        related[is_bus] = table.loc[is_bus, 'element'].map(
+            lambda bus: ', '.join(attached.get(str(bus), [])[:10]))
+    table['related'] = related
+
+    lookup = _sheet_rows(input_data, input_file, sorted(table['sheet'].dropna().unique()))
+    auto = table['element'].astype(str).str.contains(AUTO_PATTERN, regex=True)
+    table['excel_row'] = [
+        ('자동 생성' if is_auto else lookup.get(sheet, {}).get(str(element), ''))
+        if isinstance(sheet, str) else ''
+        for sheet, element, is_auto in zip(table['sheet'], table['element'], auto)
+    ]
+    return table[columns]
+
+
+def summarize_iis(table):
+    """IIS를 (제약 종류, 요소) 단위로 요약: 항목 수, 첫/마지막 스냅샷, 입력 행"""
+    if table.empty:
+        return table
+    grouped = table.groupby(['constraint', 'component', 'element', 'sheet', 'excel_row'], dropna=False, sort=False)
+    summary = grouped.agg(count=('kind', 'size'), first_snapshot=('snapshot', 'min'),
+                          last_snapshot=('snapshot', 'max')).reset_index()
+    return summary.sort_values('count', ascending=False).reset_index(drop=True)
+
+
+# ---------------------------------------------------------------------------
+# 진입점
+# ---------------------------------------------------------------------------
+
+def analyze_infeasible_network(network, input_data=None, input_file=None, output_dir=None,
+                               solver='auto', time_limit=DEFAULT_TIME_LIMIT):
+    """infeasible 네트워크의 IIS를 구해 입력 행까지 매핑하고 저장
+
+    Args:
+        network (pypsa.Network): 최적화에 실패한 네트워크 (network.model이 없으면 새로 생성)
+        input_data (dict, optional): 입력 데이터 (시트 행 번호 매핑용)
+        input_file (str, optional): 입력 Excel 경로 (input_data가 없을 때)
+        output_dir (str, optional): CSV 저장 폴더 (없으면 저장하지 않음)
+        solver (str): 'auto', 'cplex', 'highs'
+        time_limit (float): IIS 최소화 제한 시간(초)
+
+    Returns:
+        dict: status, solver, irreducible, elapsed, iis(DataFrame), summary(DataFrame), files
+    """
+    model = getattr(network, 'model', None)
+    if model is None or not hasattr(model, 'matrices'):
+        model = network.optimize.create_model()
+
+    print(f"IIS 계산 중... (solver={solver}, 제한 {time_limit:.0f}초)")
+    iis = compute_iis(model, solver=solver, time_limit=time_limit)
+    if iis['feasible']:
+        print("모델이 feasible입니다. IIS가 없습니다.")
+        return {'status': 'feasible', 'solver': iis['solver'], 'irreducible': False,
+                'elapsed': iis['elapsed'], 'iis': pd.DataFrame(), 'summary': pd.DataFrame(), 'files': {}}
+
+    table = map_iis(model, iis, network, input_data, input_file)
+    summary = summarize_iis(table)
+    label = 'IIS' if iis['irreducible'] else '모순 집합(최소화 미완료)'
+    print(f"{label}: 제약 {len(iis['rows'])}개, 변수 경계 {len(iis['bounds'])}개 "
+          f"({iis['solver']}, {iis['elapsed']:.1f}초)")
+    for _, row in summary.head(15).iterrows():
+        where = f"{row['sheet']} {row['excel_row']}행" if row['excel_row'] not in ('', None) else (row['sheet'] or '-')
+        period = row['first_snapshot'] if row['first_snapshot'] == row['last_snapshot'] else \
+            f"{row['first_snapshot']} ~ {row['last_snapshot']}"
+        print(f"  - {row['constraint']} [{row['element']}] × {row['count']} ({period}) ← {where}")
+
+    files = {}
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        files['iis'] = os.path.join(output_dir, f'iis_{stamp}.csv')
+        files['summary'] = os.path.join(output_dir, f'iis_{stamp}_summary.csv')
+        table.to_csv(files['iis'], index=False, encoding='utf-8-sig')
+        summary.to_csv(files['summary'], index=False, encoding='utf-8-sig')
+        print(f"IIS 저장: {files['iis']}")
+
+    return {'status': 'infeasible', 'solver': iis['solver'], 'irreducible': iis['irreducible'],
+            'elapsed': iis['elapsed'], 'iis': table, 'summary': summary, 'files': files}
+
+
+if __name__ == '__main__':
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import PyPSA_GUI
+
+    input_file = sys.argv[1] if len(sys.argv) > 1 else PyPSA_GUI.INPUT_FILE
+    input_data = PyPSA_GUI.read_input_data(input_file)
+    if input_data is None:
+        sys.exit(1)
+    input_data = PyPSA_GUI.standardize_bus_names_in_input(input_data)
+    network = PyPSA_GUI.create_network(input_data)
+    analyze_infeasible_network(network, input_data=input_data, output_dir=os.path.join('results', 'debug'))
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+연도별 입력 copy-on-write 오버레이 모듈
+
+멀티년 실행에서 연도마다 input_data 전체(패턴/시나리오 시트 포함)를 deepcopy하지 않도록,
+기준 입력의 시트를 얕은 복사(컬럼 배열 공유)로 감싸고 바뀐 컬럼만 새 배열로 교체합니다.
+컬럼 갱신은 항상 '컬럼 전체 교체'로 하므로 기준 입력의 배열은 절대 수정되지 않습니다.
+(행 단위 .loc/.at 대입은 공유 배열을 건드릴 수 있으므로 사용하지 않음)
+
+name 기준 갱신은 해시 조인(Series.map)으로 처리해 요소 수에 선형입니다.
+
+사용 예:
+    data = InputOverlay(base_input)
+    update_column_by_name(data['generators'], 'p_nom_min', caps, combine=np.fmax)
+    data.changed_columns()   # {'generators': ['p_nom_min']}
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class InputOverlay(dict):
+    """기준 입력 위에서 바뀐 컬럼만 새로 가지는 입력 데이터 (dict 호환, 시트 = 얕은 복사 DataFrame)"""
+
+    def __init__(self, base):
+        """초기화 함수
+
+        Args:
+            base (dict): 기준 입력 (read_input_data 결과 또는 다른 InputOverlay)
+        """
+        super().__init__({sheet: (df.copy(deep=False) if isinstance(df, pd.DataFrame) else df)
+                          for sheet, df in base.items()})
+        self.base = base.base if isinstance(base, InputOverlay) else base
+
+    def __reduce__(self):
+        # 프로세스 간 전달 시 일반 dict처럼 직렬화
+        return (dict, (dict(self),))
+
+    def changed_columns(self):
+        """기준 입력과 배열을 공유하지 않는(새로 쓰인) 컬럼 목록
+
+        Returns:
+            dict: {시트: [컬럼, ...]}
+        """
+        changed = {}
+        for sheet, df in self.items():
+            base_df = self.base.get(sheet)
+            if not isinstance(df, pd.DataFrame):
+                continue
+            if not isinstance(base_df, pd.DataFrame):
+                changed[sheet] = list(df.columns)
+                continue
+            columns = [col for col in df.columns
+                       if col not in base_df.columns or not _shares(df[col], base_df[col])]
+            if columns:
+                changed[sheet] = columns
+        return changed
+
+
+def _arrow_buffers(array):
+    # Arrow 기반 컬럼(pandas 문자열 등)은 numpy 변환 시 복사되므로 버퍼 주소로 비교
+    if not hasattr(array, '__arrow_array__'):
+        return None
+    chunked = array.__arrow_array__()
+    chunks = getattr(chunked, 'chunks', [chunked])
+    return {buf.address for chunk in chunks for buf in chunk.buffers() if buf is not None and buf.size}
+
+
+def _shares(left, right):
+    try:
+        left_buffers, right_buffers = _arrow_buffers(left.array), _arrow_buffers(right.array)
+        if left_buffers is not None and right_buffers is not None:
+            return bool(left_buffers & right_buffers)
+        return np.shares_memory(np.asarray(left.array), np.asarray(right.array))
+    except Exception:
+        return left is right
+
+
+def update_column_by_name(df, column, values, combine=None, default=np.nan):
+    """name 컬럼 기준 키 병합으로 컬럼 갱신 (컬럼 전체 교체)
+
+    Args:
+        df (pd.DataFrame): 대상 시트 (in-place로 컬럼만 교체)
+        column (str): 갱신할 컬럼 (없으면 default로 생성)
+        values (pd.Series | dict): name → 값
+        combine (callable, optional): (기존값, 새값) → 결과 (예: np.fmax). 없으면 새값으로 대체
+        default: 컬럼이 없을 때 기본값
+
+    Returns:
+        int: 갱신된 행 수
+    """
+    if df is None or df.empty or 'name' not in df.columns:
+        return 0
+    values = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    if values.empty:
+        return 0
+    values = values[~values.index.duplicated(keep='last')]
+    values.index = values.index.astype(str)
+    mapped = df['name'].astype(str).map(values)
+    hit = mapped.notna()
+    if not hit.any():
+        if column not in df.columns:
+            df[column] = default
+        return 0
+    current = df[column] if column in df.columns else pd.Series(default, index=df.index)
+    if combine is not None:
+        current = pd.to_numeric(current, errors='coerce').astype(float)
+        updated = pd.Series(combine(current.to_numpy(),
+                                    pd.to_numeric(mapped, errors='coerce').to_numpy(dtype=float)),
+                            index=df.index)
+    else:
+        updated = mapped
+    df[column] = current.where(~hit, updated)
+    return int(hit.sum())
+
+
+def set_column(df, column, value, mask=None):
+    """컬럼 전체 교체로 값 대입 (mask가 있으면 해당 행만 바꾼 새 컬럼)
+
+    Args:
+        df (pd.DataFrame): 대상 시트
+        column (str): 컬럼
+        value: 스칼라 또는 df 길이의 배열
+        mask (pd.Series, optional): 갱신할 행
+    """
+    if mask is None:
+        df[column] = value
+        return
+    current = df[column] if column in df.columns else pd.Series(np.nan, index=df.index)
+    df[column] = current.where(~mask, value)
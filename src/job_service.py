@@ -0,0 +1,624 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+로컬 작업 서비스 모듈 - pypsa/linopy를 올려 둔 상주 작업 프로세스와 입력·네트워크 캐시
+
+python PyPSA_GUI.py를 실행할 때마다 인터프리터 시작, pypsa/linopy/geopandas/korea_map 임포트, PROJ 경로 탐색,
+Excel 파싱, 솔버 확인을 매번 다시 했습니다. 작은 실행을 하루 수십 번 돌리면 이 고정 비용이 대부분입니다.
+이 서비스는 localhost HTTP(127.0.0.1)로 작업을 받아 상주 작업 프로세스에서 실행합니다.
+
+    작업 프로세스   시작 시 PyPSA_GUI를 한 번 임포트 (이후 작업은 임포트/PROJ/솔버 확인 비용 없음)
+    입력 캐시       (파일 경로, 수정 시간) → 읽기 + 버스명 표준화 결과 (LRU, JOB_SERVICE_INPUT_CACHE, 기본 4)
+    네트워크 캐시    생성 키 → 생성된 기준 네트워크 (LRU, JOB_SERVICE_NETWORK_CACHE, 기본 2, 작업마다 복사본 사용)
+                   디스크 네트워크 캐시(network_cache)도 그대로 사용
+    what-if 세션    생성 키 → ResolveSession (LRU, JOB_SERVICE_SESSION_CACHE, 기본 1)
+
+작업 종류 (POST /jobs 본문 JSON):
+    {'type': 'run', 'params': {...}, 'env': {...}, 'input_file': ...}       단일 실행 → results/<시각>_<작업 ID>
+    {'type': 'sweep', 'grid': {...}, 'core_budget': 8, ...}                   scenario_sweep.run_sweep → results_sweep/
+    {'type': 'whatif', 'changes': [{...}, ...], 'params': {...}}              재풀이 세션 → results_whatif/<작업 ID>
+    params는 scenario_sweep 변형 키, env는 작업 동안만 적용할 환경변수입니다.
+
+HTTP:
+    GET  /health            작업 프로세스·대기열 상태
+    GET  /jobs, /jobs/<ID>  작업 상태 (stage, 로그 마지막 줄들, 결과), ?since=N 이후 로그만
+    POST /jobs              작업 제출 → {'id': ...}
+    POST /shutdown          서비스 종료
+
+사용 예:
+    python src/job_service.py serve --workers 2
+    python src/job_service.py run --params '{"co2_limit": 1.5e8}'
+    python src/job_service.py whatif changes.json
+    python src/job_service.py status job_0003
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+import traceback
+import contextlib
+import multiprocessing
+from collections import OrderedDict, deque
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib import request as _request
+from urllib.error import URLError
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+JOB_TYPES = ('run', 'sweep', 'whatif')
+LOG_LINES = 500
+
+
+def _gui():
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+    import PyPSA_GUI
+    return PyPSA_GUI
+
+
+def _env_int(name, default):
+    try:
+        return max(0, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+class LRUCache:
+    """최근 사용 순서 캐시 (최대 개수를 넘으면 가장 오래 쓰지 않은 항목 제거)"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        if key in self._items:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return self._items[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def stats(self):
+        return {'size': len(self._items), 'maxsize': self.maxsize, 'hits': self.hits, 'misses': self.misses}
+
+
+# ---------------------------------------------------------------------------
+# 작업 프로세스
+# ---------------------------------------------------------------------------
+
+class _ProgressStream:
+    """작업 출력(print)을 줄 단위로 서비스에 전달하고 작업 로그 파일에도 기록"""
+
+    def __init__(self, events, job_id):
+        self.events = events
+        self.job_id = job_id
+        self.buffer = ''
+        self.log = None
+
+    def open_log(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.log = open(path, 'a', encoding='utf-8')
+
+    def write(self, text):
+        if self.log is not None:
+            self.log.write(text)
+        self.buffer += text
+        while '\n' in self.buffer:
+            line, self.buffer = self.buffer.split('\n', 1)
+            if line.strip():
+                self.events.put(('log', self.job_id, line.rstrip('\r')))
+        return len(text)
+
+    def flush(self):
+        if self.log is not None:
+            self.log.flush()
+
+    def close(self):
+        if self.buffer.strip():
+            self.events.put(('log', self.job_id, self.buffer))
+        self.buffer = ''
+        if self.log is not None:
+            self.log.close()
+            self.log = None
+
+
+class _WorkerState:
+    """작업 프로세스 상주 상태: 입력/기준 네트워크/what-if 세션 LRU 캐시"""
+
+    def __init__(self, events):
+        self.events = events
+        self.job_id = None
+        self.inputs = LRUCache(_env_int('JOB_SERVICE_INPUT_CACHE', 4))
+        self.networks = LRUCache(_env_int('JOB_SERVICE_NETWORK_CACHE', 2))
+        self.sessions = LRUCache(_env_int('JOB_SERVICE_SESSION_CACHE', 1))
+
+    def stage(self, name):
+        self.events.put(('stage', self.job_id, name))
+
+    def input(self, input_file=None):
+        """파싱된 입력 (경로·수정 시간 기준 캐시, 작업에서 바꾸지 않도록 오버레이로 사용)"""
+        gui = _gui()
+        path = os.path.abspath(input_file or os.path.join(ROOT_DIR, gui.INPUT_FILE))
+        key = (path, os.path.getmtime(path) if os.path.exists(path) else None)
+        data = self.inputs.get(key)
+        if data is None:
+            self.stage('input')
+            from scenario_sweep import load_sweep_input
+            data = load_sweep_input(path)
+            if data is None:
+                raise RuntimeError(f"입력을 읽지 못했습니다: {path}")
+            self.inputs.put(key, data)
+        else:
+            print(f"입력 캐시 적중: {os.path.basename(path)}")
+        return data
+
+    def build(self, input_data, key, timings):
+        """build_and_optimize의 생성 함수: 메모리 캐시의 기준 네트워크 복사본, 없으면 생성(디스크 캐시 포함)"""
+        self.stage('build')
+        gui = _gui()
+        cached = self.networks.get(key['built']) if key else None
+        if cached is not None:
+            t_copy = time.perf_counter()
+            network = cached.copy()
+            if timings is not None:
+                timings['cache'] = 'memory'
+                timings['build_seconds'] = round(time.perf_counter() - t_copy, 3)
+            print(f"기준 네트워크 메모리 캐시 적중: {key['built'][:12]}")
+        else:
+            network = gui.build_network_cached(input_data, key, timings)
+            if key and network is not None:
+                self.networks.put(key['built'], network.copy())
+        self.stage('solve')
+        return network
+
+
+def _variant_input(state, job):
+    from scenario_sweep import apply_variant
+    input_data = state.input(job.get('input_file'))
+    params = job.get('params') or {}
+    if not params:
+        return input_data, {}
+    return apply_variant(input_data, params)
+
+
+def _handle_run(state, job):
+    """단일 실행: 입력(캐시) → 생성(캐시)·최적화 → 표준 결과 폴더에 저장"""
+    from scenario_sweep import _patched_env
+    gui = _gui()
+    data, env = _variant_input(state, job)
+    with _patched_env(env):
+        input_hash = gui._run_catalog.compute_input_hash(data) if gui._run_catalog is not None else None
+        timings = {}
+        network, success = gui.build_and_optimize(data, input_hash=input_hash, timings=timings, build_fn=state.build)
+        state.stage('save')
+        run_meta = {'run_id': job['id'], 'input_hash': input_hash, 'timings': timings,
+                    'extra': {'job_service': True, 'params': job.get('params') or {}}}
+        if not success:
+            run_meta['status'] = 'failed'
+        saved = gui.save_results(network, subdir=job['results_dir'], run_meta=run_meta)
+        if not saved and not success:
+            gui._record_failed_run(network, job['results_dir'], run_meta)
+    solve_info = getattr(network, 'solve_info', None) or {}
+    status = 'ok' if success else str(solve_info.get('status') or 'None')
+    return {'status': 'failed' if status == 'None' else status, 'results_dir': job['results_dir'],
+            'objective': float(network.objective) if success else None, 'timings': timings,
+            'solve_seconds': solve_info.get('solve_seconds'), 'error': solve_info.get('error')}
+
+
+def _handle_sweep(state, job):
+    """스윕: 캐시된 입력으로 scenario_sweep.run_sweep 실행 (변형별 결과는 스윕 결과 구조)"""
+    from scenario_sweep import run_sweep
+    input_data = state.input(job.get('input_file'))
+    state.stage('sweep')
+    summary = run_sweep(job['grid'], input_data=input_data, core_budget=job.get('core_budget'),
+                        threads_per_job=job.get('threads_per_job'), max_jobs=job.get('max_jobs'),
+                        memory_per_job_gb=job.get('memory_per_job_gb'),
+                        results_root=job.get('results_root') or os.path.join(ROOT_DIR, 'results_sweep'),
+                        env=job.get('env'))
+    if summary.empty:
+        return {'status': 'failed', 'variants': []}
+    return {'status': 'ok', 'results_dir': os.path.dirname(summary['results_dir'].iloc[0]),
+            'variants': json.loads(summary.to_json(orient='records', force_ascii=False))}
+
+
+def _handle_whatif(state, job):
+    """what-if: 기준 해 재풀이 세션(캐시)에서 변경 목록을 차례로 적용해 기준 대비 차이 반환·저장"""
+    from scenario_sweep import _patched_env
+    from resolve_session import ResolveSession
+    gui = _gui()
+    data, env = _variant_input(state, job)
+    changes = job.get('changes') or []
+    changes = [changes] if isinstance(changes, dict) else changes
+    with _patched_env(env):
+        key = gui.network_cache_key(data)
+        session_key = key['solved'] if key else None
+        session = state.sessions.get(session_key) if session_key else None
+        if session is None:
+            network, success = gui.build_and_optimize(data, build_fn=state.build)
+            if not success:
+                raise RuntimeError("what-if 기준 네트워크 최적화 실패")
+            session = ResolveSession(network, **(job.get('session') or {}))
+            if session_key:
+                state.sessions.put(session_key, session)
+        else:
+            print(f"what-if 세션 캐시 적중: {session_key[:12]}")
+        results = []
+        os.makedirs(job['results_dir'], exist_ok=True)
+        for i, change in enumerate(changes, start=1):
+            state.stage(f"whatif {i}/{len(changes)}")
+            diff = session.whatif(change)
+            results.append(_diff_to_json(diff, job['results_dir'], f"whatif_{i:03d}"))
+    return {'status': 'ok', 'results_dir': job['results_dir'],
+            'base_objective': session.base['summary']['objective'], 'whatifs': results}
+
+
+def _diff_to_json(diff, results_dir, prefix):
+    """what-if 차이 → JSON 직렬화 가능한 dict (표는 CSV로도 저장)"""
+    out = {}
+    for key, value in diff.items():
+        if hasattr(value, 'to_csv'):
+            table = value.reset_index()
+            table.to_csv(os.path.join(results_dir, f"{prefix}_{key}.csv"), index=False, encoding='utf-8-sig')
+            out[key] = json.loads(table.to_json(orient='records', force_ascii=False))
+        else:
+            out[key] = value
+    with open(os.path.join(results_dir, f"{prefix}.json"), 'w', encoding='utf-8') as f:
+        json.dump(out, f, ensure_ascii=False, indent=2, default=str)
+    return out
+
+
+HANDLERS = {'run': _handle_run, 'sweep': _handle_sweep, 'whatif': _handle_whatif}
+
+
+def _worker_main(worker_id, jobs, events):
+    """상주 작업 프로세스: 시작 시 임포트 1회, 이후 대기열의 작업을 차례로 실행"""
+    os.chdir(ROOT_DIR)
+    started = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(open(os.devnull, 'w', encoding='utf-8')):
+            _gui()
+            import scenario_sweep  # noqa: F401
+    except Exception as e:
+        events.put(('worker_error', worker_id, str(e)))
+        return
+    events.put(('ready', worker_id, round(time.perf_counter() - started, 3)))
+    state = _WorkerState(events)
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        state.job_id = job['id']
+        events.put(('started', job['id'], worker_id))
+        stream = _ProgressStream(events, job['id'])
+        if job.get('results_dir'):
+            stream.open_log(os.path.join(job['results_dir'], 'job.log'))
+        try:
+            with contextlib.redirect_stdout(stream), contextlib.redirect_stderr(stream):
+                from scenario_sweep import DEFAULT_ENV, _patched_env
+                with _patched_env({**DEFAULT_ENV, **(job.get('env') or {})}):
+                    result = HANDLERS[job['type']](state, job)
+            stream.close()
+            events.put(('done', job['id'], result))
+        except Exception as e:
+            stream.write(traceback.format_exc())
+            stream.close()
+            events.put(('failed', job['id'], str(e)))
+        finally:
+            events.put(('cache', worker_id, {'inputs': state.inputs.stats(), 'networks': state.networks.stats(),
+                                             'sessions': state.sessions.stats()}))
+
+
+# ---------------------------------------------------------------------------
+# 서비스 (HTTP + 작업 표)
+# ---------------------------------------------------------------------------
+
+class JobService:
+    """작업 표와 상주 작업 프로세스 관리"""
+
+    def __init__(self, workers=1):
+        ctx = multiprocessing.get_context('spawn' if os.name == 'nt' else None)
+        self.jobs_queue = ctx.Queue()
+        self.events = ctx.Queue()
+        self.jobs = OrderedDict()
+        self.workers = {}
+        self.lock = threading.Lock()
+        self.counter = 0
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self._closed = False
+        for worker_id in range(max(1, int(workers))):
+            # 스윕 작업이 작업 프로세스 안에서 ProcessPoolExecutor를 쓰므로 daemon이 아닌 프로세스로 실행 (종료는 shutdown)
+            process = ctx.Process(target=_worker_main, args=(worker_id, self.jobs_queue, self.events), daemon=False)
+            process.start()
+            self.workers[worker_id] = {'pid': process.pid, 'process': process, 'status': 'starting', 'job': None,
+                                       'startup_seconds': None, 'cache': None}
+        self._consumer = threading.Thread(target=self._consume_events, daemon=True)
+        self._consumer.start()
+        # daemon이 아닌 작업 프로세스는 인터프리터 종료 시 join되므로 shutdown 없이 끝나도 멈추지 않도록 등록
+        atexit.register(self.shutdown)
+
+    def submit(self, spec):
+        """작업 제출 → 작업 ID"""
+        job_type = spec.get('type')
+        if job_type not in JOB_TYPES:
+            raise ValueError(f"알 수 없는 작업 종류: {job_type} (가능: {', '.join(JOB_TYPES)})")
+        if job_type == 'sweep' and not spec.get('grid'):
+            raise ValueError("sweep 작업에는 grid가 필요합니다.")
+        with self.lock:
+            self.counter += 1
+            job_id = f"job_{self.counter:04d}"
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            results_dir = spec.get('results_dir')
+            if not results_dir and job_type == 'run':
+                results_dir = os.path.join(ROOT_DIR, 'results', f"{timestamp}_{job_id}")
+            elif not results_dir and job_type == 'whatif':
+                results_dir = os.path.join(ROOT_DIR, 'results_whatif', f"{timestamp}_{job_id}")
+            job = dict(spec, id=job_id, results_dir=results_dir)
+            self.jobs[job_id] = {'id': job_id, 'type': job_type, 'status': 'queued', 'stage': None, 'worker': None,
+                                 'submitted_at': datetime.now().isoformat(timespec='seconds'), 'started_at': None,
+                                 'finished_at': None, 'wall_seconds': None, 'results_dir': results_dir,
+                                 'result': None, 'error': None, 'log': deque(maxlen=LOG_LINES), 'log_count': 0}
+        self.jobs_queue.put(job)
+        return job_id
+
+    def _consume_events(self):
+        while True:
+            try:
+                kind, target, payload = self.events.get()
+            except (EOFError, OSError):
+                return
+            with self.lock:
+                if kind in ('ready', 'worker_error', 'cache'):
+                    worker = self.workers.get(target)
+                    if worker is None:
+                        continue
+                    if kind == 'ready':
+                        worker.update(status='idle', startup_seconds=payload)
+                    elif kind == 'worker_error':
+                        worker.update(status='error', error=payload)
+                    else:
+                        worker['cache'] = payload
+                    continue
+                job = self.jobs.get(target)
+                if job is None:
+                    continue
+                if kind == 'log':
+                    job['log'].append(payload)
+                    job['log_count'] += 1
+                elif kind == 'stage':
+                    job['stage'] = payload
+                elif kind == 'started':
+                    job.update(status='running', worker=payload, started_at=datetime.now().isoformat(timespec='seconds'),
+                               _t=time.perf_counter())
+                    self.workers[payload].update(status='busy', job=target)
+                elif kind in ('done', 'failed'):
+                    job.update(status='done' if kind == 'done' else 'failed', stage=None,
+                               finished_at=datetime.now().isoformat(timespec='seconds'),
+                               wall_seconds=round(time.perf_counter() - job.pop('_t', time.perf_counter()), 3))
+                    job['result' if kind == 'done' else 'error'] = payload
+                    if job['worker'] in self.workers:
+                        self.workers[job['worker']].update(status='idle', job=None)
+
+    def job_view(self, job_id, since=0):
+        """작업 상태 (since 이후 로그 줄만)"""
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            view = {k: v for k, v in job.items() if k not in ('log', '_t')}
+            lines = list(job['log'])
+            first = job['log_count'] - len(lines)
+            view['log'] = lines[max(0, int(since) - first):]
+            view['log_from'] = max(first, int(since))
+            return view
+
+    def health(self):
+        with self.lock:
+            workers = {wid: {k: v for k, v in w.items() if k != 'process'} for wid, w in self.workers.items()}
+            for wid, worker in self.workers.items():
+                if not worker['process'].is_alive() and worker['status'] != 'error':
+                    workers[wid]['status'] = 'dead'
+            counts = {}
+            for job in self.jobs.values():
+                counts[job['status']] = counts.get(job['status'], 0) + 1
+        return {'started_at': self.started_at, 'workers': workers, 'jobs': counts}
+
+    def shutdown(self, timeout=5):
+        """작업 프로세스 종료 (대기열에 종료 신호, timeout초 안에 끝나지 않으면 강제 종료 후 회수)"""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self.workers:
+            self.jobs_queue.put(None)
+        for worker in self.workers.values():
+            process = worker['process']
+            process.join(timeout=timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout=timeout)
+            if process.is_alive():
+                process.kill()
+                process.join()
+
+
+def _make_handler(service, server_ref):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send(self, code, payload):
+            body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+            self.send_response(code)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            path, _, query = self.path.partition('?')
+            params = dict(part.split('=', 1) for part in query.split('&') if '=' in part)
+            if path == '/health':
+                self._send(200, service.health())
+            elif path == '/jobs':
+                with service.lock:
+                    ids = list(service.jobs)
+                self._send(200, [dict(service.job_view(job_id, since=10 ** 9), log=None) for job_id in ids])
+            elif path.startswith('/jobs/'):
+                view = service.job_view(path[len('/jobs/'):], since=params.get('since', 0))
+                self._send(200 if view else 404, view or {'error': '작업이 없습니다.'})
+            else:
+                self._send(404, {'error': f"알 수 없는 경로: {path}"})
+
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            try:
+                spec = json.loads(self.rfile.read(length).decode('utf-8') or '{}')
+            except ValueError as e:
+                self._send(400, {'error': f"JSON 오류: {str(e)}"})
+                return
+            if self.path == '/jobs':
+                try:
+                    self._send(200, {'id': service.submit(spec)})
+                except ValueError as e:
+                    self._send(400, {'error': str(e)})
+            elif self.path == '/shutdown':
+                self._send(200, {'status': 'stopping'})
+                threading.Thread(target=server_ref[0].shutdown, daemon=True).start()
+            else:
+                self._send(404, {'error': f"알 수 없는 경로: {self.path}"})
+
+    return Handler
+
+
+def serve(host=DEFAULT_HOST, port=None, workers=None):
+    """작업 서비스 실행 (Ctrl+C 또는 POST /shutdown으로 종료)"""
+    port = int(port or os.environ.get('JOB_SERVICE_PORT') or DEFAULT_PORT)
+    workers = int(workers or os.environ.get('JOB_SERVICE_WORKERS') or 1)
+    service = JobService(workers)
+    server_ref = [None]
+    server = ThreadingHTTPServer((host, port), _make_handler(service, server_ref))
+    server_ref[0] = server
+    print(f"작업 서비스 시작: http://{host}:{port} (작업 프로세스 {workers}개)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+        print("작업 서비스 종료")
+
+
+# ---------------------------------------------------------------------------
+# 클라이언트
+# ---------------------------------------------------------------------------
+
+def _call(method, path, payload=None, host=DEFAULT_HOST, port=None):
+    port = int(port or os.environ.get('JOB_SERVICE_PORT') or DEFAULT_PORT)
+    data = json.dumps(payload, default=str).encode('utf-8') if payload is not None else None
+    req = _request.Request(f"http://{host}:{port}{path}", data=data, method=method,
+                           headers={'Content-Type': 'application/json'})
+    try:
+        with _request.urlopen(req, timeout=30) as response:
+            return json.loads(response.read().decode('utf-8'))
+    except URLError as e:
+        if hasattr(e, 'read'):
+            return json.loads(e.read().decode('utf-8'))
+        raise ConnectionError(f"작업 서비스에 연결할 수 없습니다 ({host}:{port}). "
+                              f"'python src/job_service.py serve'로 먼저 시작하세요.") from e
+
+
+def submit(spec, wait=True, poll=1.0, host=DEFAULT_HOST, port=None):
+    """작업 제출 (wait=True면 진행 로그를 출력하며 끝날 때까지 대기)
+
+    Returns:
+        dict: 작업 상태 (wait=False면 {'id': ...})
+    """
+    response = _call('POST', '/jobs', spec, host, port)
+    if 'id' not in response or not wait:
+        return response
+    job_id, since, stage = response['id'], 0, None
+    print(f"작업 제출: {job_id}")
+    while True:
+        view = _call('GET', f"/jobs/{job_id}?since={since}", host=host, port=port)
+        for line in view.get('log') or []:
+            print(f"  {line}")
+        since = view.get('log_from', since) + len(view.get('log') or [])
+        if view.get('stage') and view['stage'] != stage:
+            stage = view['stage']
+            print(f"[{job_id}] 단계: {stage}")
+        if view['status'] in ('done', 'failed'):
+            print(f"[{job_id}] {view['status']} ({view.get('wall_seconds')}초) {view.get('results_dir') or ''}")
+            return view
+        time.sleep(poll)
+
+
+def main():
+    """작업 서비스 CLI"""
+    import argparse
+    parser = argparse.ArgumentParser(description='로컬 작업 서비스 (상주 작업 프로세스)')
+    parser.add_argument('--port', type=int, default=None, help=f"포트 (기본 JOB_SERVICE_PORT 또는 {DEFAULT_PORT})")
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_serve = sub.add_parser('serve', help='서비스 시작')
+    p_serve.add_argument('--workers', type=int, default=None, help='작업 프로세스 수 (기본 JOB_SERVICE_WORKERS 또는 1)')
+    for name in ('run', 'whatif', 'sweep'):
+        p = sub.add_parser(name, help=f"{name} 작업 제출")
+        if name == 'sweep':
+            p.add_argument('grid', help='파라미터 격자 JSON 파일')
+            p.add_argument('--budget', type=int, default=None, help='총 코어 예산')
+        if name == 'whatif':
+            p.add_argument('changes', help='what-if 변경 JSON 파일 ({키: 값} 또는 목록)')
+        p.add_argument('--params', default=None, help='scenario_sweep 변형 파라미터 JSON 문자열')
+        p.add_argument('--env', default=None, help='작업 환경변수 JSON 문자열')
+        p.add_argument('--input', default=None, help='입력 Excel')
+        p.add_argument('--no-wait', action='store_true', help='제출만 하고 종료')
+    p_status = sub.add_parser('status', help='작업 상태 (ID 없으면 서비스 상태)')
+    p_status.add_argument('job_id', nargs='?')
+    sub.add_parser('shutdown', help='서비스 종료')
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        serve(port=args.port, workers=args.workers)
+        return
+    if args.command == 'status':
+        path = f"/jobs/{args.job_id}" if args.job_id else '/health'
+        print(json.dumps(_call('GET', path, port=args.port), ensure_ascii=False, indent=2))
+        return
+    if args.command == 'shutdown':
+        print(_call('POST', '/shutdown', {}, port=args.port))
+        return
+    spec = {'type': args.command, 'input_file': args.input,
+            'params': json.loads(args.params) if args.params else None,
+            'env': json.loads(args.env) if args.env else None}
+    if args.command == 'sweep':
+        with open(args.grid, encoding='utf-8') as f:
+            spec.update(grid=json.load(f), core_budget=args.budget)
+    if args.command == 'whatif':
+        with open(args.changes, encoding='utf-8') as f:
+            spec['changes'] = json.load(f)
+    outcome = submit(spec, wait=not args.no_wait, port=args.port)
+    if args.no_wait or outcome.get('status') not in ('done', 'failed'):
+        print(json.dumps(outcome, ensure_ascii=False, indent=2))
+    else:
+        print(json.dumps(outcome.get('result') or {'error': outcome.get('error')}, ensure_ascii=False, indent=2,
+                         default=str)[:4000])
+    sys.exit(0 if outcome.get('status') in ('done', None) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,19 +1,33 @@
-import geopandas as gpd
 import matplotlib.pyplot as plt
-from shapely.geometry import Point, LineString
-import contextily as ctx
 import traceback
 import matplotlib.font_manager as fm
 import platform
 import pandas as pd
 import numpy as np
 
+# geopandas/contextily(GDAL/PROJ)는 필요한 경우에만 임포트하고, 기본 경로는 지오메트리 캐시 사용
+from geometry_cache import load_geometry_cache, DEFAULT_SHAPEFILE
+from region_distance import euclidean_matrix
+
 class KoreaMapVisualizer:
     def __init__(self):
         """한국 지도 시각화를 위한 클래스 초기화"""
-        self.map_data = None
+        self._map_data = None
+        self.geometry = None  # 캐시된 경계/중심점/거리 (geometry_cache.KoreaGeometry)
+        self.level = None
         self.ax = None
         self._set_font()  # 폰트 설정
+
+    @property
+    def map_data(self):
+        """행정구역 GeoDataFrame (캐시에서 로드한 경우 처음 접근할 때 복원)"""
+        if self._map_data is None and self.geometry is not None:
+            self._map_data = self.geometry.to_geodataframe(self.level)
+        return self._map_data
+
+    @map_data.setter
+    def map_data(self, value):
+        self._map_data = value
         
     def _set_font(self):
         """시스템에 맞는 한글 폰트 설정"""
@@ -28,9 +42,23 @@ class KoreaMapVisualizer:
             
         plt.rcParams['axes.unicode_minus'] = False  # 마이너스 기호 깨짐 방지
         
-    def load_map_data(self, shapefile_path="data/BND_SIDO_PG.shp"):
-        """행정구역 데이터 로드"""
+    def load_map_data(self, shapefile_path=DEFAULT_SHAPEFILE, level='medium', use_cache=True):
+        """행정구역 데이터 로드
+
+        Args:
+            shapefile_path (str): 행정구역 셰이프파일 경로
+            level (str): 캐시 단순화 레벨 ('high', 'medium', 'low')
+            use_cache (bool): 지오메트리 캐시 사용 여부 (없으면 1회 생성 후 사용)
+        """
+        if use_cache:
+            geometry = load_geometry_cache(shapefile_path)
+            if geometry is not None:
+                self.geometry = geometry
+                self.level = level
+                self._map_data = None
+                return True
         try:
+            import geopandas as gpd
             self.map_data = gpd.read_file(shapefile_path, encoding='cp949')
             self.map_data = self.map_data.to_crs(epsg=3857)  # Web Mercator로 변환
             return True
@@ -100,6 +128,7 @@ class KoreaMapVisualizer:
                     print(f"{name} 중심점 좌표: ({centroid.x:.2f}, {centroid.y:.2f})")
             
             # 배경지도 추가
+            import contextily as ctx
             ctx.add_basemap(
                 self.ax,
                 source=ctx.providers.CartoDB.Positron,
@@ -133,6 +162,10 @@ class KoreaMapVisualizer:
     
     def get_province_centroids(self):
         """각 시도의 중심점 좌표 반환"""
+        if self.geometry is not None:
+            column = self.geometry.name_column(('SIG_KOR_NM', 'CTP_KOR_NM', 'SIDO_NM'))
+            return {name: {'x': x, 'y': y} for name, (x, y) in self.geometry.centroids(column).items()}
+
         if self.map_data is None:
             print("지도 데이터가 로드되지 않았습니다.")
             return None
@@ -161,11 +194,7 @@ class KoreaMapVisualizer:
                 self.plot_korea_map(save_path=save_path)
             
             # 각 행정구역의 중심점 좌표 얻기
-            centroids = {}
-            for idx, row in self.map_data.iterrows():
-                name = row['SIDO_NM']
-                centroid = row.geometry.centroid
-                centroids[name] = (centroid.x, centroid.y)
+            centroids = self.region_centroids()
             
             # 연결선 그리기
             for i, region1 in enumerate(connections_df.index):
@@ -223,38 +252,32 @@ class KoreaMapVisualizer:
             traceback.print_exc()
             return False
 
+    def region_centroids(self, name_column='SIDO_NM'):
+        """시도 이름 → 중심점 (x, y) (EPSG:3857, 캐시 우선)"""
+        if self.geometry is not None:
+            return self.geometry.centroids(name_column)
+        centroid = self.map_data.geometry.centroid
+        return dict(zip(self.map_data[name_column], zip(centroid.x, centroid.y)))
+
     def calculate_distances(self, save_path='distance.xlsx'):
         """행정구역 간 거리 계산 및 엑셀 파일로 저장"""
         try:
-            if self.map_data is None:
+            if self.geometry is None and self.map_data is None:
                 print("지도 데이터가 로드되지 않았습니다.")
                 return False
             
-            # 행정구역 이름과 중심점 좌표 가져오기
-            regions = []
-            centroids = {}
-            for idx, row in self.map_data.iterrows():
-                name = row['SIDO_NM']
-                centroid = row.geometry.centroid
-                regions.append(name)
-                centroids[name] = (centroid.x, centroid.y)
-            
-            # 거리 행렬 생성
-            distances = pd.DataFrame(index=regions, columns=regions)
-            
-            # 각 행정구역 쌍에 대해 거리 계산
-            for i, region1 in enumerate(regions):
-                for j, region2 in enumerate(regions):
-                    if i == j:
-                        distances.loc[region1, region2] = 0
-                    else:
-                        x1, y1 = centroids[region1]
-                        x2, y2 = centroids[region2]
-                        # 유클리드 거리 계산 (미터 단위)
-                        distance = np.sqrt((x2-x1)**2 + (y2-y1)**2)
-                        # 킬로미터로 변환하고 소수점 둘째자리까지 반올림
-                        distance_km = round(distance/1000, 2)
-                        distances.loc[region1, region2] = distance_km
+            if self.geometry is not None:
+                # 캐시에 저장된 중심점 거리 행렬 사용
+                distances = self.geometry.distance_matrix('SIDO_NM')
+            else:
+                # 중심점 좌표로 유클리드 거리 행렬 계산 (미터 → km)
+                centroids = self.region_centroids()
+                regions = list(centroids.keys())
+                xy = np.array([centroids[r] for r in regions], dtype=float)
+                distances = pd.DataFrame(euclidean_matrix(xy, scale=1 / 1000),
+                                         index=regions, columns=regions)
+            # 소수점 둘째자리까지 반올림
+            distances = distances.round(2)
             
             # 엑셀 파일로 저장
             distances.to_excel(save_path)
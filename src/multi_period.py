@@ -0,0 +1,438 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+다기간(투자 기간) 단일 모델 모듈 - run_multi_year_sequence의 연도 루프 대안
+
+연도 루프는 연도마다 네트워크를 새로 만들고(create_network) 독립 LP를 풀며 용량을 p_nom_min으로 넘깁니다.
+이 모듈은 연도별 입력(prepare_year_input: interface 연도 시나리오 + build_overrides_for_years 오버라이드)을
+한 번에 만든 뒤 네트워크는 첫 연도로 한 번만 생성하고, PyPSA 투자 기간(investment_periods)으로 확장합니다.
+
+    정적 토폴로지(버스/선로/링크/저장)       모든 기간이 공유
+    시계열(패턴 p_max_pu, 부하 p_set 등)     첫 연도 시계열을 기간마다 반복 (부하는 연도별 p_set 비율로 배율)
+    연도별로 달라지는 용량(p_nom/p_nom_min)   변경 연도마다 빈티지 자산(이름-연도, build_year/lifetime)으로 분리
+    연도별 한계비용                          기간별 시계열 marginal_cost
+
+foresight:
+    myopic   한 번 생성한 네트워크에서 기간별로 순서대로 풀고, 지은 확장 용량을 다음 기간 최소 용량으로 인계 (기존 연도 루프와 같은 근시안 경로)
+    perfect  모든 기간을 한 번에 풀이 (완전 예견 투자)
+
+resolution(시간)을 주면 연속 구간 평균으로 스냅샷을 줄이고 snapshot_weightings로 보정합니다 (대표 시간 해상도).
+
+사용 예:
+    network = build_multi_period_network([2030, 2035, 2040], base_input, overrides_by_year, interface_path)
+    status = solve_multi_period(network, foresight='perfect')
+    summary = summarize_periods(network)
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 연도별 용량 변화를 빈티지로 나눌 컴포넌트 (시트/리스트 이름 → (PyPSA 클래스, 명목 용량 속성))
+CAPACITY_COMPONENTS = {
+    'generators': ('Generator', 'p_nom'),
+    'links': ('Link', 'p_nom'),
+    'lines': ('Line', 's_nom'),
+    'stores': ('Store', 'e_nom'),
+}
+
+
+def _gui():
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+    import PyPSA_GUI
+    return PyPSA_GUI
+
+
+# ---------------------------------------------------------------------------
+# 시간 축: 대표 해상도, 투자 기간
+# ---------------------------------------------------------------------------
+
+def _dynamic_frames(network):
+    """시계열 속성 전체 {(리스트 이름, 속성): DataFrame} (비어 있지 않은 것만)"""
+    frames = {}
+    for component in network.iterate_components():
+        for attr, df in component.dynamic.items():
+            if isinstance(df, pd.DataFrame) and not df.empty:
+                frames[(component.list_name, attr)] = df
+    return frames
+
+
+def aggregate_snapshots(network, hours):
+    """연속 hours 시간 구간 평균으로 스냅샷 축소 (snapshot_weightings = 구간 길이)
+
+    Args:
+        network (pypsa.Network): 단일 연도 네트워크
+        hours (int): 구간 길이 (시간)
+    """
+    hours = int(hours or 1)
+    if hours <= 1:
+        return network
+    frames = _dynamic_frames(network)
+    weights = network.snapshot_weightings.copy()
+    blocks = np.arange(len(network.snapshots)) // hours
+    snapshots = network.snapshots[::hours]
+    network.set_snapshots(snapshots)
+    for (list_name, attr), df in frames.items():
+        getattr(network, f'{list_name}_t')[attr] = df.groupby(blocks).mean().set_axis(snapshots)
+    network.snapshot_weightings = weights.groupby(blocks).sum().set_axis(snapshots)
+    return network
+
+
+def period_weightings(years, discount_rate=0.0):
+    """투자 기간 가중치 (years: 다음 기간까지 연수, objective: 해당 연수의 할인 계수 합)
+
+    Args:
+        years (list[int]): 투자 기간 (오름차순)
+        discount_rate (float): 할인율 (0이면 연수 그대로)
+
+    Returns:
+        pd.DataFrame: index=기간, columns=['objective', 'years']
+    """
+    years = sorted(int(y) for y in years)
+    gaps = np.diff(years).tolist()
+    gaps.append(gaps[-1] if gaps else 1)
+    objective = [sum(1.0 / (1.0 + discount_rate) ** (year - years[0] + t) for t in range(gap))
+                 for year, gap in zip(years, gaps)]
+    return pd.DataFrame({'objective': objective, 'years': gaps}, index=pd.Index(years, name='period'))
+
+
+def expand_to_periods(network, years, discount_rate=0.0):
+    """단일 연도 네트워크를 투자 기간 네트워크로 확장 (시계열은 기간마다 반복)"""
+    frames = _dynamic_frames(network)
+    weights = network.snapshot_weightings.copy()
+    timesteps = network.snapshots
+    network.set_snapshots(pd.MultiIndex.from_product([years, timesteps], names=['period', 'timestep']))
+    network.investment_periods = years
+    for (list_name, attr), df in frames.items():
+        getattr(network, f'{list_name}_t')[attr] = pd.concat({year: df for year in years}, names=['period', 'timestep'])
+    network.snapshot_weightings = pd.concat({year: weights for year in years}, names=['period', 'timestep'])
+    network.investment_period_weightings = period_weightings(years, discount_rate)
+    return network
+
+
+# ---------------------------------------------------------------------------
+# 연도별 입력 차이 → 기간별 값
+# ---------------------------------------------------------------------------
+
+def _year_frame(inputs, sheet, column):
+    """연도별 입력 시트에서 name × 연도 값 표 (없는 값은 NaN)"""
+    columns = {}
+    for year, data in inputs.items():
+        df = data.get(sheet)
+        if df is None or df.empty or 'name' not in df.columns or column not in df.columns:
+            continue
+        values = pd.to_numeric(df[column], errors='coerce')
+        values.index = df['name'].astype(str)
+        columns[year] = values[~values.index.duplicated(keep='last')]
+    return pd.DataFrame(columns)
+
+
+def _period_level(network):
+    return network.snapshots.get_level_values(0)
+
+
+def scale_period_loads(network, inputs):
+    """부하 시계열을 연도별 loads.p_set 비율로 배율 (create_network의 p_set × 패턴 구조를 그대로 이용)"""
+    p_set = _year_frame(inputs, 'loads', 'p_set')
+    loads_t = network.loads_t.p_set
+    if p_set.empty or loads_t.empty:
+        return 0
+    years = list(p_set.columns)
+    p_set = p_set.reindex(loads_t.columns)
+    base = p_set[years[0]]
+    ratio = p_set.div(base.where(base != 0), axis=0)
+    # 첫 해 값이 0이라 비율을 알 수 없는 부하는 그 해 값을 일정 부하로 사용
+    constant = p_set.where(base.eq(0) & p_set.ne(0))
+    factors = ratio.T.reindex(_period_level(network)).set_axis(network.snapshots)
+    scaled = loads_t * factors.fillna(1.0)
+    levels = constant.T.reindex(_period_level(network)).set_axis(network.snapshots)
+    network.loads_t.p_set = scaled.where(levels.isna(), levels)
+    return int(ratio.ne(1.0).any(axis=1).sum())
+
+
+def apply_period_marginal_costs(network, inputs):
+    """연도별로 다른 발전기 한계비용을 기간별 시계열로 반영 (첫 해 대비 증감을 네트워크 값에 더함)"""
+    costs = _year_frame(inputs, 'generators', 'marginal_cost')
+    if costs.empty:
+        return 0
+    years = list(costs.columns)
+    costs = costs[costs.index.isin(network.generators.index)]
+    varying = costs.index[costs.nunique(axis=1) > 1]
+    if len(varying) == 0:
+        return 0
+    delta = costs.loc[varying].sub(costs.loc[varying, years[0]], axis=0).fillna(0.0)
+    base = network.generators.loc[varying, 'marginal_cost']
+    per_snapshot = delta.T.reindex(_period_level(network)).set_axis(network.snapshots) + base
+    existing = network.generators_t.marginal_cost
+    if not existing.empty:
+        shared = existing.columns.intersection(varying)
+        per_snapshot[shared] = existing[shared].values + delta.loc[shared].T.reindex(_period_level(network)).values
+    network.generators_t.marginal_cost = pd.concat([existing.drop(columns=varying, errors='ignore'), per_snapshot],
+                                                   axis=1)
+    return len(varying)
+
+
+def _input_columns(network, class_name, static):
+    try:
+        defaults = network.components[class_name].defaults
+    except Exception:
+        defaults = network.components[class_name]['attrs']
+    inputs = defaults.index[defaults['status'].astype(str).str.startswith('Input')]
+    return [col for col in static.columns if col in inputs]
+
+
+def split_capacity_vintages(network, inputs, list_name):
+    """연도별로 명목/최소 용량이 달라지는 자산을 변경 연도별 빈티지 자산으로 분리
+
+    비확장 자산: 변경 연도마다 해당 연도 용량의 자산(build_year=변경 연도, lifetime=다음 변경까지)
+    확장 자산: 최소 용량 목표가 바뀌는 연도마다 추가 투자 자산(수명 무한), 최소 용량은 이전 목표 대비 증분
+
+    Returns:
+        int: 빈티지로 분리된 자산 수
+    """
+    class_name, nom_attr = CAPACITY_COMPONENTS[list_name]
+    static = getattr(network, list_name)
+    if static.empty:
+        return 0
+    years = sorted(inputs)
+    nom = _year_frame(inputs, list_name, nom_attr).reindex(columns=years)
+    mins = _year_frame(inputs, list_name, f'{nom_attr}_min').reindex(columns=years)
+    names = static.index[static.index.isin(nom.index.union(mins.index))]
+    if len(names) == 0:
+        return 0
+    nom, mins = nom.reindex(names).ffill(axis=1), mins.reindex(names).ffill(axis=1).fillna(0.0)
+    extendable = static.loc[names, f'{nom_attr}_extendable'].astype(bool)
+    # 변경 연도: 비확장은 명목 용량, 확장은 최소 용량 목표가 이전 연도와 달라진 연도
+    tracked = nom.where(~extendable, mins, axis=0)
+    changed = tracked.ne(tracked.shift(axis=1)) & tracked.notna()
+    changed[years[0]] = False
+    names = changed.index[changed.any(axis=1)]
+    if len(names) == 0:
+        return 0
+
+    columns = _input_columns(network, class_name, static)
+    frames = {attr: df for (ln, attr), df in _dynamic_frames(network).items() if ln == list_name}
+    maxes = _year_frame(inputs, list_name, f'{nom_attr}_max').reindex(index=names, columns=years).ffill(axis=1)
+    first = years[0]
+    static.loc[names, 'build_year'] = first
+    rows = {}
+    for name in names:
+        change_years = [y for y in years[1:] if changed.at[name, y]]
+        ext = bool(extendable[name])
+        if not ext:
+            static.at[name, 'lifetime'] = change_years[0] - first
+        running = float(mins.at[name, first])
+        for i, year in enumerate(change_years):
+            row = static.loc[name, columns].copy()
+            row['build_year'] = year
+            if ext:
+                # 추가 투자분: 최소 용량은 이전 목표 대비 증분, 상한은 그 해 상한에서 이전 목표를 뺀 값으로 근사
+                target = float(mins.at[name, year])
+                row[nom_attr] = 0.0
+                row[f'{nom_attr}_min'] = max(0.0, target - running)
+                year_max = maxes.at[name, year]
+                if pd.notna(year_max) and np.isfinite(year_max):
+                    row[f'{nom_attr}_max'] = max(row[f'{nom_attr}_min'], float(year_max) - running)
+                running = max(running, target)
+                row['lifetime'] = np.inf
+            else:
+                row[nom_attr] = float(nom.at[name, year])
+                row['lifetime'] = (change_years[i + 1] - year) if i + 1 < len(change_years) else np.inf
+            rows[f'{name}-{year}'] = (name, row)
+
+    # 빈티지를 한 번에 추가 (시계열 속성은 원 자산의 시계열을 복사)
+    vintages = pd.DataFrame({vintage: row for vintage, (_, row) in rows.items()}).T
+    origin = [name for name, _ in rows.values()]
+    series = {attr: df.reindex(columns=origin).set_axis(vintages.index, axis=1)
+              for attr, df in frames.items() if df.columns.isin(origin).any()}
+    for attr, df in series.items():
+        # 원 자산에 시계열이 없는 빈티지는 정적 값 사용
+        missing = ~vintages.index.isin(vintages.index[df.notna().any()])
+        if missing.any() and attr in vintages.columns:
+            df.loc[:, missing] = df.loc[:, missing].fillna(pd.to_numeric(vintages.loc[missing, attr]))
+    static_attrs = {col: vintages[col].tolist() for col in vintages.columns if col not in series}
+    network.add(class_name, vintages.index, **static_attrs, **series)
+    return len(names)
+
+
+def split_period_emission_limits(network, inputs):
+    """연간 배출 상한(primary_energy 전역 제약, 예: CO2Limit)을 기간별 제약으로 분리
+
+    create_network가 넣는 상한은 연간 값이지만 투자 기간 네트워크에서 investment_period가 없는 제약은
+    모든 기간의 (연수 가중) 배출 합에 걸리므로, 완전 예견에서는 전체 기간 예산이 되고 myopic에서는 1년치가
+    기간 연수만큼 나뉘어 과도하게 조여집니다. 원 제약을 지우고 기간마다 investment_period=연도,
+    constant=그 해 연간 상한 × 기간 연수인 제약(이름-연도)을 추가합니다. 연도별 입력의 constraints 시트에
+    같은 이름의 상한이 있으면 그 값을, 없으면 원 제약 값을 사용합니다.
+
+    Returns:
+        int: 기간별로 분리된 제약 수
+    """
+    glcs = network.global_constraints
+    if glcs.empty:
+        return 0
+    annual = glcs.index[(glcs['type'] == 'primary_energy') & glcs['investment_period'].isna()]
+    if len(annual) == 0:
+        return 0
+    weightings = network.investment_period_weightings['years']
+    limits = _year_frame(inputs, 'constraints', 'constant').reindex(columns=list(weightings.index))
+    for name in annual:
+        row = glcs.loc[name]
+        base = float(row['constant'])
+        year_limits = limits.loc[name] if name in limits.index else pd.Series(np.nan, index=weightings.index)
+        network.remove('GlobalConstraint', name)
+        for period, years in weightings.items():
+            limit = year_limits.get(period)
+            limit = base if pd.isna(limit) else float(limit)
+            network.add('GlobalConstraint', f'{name}-{period}', type=row['type'],
+                        carrier_attribute=row['carrier_attribute'], sense=row['sense'],
+                        investment_period=period, constant=limit * float(years))
+    return len(annual)
+
+
+def check_period_emission_limits(network):
+    """기간 연수 가중 없이 전체 기간에 걸린 배출 상한이 남아 있으면 ValueError (split_period_emission_limits 회귀 확인)"""
+    glcs = network.global_constraints
+    if glcs.empty or not len(network.investment_periods):
+        return
+    annual = glcs.index[(glcs['type'] == 'primary_energy') & glcs['investment_period'].isna()]
+    if len(annual):
+        raise ValueError(f"기간이 지정되지 않은 배출 상한이 남아 있습니다: {list(annual)}")
+    weightings = network.investment_period_weightings['years']
+    periods = glcs.loc[glcs['type'] == 'primary_energy', 'investment_period']
+    unknown = periods[~periods.isin(weightings.index)]
+    if len(unknown):
+        raise ValueError(f"투자 기간에 없는 배출 상한 기간: {unknown.to_dict()}")
+
+
+def build_multi_period_network(years, base_input, overrides_by_year=None, interface_path=None, resolution=None,
+                               discount_rate=0.0):
+    """연도별 입력으로 다기간 네트워크 1개 생성 (네트워크 생성은 첫 연도 1회)
+
+    Args:
+        years (list[int]): 투자 기간 연도
+        base_input (dict): read_input_data 결과
+        overrides_by_year (dict): {연도: 오버라이드} (build_overrides_for_years 결과)
+        interface_path (str): interface.xlsx (연도 시나리오 시트)
+        resolution (int): 대표 시간 해상도(시간), 없으면 원 해상도
+        discount_rate (float): 기간 목적함수 할인율
+
+    Returns:
+        pypsa.Network: investment_periods가 설정된 네트워크 (network.multi_period_info에 구성 요약)
+    """
+    gui = _gui()
+    years = sorted(int(y) for y in years)
+    inputs = {year: gui.prepare_year_input(base_input, year, (overrides_by_year or {}).get(year), interface_path)
+              for year in years}
+    network = gui.create_network(inputs[years[0]])
+    aggregate_snapshots(network, resolution)
+    expand_to_periods(network, years, discount_rate)
+    info = {'years': years, 'resolution': int(resolution or 1), 'discount_rate': discount_rate,
+            'scaled_loads': scale_period_loads(network, inputs),
+            'period_marginal_costs': apply_period_marginal_costs(network, inputs),
+            'period_emission_limits': split_period_emission_limits(network, inputs)}
+    info['vintages'] = {list_name: split_capacity_vintages(network, inputs, list_name) for list_name in CAPACITY_COMPONENTS}
+    check_period_emission_limits(network)
+    network.multi_period_info = info
+    print(f"다기간 네트워크 생성: 기간 {years}, 스냅샷 {len(network.snapshots):,}개 (해상도 {info['resolution']}시간), "
+          f"부하 배율 {info['scaled_loads']}개, 기간별 한계비용 {info['period_marginal_costs']}개, "
+          f"기간별 배출 상한 {info['period_emission_limits']}개, 빈티지 {info['vintages']}")
+    return network
+
+
+# ---------------------------------------------------------------------------
+# 풀이와 요약
+# ---------------------------------------------------------------------------
+
+def solve_multi_period(network, foresight='myopic'):
+    """다기간 네트워크 풀이
+
+    Args:
+        network (pypsa.Network): build_multi_period_network 결과
+        foresight (str): 'myopic'(기간 순서대로 풀고 지은 용량을 다음 기간 최소 용량으로 인계) 또는 'perfect'(전체 기간 한 번에)
+
+    Returns:
+        dict: {기간: 성공 여부}
+    """
+    gui = _gui()
+    periods = list(network.investment_periods)
+    if foresight == 'perfect':
+        success = gui.optimize_network(network, multi_investment_periods=True)
+        status = {period: success for period in periods}
+    else:
+        status = {}
+        for period in periods:
+            print(f"\n===== 다기간 모델 {period} 기간 풀이 (myopic) =====")
+            snapshots = network.snapshots[_period_level(network) == period]
+            status[period] = gui.optimize_network(network, snapshots=snapshots, multi_investment_periods=True)
+            # 이 기간까지 지은 확장 용량을 이후 기간의 최소 용량으로 인계 (연도 루프의 carryover와 같은 방식)
+            for list_name, (_, nom_attr) in CAPACITY_COMPONENTS.items():
+                df = getattr(network, list_name)
+                if df.empty or f'{nom_attr}_opt' not in df.columns:
+                    continue
+                built = df.index[df[f'{nom_attr}_extendable'].astype(bool) & (df['build_year'] <= period)]
+                df.loc[built, f'{nom_attr}_min'] = np.fmax(df.loc[built, f'{nom_attr}_min'].astype(float),
+                                                           df.loc[built, f'{nom_attr}_opt'].astype(float))
+            if not status[period]:
+                print(f"{period} 기간 풀이 실패. 이후 기간 풀이를 중단합니다.")
+                break
+    network.multi_period_info = dict(getattr(network, 'multi_period_info', {}), foresight=foresight,
+                                     status={str(k): bool(v) for k, v in status.items()})
+    return status
+
+
+def summarize_periods(network):
+    """기간별 탄소원(carrier)별 가동 용량과 발전량
+
+    Returns:
+        pd.DataFrame: period, component, carrier, capacity, generation_mwh
+    """
+    rows = []
+    weights = network.snapshot_weightings['generators'] \
+        if 'generators' in network.snapshot_weightings.columns else network.snapshot_weightings.iloc[:, 0]
+    gen_p = network.generators_t.p
+    for period in network.investment_periods:
+        for list_name, (class_name, nom_attr) in CAPACITY_COMPONENTS.items():
+            df = getattr(network, list_name)
+            if df.empty:
+                continue
+            active = network.get_active_assets(class_name, period)
+            active = active[active].index
+            caps = df.loc[active, f'{nom_attr}_opt'].fillna(df.loc[active, nom_attr]) \
+                if f'{nom_attr}_opt' in df.columns else df.loc[active, nom_attr]
+            carriers = df.loc[active, 'carrier'].fillna('unknown') if 'carrier' in df.columns else 'unknown'
+            capacity = pd.to_numeric(caps, errors='coerce').groupby(carriers).sum()
+            generation = pd.Series(dtype=float)
+            if list_name == 'generators' and not gen_p.empty:
+                mask = _period_level(network) == period
+                totals = gen_p[mask].mul(weights[mask], axis=0).sum()
+                generation = totals.groupby(network.generators['carrier'].reindex(totals.index).fillna('unknown')).sum()
+            for carrier, value in capacity.items():
+                rows.append({'period': period, 'component': list_name, 'carrier': str(carrier),
+                             'capacity': float(value), 'generation_mwh': float(generation.get(carrier, np.nan))})
+    return pd.DataFrame(rows, columns=['period', 'component', 'carrier', 'capacity', 'generation_mwh'])
+
+
+def run_multi_period(years, base_input, overrides_by_year=None, interface_path=None, results_dir='results_multi_period',
+                     foresight='myopic', resolution=None, discount_rate=0.0):
+    """다기간 단일 모델 실행: 생성 1회 → 풀이(myopic: 기간별, perfect: 1회) → .nc와 기간 요약 저장
+
+    Returns:
+        tuple: (네트워크, {기간: 성공 여부}, 기간 요약 DataFrame)
+    """
+    network = build_multi_period_network(years, base_input, overrides_by_year, interface_path, resolution, discount_rate)
+    status = solve_multi_period(network, foresight)
+    summary = summarize_periods(network)
+    os.makedirs(results_dir, exist_ok=True)
+    summary.to_csv(os.path.join(results_dir, 'multi_period_summary.csv'), index=False, encoding='utf-8-sig')
+    try:
+        network.export_to_netcdf(os.path.join(results_dir, 'multi_period_network.nc'))
+    except Exception as e:
+        print(f"다기간 네트워크 저장 경고: {str(e)}")
+    print(f"다기간 결과 저장: {results_dir} (기간별 상태 {status})")
+    return network, status, summary
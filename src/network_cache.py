@@ -0,0 +1,284 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+네트워크 생성/풀이 결과 캐시 모듈 (내용 주소 기반)
+
+같은 입력을 다시 푸는 경우(그래프 오류 후 재실행, 앞 연도가 그대로인 멀티년 재실행, 스윕의 중복 점)에
+create_network와 optimize_network를 건너뛰도록, 생성된 네트워크와 풀린 네트워크를 따로 저장합니다.
+
+    생성 키 = 입력 해시(compute_input_hash) + 생성 환경변수 스위치 + 코드 버전
+    풀이 키 = 생성 키 + 솔버 설정(솔버, 방법별 옵션; 스레드 수 제외)
+
+저장 위치: <NETWORK_CACHE_DIR, 기본 results/network_cache>/<built|solved>/<키>/
+    network.nc       네트워크 (PyPSA netcdf)
+    basis.pkl        워밍스타트 basis (풀이 항목, 있을 때만)
+    manifest.json    키 구성 요소(시트·컬럼별 해시 포함), 솔버 정보, 생성 시각 - 마지막에 기록되어 완료 표시
+
+캐시 미스 시 가장 가까운(구성 요소가 가장 많이 같은) 항목과 비교해 무엇이 바뀌었는지 설명합니다.
+DISABLE_NETWORK_CACHE=1로 끄고, NETWORK_CACHE_MAX_GB(기본 20)를 넘으면 오래 쓰지 않은 항목부터 지웁니다.
+실패한 풀이는 저장하지 않으므로 항상 다시 풉니다.
+
+사용 예:
+    key = cache_key(input_data, solver_settings)
+    network = load_network(key, 'solved')
+    if network is None:
+        print('\n'.join(explain_miss(key, 'solved')))
+"""
+
+import os
+import json
+import glob
+import pickle
+import shutil
+import hashlib
+from datetime import datetime
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_DIR = os.path.join('results', 'network_cache')
+STAGES = ('built', 'solved')
+
+# create_network 결과에 영향을 주는 환경변수 스위치
+BUILD_ENV_SWITCHES = ['DISABLE_POWER_SLACK', 'SLACK_GEN_COST', 'ENABLE_ALWAYS_SLACK', 'DISABLE_CO2_LIMIT',
+                      'ENABLE_AUTO_TRANSFORMER']
+
+# 코드 버전에 포함하는 파일 (네트워크 생성/풀이 경로)
+CODE_FILES = ['PyPSA_GUI.py', os.path.join('src', 'demand_engine.py'), os.path.join('src', 'input_overlay.py'),
+              os.path.join('src', 'adequacy_screen.py'), os.path.join('src', 'warm_start.py')]
+
+_code_version = None
+
+
+def cache_enabled():
+    """캐시 사용 여부 (DISABLE_NETWORK_CACHE=1이면 사용하지 않음)"""
+    return os.environ.get('DISABLE_NETWORK_CACHE', '0') != '1'
+
+
+def get_cache_dir():
+    """캐시 폴더 경로 (환경변수 우선)"""
+    return os.environ.get('NETWORK_CACHE_DIR') or DEFAULT_CACHE_DIR
+
+
+def _digest(value):
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def code_version():
+    """코드 버전: 생성/풀이 경로 소스 파일과 pypsa/linopy 버전의 해시 (프로세스당 한 번 계산)"""
+    global _code_version
+    if _code_version is None:
+        h = hashlib.sha256()
+        for rel in CODE_FILES:
+            path = os.path.join(ROOT_DIR, rel)
+            h.update(rel.encode('utf-8'))
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    h.update(f.read())
+        for module in ('pypsa', 'linopy'):
+            try:
+                h.update(f"{module}={__import__(module).__version__}".encode('utf-8'))
+            except Exception:
+                pass
+        _code_version = h.hexdigest()
+    return _code_version
+
+
+def sheet_column_hashes(input_data):
+    """시트별 컬럼 해시 {시트: {컬럼: 해시}} (미스 설명용)"""
+    hashes = {}
+    for sheet, df in (input_data or {}).items():
+        if not isinstance(df, pd.DataFrame):
+            continue
+        columns = {}
+        for col in df.columns:
+            try:
+                values = pd.util.hash_pandas_object(df[col], index=False).values.tobytes()
+            except Exception:
+                values = df[col].astype(str).str.cat(sep='\x1f').encode('utf-8')
+            columns[str(col)] = hashlib.sha256(values).hexdigest()[:16]
+        hashes[str(sheet)] = columns
+    return hashes
+
+
+def cache_key(input_data, solver_settings=None, input_hash=None):
+    """생성/풀이 캐시 키
+
+    Args:
+        input_data (dict): 네트워크를 만들 입력 (prepare_year_input 등 최종 입력)
+        solver_settings (dict): 솔버 설정 (풀이 키에 포함)
+        input_hash (str): 이미 계산한 compute_input_hash 결과 (없으면 계산)
+
+    Returns:
+        dict: built/solved 키와 구성 요소(input, sheets, env, code, solver)
+    """
+    if input_hash is None:
+        from run_catalog import compute_input_hash
+        input_hash = compute_input_hash(input_data)
+    components = {
+        'input': input_hash,
+        'sheets': sheet_column_hashes(input_data),
+        'env': {name: os.environ.get(name) for name in BUILD_ENV_SWITCHES},
+        'code': code_version(),
+        'solver': solver_settings or {},
+    }
+    built = _digest([components['input'], components['env'], components['code']])
+    return {'built': built, 'solved': _digest([built, components['solver']]), 'components': components}
+
+
+def _entry_dir(key, stage):
+    return os.path.join(get_cache_dir(), stage, key[stage])
+
+
+def _replace_atomic(path, write):
+    tmp_path = f"{path}.tmp"
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def load_network(key, stage):
+    """캐시된 네트워크 로드
+
+    Args:
+        key (dict): cache_key 결과
+        stage (str): 'built' 또는 'solved'
+
+    Returns:
+        pypsa.Network: 캐시 항목 (없으면 None). 풀이 항목은 solve_info/solve_basis를 복원
+    """
+    if not cache_enabled() or key is None:
+        return None
+    folder = _entry_dir(key, stage)
+    manifest_path = os.path.join(folder, 'manifest.json')
+    if not os.path.exists(manifest_path):
+        return None
+    try:
+        import pypsa
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        network = pypsa.Network(os.path.join(folder, 'network.nc'))
+        if manifest.get('solve_info'):
+            network.solve_info = dict(manifest['solve_info'], cache='hit')
+        basis_path = os.path.join(folder, 'basis.pkl')
+        if os.path.exists(basis_path):
+            try:
+                with open(basis_path, 'rb') as f:
+                    network.solve_basis = pickle.load(f)
+            except Exception as e:
+                print(f"캐시 basis 로드 경고: {str(e)}")
+        os.utime(manifest_path)
+        print(f"네트워크 캐시 적중({stage}): {key[stage][:12]} (저장 {manifest.get('created_at')})")
+        return network
+    except Exception as e:
+        print(f"네트워크 캐시 로드 경고({stage}): {str(e)}")
+        return None
+
+
+def store_network(key, stage, network):
+    """네트워크를 캐시에 저장 (netcdf → basis → manifest 순서로 원자적 기록)
+
+    Returns:
+        str: 캐시 항목 폴더 (저장하지 않았으면 None)
+    """
+    if not cache_enabled() or key is None or network is None:
+        return None
+    folder = _entry_dir(key, stage)
+    try:
+        os.makedirs(folder, exist_ok=True)
+        _replace_atomic(os.path.join(folder, 'network.nc'), lambda p: network.export_to_netcdf(p))
+        basis = getattr(network, 'solve_basis', None) if stage == 'solved' else None
+        if basis is not None:
+            def _write_basis(p):
+                with open(p, 'wb') as f:
+                    pickle.dump(basis, f, protocol=pickle.HIGHEST_PROTOCOL)
+            _replace_atomic(os.path.join(folder, 'basis.pkl'), _write_basis)
+        manifest = {
+            'stage': stage,
+            'key': key[stage],
+            'components': key['components'],
+            'solve_info': getattr(network, 'solve_info', None) if stage == 'solved' else None,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+        }
+
+        def _write_manifest(p):
+            with open(p, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False, default=str)
+        _replace_atomic(os.path.join(folder, 'manifest.json'), _write_manifest)
+        prune_cache()
+        return folder
+    except Exception as e:
+        print(f"네트워크 캐시 저장 경고({stage}): {str(e)}")
+        shutil.rmtree(folder, ignore_errors=True)
+        return None
+
+
+def _manifests(stage):
+    for path in glob.glob(os.path.join(get_cache_dir(), stage, '*', 'manifest.json')):
+        try:
+            with open(path, encoding='utf-8') as f:
+                yield path, json.load(f)
+        except Exception:
+            continue
+
+
+def explain_miss(key, stage):
+    """캐시 미스 설명: 가장 가까운 항목과 비교해 바뀐 구성 요소 목록
+
+    Returns:
+        list[str]: 설명 줄 (캐시가 비어 있으면 한 줄 안내)
+    """
+    current = key['components']
+    parts = ['input', 'env', 'code'] + (['solver'] if stage == 'solved' else [])
+    best, best_score = None, -1
+    for _, manifest in _manifests(stage):
+        other = manifest.get('components', {})
+        sheets = other.get('sheets', {})
+        score = sum(other.get(p) == current.get(p) for p in parts) * 1000 + \
+            sum(sheets.get(s) == cols for s, cols in current['sheets'].items())
+        if score > best_score:
+            best, best_score = manifest, score
+    if best is None:
+        return [f"캐시 미스({stage}): 저장된 항목이 없습니다."]
+    other = best['components']
+    lines = [f"캐시 미스({stage}): 가장 가까운 항목 {best.get('key', '')[:12]} ({best.get('created_at')})와 비교"]
+    if other.get('input') != current['input']:
+        old_sheets, new_sheets = other.get('sheets', {}), current['sheets']
+        for sheet in sorted(set(old_sheets) | set(new_sheets)):
+            if sheet not in old_sheets or sheet not in new_sheets:
+                lines.append(f"  입력 시트 {'추가' if sheet in new_sheets else '삭제'}: {sheet}")
+                continue
+            old_cols, new_cols = old_sheets[sheet], new_sheets[sheet]
+            changed = [c for c in new_cols if old_cols.get(c) != new_cols[c]] + [c for c in old_cols if c not in new_cols]
+            if changed:
+                lines.append(f"  입력 변경: {sheet} 컬럼 {changed[:10]}{'...' if len(changed) > 10 else ''}")
+        if len(lines) == 1:
+            lines.append("  입력 변경: 시트/컬럼 해시는 같고 행 순서 또는 구성이 다름")
+    for name, value in current['env'].items():
+        if other.get('env', {}).get(name) != value:
+            lines.append(f"  환경변수 변경: {name} {other.get('env', {}).get(name)!r} → {value!r}")
+    if other.get('code') != current['code']:
+        lines.append("  코드 버전 변경 (PyPSA_GUI.py 등 생성/풀이 코드 또는 pypsa/linopy 버전)")
+    if stage == 'solved' and other.get('solver') != current['solver']:
+        lines.append(f"  솔버 설정 변경: {other.get('solver')} → {current['solver']}")
+    return lines
+
+
+def prune_cache(max_gb=None):
+    """캐시 용량이 상한을 넘으면 오래 쓰지 않은(manifest 접근 시각 기준) 항목부터 삭제"""
+    try:
+        max_bytes = float(max_gb if max_gb is not None else os.environ.get('NETWORK_CACHE_MAX_GB', '20')) * 1024 ** 3
+    except ValueError:
+        return
+    entries = []
+    for stage in STAGES:
+        for path, _ in _manifests(stage):
+            folder = os.path.dirname(path)
+            size = sum(os.path.getsize(p) for p in glob.glob(os.path.join(folder, '*')) if os.path.isfile(p))
+            entries.append((os.path.getmtime(path), size, folder))
+    total = sum(size for _, size, _ in entries)
+    for _, size, folder in sorted(entries):
+        if total <= max_bytes:
+            break
+        shutil.rmtree(folder, ignore_errors=True)
+        total -= size
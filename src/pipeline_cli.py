@@ -0,0 +1,455 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+단계별 명령줄 도구 모듈 - 필요한 단계에서만 무거운 의존성을 임포트
+
+python PyPSA_GUI.py는 항상 통합 입력 생성 → 읽기 → 표준화 저장 → 생성 → 최적화 → 저장 전체를 실행합니다.
+이 CLI는 단계를 나눠 실행하고, 단계 산출물을 작업 폴더(PIPELINE_WORK_DIR, 기본 results/pipeline)에 남겨
+다음 단계가 이어 받습니다. 모듈 최상위에서는 표준 라이브러리만 임포트하고, pandas/pypsa/linopy/geopandas는
+해당 단계에서만 임포트합니다 (validate는 pandas만, 지도 스택은 plot에서만).
+
+    compile-input   interface.xlsx → 통합 입력 (필요 시), 읽기 + 버스명 표준화 → input.pkl
+    validate        입력 점검 (필수 시트/시간 설정/버스 참조/중복 이름), --screen이면 생성 후 사전 점검
+    build           네트워크 생성 (디스크 네트워크 캐시 사용) → built.nc
+    solve           built.nc(입력 해시가 같을 때) 최적화 → solved.nc
+    export          solved.nc → 표준 결과 폴더 저장 (save_results)
+    analyze         solved.nc → 혼잡/발전기 이용률/지역별 분석
+    plot            solved.nc → 그래프/지도 (--plots로 선택), --dashboard
+    multi-year      run_multi_year_sequence
+
+입력 산출물(input.pkl)은 통합 입력과 interface.xlsx의 수정 시간이 같으면 Excel을 다시 파싱하지 않습니다.
+각 단계는 --network로 다른 .nc 파일을 받을 수 있고, 단계 기록은 작업 폴더의 state.json에 남습니다.
+
+사용 예:
+    python src/pipeline_cli.py compile-input
+    python src/pipeline_cli.py validate
+    python src/pipeline_cli.py build && python src/pipeline_cli.py solve && python src/pipeline_cli.py export
+    python src/pipeline_cli.py plot --plots maps
+    python src/pipeline_cli.py multi-year 2030 2035 2040 --mode pipelined --from-interface
+"""
+
+import os
+import sys
+import json
+import time
+import pickle
+import argparse
+from datetime import datetime
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_WORK_DIR = os.path.join('results', 'pipeline')
+INPUT_ARTIFACT = 'input.pkl'
+BUILT_NETWORK = 'built.nc'
+SOLVED_NETWORK = 'solved.nc'
+STATE_FILE = 'state.json'
+
+# 네트워크 생성에 필요한 시트
+REQUIRED_SHEETS = ('buses', 'generators', 'loads')
+
+# 입력 시트별 버스 참조 컬럼
+BUS_COLUMNS = {
+    'generators': ('bus',),
+    'loads': ('bus',),
+    'stores': ('bus',),
+    'storage_units': ('bus',),
+    'lines': ('bus0', 'bus1'),
+    'links': ('bus0', 'bus1', 'bus2', 'bus3'),
+}
+
+
+def _gui():
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+    import PyPSA_GUI
+    return PyPSA_GUI
+
+
+def get_work_dir(work_dir=None):
+    """단계 산출물 폴더 (PIPELINE_WORK_DIR 환경변수, 기본 results/pipeline)"""
+    path = work_dir or os.environ.get('PIPELINE_WORK_DIR') or DEFAULT_WORK_DIR
+    path = path if os.path.isabs(path) else os.path.join(ROOT_DIR, path)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _read_state(work_dir):
+    path = os.path.join(work_dir, STATE_FILE)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"단계 기록 읽기 경고: {str(e)}")
+        return {}
+
+
+def _write_stage(work_dir, stage, record):
+    state = _read_state(work_dir)
+    state[stage] = dict(record, created_at=datetime.now().isoformat(timespec='seconds'))
+    with open(os.path.join(work_dir, STATE_FILE), 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2, default=str)
+
+
+def _input_path(input_file=None):
+    return os.path.abspath(input_file or os.path.join(ROOT_DIR, 'integrated_input_data.xlsx'))
+
+
+def _source_stamp(input_path):
+    """입력 산출물 유효성 기준: 통합 입력과 interface.xlsx의 수정 시간 (read_input_data가 둘 다 읽음)"""
+    stamp = {}
+    for path in (input_path, os.path.join(ROOT_DIR, 'interface.xlsx')):
+        stamp[os.path.basename(path)] = os.path.getmtime(path) if os.path.exists(path) else None
+    return stamp
+
+
+def parse_input(input_path, work_dir):
+    """Excel 읽기 + 버스명 표준화 후 입력 산출물로 저장
+
+    Returns:
+        tuple: (입력 데이터 dict, 입력 해시)
+    """
+    gui = _gui()
+    input_data = gui.read_input_data(input_path)
+    if input_data is None:
+        raise RuntimeError(f"입력을 읽지 못했습니다: {input_path}")
+    input_data = gui.standardize_bus_names_in_input(input_data)
+    input_hash = gui._run_catalog.compute_input_hash(input_data) if gui._run_catalog is not None else None
+    artifact = {'source': input_path, 'stamp': _source_stamp(input_path), 'input_hash': input_hash,
+                'data': input_data}
+    with open(os.path.join(work_dir, INPUT_ARTIFACT), 'wb') as f:
+        pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+    _write_stage(work_dir, 'compile-input', {'source': input_path, 'input_hash': input_hash,
+                                             'path': os.path.join(work_dir, INPUT_ARTIFACT)})
+    return input_data, input_hash
+
+
+def load_input(input_file=None, work_dir=None):
+    """입력 산출물 로드 (원본 수정 시간이 같으면 Excel을 다시 파싱하지 않음)
+
+    Returns:
+        tuple: (입력 데이터 dict, 입력 해시)
+    """
+    work_dir = get_work_dir(work_dir)
+    input_path = _input_path(input_file)
+    artifact_path = os.path.join(work_dir, INPUT_ARTIFACT)
+    if os.path.exists(artifact_path):
+        try:
+            with open(artifact_path, 'rb') as f:
+                artifact = pickle.load(f)
+            if artifact.get('source') == input_path and artifact.get('stamp') == _source_stamp(input_path):
+                print(f"입력 산출물 사용: {artifact_path}")
+                return artifact['data'], artifact.get('input_hash')
+            print("입력 파일이 바뀌어 다시 읽습니다.")
+        except Exception as e:
+            print(f"입력 산출물 로드 경고: {str(e)}")
+    return parse_input(input_path, work_dir)
+
+
+def _load_network(path):
+    """저장된 .nc 네트워크 로드 (단계 기록의 solve_info 복원)"""
+    import pypsa
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"네트워크 파일이 없습니다: {path} (앞 단계를 먼저 실행하세요)")
+    network = pypsa.Network(path)
+    info_path = os.path.splitext(path)[0] + '.json'
+    if os.path.exists(info_path):
+        with open(info_path, encoding='utf-8') as f:
+            network.solve_info = json.load(f)
+    return network
+
+
+def _solved_network(args):
+    work_dir = get_work_dir(args.work_dir)
+    return _load_network(args.network or os.path.join(work_dir, SOLVED_NETWORK))
+
+
+def _output_dir(args, suffix):
+    """분석/그림 저장 폴더: --out, 없으면 마지막 export 결과 폴더, 없으면 작업 폴더 아래"""
+    if args.out:
+        path = args.out
+    else:
+        exported = _read_state(get_work_dir(args.work_dir)).get('export', {}).get('results_dir')
+        path = exported if exported and os.path.isdir(exported) else os.path.join(get_work_dir(args.work_dir), suffix)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def check_sheets(input_data):
+    """필수 시트/시간 설정 점검 (create_network 기준: timeseries가 비면 기본 시간 설정 사용)
+
+    Returns:
+        list: (심각도, 시트, 내용) 목록
+    """
+    import pandas as pd
+    findings = []
+    for sheet in REQUIRED_SHEETS:
+        df = input_data.get(sheet)
+        if df is None or df.empty:
+            findings.append(('error', sheet, '필수 시트가 없거나 비어 있습니다.'))
+    timeseries = input_data.get('timeseries')
+    if timeseries is None or timeseries.empty:
+        findings.append(('warning', 'timeseries', '시트가 비어 있어 기본 시간 설정을 사용합니다.'))
+        return findings
+    row = timeseries.iloc[0]
+    for column in ('start_time', 'end_time'):
+        try:
+            pd.Timestamp(row[column])
+        except Exception:
+            findings.append(('error', 'timeseries', f"잘못된 {column}: {row.get(column)}"))
+    if 'h' not in str(row.get('frequency', '')).lower():
+        findings.append(('error', 'timeseries', f"frequency는 'h' 형식이어야 합니다: {row.get('frequency')}"))
+    return findings
+
+
+def check_references(input_data):
+    """시트별 버스 참조/이름 중복 점검
+
+    Returns:
+        list: (심각도, 시트, 내용) 목록
+    """
+    findings = []
+    buses = input_data.get('buses')
+    bus_names = set(buses['name'].astype(str)) if buses is not None and 'name' in buses.columns else set()
+    for sheet, columns in BUS_COLUMNS.items():
+        df = input_data.get(sheet)
+        if df is None or df.empty:
+            continue
+        if 'name' in df.columns:
+            duplicated = df['name'][df['name'].duplicated()].astype(str).unique()
+            if len(duplicated):
+                findings.append(('error', sheet, f"중복 이름 {len(duplicated)}개: {', '.join(duplicated[:5])}"))
+        for column in columns:
+            if column not in df.columns:
+                continue
+            refs = df[column].dropna().astype(str).str.strip()
+            missing = sorted(set(refs[~refs.isin(['', 'nan', 'None'])]) - bus_names)
+            if missing:
+                findings.append(('warning', sheet, f"{column}: 정의되지 않은 버스 {len(missing)}개 "
+                                                   f"({', '.join(missing[:5])}) - 생성 시 보정/제외될 수 있음"))
+    return findings
+
+
+# ---------------------------------------------------------------------------
+# 하위 명령
+# ---------------------------------------------------------------------------
+
+def cmd_compile_input(args):
+    """통합 입력 생성(필요 시) + 읽기/표준화 → 입력 산출물"""
+    gui = _gui()
+    gui.ensure_integrated_input(force=args.force)
+    work_dir = get_work_dir(args.work_dir)
+    input_data, input_hash = parse_input(_input_path(args.input), work_dir)
+    if args.persist:
+        gui._persist_standardized_input(_input_path(args.input), input_data)
+    for sheet, df in input_data.items():
+        if hasattr(df, 'shape'):
+            print(f"  {sheet}: {df.shape[0]}행")
+    print(f"입력 산출물 저장: {os.path.join(work_dir, INPUT_ARTIFACT)} (입력 해시 {str(input_hash)[:12]})")
+    return 0
+
+
+def cmd_validate(args):
+    """입력 점검 (--screen이면 네트워크 생성 후 공급 적정성 사전 점검까지, GUI 모듈은 그때만 임포트)"""
+    input_data, _ = load_input(args.input, args.work_dir)
+    findings = check_sheets(input_data) + check_references(input_data)
+    for severity, sheet, detail in findings:
+        print(f"[{severity}] {sheet}: {detail}")
+    errors = sum(1 for f in findings if f[0] == 'error')
+    print(f"입력 점검: 오류 {errors}건, 경고 {len(findings) - errors}건")
+
+    if args.screen and not errors:
+        from adequacy_screen import screen_network
+        result = screen_network(_gui().create_network(input_data))
+        result.print_report()
+        if result.infeasible:
+            errors += 1
+    return 1 if errors else 0
+
+
+def cmd_build(args):
+    """네트워크 생성 → built.nc"""
+    gui = _gui()
+    work_dir = get_work_dir(args.work_dir)
+    input_data, input_hash = load_input(args.input, work_dir)
+    timings = {}
+    key = gui.network_cache_key(input_data, input_hash)
+    network = gui.build_network_cached(input_data, key, timings)
+    if network is None:
+        print("네트워크 생성 실패")
+        return 1
+    path = os.path.join(work_dir, BUILT_NETWORK)
+    network.export_to_netcdf(path)
+    _write_stage(work_dir, 'build', {'path': path, 'input_hash': input_hash, 'timings': timings,
+                                     'key': key['built'] if key else None})
+    print(f"생성 네트워크 저장: {path}")
+    return 0
+
+
+def cmd_solve(args):
+    """built.nc 최적화 → solved.nc (생성 기록이 현재 입력과 다르면 다시 생성)"""
+    gui = _gui()
+    work_dir = get_work_dir(args.work_dir)
+    timings = {}
+    if args.network:
+        network = _load_network(args.network)
+        input_hash = None
+        success = gui.optimize_network(network)
+    else:
+        input_data, input_hash = load_input(args.input, work_dir)
+        built = _read_state(work_dir).get('build', {})
+        built_path = os.path.join(work_dir, BUILT_NETWORK)
+
+        def _build(data, key, build_timings):
+            if built.get('input_hash') == input_hash and os.path.exists(built_path):
+                print(f"생성 네트워크 사용: {built_path}")
+                return _load_network(built_path)
+            return gui.build_network_cached(data, key, build_timings)
+
+        network, success = gui.build_and_optimize(input_data, input_hash=input_hash, timings=timings,
+                                                  build_fn=_build)
+    if not success:
+        print("최적화 실패!")
+        return 1
+    path = os.path.join(work_dir, SOLVED_NETWORK)
+    network.export_to_netcdf(path)
+    solve_info = getattr(network, 'solve_info', None) or {}
+    with open(os.path.splitext(path)[0] + '.json', 'w', encoding='utf-8') as f:
+        json.dump(solve_info, f, ensure_ascii=False, default=str)
+    _write_stage(work_dir, 'solve', {'path': path, 'input_hash': input_hash, 'timings': timings,
+                                     'objective': float(network.objective), 'solve_info': solve_info})
+    print(f"풀린 네트워크 저장: {path} (목적함수 {float(network.objective):,.2f})")
+    return 0
+
+
+def cmd_export(args):
+    """solved.nc → 표준 결과 폴더 (save_results)"""
+    if args.no_plots:
+        os.environ['DISABLE_PLOTS'] = '1'
+        os.environ['DISABLE_DASHBOARD'] = '1'
+    gui = _gui()
+    work_dir = get_work_dir(args.work_dir)
+    network = _solved_network(args)
+    solved = _read_state(work_dir).get('solve', {}) if not args.network else {}
+    results_dir = args.out or os.path.join('results', datetime.now().strftime('%Y%m%d_%H%M%S'))
+    run_meta = {'input_hash': solved.get('input_hash'), 'timings': solved.get('timings') or {}}
+    if not gui.save_results(network, subdir=results_dir, run_meta=run_meta):
+        return 1
+    _write_stage(work_dir, 'export', {'results_dir': os.path.abspath(results_dir), 'source': args.network})
+    return 0
+
+
+def cmd_analyze(args):
+    """solved.nc → 송전 혼잡/발전기 이용률/지역별 분석"""
+    gui = _gui()
+    from congestion import analyze_network as analyze_congestion, save_congestion_tables
+    from generation_metrics import analyze_network as analyze_generation, save_generation_metrics
+    network = _solved_network(args)
+    results_dir = _output_dir(args, 'analysis')
+    current_time = datetime.now().strftime('%Y%m%d_%H%M%S')
+    prefix = os.path.join(results_dir, f"optimization_result_{current_time}")
+    for path in save_congestion_tables(analyze_congestion(network), prefix).values():
+        print(f"  {path}")
+    save_generation_metrics(analyze_generation(network, hourly_groups=False), prefix)
+    gui.analyze_regional_results(network, results_dir, current_time)
+    print(f"분석 결과 저장: {results_dir}")
+    return 0
+
+
+def cmd_plot(args):
+    """solved.nc → 그래프/지도 (지도 스택은 이 단계에서만 로드)"""
+    import plot_renderer
+    network = _solved_network(args)
+    results_dir = _output_dir(args, 'plots')
+    current_time = datetime.now().strftime('%Y%m%d_%H%M%S')
+    status = plot_renderer.render_network_plots(network, results_dir, current_time, plots=args.plots,
+                                                workers=args.workers)
+    if args.dashboard:
+        from dashboard import build_dashboard
+        build_dashboard(network, os.path.join(results_dir, f"optimization_result_{current_time}_dashboard.html"),
+                        title=f"optimization_result_{current_time}")
+    print(f"그림 저장: {results_dir} {status if status else ''}")
+    return 0
+
+
+def cmd_multi_year(args):
+    """run_multi_year_sequence 실행"""
+    gui = _gui()
+    base_input = _input_path(args.input)
+    overrides = gui.build_overrides_for_years(args.years, base_input) if args.from_interface else None
+    results = gui.run_multi_year_sequence(args.years, base_input_file=base_input, overrides_by_year=overrides,
+                                          carryover=not args.no_carryover, results_root=args.results_root,
+                                          mode=args.mode, max_workers=args.workers, resume=args.resume,
+                                          streaming=True if args.streaming else None)
+    failed = 0
+    for year, result in sorted((results or {}).items()):
+        print(f"  {year}: {result.status} {result.results_dir}")
+        failed += result.status == 'failed'
+    return 1 if failed or not results else 0
+
+
+COMMANDS = {
+    'compile-input': cmd_compile_input,
+    'validate': cmd_validate,
+    'build': cmd_build,
+    'solve': cmd_solve,
+    'export': cmd_export,
+    'analyze': cmd_analyze,
+    'plot': cmd_plot,
+    'multi-year': cmd_multi_year,
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='PyPSA 모델 단계별 실행 도구')
+    parser.add_argument('--work-dir', default=None, help=f"단계 산출물 폴더 (기본 PIPELINE_WORK_DIR 또는 {DEFAULT_WORK_DIR})")
+    parser.add_argument('--input', default=None, help='통합 입력 Excel (기본 integrated_input_data.xlsx)')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('compile-input', help='통합 입력 생성 + 읽기/표준화 → 입력 산출물')
+    p.add_argument('--force', action='store_true', help='interface.xlsx에서 통합 입력을 강제로 다시 생성')
+    p.add_argument('--persist', action='store_true', help='표준화된 버스명을 통합 입력 파일에 다시 저장')
+
+    p = sub.add_parser('validate', help='입력 점검')
+    p.add_argument('--screen', action='store_true', help='네트워크 생성 후 공급 적정성 사전 점검까지 실행')
+
+    sub.add_parser('build', help='네트워크 생성 → built.nc')
+
+    p = sub.add_parser('solve', help='최적화 → solved.nc')
+    p.add_argument('--network', default=None, help='최적화할 .nc (기본 작업 폴더의 built.nc)')
+
+    for name, help_text in (('export', '표준 결과 폴더 저장'), ('analyze', '혼잡/이용률/지역별 분석'),
+                            ('plot', '그래프/지도')):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument('--network', default=None, help='풀린 네트워크 .nc (기본 작업 폴더의 solved.nc)')
+        p.add_argument('--out', default=None, help='저장 폴더')
+        if name == 'export':
+            p.add_argument('--no-plots', action='store_true', help='그림/대시보드 생략 (나중에 plot 단계로 생성)')
+        if name == 'plot':
+            p.add_argument('--plots', default=None, help='PLOT_SET 형식 플롯 선택 (예: charts,maps)')
+            p.add_argument('--workers', type=int, default=None, help='렌더링 프로세스 수')
+            p.add_argument('--dashboard', action='store_true', help='HTML 대시보드도 생성')
+
+    p = sub.add_parser('multi-year', help='연도별 실행')
+    p.add_argument('years', nargs='+', type=int, help='연도 목록')
+    p.add_argument('--mode', default=None, help='sequential/parallel/pipelined/auto/multi_period')
+    p.add_argument('--results-root', default='results_multi', help='결과 루트 폴더')
+    p.add_argument('--no-carryover', action='store_true', help='이전 해 용량 인계 끄기')
+    p.add_argument('--from-interface', action='store_true', help='interface.xlsx 연도별 발전 용량으로 오버라이드 구성')
+    p.add_argument('--workers', type=int, default=None, help='parallel 모드 동시 연도 수')
+    p.add_argument('--resume', default=None, help='이어서 실행할 실행 그룹 (latest 가능)')
+    p.add_argument('--streaming', action='store_true', help='연도 결과 저장 후 네트워크 해제')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    started = time.perf_counter()
+    code = COMMANDS[args.command](args)
+    print(f"[{args.command}] 완료 ({time.perf_counter() - started:.2f}초)")
+    return code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
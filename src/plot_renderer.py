@@ -0,0 +1,797 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+시각화 렌더링 모듈
+
+save_results의 그래프/지도를 선언형 플롯 명세(PlotSpec)로 정의하고,
+    1) 선택한 플롯만 (PLOT_SET 환경변수 또는 plots 인자)
+    2) 프로세스 풀에서 병렬로 (PLOT_WORKERS)
+    3) 입력 데이터 해시가 같은 플롯은 다시 그리지 않고 (결과 폴더 매니페스트 + 전역 캐시)
+렌더링합니다. 네트워크에서 플롯 입력(작은 집계 테이블)을 먼저 만들고,
+워커에는 이 집계 데이터만 전달합니다.
+
+PLOT_SET 예: "all"(기본), "none", "charts,maps", "energy_balance,korea_transmission_map"
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import traceback
+import concurrent.futures
+
+import numpy as np
+import pandas as pd
+
+# 렌더러 코드가 바뀌면 올려서 기존 캐시 무효화
+RENDERER_VERSION = 2
+
+DEFAULT_DPI = 300
+DEFAULT_CACHE_DIR = os.path.join('results', '.plot_cache')
+MANIFEST_NAME = '.plot_manifest.json'
+
+# 지역 코드와 한국어 이름 매핑
+REGION_NAMES = {
+    'SEL': '서울특별시',
+    'BSN': '부산광역시',
+    'DGU': '대구광역시',
+    'ICN': '인천광역시',
+    'GWJ': '광주광역시',
+    'DJN': '대전광역시',
+    'USN': '울산광역시',
+    'SJG': '세종특별자치시',
+    'GGD': '경기도',
+    'GWD': '강원도',
+    'CBD': '충청북도',
+    'CND': '충청남도',
+    'JBD': '전라북도',
+    'JND': '전라남도',
+    'GBD': '경상북도',
+    'GND': '경상남도',
+    'JJD': '제주특별자치도'
+}
+
+# 이전 버전 지도용 간단 좌표
+LEGACY_REGION_COORDS = {
+    'SEL': (5, 7),    # 서울
+    'ICN': (4, 7),    # 인천
+    'GGD': (5, 6),    # 경기
+    'GWD': (7, 8),    # 강원
+    'CBD': (6, 5),    # 충북
+    'CND': (4, 5),    # 충남
+    'DJN': (5, 4),    # 대전
+    'SJG': (5, 4.5),  # 세종
+    'JBD': (3, 3),    # 전북
+    'JND': (2, 2),    # 전남
+    'GWJ': (3, 2.5),  # 광주
+    'GBD': (7, 4),    # 경북
+    'DGU': (7, 3),    # 대구
+    'GND': (6, 2),    # 경남
+    'BSN': (7, 1),    # 부산
+    'USN': (7.5, 1.5), # 울산
+    'JJD': (1, 0)     # 제주
+}
+
+RENEWABLE_KEYWORDS = ('PV', 'WT', 'Wind', 'Solar')
+
+
+class PlotSpec:
+    """플롯 명세: 이름, 렌더 함수, 출력 파일, 입력 데이터"""
+
+    def __init__(self, name, renderer, output, data, groups=()):
+        """초기화 함수
+
+        Args:
+            name (str): 플롯 이름 (PLOT_SET에서 선택하는 키)
+            renderer (callable): render(data, output_path, dpi) 형태의 모듈 수준 함수
+            output (str): 출력 파일 경로
+            data (dict): 렌더 입력 (작은 집계 테이블/값만)
+            groups (tuple, optional): 묶음 이름 (예: 'maps', 'charts')
+        """
+        self.name = name
+        self.renderer = renderer
+        self.output = output
+        self.data = data
+        self.groups = tuple(groups)
+
+    def data_hash(self, dpi):
+        """입력 데이터 + 렌더러 버전 + dpi 해시 (같으면 결과 이미지도 같음)"""
+        h = hashlib.sha256()
+        h.update(f"{self.name}|{RENDERER_VERSION}|{dpi}".encode('utf-8'))
+        _update_hash(h, self.data)
+        return h.hexdigest()
+
+
+def _update_hash(h, obj):
+    """DataFrame/Series/dict/list/스칼라를 결정적으로 해시에 반영"""
+    if isinstance(obj, pd.DataFrame):
+        h.update(('DF' + '|'.join(map(str, obj.columns))).encode('utf-8'))
+        h.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+    elif isinstance(obj, pd.Series):
+        h.update(b'S')
+        h.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+    elif isinstance(obj, dict):
+        h.update(b'D')
+        for key in sorted(obj, key=str):
+            h.update(str(key).encode('utf-8'))
+            _update_hash(h, obj[key])
+    elif isinstance(obj, (list, tuple)):
+        h.update(b'L')
+        for item in obj:
+            _update_hash(h, item)
+    elif isinstance(obj, float):
+        h.update(repr(round(obj, 9)).encode('utf-8'))
+    else:
+        h.update(repr(obj).encode('utf-8'))
+
+
+# ---------------------------------------------------------------------------
+# 워커 공통 설정 (프로세스당 1회)
+# ---------------------------------------------------------------------------
+
+_MPL_READY = False
+_KOREA_MAP = None
+
+
+def _configure_matplotlib():
+    """Agg 백엔드/한글 폰트/경고 설정 (프로세스당 1회)"""
+    global _MPL_READY
+    if _MPL_READY:
+        return
+    import matplotlib
+    matplotlib.use('Agg')
+    # 한글 폰트 설정(윈도우: 맑은 고딕)
+    try:
+        import matplotlib as mpl
+        mpl.rcParams['font.family'] = ['Malgun Gothic', 'DejaVu Sans']
+        mpl.rcParams['axes.unicode_minus'] = False
+        import warnings as _warn
+        import logging as _logging
+        _warn.filterwarnings('ignore', message='findfont:', category=UserWarning, module='matplotlib')
+        try:
+            _logging.getLogger('matplotlib.font_manager').setLevel(_logging.ERROR)
+        except Exception:
+            pass
+    except Exception:
+        pass
+    _MPL_READY = True
+
+
+def _init_worker():
+    """프로세스 풀 워커 초기화"""
+    _configure_matplotlib()
+
+
+def _load_korea_map():
+    """행정구역 지도와 시도 중심점 (프로세스당 1회 로드, 지오메트리 캐시 우선)"""
+    global _KOREA_MAP
+    if _KOREA_MAP is None:
+        from geometry_cache import load_geometry_cache
+        geometry = load_geometry_cache()
+        if geometry is not None:
+            _KOREA_MAP = (geometry, geometry.centroids('SIDO_NM'))
+        else:
+            from korea_map import KoreaMapVisualizer
+            visualizer = KoreaMapVisualizer()
+            if not visualizer.load_map_data(use_cache=False):
+                return None, None
+            _KOREA_MAP = (visualizer.map_data, visualizer.region_centroids())
+    return _KOREA_MAP
+
+
+def _utilization_style(utilization):
+    """이용률 → 선 색상"""
+    if utilization > 80:
+        return 'red'
+    elif utilization > 60:
+        return 'orange'
+    elif utilization > 40:
+        return 'yellow'
+    return 'green'
+
+
+def _utilization_legend(plt):
+    return [
+        plt.Line2D([0], [0], color='green', lw=2, label='이용률 < 40%'),
+        plt.Line2D([0], [0], color='yellow', lw=2, label='이용률 40-60%'),
+        plt.Line2D([0], [0], color='orange', lw=2, label='이용률 60-80%'),
+        plt.Line2D([0], [0], color='red', lw=2, label='이용률 > 80%')
+    ]
+
+
+# ---------------------------------------------------------------------------
+# 렌더 함수 (워커에서 실행, 모듈 수준이어야 피클 가능)
+# ---------------------------------------------------------------------------
+
+def render_energy_balance(data, output, dpi):
+    """지역별 에너지 밸런스 차트"""
+    _configure_matplotlib()
+    import matplotlib.pyplot as plt
+    balance_df = data['balance_df']
+    fig, ax = plt.subplots(figsize=(15, 8))
+    x = range(len(balance_df))
+    width = 0.35
+
+    ax.bar([i - width/2 for i in x], balance_df['발전량(MWh)'], width, label='발전량', alpha=0.8)
+    ax.bar([i + width/2 for i in x], balance_df['부하량(MWh)'], width, label='부하량', alpha=0.8)
+
+    ax.set_xlabel('지역')
+    ax.set_ylabel('에너지 (MWh)')
+    ax.set_title('지역별 에너지 밸런스')
+    ax.set_xticks(x)
+    ax.set_xticklabels(balance_df['지역'], rotation=45)
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig(output, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+
+
+def render_renewable_ratio(data, output, dpi):
+    """지역별 재생에너지 비율 차트"""
+    _configure_matplotlib()
+    import matplotlib.pyplot as plt
+    renewable_df = data['renewable_df']
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(20, 8))
+
+    # 재생에너지 비율 막대 차트
+    ax1.bar(renewable_df['지역'], renewable_df['재생에너지비율(%)'], color='green', alpha=0.7)
+    ax1.set_xlabel('지역')
+    ax1.set_ylabel('재생에너지 비율 (%)')
+    ax1.set_title('지역별 재생에너지 비율')
+    ax1.tick_params(axis='x', rotation=45)
+    ax1.grid(True, alpha=0.3)
+
+    # 재생에너지 vs 총발전량 비교
+    x = range(len(renewable_df))
+    width = 0.35
+
+    ax2.bar([i - width/2 for i in x], renewable_df['재생에너지(MWh)'], width, label='재생에너지', color='green', alpha=0.7)
+    ax2.bar([i + width/2 for i in x], renewable_df['총발전량(MWh)'] - renewable_df['재생에너지(MWh)'], width, label='기타 발전', color='gray', alpha=0.7)
+
+    ax2.set_xlabel('지역')
+    ax2.set_ylabel('발전량 (MWh)')
+    ax2.set_title('지역별 발전원별 발전량')
+    ax2.set_xticks(x)
+    ax2.set_xticklabels(renewable_df['지역'], rotation=45)
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig(output, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+
+
+def render_transmission_graph(data, output, dpi):
+    """송전선로 네트워크 그래프"""
+    _configure_matplotlib()
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
+    G = nx.Graph()
+    # 노드 추가 (버스)
+    G.add_nodes_from(data['buses'])
+    # 엣지 추가 (선로)
+    for bus0, bus1, flow, line_name in data['edges']:
+        G.add_edge(bus0, bus1, weight=flow, line_name=line_name)
+
+    # 네트워크 그래프 그리기 (레이아웃 시드 고정: 같은 입력이면 같은 그림)
+    plt.figure(figsize=(20, 15))
+    pos = nx.spring_layout(G, k=3, iterations=50, seed=42)
+
+    # 노드 그리기
+    nx.draw_networkx_nodes(G, pos, node_color='lightblue', node_size=500, alpha=0.8)
+
+    # 엣지 그리기 (조류 크기에 따라 두께 조정)
+    edges = G.edges()
+    weights = [G[u][v]['weight'] for u, v in edges]
+    max_weight = max(weights) if weights else 1e-6
+    edge_widths = [w/max_weight * 5 + 0.5 for w in weights]
+
+    nx.draw_networkx_edges(G, pos, width=edge_widths, alpha=0.6, edge_color='red')
+
+    # 라벨 그리기
+    nx.draw_networkx_labels(G, pos, font_size=8, font_weight='bold')
+
+    plt.title('송전선로 네트워크 및 조류 현황', fontsize=16, fontweight='bold')
+    plt.axis('off')
+    plt.tight_layout()
+    plt.savefig(output, dpi=dpi, bbox_inches='tight')
+    plt.close()
+
+
+def render_transmission_html(data, output, dpi):
+    """송전선로별 이용률 인터랙티브 차트 (HTML)"""
+    import plotly.graph_objects as go
+    import plotly.offline as pyo
+    transmission_df = data['transmission_df']
+
+    fig = go.Figure()
+    # 선로별 조류 막대 차트
+    fig.add_trace(go.Bar(
+        x=transmission_df['선로명'],
+        y=transmission_df['이용률(%)'],
+        name='선로 이용률',
+        text=transmission_df['평균조류(MW)'].round(1),
+        textposition='auto',
+        hovertemplate='<b>%{x}</b><br>이용률: %{y:.1f}%<br>조류: %{text} MW<extra></extra>'
+    ))
+
+    fig.update_layout(
+        title='송전선로별 이용률 및 조류 현황',
+        xaxis_title='송전선로',
+        yaxis_title='이용률 (%)',
+        hovermode='x unified',
+        height=600
+    )
+
+    pyo.plot(fig, filename=output, auto_open=False)
+
+
+def render_korea_transmission_map(data, output, dpi):
+    """한국 지도 기반 송전선로 시각화"""
+    _configure_matplotlib()
+    import matplotlib.pyplot as plt
+
+    map_data, region_centroids = _load_korea_map()
+    if map_data is None:
+        raise RuntimeError("한국 지도 데이터를 로드할 수 없습니다.")
+    transmission_df = data['transmission_df']
+
+    # 지도 그리기
+    fig, ax = plt.subplots(figsize=(15, 12))
+
+    # 행정구역 경계 그리기
+    map_data.plot(ax=ax,
+                  color='lightgray',
+                  edgecolor='black',
+                  linewidth=0.5,
+                  alpha=0.7)
+
+    # 송전선로 그리기
+    for start_region, end_region, utilization in zip(transmission_df['시작지역'],
+                                                     transmission_df['종료지역'],
+                                                     transmission_df['이용률(%)']):
+        if start_region in region_centroids and end_region in region_centroids:
+            start_x, start_y = region_centroids[start_region]
+            end_x, end_y = region_centroids[end_region]
+
+            # 이용률에 따른 선 두께와 색상 설정
+            line_width = max(0.5, utilization / 20)  # 최소 0.5, 최대 5
+            ax.plot([start_x, end_x], [start_y, end_y],
+                    color=_utilization_style(utilization), linewidth=line_width, alpha=0.8)
+
+            # 중점에 이용률 표시 (이용률이 높은 경우만)
+            if utilization > 50:
+                mid_x = (start_x + end_x) / 2
+                mid_y = (start_y + end_y) / 2
+                ax.text(mid_x, mid_y, f'{utilization:.0f}%',
+                        fontsize=8, ha='center', va='center',
+                        bbox=dict(facecolor='white', alpha=0.7, edgecolor='none'))
+
+    # 지역 중심점에 지역명 표시
+    name_to_code = {name: code for code, name in REGION_NAMES.items()}
+    for region_name, (x, y) in region_centroids.items():
+        region_code = name_to_code.get(region_name)
+        if region_code:
+            ax.plot(x, y, 'ko', markersize=8, alpha=0.8)
+            ax.text(x, y + 20000, region_code, fontsize=10, ha='center', va='bottom',
+                    fontweight='bold',
+                    bbox=dict(facecolor='white', alpha=0.8, edgecolor='black'))
+
+    # 범례 추가
+    ax.legend(handles=_utilization_legend(plt), loc='upper left', bbox_to_anchor=(0.02, 0.98))
+
+    ax.set_title('한국 송전선로 이용률 현황', fontsize=16, fontweight='bold', pad=20)
+    ax.set_axis_off()
+
+    plt.tight_layout()
+    plt.savefig(output, dpi=dpi, bbox_inches='tight', facecolor='white')
+    plt.close(fig)
+
+
+def render_legacy_korea_map(data, output, dpi):
+    """이전 버전의 한국 지도 시각화 (간단한 지역 연결 지도)"""
+    _configure_matplotlib()
+    import matplotlib.pyplot as plt
+
+    region_coords = LEGACY_REGION_COORDS
+    regional_generation = data['regional_generation']
+    regional_renewable = data['regional_renewable']
+    regional_load = data['regional_load']
+
+    # 그래프 생성
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(20, 10))
+
+    # 첫 번째 지도: 발전량과 송전선로
+    ax1.set_xlim(0, 9)
+    ax1.set_ylim(-1, 9)
+    ax1.set_aspect('equal')
+
+    # 지역별 발전량을 원의 크기로 표현
+    max_generation = max(regional_generation.values()) if regional_generation else 1e-6
+
+    for region, (x, y) in region_coords.items():
+        generation = regional_generation.get(region, 0)
+        renewable = regional_renewable.get(region, 0)
+
+        # 발전량에 비례한 원의 크기
+        size = max(50, (generation / max_generation) * 1000) if max_generation > 0 else 50
+
+        # 재생에너지 비율에 따른 색상
+        renewable_ratio = renewable / generation if generation > 0 else 0
+        color = plt.cm.RdYlGn(renewable_ratio)
+
+        # 지역 원 그리기
+        circle = plt.Circle((x, y), np.sqrt(size)/20, color=color, alpha=0.7, edgecolor='black')
+        ax1.add_patch(circle)
+
+        # 지역명 표시
+        ax1.text(x, y, region, ha='center', va='center', fontsize=8, fontweight='bold')
+
+        # 발전량 정보 표시
+        info_text = f"{generation/1000:.0f}GWh"
+        if renewable_ratio > 0:
+            info_text += f"\n재생{renewable_ratio*100:.0f}%"
+        ax1.text(x, y-0.5, info_text, ha='center', va='top', fontsize=6)
+
+    # 송전선로 그리기
+    width_by_color = {'red': 3, 'orange': 2.5, 'yellow': 2, 'green': 1.5}
+    for region0, region1, utilization in data['lines']:
+        if region0 in region_coords and region1 in region_coords:
+            x0, y0 = region_coords[region0]
+            x1, y1 = region_coords[region1]
+
+            # 이용률에 따른 선 색상과 두께
+            color = _utilization_style(utilization)
+            ax1.plot([x0, x1], [y0, y1], color=color, linewidth=width_by_color[color], alpha=0.8)
+
+            # 이용률이 높은 경우 수치 표시
+            if utilization > 50:
+                mid_x, mid_y = (x0 + x1) / 2, (y0 + y1) / 2
+                ax1.text(mid_x, mid_y, f'{utilization:.0f}%',
+                         fontsize=6, ha='center', va='center',
+                         bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', pad=1))
+
+    ax1.set_title('지역별 발전량 및 송전선로 이용률', fontsize=14, fontweight='bold')
+    ax1.set_xlabel('재생에너지 비율: 빨간색(낮음) → 녹색(높음)', fontsize=10)
+    ax1.grid(True, alpha=0.3)
+    ax1.set_xticks([])
+    ax1.set_yticks([])
+
+    # 두 번째 지도: 에너지 밸런스
+    ax2.set_xlim(0, 9)
+    ax2.set_ylim(-1, 9)
+    ax2.set_aspect('equal')
+
+    gen_max = max([1e-6] + list(regional_generation.values()))
+    load_max = max([1e-6] + list(regional_load.values()))
+    denom = max([1e-6] + list(regional_generation.values()) + list(regional_load.values()))
+
+    # 지역별 에너지 밸런스 (발전량 - 부하량)
+    for region, (x, y) in region_coords.items():
+        generation = regional_generation.get(region, 0)
+        load = regional_load.get(region, 0)
+        balance = generation - load
+
+        # 밸런스에 따른 색상 (잉여: 파란색, 부족: 빨간색)
+        if balance > 0:
+            color = 'blue'
+            alpha = min(0.8, abs(balance) / gen_max * 2)
+        else:
+            color = 'red'
+            alpha = min(0.8, abs(balance) / load_max * 2)
+
+        # 밸런스 크기에 비례한 원
+        size = max(50, abs(balance) / denom * 1000)
+
+        circle = plt.Circle((x, y), np.sqrt(size)/20, color=color, alpha=alpha, edgecolor='black')
+        ax2.add_patch(circle)
+
+        # 지역명과 밸런스 정보
+        ax2.text(x, y, region, ha='center', va='center', fontsize=8, fontweight='bold', color='white')
+        balance_text = f"{balance/1000:.0f}GWh"
+        if balance > 0:
+            balance_text = "+" + balance_text
+        ax2.text(x, y-0.5, balance_text, ha='center', va='top', fontsize=6)
+
+    ax2.set_title('지역별 에너지 밸런스 (발전량 - 부하량)', fontsize=14, fontweight='bold')
+    ax2.set_xlabel('파란색: 잉여, 빨간색: 부족', fontsize=10)
+    ax2.grid(True, alpha=0.3)
+    ax2.set_xticks([])
+    ax2.set_yticks([])
+
+    # 범례 추가
+    ax1.legend(handles=_utilization_legend(plt), loc='upper left')
+
+    legend_elements2 = [
+        plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='blue', markersize=10, label='에너지 잉여'),
+        plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='red', markersize=10, label='에너지 부족')
+    ]
+    ax2.legend(handles=legend_elements2, loc='upper left')
+
+    plt.tight_layout()
+    plt.savefig(output, dpi=dpi, bbox_inches='tight', facecolor='white')
+    plt.close(fig)
+
+
+# ---------------------------------------------------------------------------
+# 플롯 입력 준비 (메인 프로세스, 작은 집계만)
+# ---------------------------------------------------------------------------
+
+def _region_prefix_totals(totals):
+    """'지역_나머지' 이름의 합계를 지역 코드별로 집계 (이름에 '_'가 있는 항목만)"""
+    names = pd.Index(totals.index).astype(str)
+    mask = names.str.contains('_', regex=False)
+    if not mask.any():
+        return pd.Series(dtype=float)
+    return totals[mask].groupby(names[mask].str.split('_').str[0]).sum()
+
+
+def _line_table(network):
+    """선로별 평균 조류/용량/이용률 + 양단 지역 (벡터화)"""
+    lines = network.lines
+    flows = network.lines_t.p0.mean() if not network.lines_t.p0.empty else pd.Series(dtype=float)
+    flow = flows.reindex(lines.index).fillna(0.0)
+    capacity = pd.to_numeric(lines['s_nom'], errors='coerce').fillna(0.0)
+    utilization = np.where(capacity > 0, flow.abs() / capacity.where(capacity > 0, 1.0) * 100, 0.0)
+    bus0 = lines['bus0'].astype(str)
+    bus1 = lines['bus1'].astype(str)
+    return pd.DataFrame({
+        'name': lines.index,
+        'bus0': bus0.to_numpy(),
+        'bus1': bus1.to_numpy(),
+        'region0': np.where(bus0.str.contains('_', regex=False), bus0.str.split('_').str[0], bus0),
+        'region1': np.where(bus1.str.contains('_', regex=False), bus1.str.split('_').str[0], bus1),
+        'flow': flow.to_numpy(),
+        'has_flow': lines.index.isin(flows.index),
+        'capacity': capacity.to_numpy(),
+        'utilization': utilization,
+    })
+
+
+def build_plot_specs(network, results_dir, current_time):
+    """네트워크에서 플롯 명세 목록 생성 (표 형태 산출물 CSV도 함께 저장)
+
+    Returns:
+        list: PlotSpec 목록
+    """
+    specs = []
+    gen_output = network.generators_t.p
+    load_output = network.loads_t.p
+    gen_totals = gen_output.sum() if not gen_output.empty else pd.Series(dtype=float)
+    load_totals = load_output.sum() if not load_output.empty else pd.Series(dtype=float)
+
+    # 1. 지역별 에너지 밸런스
+    regional_generation = _region_prefix_totals(gen_totals)
+    regional_load = _region_prefix_totals(load_totals)
+    regions = sorted(set(regional_generation.index) | set(regional_load.index))
+    balance_df = pd.DataFrame({
+        '지역': regions,
+        '발전량(MWh)': regional_generation.reindex(regions).fillna(0.0).to_numpy(),
+        '부하량(MWh)': regional_load.reindex(regions).fillna(0.0).to_numpy(),
+    })
+    balance_df['밸런스(MWh)'] = balance_df['발전량(MWh)'] - balance_df['부하량(MWh)']
+    balance_df.to_csv(f'{results_dir}/regional_energy_balance.csv', index=False, encoding='utf-8-sig')
+    specs.append(PlotSpec('energy_balance', render_energy_balance,
+                          f'{results_dir}/regional_energy_balance.png',
+                          {'balance_df': balance_df}, groups=('charts',)))
+
+    # 2. 지역별 재생에너지 비율
+    gen_names = pd.Index(gen_totals.index).astype(str)
+    is_renewable = np.zeros(len(gen_names), dtype=bool)
+    for keyword in RENEWABLE_KEYWORDS:
+        is_renewable |= gen_names.str.contains(keyword, regex=False)
+    regional_renewable = _region_prefix_totals(gen_totals[is_renewable]) if len(gen_totals) else pd.Series(dtype=float)
+    renewable_df = pd.DataFrame({
+        '지역': regions,
+        '재생에너지(MWh)': regional_renewable.reindex(regions).fillna(0.0).to_numpy(),
+        '총발전량(MWh)': regional_generation.reindex(regions).fillna(0.0).to_numpy(),
+    })
+    renewable_df['재생에너지비율(%)'] = np.where(renewable_df['총발전량(MWh)'] > 0,
+                                          renewable_df['재생에너지(MWh)'] / renewable_df['총발전량(MWh)'].where(renewable_df['총발전량(MWh)'] > 0, 1.0) * 100,
+                                          0.0)
+    specs.append(PlotSpec('renewable_ratio', render_renewable_ratio,
+                          f'{results_dir}/regional_renewable_ratio.png',
+                          {'renewable_df': renewable_df}, groups=('charts',)))
+
+    line_table = _line_table(network)
+
+    # 3. 송전선로 조류 (그래프 + HTML)
+    if not network.lines_t.p0.empty:
+        flowing = line_table[line_table['has_flow']]
+        transmission_df = pd.DataFrame({
+            '선로명': flowing['name'].to_numpy(),
+            '시작버스': flowing['bus0'].to_numpy(),
+            '종료버스': flowing['bus1'].to_numpy(),
+            '평균조류(MW)': flowing['flow'].to_numpy(),
+            '용량(MVA)': flowing['capacity'].to_numpy(),
+            '이용률(%)': flowing['utilization'].to_numpy(),
+        })
+        transmission_df.to_csv(f'{results_dir}/transmission_flow.csv', index=False, encoding='utf-8-sig')
+        edges = list(zip(flowing['bus0'], flowing['bus1'], flowing['flow'].abs(), flowing['name']))
+        specs.append(PlotSpec('transmission_graph', render_transmission_graph,
+                              f'{results_dir}/transmission_network_graph.png',
+                              {'buses': [str(b) for b in network.buses.index], 'edges': edges},
+                              groups=('transmission',)))
+        specs.append(PlotSpec('transmission_html', render_transmission_html,
+                              f'{results_dir}/transmission_flow_map.html',
+                              {'transmission_df': transmission_df}, groups=('transmission',)))
+
+    # 4. 한국 지도 기반 송전선로 시각화
+    korea_df = pd.DataFrame({
+        '선로명': line_table['name'].to_numpy(),
+        '시작지역': [REGION_NAMES.get(r, r) for r in line_table['region0']],
+        '종료지역': [REGION_NAMES.get(r, r) for r in line_table['region1']],
+        '조류(MW)': line_table['flow'].to_numpy(),
+        '용량(MVA)': line_table['capacity'].to_numpy(),
+        '이용률(%)': line_table['utilization'].to_numpy(),
+    })
+    korea_df.to_csv(f'{results_dir}/korea_transmission_details_{current_time}.csv',
+                    index=False, encoding='utf-8-sig')
+    specs.append(PlotSpec('korea_transmission_map', render_korea_transmission_map,
+                          f'{results_dir}/korea_transmission_map_{current_time}.png',
+                          {'transmission_df': korea_df[['시작지역', '종료지역', '이용률(%)']]},
+                          groups=('maps',)))
+
+    # 5. 이전 버전 한국 지도 (지역별 발전/재생/부하 + 선로 이용률)
+    legacy_df = pd.DataFrame({'지역': list(LEGACY_REGION_COORDS.keys())})
+    legacy_df['발전량(GWh)'] = regional_generation.reindex(legacy_df['지역']).fillna(0.0).to_numpy() / 1000
+    legacy_df['재생에너지(GWh)'] = regional_renewable.reindex(legacy_df['지역']).fillna(0.0).to_numpy() / 1000
+    legacy_df['부하량(GWh)'] = regional_load.reindex(legacy_df['지역']).fillna(0.0).to_numpy() / 1000
+    legacy_df['밸런스(GWh)'] = legacy_df['발전량(GWh)'] - legacy_df['부하량(GWh)']
+    legacy_df['재생에너지비율(%)'] = np.where(legacy_df['발전량(GWh)'] > 0,
+                                        legacy_df['재생에너지(GWh)'] / legacy_df['발전량(GWh)'].where(legacy_df['발전량(GWh)'] > 0, 1.0) * 100,
+                                        0.0)
+    legacy_df.to_csv(f'{results_dir}/legacy_korea_energy_summary_{current_time}.csv',
+                     index=False, encoding='utf-8-sig')
+    specs.append(PlotSpec('legacy_korea_map', render_legacy_korea_map,
+                          f'{results_dir}/legacy_korea_transmission_map_{current_time}.png',
+                          {'regional_generation': {k: float(v) for k, v in regional_generation.items()},
+                           'regional_renewable': {k: float(v) for k, v in regional_renewable.items()},
+                           'regional_load': {k: float(v) for k, v in regional_load.items()},
+                           'lines': list(zip(line_table['region0'], line_table['region1'],
+                                             line_table['utilization'].abs().round(6)))},
+                          groups=('maps',)))
+    return specs
+
+
+# ---------------------------------------------------------------------------
+# 선택 / 캐시 / 실행
+# ---------------------------------------------------------------------------
+
+def select_specs(specs, plots=None):
+    """PLOT_SET 또는 plots 인자로 렌더링할 명세 선택
+
+    Args:
+        specs (list): PlotSpec 목록
+        plots (str or list, optional): 'all', 'none', 플롯 이름 또는 묶음 이름 목록
+    """
+    if plots is None:
+        plots = os.environ.get('PLOT_SET', 'all')
+    if isinstance(plots, str):
+        plots = [p.strip() for p in plots.split(',') if p.strip()]
+    wanted = set(plots)
+    if not wanted or 'none' in wanted:
+        return []
+    if 'all' in wanted:
+        return list(specs)
+    return [s for s in specs if s.name in wanted or wanted.intersection(s.groups)]
+
+
+def _read_manifest(results_dir):
+    path = os.path.join(results_dir, MANIFEST_NAME)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def _write_manifest(results_dir, manifest):
+    path = os.path.join(results_dir, MANIFEST_NAME)
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+    except Exception as e:
+        print(f"플롯 매니페스트 저장 경고: {str(e)}")
+
+
+def _cache_path(cache_dir, digest, output):
+    return os.path.join(cache_dir, digest + os.path.splitext(output)[1])
+
+
+def _render_one(renderer, data, output, dpi, cache_file=None):
+    """워커에서 실행: 렌더링 후 전역 캐시에 복사"""
+    try:
+        renderer(data, output, dpi)
+        if cache_file:
+            try:
+                os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+                shutil.copy2(output, cache_file)
+            except Exception:
+                pass
+        return 'rendered', None
+    except Exception as e:
+        return 'error', f"{str(e)}\n{traceback.format_exc()}"
+
+
+def render_plots(specs, plots=None, workers=None, dpi=None, cache_dir=None):
+    """플롯 명세 렌더링 (선택 → 해시 비교 → 병렬 렌더링)
+
+    Args:
+        specs (list): build_plot_specs 결과
+        plots (str or list, optional): 선택 (기본 PLOT_SET 환경변수, 없으면 전체)
+        workers (int, optional): 프로세스 수 (기본 PLOT_WORKERS, 1이면 현재 프로세스에서 순차 실행)
+        dpi (int, optional): 해상도 (기본 PLOT_DPI 또는 300)
+        cache_dir (str, optional): 전역 렌더 캐시 폴더 (기본 PLOT_CACHE_DIR 또는 results/.plot_cache)
+
+    Returns:
+        dict: {플롯 이름: 'rendered' | 'unchanged' | 'cached' | 'error'}
+    """
+    dpi = int(dpi or os.environ.get('PLOT_DPI', DEFAULT_DPI))
+    use_cache = os.environ.get('DISABLE_PLOT_CACHE', '0') != '1'
+    cache_dir = cache_dir or os.environ.get('PLOT_CACHE_DIR') or DEFAULT_CACHE_DIR
+    if workers is None:
+        workers = int(os.environ.get('PLOT_WORKERS', min(4, os.cpu_count() or 1)))
+
+    selected = select_specs(specs, plots)
+    status = {s.name: 'skipped' for s in specs if s not in selected}
+    manifests = {}
+    pending = []
+
+    for spec in selected:
+        results_dir = os.path.dirname(spec.output) or '.'
+        manifest = manifests.setdefault(results_dir, _read_manifest(results_dir))
+        digest = spec.data_hash(dpi)
+        key = os.path.basename(spec.output)
+        if use_cache and os.path.exists(spec.output) and manifest.get(key) == digest:
+            status[spec.name] = 'unchanged'
+            continue
+        cache_file = _cache_path(cache_dir, digest, spec.output) if use_cache else None
+        if cache_file and os.path.exists(cache_file):
+            try:
+                shutil.copy2(cache_file, spec.output)
+                manifest[key] = digest
+                status[spec.name] = 'cached'
+                continue
+            except Exception:
+                pass
+        pending.append((spec, digest, cache_file))
+
+    def _finish(spec, digest, result):
+        state, error = result
+        status[spec.name] = state
+        if state == 'rendered':
+            manifests[os.path.dirname(spec.output) or '.'][os.path.basename(spec.output)] = digest
+        else:
+            print(f"플롯 렌더링 오류({spec.name}): {error}")
+
+    if pending and workers > 1 and len(pending) > 1:
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=min(workers, len(pending)),
+                                                        initializer=_init_worker) as pool:
+                futures = {pool.submit(_render_one, spec.renderer, spec.data, spec.output, dpi, cache_file): (spec, digest)
+                           for spec, digest, cache_file in pending}
+                for future in concurrent.futures.as_completed(futures):
+                    spec, digest = futures[future]
+                    _finish(spec, digest, future.result())
+            pending = []
+        except Exception as e:
+            print(f"병렬 렌더링 경고: {str(e)} - 순차 렌더링으로 대체")
+            pending = [(s, d, c) for s, d, c in pending if status.get(s.name) not in ('rendered',)]
+
+    for spec, digest, cache_file in pending:
+        _finish(spec, digest, _render_one(spec.renderer, spec.data, spec.output, dpi, cache_file))
+
+    for results_dir, manifest in manifests.items():
+        _write_manifest(results_dir, manifest)
+    return status
+
+
+def render_network_plots(network, results_dir, current_time, plots=None, workers=None, dpi=None):
+    """save_results용 진입점: 명세 생성 후 렌더링"""
+    specs = build_plot_specs(network, results_dir, current_time)
+    return render_plots(specs, plots=plots, workers=workers, dpi=dpi)
@@ -351,6 +351,7 @@ class RegionalExcelProcessor:
             header_row = 5
             
             # 데이터 행 처리
+            connections = []
             for row in range(header_row + 1, ws.max_row + 1):
                 # 빈 행 건너뛰기
                 if not ws.cell(row=row, column=1).value:
@@ -393,18 +394,22 @@ class RegionalExcelProcessor:
                     'r': float(r) if r else None
                 }
                 
-                # 거리, x, r 자동 계산 (값이 없는 경우)
-                if not distance or not x or not r:
-                    calc_distance = self.region_selector.calculate_distance(region1, region2)
-                    if calc_distance:
-                        if not distance:
-                            connection_data['length'] = calc_distance
-                        if not x:
-                            connection_data['x'] = calc_distance * 0.0004
-                        if not r:
-                            connection_data['r'] = calc_distance * 0.0001
-                
-                # 데이터 관리자에 연결 추가
+                connections.append((region1, region2, connection_data))
+            
+            # 거리, x, r 자동 계산 (값이 없는 연결만, 공유 거리 서비스로 일괄 계산)
+            missing = [c for c in connections if not all(c[2][k] for k in ('length', 'x', 'r'))]
+            if missing:
+                params = self.region_selector.distance_service.line_parameters(
+                    [c[0] for c in missing], [c[1] for c in missing])
+                for (_, _, connection_data), calc in zip(missing, params.itertuples(index=False)):
+                    if pd.isna(calc.length) or not calc.length:
+                        continue
+                    for key in ('length', 'x', 'r'):
+                        if not connection_data[key]:
+                            connection_data[key] = float(getattr(calc, key))
+            
+            # 데이터 관리자에 연결 추가
+            for region1, region2, connection_data in connections:
                 self.data_manager.add_connection(region1, region2, connection_data)
             
             return True
@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+지역 간 거리 및 송전선로 파라미터 서비스
+
+지역 중심 좌표(경도, 위도)로 대권(하버사인) 거리 행렬을 NumPy로 한 번 계산해 캐시하고,
+후보 연결 전체의 길이/리액턴스/저항/건설비/손실률을 일괄 계산합니다.
+RegionalSelector, create_lines_data, KoreaMapVisualizer, 거리 기반 송전 모델이
+각자 쌍별 루프로 다시 계산하지 않고 이 서비스를 공유합니다.
+
+시군구/읍면동 수준으로 지역 수가 늘어나면 쌍의 수가 제곱으로 늘어나므로
+    - 전체 행렬은 행 블록 단위로 채우고 (중간 배열 크기 제한)
+    - max_matrix_size보다 큰 경우 행렬을 만들지 않고 요청한 쌍만 직접 계산합니다.
+
+사용 예:
+    service = get_distance_service(KOREA_REGIONS)
+    service.distance('SEL', 'GGD')                       # km
+    params = service.line_parameters(['SEL', 'GGD'], ['GGD', 'CBD'])
+"""
+
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+# 지구 반지름 (km)
+EARTH_RADIUS_KM = 6371.0
+
+# 전체 거리 행렬을 만드는 최대 지역 수 (이보다 크면 쌍별 직접 계산)
+# float64 행렬은 N² × 8바이트 (2,500개 ≈ 50 MB, 20,000개면 3.2 GB)
+MAX_MATRIX_SIZE = 2500
+
+# 행렬 계산 블록 크기 (행 수)
+BLOCK_ROWS = 1024
+
+# 선로 유형별 단위 길이 파라미터 (기존 create_lines_data / read_connections 기준)
+LINE_TYPES = {
+    'AC': {
+        'x_per_km': 0.0004,            # 리액턴스 (거리에 비례)
+        'r_per_km': 0.0001,            # 저항 (거리에 비례)
+        'capital_cost_per_km': 0.01,   # 건설 비용 (거리에 비례)
+        'loss_per_100km': 0.02         # 송전 손실률 2% per 100km
+    },
+    'DC': {
+        'x_per_km': 0.0,               # DC는 리액턴스 없음
+        'r_per_km': 0.0002,            # DC 해저 케이블 저항
+        'capital_cost_per_km': 0.05,   # 해저 케이블은 더 비쌈
+        'loss_per_100km': 0.01
+    }
+}
+
+# 좌표 해시 → 서비스 (프로세스 내 재사용)
+_SERVICES = {}
+
+
+def region_of(bus_names):
+    """버스 이름 → 지역 코드 ('SEL_EHV' → 'SEL', 구분자가 없으면 앞 3글자)"""
+    names = pd.Index(bus_names).astype(str)
+    has_sep = names.str.contains('_', regex=False)
+    return np.where(has_sep, names.str.split('_').str[0], names.str[:3])
+
+
+def haversine(lon1, lat1, lon2, lat2, radius=EARTH_RADIUS_KM):
+    """하버사인 거리 (km, 배열 브로드캐스팅 지원)"""
+    lon1, lat1, lon2, lat2 = (np.radians(np.asarray(v, dtype=float)) for v in (lon1, lat1, lon2, lat2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * radius * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def haversine_matrix(lon, lat, radius=EARTH_RADIUS_KM, dtype=np.float64, block_rows=BLOCK_ROWS):
+    """전체 하버사인 거리 행렬 (행 블록 단위 계산)
+
+    Args:
+        lon (array): 경도 배열
+        lat (array): 위도 배열
+        dtype: 결과 자료형 (대규모 지역은 np.float32로 메모리 절반)
+        block_rows (int): 한 번에 계산할 행 수
+
+    Returns:
+        np.ndarray: (N, N) 거리 행렬 (km)
+    """
+    lon = np.radians(np.asarray(lon, dtype=float))
+    lat = np.radians(np.asarray(lat, dtype=float))
+    n = len(lon)
+    cos_lat = np.cos(lat)
+    result = np.empty((n, n), dtype=dtype)
+    for start in range(0, n, block_rows):
+        stop = min(start + block_rows, n)
+        dlat = lat[None, :] - lat[start:stop, None]
+        dlon = lon[None, :] - lon[start:stop, None]
+        a = np.sin(dlat / 2) ** 2 + cos_lat[start:stop, None] * cos_lat[None, :] * np.sin(dlon / 2) ** 2
+        result[start:stop] = 2 * radius * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    np.fill_diagonal(result, 0)
+    return result
+
+
+def euclidean_matrix(xy, scale=1.0, dtype=np.float64, block_rows=BLOCK_ROWS):
+    """투영 좌표(예: EPSG:3857 m) 간 유클리드 거리 행렬 (scale로 단위 변환, 예: 1/1000 → km)"""
+    xy = np.asarray(xy, dtype=float)
+    n = len(xy)
+    result = np.empty((n, n), dtype=dtype)
+    for start in range(0, n, block_rows):
+        stop = min(start + block_rows, n)
+        diff = xy[start:stop, None, :] - xy[None, :, :]
+        result[start:stop] = np.sqrt((diff ** 2).sum(axis=2)) * scale
+    return result
+
+
+def shortest_path_matrix(region0, region1, length, directed=False):
+    """연결(엣지) 기준 지역 간 최단 경로 거리 행렬 (scipy 다익스트라, 연결 없는 쌍은 inf)
+
+    Args:
+        region0 (array): 연결 시작 지역
+        region1 (array): 연결 종료 지역
+        length (array): 연결 길이 (중복 연결은 최소값 사용)
+
+    Returns:
+        pd.DataFrame: 지역 × 지역 최단 거리
+    """
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import shortest_path
+
+    edges = pd.DataFrame({'region0': np.asarray(region0, dtype=str),
+                          'region1': np.asarray(region1, dtype=str),
+                          'length': pd.to_numeric(pd.Series(np.asarray(length, dtype=object)),
+                                                  errors='coerce').to_numpy()})
+    edges = edges[edges['region0'] != edges['region1']].dropna(subset=['length'])
+    nodes = pd.Index(pd.unique(np.concatenate([edges['region0'].to_numpy(), edges['region1'].to_numpy()])))
+    if len(nodes) == 0:
+        return pd.DataFrame()
+    edges = edges.groupby(['region0', 'region1'], as_index=False)['length'].min()
+    i = nodes.get_indexer(edges['region0'])
+    j = nodes.get_indexer(edges['region1'])
+    # 0 길이 엣지도 유지되도록 아주 작은 값으로 대체
+    weights = np.maximum(edges['length'].to_numpy(dtype=float), 1e-9)
+    graph = coo_matrix((weights, (i, j)), shape=(len(nodes), len(nodes))).tocsr()
+    # 무방향이면 A→B, B→A 중 짧은 쪽을 사용
+    dist = shortest_path(graph, method='D', directed=directed)
+    return pd.DataFrame(dist, index=nodes, columns=nodes)
+
+
+class RegionDistanceService:
+    """지역 간 거리 행렬과 선로 파라미터 일괄 계산 서비스"""
+
+    def __init__(self, coordinates, max_matrix_size=MAX_MATRIX_SIZE, dtype=np.float64):
+        """초기화 함수
+
+        Args:
+            coordinates (dict or pd.DataFrame): {지역 코드: (경도, 위도)} 또는 lon/lat 컬럼 DataFrame
+            max_matrix_size (int): 전체 행렬을 만드는 최대 지역 수
+            dtype: 행렬 자료형
+        """
+        if isinstance(coordinates, pd.DataFrame):
+            frame = coordinates[['lon', 'lat']].astype(float)
+        else:
+            frame = pd.DataFrame.from_dict({str(k): tuple(v) for k, v in coordinates.items()},
+                                           orient='index', columns=['lon', 'lat']).astype(float)
+        self.codes = pd.Index(frame.index.astype(str))
+        self.lon = frame['lon'].to_numpy()
+        self.lat = frame['lat'].to_numpy()
+        self.max_matrix_size = max_matrix_size
+        self.dtype = dtype
+        self._matrix = None
+
+    def __len__(self):
+        return len(self.codes)
+
+    def positions(self, codes):
+        """지역 코드 → 위치 인덱스 (없는 코드는 -1)"""
+        return self.codes.get_indexer(pd.Index(codes).astype(str))
+
+    def matrix(self):
+        """전체 거리 행렬 (km, 최초 1회 계산 후 캐시)"""
+        if self._matrix is None:
+            if len(self) > self.max_matrix_size:
+                raise MemoryError(f"지역 수({len(self)})가 너무 많아 전체 거리 행렬을 만들지 않습니다. "
+                                  f"pair_distances를 사용하세요.")
+            self._matrix = haversine_matrix(self.lon, self.lat, dtype=self.dtype)
+        return self._matrix
+
+    def as_frame(self):
+        """거리 행렬 DataFrame (행/열: 지역 코드)"""
+        return pd.DataFrame(self.matrix(), index=self.codes, columns=self.codes)
+
+    def pair_distances(self, codes0, codes1):
+        """지역 쌍 배열의 거리 (km, 알 수 없는 지역은 NaN)
+
+        작은 지역 집합은 캐시된 행렬에서 조회하고, 큰 집합은 요청한 쌍만 계산합니다.
+        """
+        i = self.positions(codes0)
+        j = self.positions(codes1)
+        valid = (i >= 0) & (j >= 0)
+        result = np.full(len(i), np.nan)
+        if not valid.any():
+            return result
+        if self._matrix is not None or len(self) <= self.max_matrix_size:
+            result[valid] = self.matrix()[i[valid], j[valid]]
+        else:
+            result[valid] = haversine(self.lon[i[valid]], self.lat[i[valid]],
+                                      self.lon[j[valid]], self.lat[j[valid]])
+        return result
+
+    def distance(self, code1, code2):
+        """두 지역 간 거리 (km, 알 수 없는 지역이면 None)"""
+        value = self.pair_distances([code1], [code2])[0]
+        return None if np.isnan(value) else float(value)
+
+    def all_pairs(self, codes=None):
+        """지역 목록의 모든 쌍(i < j) 거리 DataFrame (region0, region1, distance)"""
+        codes = list(self.codes if codes is None else codes)
+        i, j = np.triu_indices(len(codes), k=1)
+        region0 = np.asarray(codes, dtype=object)[i]
+        region1 = np.asarray(codes, dtype=object)[j]
+        return pd.DataFrame({'region0': region0, 'region1': region1,
+                             'distance': self.pair_distances(region0, region1)})
+
+    def line_parameters(self, region0, region1, carrier='AC', length=None, line_types=None, decimals=None):
+        """후보 연결 전체의 선로 파라미터 일괄 계산
+
+        Args:
+            region0 (array): 시작 지역 코드
+            region1 (array): 종료 지역 코드
+            carrier (str or array): 'AC'/'DC' (연결별 지정 가능)
+            length (array, optional): 이미 알고 있는 길이 (NaN/None인 항목만 계산값으로 채움)
+            line_types (dict, optional): 선로 유형별 단위 파라미터 (기본 LINE_TYPES)
+            decimals (int, optional): 길이 반올림 자릿수
+
+        Returns:
+            pd.DataFrame: region0, region1, carrier, length, x, r, capital_cost, loss_rate, efficiency
+        """
+        line_types = line_types or LINE_TYPES
+        region0 = np.asarray(region0, dtype=object)
+        region1 = np.asarray(region1, dtype=object)
+        carriers = np.broadcast_to(np.asarray(carrier, dtype=object), region0.shape)
+
+        computed = self.pair_distances(region0, region1)
+        if length is not None:
+            given = pd.to_numeric(pd.Series(np.asarray(length, dtype=object)), errors='coerce').to_numpy()
+            computed = np.where(np.isnan(given), computed, given)
+        if decimals is not None:
+            computed = np.round(computed, decimals)
+
+        table = pd.DataFrame({'region0': region0, 'region1': region1,
+                              'carrier': carriers, 'length': computed})
+        for column, key in (('x', 'x_per_km'), ('r', 'r_per_km'),
+                            ('capital_cost', 'capital_cost_per_km'), ('loss_rate', 'loss_per_100km')):
+            per_km = pd.Series(carriers).map({c: v[key] for c, v in line_types.items()}).fillna(
+                line_types['AC'][key]).to_numpy(dtype=float)
+            table[column] = per_km * computed / (100.0 if column == 'loss_rate' else 1.0)
+        table['efficiency'] = 1 - table['loss_rate']
+        return table
+
+
+def _coordinates_key(coordinates):
+    items = sorted((str(k), tuple(np.round(v, 9))) for k, v in coordinates.items())
+    return hashlib.sha1(repr(items).encode('utf-8')).hexdigest()
+
+
+def get_distance_service(regions):
+    """지역 정보로 거리 서비스 조회 (같은 좌표 집합이면 캐시된 서비스 재사용)
+
+    Args:
+        regions (dict): {코드: {'center': (경도, 위도), ...}} 또는 {코드: (경도, 위도)}
+
+    Returns:
+        RegionDistanceService
+    """
+    coordinates = {code: (info['center'] if isinstance(info, dict) else info) for code, info in regions.items()}
+    key = _coordinates_key(coordinates)
+    service = _SERVICES.get(key)
+    if service is None:
+        service = RegionDistanceService(coordinates)
+        _SERVICES[key] = service
+    return service
@@ -16,6 +16,14 @@ from matplotlib.collections import PatchCollection
 import json
 import math
 
+# 행정구역 경계는 전처리된 지오메트리 캐시에서 로드 (GDAL/PROJ 임포트 없음)
+try:
+    from geometry_cache import load_geometry_cache
+except Exception:
+    load_geometry_cache = None
+
+from region_distance import get_distance_service
+
 # 기본 한국 행정구역 정보
 KOREA_REGIONS = {
     'SEL': {
@@ -159,19 +167,25 @@ KOREA_REGIONS = {
 class RegionalSelector:
     """지역 선택 및 관리 클래스"""
     
-    def __init__(self, boundary_file=None):
+    def __init__(self, boundary_file=None, geometry_cache=None):
         """초기화 함수
         
         Args:
             boundary_file (str, optional): 행정구역 경계 파일 경로
+            geometry_cache (str, optional): 지오메트리 캐시(.npz) 경로 (기본: data/BND_SIDO_PG_geometry.npz)
         """
         self.regions = KOREA_REGIONS
         self.selected_regions = []
         self.boundaries = None
+        self.geometry = None
         
         # 경계 파일이 제공된 경우 로드
         if boundary_file and os.path.exists(boundary_file):
             self.load_boundaries(boundary_file)
+        
+        # 캐시가 있으면 실제 경계 사용 (없으면 생성하지 않고 원 표시로 대체)
+        if load_geometry_cache is not None:
+            self.geometry = load_geometry_cache(cache_path=geometry_cache, build=False)
     
     def load_boundaries(self, file_path):
         """행정구역 경계 파일 로드
@@ -257,8 +271,10 @@ class RegionalSelector:
         else:
             fig = ax.figure
         
-        # 경계 파일이 있는 경우 정확한 경계 그리기
-        if self.boundaries:
+        # 지오메트리 캐시가 있는 경우 정확한 경계 그리기 (경위도, 저해상도)
+        if self.geometry is not None:
+            self._draw_cached_boundaries(ax, highlight_selected)
+        elif self.boundaries:
             # 경계 파일 기반 그리기 로직
             pass
         else:
@@ -308,6 +324,37 @@ class RegionalSelector:
         
         return fig, ax
     
+    def _draw_cached_boundaries(self, ax, highlight_selected=True):
+        """지오메트리 캐시의 경계로 지역 그리기"""
+        from matplotlib.patches import PathPatch
+        
+        name_to_code = {info['name']: code for code, info in self.regions.items()}
+        names = self.geometry.names()
+        lonlat_centroids = self.geometry.centroids(lonlat=True)
+        for name, path in zip(names, self.geometry.paths(level='low', lonlat=True)):
+            if path is None:
+                continue
+            code = name_to_code.get(name)
+            selected = highlight_selected and code in self.selected_regions
+            color = self.regions[code]['color'] if code else 'lightgray'
+            ax.add_patch(PathPatch(
+                path,
+                facecolor=color,
+                edgecolor='red' if selected else 'black',
+                linewidth=2 if selected else 0.5,
+                alpha=1.0 if selected else 0.7
+            ))
+            
+            # 지역명 표시
+            ax.annotate(name, xy=lonlat_centroids[name], ha='center', va='center', fontsize=8)
+    
+    @property
+    def distance_service(self):
+        """지역 중심 좌표 기반 거리 서비스 (거리 행렬은 최초 조회 시 한 번 계산)"""
+        if getattr(self, '_distance_service', None) is None:
+            self._distance_service = get_distance_service(self.regions)
+        return self._distance_service
+    
     def calculate_distance(self, region_code1, region_code2):
         """두 지역 간 거리 계산 (하버사인 공식)
         
@@ -321,26 +368,8 @@ class RegionalSelector:
         if region_code1 not in self.regions or region_code2 not in self.regions:
             return None
         
-        # 두 지역의 중심 좌표
-        lon1, lat1 = self.regions[region_code1]['center']
-        lon2, lat2 = self.regions[region_code2]['center']
-        
-        # 하버사인 공식
-        R = 6371.0  # 지구 반지름 (km)
-        
-        lat1_rad = math.radians(lat1)
-        lon1_rad = math.radians(lon1)
-        lat2_rad = math.radians(lat2)
-        lon2_rad = math.radians(lon2)
-        
-        dlon = lon2_rad - lon1_rad
-        dlat = lat2_rad - lat1_rad
-        
-        a = math.sin(dlat / 2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2)**2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        
-        distance = R * c
-        return distance
+        # 공유 거리 서비스의 캐시된 거리 행렬에서 조회
+        return self.distance_service.distance(region_code1, region_code2)
     
     def get_all_distances(self):
         """선택된 모든 지역 쌍 간의 거리 계산
@@ -348,16 +377,9 @@ class RegionalSelector:
         Returns:
             dict: 지역 쌍과 거리 매핑
         """
-        distances = {}
-        
-        for i, region1 in enumerate(self.selected_regions):
-            for region2 in self.selected_regions[i+1:]:
-                distance = self.calculate_distance(region1, region2)
-                if distance is not None:
-                    key = (region1, region2)
-                    distances[key] = distance
-        
-        return distances
+        codes = [code for code in self.selected_regions if code in self.regions]
+        pairs = self.distance_service.all_pairs(codes)
+        return {(r1, r2): float(d) for r1, r2, d in pairs.itertuples(index=False)}
     
     def get_region_prefix(self, region_code):
         """지역 코드에서 파일명 접두사 생성
@@ -0,0 +1,568 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+파라미터 변경 재풀이 세션 모듈 - 빠른 what-if 분석
+
+CO2 한도, 연료비, 선로 용량 같은 what-if는 구조가 같은데도 Excel에서 네트워크를 다시 만들고
+linopy 모델 전체를 다시 생성했습니다. 이 세션은 생성·풀이가 끝난 네트워크의 모델을 그대로 두고
+바뀐 계수만 제자리에서 고친 뒤 다시 풉니다 (직전 풀이 basis로 워밍스타트, 변수/제약 label이 같으므로 매핑 불필요).
+
+    비용        marginal_cost → 목적함수 p 계수, capital_cost → 목적함수 p_nom 계수와 기존 용량 capex
+                상수(objective_constant 변수 범위) (단일 기간)
+    고정 용량    p_nom / s_nom (확장 불가 설비) → fix-*-upper/lower 제약 우변
+    출력 프로파일 p_max_pu / p_min_pu / s_max_pu → fix 제약 우변, ext 제약의 용량 계수
+    확장 한도    p_nom_min/max, s_nom_min/max (확장 설비) → ext-*-lower/upper 제약 우변 (없으면 변수 범위)
+    전역 제약    GlobalConstraint constant (예: CO2Limit) → 제약 우변
+
+what-if는 항상 기준 해 대비입니다. 새 what-if 전에 직전 what-if에서 바꾼 값을 기준 값으로 되돌린 뒤 적용하고,
+결과는 기준 해와의 차이(목적함수, 탄소별 발전량, 용량, 버스별 평균 가격, CO2 가격)로 반환합니다.
+
+변경 키 (scenario_sweep 파라미터 형식과 같음):
+    co2_limit                   CO2Limit 전역 제약 상수
+    cost.<기술>                  발전기/링크 marginal_cost 배율 (carrier, 기술 분류명 또는 이름 포함 문자열)
+    line_scale[.이름]            선로 s_nom(고정)/s_nom_max(확장) 배율
+    <컴포넌트>/<name>/<속성>      값 지정 (name='*'은 전체, 시계열 속성은 스칼라 또는 스냅샷 길이 배열/Series)
+
+사용 예:
+    session = ResolveSession(network)                    # optimize_network가 끝난 네트워크
+    diff = session.whatif({'co2_limit': 1.5e8, 'cost.LNG': 1.3})
+    diff['objective']['delta'], diff['generation']
+    session.whatif({'generators/GBD_WT/p_max_pu': profile})   # 이전 what-if는 되돌리고 적용
+    session.check_against_rebuild({'generators/SEL_PV/capital_cost': 100})['ok']   # 재생성 풀이와 목적함수 비교
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from year_results import summarize_year
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 컴포넌트 → (클래스, 출력 변수, 명목 용량, 상한 pu 속성, 하한 pu 속성, 하한 부호)
+# 선로는 하한이 -s_max_pu × s_nom 이므로 하한 속성 s_max_pu, 부호 -1
+COMPONENTS = {
+    'generators': ('Generator', 'p', 'p_nom', 'p_max_pu', 'p_min_pu', 1.0),
+    'links': ('Link', 'p', 'p_nom', 'p_max_pu', 'p_min_pu', 1.0),
+    'lines': ('Line', 's', 's_nom', 's_max_pu', 's_max_pu', -1.0),
+}
+COMPONENT_LIST = {cls: component for component, (cls, *_rest) in COMPONENTS.items()}
+
+SUPPORTED_ATTRS = {'marginal_cost', 'capital_cost', 'p_nom', 's_nom', 'p_max_pu', 'p_min_pu', 's_max_pu',
+                   'p_nom_min', 'p_nom_max', 's_nom_min', 's_nom_max'}
+
+
+def _gui():
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+    import PyPSA_GUI
+    return PyPSA_GUI
+
+
+def _update(item, **values):
+    """linopy 변수/제약 값 변경 (update가 있으면 사용, 구버전은 속성 setter)"""
+    if callable(getattr(item, 'update', None)):
+        item.update(**values)
+    else:
+        for name, value in values.items():
+            setattr(item, name, value)
+
+
+def _diff_frame(base, new, index_name):
+    frame = pd.DataFrame({'base': pd.Series(base, dtype=float), 'new': pd.Series(new, dtype=float)}).fillna(0.0)
+    frame['delta'] = frame['new'] - frame['base']
+    frame.index.name = index_name
+    return frame
+
+
+def _diff_value(base, new):
+    delta = None if base is None or new is None else float(new) - float(base)
+    return {'base': base, 'new': new, 'delta': delta}
+
+
+class ResolveSession:
+    """생성·풀이가 끝난 네트워크의 linopy 모델을 제자리 수정해 다시 푸는 what-if 세션"""
+
+    def __init__(self, network, solver_name='cplex', solver_options=None):
+        """초기화 함수
+
+        Args:
+            network (pypsa.Network): 풀이가 끝난 네트워크 (linopy 모델이 없으면 모델을 만들고 기준 해를 다시 풂)
+            solver_name (str): 솔버 (기본 cplex)
+            solver_options (dict): 솔버 옵션 (None이면 cplex는 optimize_network와 같은 방법별 옵션 세트)
+        """
+        self.network = network
+        self.solver_name = solver_name
+        self.solver_options = solver_options
+        self._basis_dir = tempfile.mkdtemp(prefix='pypsa-resolve-')
+        self._basis_fn = None
+        self._base_static = {}      # (컴포넌트, 속성) → 기준 정적 값 Series
+        self._base_dynamic = {}     # (컴포넌트, 속성) → 기준 시계열 DataFrame (없으면 빈 프레임)
+        self._base_constants = {}   # 전역 제약 이름 → 기준 constant
+        self._applied_constants = {}  # 전역 제약 이름 → 모델 우변에 반영된 constant
+        self._touched = {}          # (컴포넌트, 속성) → 직전 what-if에서 바꾼 이름 집합
+
+        if getattr(network, 'model', None) is None or not self._has_solution():
+            print("재풀이 세션: linopy 모델이 없어 모델을 만들고 기준 해를 다시 풉니다.")
+            network.optimize.create_model()
+            status = self._solve()
+            if not self._ok(status):
+                raise RuntimeError(f"재풀이 세션 기준 풀이 실패: {status}")
+        # 기존 용량 capex 상수 (PyPSA는 확장 설비의 capital_cost × 명목 용량을 objective_constant 변수로 고정)
+        self._base_capex = self._existing_capex()
+        self._base_objective_constant = self._objective_constant_value()
+        self._objective_offset = 0.0  # objective_constant 변수가 없는 모델에서 보고 목적함수에 더할 보정
+        self.base = self._snapshot()
+
+    @classmethod
+    def from_input(cls, input_data, **kwargs):
+        """입력 데이터 → 네트워크 생성·풀이(네트워크 캐시 사용) → 세션"""
+        network, success = _gui().build_and_optimize(input_data)
+        if not success:
+            raise RuntimeError("재풀이 세션: 기준 네트워크 최적화 실패")
+        return cls(network, **kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """basis 임시 폴더 정리"""
+        shutil.rmtree(self._basis_dir, ignore_errors=True)
+
+    # ---- 풀이 ----
+
+    def _has_solution(self):
+        try:
+            return self.network.objective is not None and np.isfinite(float(self.network.objective))
+        except Exception:
+            return False
+
+    @staticmethod
+    def _ok(status):
+        text = ' '.join(str(s) for s in status) if isinstance(status, tuple) else str(status)
+        return 'ok' in text.lower() or 'optimal' in text.lower()
+
+    def _option_variants(self):
+        if self.solver_options is not None or self.solver_name != 'cplex':
+            return [{'name': self.solver_name, 'opts': dict(self.solver_options or {})}]
+        gui = _gui()
+        import multiprocessing
+        threads = int(os.environ.get('SOLVER_THREADS') or multiprocessing.cpu_count())
+        variants = gui._solver_option_variants(threads)
+        if self._basis_fn:
+            # barrier는 시작 basis를 쓰지 않으므로 직전 basis로 dual simplex를 먼저 시도
+            variants.insert(0, {'name': 'warm-dual-simplex',
+                                'opts': {'threads': threads, 'lpmethod': 2, 'parallel': 1, 'advance': 1}})
+        return variants
+
+    def _solve(self):
+        """현재 모델 재풀이 (직전 basis로 워밍스타트, 풀이 basis를 다음 what-if용으로 보관)"""
+        basis_fn = os.path.join(self._basis_dir, 'solution.bas')
+        warm = self._basis_fn is not None and os.environ.get('WARM_START', '1') != '0'
+        status = None
+        for variant in self._option_variants():
+            kwargs = {'basis_fn': basis_fn}
+            if warm:
+                start_fn = os.path.join(self._basis_dir, 'start.bas')
+                shutil.copyfile(self._basis_fn, start_fn)
+                kwargs['warmstart_fn'] = start_fn
+            try:
+                status = self.network.optimize.solve_model(solver_name=self.solver_name,
+                                                           solver_options=variant['opts'], **kwargs)
+            except Exception as e:
+                status = ('error', str(e))
+                print(f"재풀이 경고({variant['name']}): {str(e)}")
+                continue
+            if self._ok(status):
+                break
+        if self._ok(status) and os.path.exists(basis_fn):
+            self._basis_fn = basis_fn
+        return status
+
+    # ---- 기준 값 보관/복원 ----
+
+    def _component(self, component):
+        return getattr(self.network, component)
+
+    def _remember(self, component, attr):
+        key = (component, attr)
+        if key in self._base_static:
+            return
+        df = self._component(component)
+        self._base_static[key] = df[attr].copy() if attr in df.columns else None
+        dynamic = getattr(self.network, f"{component}_t")
+        frame = dynamic[attr] if attr in dynamic else pd.DataFrame(index=self.network.snapshots)
+        self._base_dynamic[key] = frame.copy()
+
+    def _restore(self):
+        """직전 what-if에서 바꾼 값을 기준 값으로 되돌림 (모델 계수는 refresh에서 함께 다시 계산)"""
+        for (component, attr), names in self._touched.items():
+            if component == 'global_constraints':
+                for name in names:
+                    self.network.global_constraints.loc[name, 'constant'] = self._base_constants[name]
+                continue
+            df = self._component(component)
+            base = self._base_static[(component, attr)]
+            if base is not None:
+                df.loc[list(names), attr] = base.reindex(list(names)).values
+            dynamic = getattr(self.network, f"{component}_t")
+            if attr in dynamic:
+                frame = dynamic[attr]
+                base_frame = self._base_dynamic[(component, attr)]
+                frame = frame.drop(columns=[n for n in names if n in frame.columns])
+                kept = [n for n in names if n in base_frame.columns]
+                dynamic[attr] = pd.concat([frame, base_frame[kept]], axis=1) if kept else frame
+
+    # ---- 변경 적용 (네트워크 데이터) ----
+
+    def _names(self, component, name):
+        index = self._component(component).index
+        if name == '*':
+            return list(index)
+        if name not in index:
+            raise KeyError(f"{component}에 '{name}'이(가) 없습니다.")
+        return [name]
+
+    def _set(self, component, names, attr, value, touched):
+        if component == 'global_constraints':
+            if attr != 'constant':
+                raise ValueError(f"전역 제약은 constant만 바꿀 수 있습니다: {attr}")
+            for name in names:
+                self._base_constants.setdefault(name, float(self.network.global_constraints.at[name, 'constant']))
+                self.network.global_constraints.loc[name, 'constant'] = float(value)
+            touched.setdefault((component, attr), set()).update(names)
+            return
+        if component not in COMPONENTS or attr not in SUPPORTED_ATTRS:
+            raise ValueError(f"재풀이 세션에서 바꿀 수 없는 속성입니다 (재생성 필요): {component}.{attr}")
+        self._remember(component, attr)
+        df = self._component(component)
+        dynamic = getattr(self.network, f"{component}_t")
+        if np.ndim(value) == 0:
+            df.loc[names, attr] = float(value)
+            if attr in dynamic:
+                dynamic[attr] = dynamic[attr].drop(columns=[n for n in names if n in dynamic[attr].columns])
+        else:
+            values = np.asarray(value, dtype=float)
+            if len(values) != len(self.network.snapshots):
+                raise ValueError(f"{attr} 프로파일 길이({len(values)})가 스냅샷 수({len(self.network.snapshots)})와 다릅니다.")
+            frame = dynamic[attr] if attr in dynamic else pd.DataFrame(index=self.network.snapshots)
+            frame = frame.drop(columns=[n for n in names if n in frame.columns])
+            profile = pd.DataFrame(np.repeat(values[:, None], len(names), axis=1),
+                                   index=self.network.snapshots, columns=names)
+            dynamic[attr] = pd.concat([frame, profile], axis=1)
+        touched.setdefault((component, attr), set()).update(names)
+
+    def _scale(self, component, names, attr, factor, touched):
+        df = self._component(component)
+        self._remember(component, attr)
+        base = self._base_static[(component, attr)]
+        dynamic = self._base_dynamic[(component, attr)]
+        for name in names:
+            if name in dynamic.columns:
+                self._set(component, [name], attr, dynamic[name].values * float(factor), touched)
+            else:
+                self._set(component, [name], attr, float(base[name] if base is not None else df.at[name, attr]) * float(factor),
+                          touched)
+
+    def _apply_changes(self, changes):
+        gui = None
+        touched = {}
+        for key, value in changes.items():
+            head, _, sub = key.partition('.')
+            if key == 'co2_limit':
+                if 'CO2Limit' not in self.network.global_constraints.index:
+                    raise ValueError("네트워크에 CO2Limit 전역 제약이 없습니다 (DISABLE_CO2_LIMIT 상태는 재생성 필요).")
+                if value is None:
+                    raise ValueError("CO2Limit 제거는 모델 구조가 바뀌므로 재생성이 필요합니다.")
+                self._set('global_constraints', ['CO2Limit'], 'constant', value, touched)
+            elif head == 'cost' and sub:
+                gui = gui or _gui()
+                target = sub.lower()
+                for component in ('generators', 'links'):
+                    df = self._component(component)
+                    names = df.index.astype(str)
+                    carrier = df['carrier'].astype(str).str.lower() if 'carrier' in df.columns else ''
+                    mask = ((carrier == target) | names.str.lower().str.contains(target, regex=False) |
+                            (names.map(gui._classify_technology).str.lower() == target))
+                    self._scale(component, list(df.index[np.asarray(mask)]), 'marginal_cost', value, touched)
+            elif head == 'line_scale':
+                lines = self.network.lines
+                mask = lines.index.astype(str).str.contains(sub, regex=False) if sub else np.ones(len(lines), bool)
+                selected = lines[np.asarray(mask)]
+                extendable = selected['s_nom_extendable'].astype(bool)
+                self._scale('lines', list(selected.index[~extendable]), 's_nom', value, touched)
+                self._scale('lines', list(selected.index[extendable]), 's_nom_max', value, touched)
+            elif key.count('/') == 2:
+                component, name, attr = key.split('/')
+                self._set(component, self._names(component, name), attr, value, touched)
+            else:
+                raise ValueError(f"알 수 없는 what-if 키: {key}")
+        return touched
+
+    # ---- 모델 계수 갱신 ----
+
+    def _dense(self, cls, attr, snapshots, names):
+        return self.network.get_switchable_as_dense(cls, attr, snapshots).reindex(columns=names)
+
+    def _refresh(self, targets):
+        """바뀐 (컴포넌트, 속성) → linopy 모델 계수/우변 갱신"""
+        m = self.network.model
+        objective_updates = []
+        for (component, attr), names in targets.items():
+            names = sorted(names)
+            if not names:
+                continue
+            if component == 'global_constraints':
+                for name in names:
+                    con = m.constraints[f"GlobalConstraint-{name}"]
+                    # 우변 = constant - (저장 설비 초기 에너지 등 보정), 보정은 그대로 두고 constant 차이만 반영
+                    old = float(con.rhs.values.ravel()[0])
+                    gc = self.network.global_constraints
+                    current = float(gc.at[name, 'constant'])
+                    applied = self._applied_constants.get(name, self._base_constants[name])
+                    _update(con, rhs=old + current - applied)
+                    self._applied_constants[name] = current
+                continue
+            cls, var, nom, upper_attr, lower_attr, lower_sign = COMPONENTS[component]
+            if attr == 'marginal_cost':
+                objective_updates.append(self._marginal_cost_coefficients(cls, var, names))
+            elif attr == 'capital_cost':
+                objective_updates.append(self._capital_cost_coefficients(cls, nom, names))
+            elif attr in (nom, upper_attr, lower_attr):
+                self._refresh_dispatch_limits(cls, var, nom, upper_attr, lower_attr, lower_sign, names)
+            elif attr in (f"{nom}_min", f"{nom}_max"):
+                self._refresh_nominal_limits(cls, nom, attr, names)
+        if objective_updates:
+            self._refresh_objective(pd.concat(objective_updates))
+        if any(component in COMPONENTS and attr in ('capital_cost', COMPONENTS[component][2])
+               for component, attr in targets):
+            self._refresh_objective_constant()
+
+    def _marginal_cost_coefficients(self, cls, var, names):
+        labels = self.network.model.variables[f"{cls}-{var}"].labels
+        names = [n for n in names if n in labels.indexes['name']]
+        snapshots = labels.indexes['snapshot']
+        weights = self.network.snapshot_weightings['objective'].reindex(snapshots)
+        if getattr(self.network, '_multi_invest', False):
+            periods = snapshots.get_level_values(0)
+            weights = weights * self.network.investment_period_weightings['objective'].reindex(periods).values
+        cost = self._dense(cls, 'marginal_cost', snapshots, names).mul(weights.values, axis=0)
+        label_values = labels.transpose('snapshot', 'name').sel(name=names).values
+        return pd.Series(cost.values.ravel(), index=label_values.ravel())
+
+    def _capital_cost_coefficients(self, cls, nom, names):
+        if getattr(self.network, '_multi_invest', False):
+            raise ValueError("다기간 모델의 capital_cost 변경은 재생성이 필요합니다.")
+        labels = self.network.model.variables[f"{cls}-{nom}"].labels
+        names = [n for n in names if n in labels.indexes['name']]
+        cost = getattr(self.network, COMPONENT_LIST[cls])['capital_cost'].reindex(names)
+        return pd.Series(cost.values, index=labels.sel(name=names).values)
+
+    def _existing_capex(self):
+        """모델의 확장 설비(발전기/링크/선로) 기존 용량 capex 합 (capital_cost × p_nom/s_nom, 단일 기간)"""
+        m = self.network.model
+        total = 0.0
+        for component, (cls, _var, nom, *_rest) in COMPONENTS.items():
+            if f"{cls}-{nom}" not in m.variables:
+                continue
+            names = m.variables[f"{cls}-{nom}"].labels.indexes['name']
+            static = self._component(component).reindex(names)
+            cost = pd.to_numeric(static['capital_cost'], errors='coerce').fillna(0.0)
+            total += float((cost * pd.to_numeric(static[nom], errors='coerce').fillna(0.0)).sum())
+        return total
+
+    def _objective_constant_value(self):
+        m = self.network.model
+        if 'objective_constant' not in m.variables:
+            return None
+        return float(np.asarray(m.variables['objective_constant'].lower.values).ravel()[0])
+
+    def _refresh_objective_constant(self):
+        """capital_cost/명목 용량 변경에 따른 기존 용량 capex 상수 갱신
+
+        목적함수 p_nom 계수만 바꾸면 objective_constant 변수(기존 용량 capex, 범위로 고정)가 기준 값으로 남아
+        목적함수가 Δcapital_cost × p_nom만큼 어긋나므로 변수 범위를 새 상수로 고칩니다.
+        변수가 없는 모델(기준 상수 0)은 차이를 보고 목적함수 보정으로 반영합니다.
+        """
+        if getattr(self.network, '_multi_invest', False):
+            return
+        delta = self._existing_capex() - self._base_capex
+        if self._base_objective_constant is None:
+            self._objective_offset = -delta
+            return
+        value = self._base_objective_constant + delta
+        variable = self.network.model.variables['objective_constant']
+        bound = variable.lower.copy(data=np.full(variable.lower.shape, value))
+        _update(variable, lower=bound, upper=bound)
+        self.network._objective_constant = value
+
+    def _refresh_objective(self, coefficients):
+        """목적함수에서 해당 변수 항의 계수 교체 (같은 변수가 여러 항이면 첫 항에 몰고 나머지는 0)"""
+        coefficients = coefficients[coefficients.index >= 0]
+        coefficients = coefficients[~coefficients.index.duplicated(keep='last')]
+        m = self.network.model
+        expr = m.objective.expression
+        variables = pd.Series(np.asarray(expr.vars.values).ravel())
+        coeffs = np.asarray(expr.coeffs.values, dtype=float).ravel().copy()
+        mask = variables.isin(coefficients.index).values
+        coeffs[mask] = 0.0
+        first = mask & ~variables.duplicated().values
+        coeffs[first] = coefficients.reindex(variables[first]).values
+        m.objective = type(expr)(expr.data.assign(coeffs=(expr.coeffs.dims, coeffs.reshape(expr.coeffs.shape))), m)
+
+    def _refresh_dispatch_limits(self, cls, var, nom, upper_attr, lower_attr, lower_sign, names):
+        m = self.network.model
+        component = COMPONENT_LIST[cls]
+        static = getattr(self.network, component)
+        for side, pu_attr, sign in (('upper', upper_attr, 1.0), ('lower', lower_attr, lower_sign)):
+            # 확장 불가 설비: var ≤ pu × nom (우변)
+            name = f"{cls}-fix-{var}-{side}"
+            if name in m.constraints:
+                con = m.constraints[name]
+                rhs = con.rhs.transpose('snapshot', 'name')
+                fixed = [n for n in names if n in rhs.indexes['name']]
+                if fixed:
+                    pu = self._dense(cls, pu_attr, rhs.indexes['snapshot'], fixed) * sign
+                    values = rhs.values.copy()
+                    positions = rhs.indexes['name'].get_indexer(fixed)
+                    values[:, positions] = pu.values * static[nom].reindex(fixed).values
+                    _update(con, rhs=rhs.copy(data=values))
+            # 확장 설비: var - pu × nom_var ≤/≥ 0 (nom_var 계수 = -pu)
+            name = f"{cls}-ext-{var}-{side}"
+            if name in m.constraints and f"{cls}-{nom}" in m.variables:
+                con = m.constraints[name]
+                coeffs = con.coeffs.transpose('snapshot', 'name', '_term')
+                variables = con.vars.transpose('snapshot', 'name', '_term').values
+                extendable = [n for n in names if n in coeffs.indexes['name']]
+                if not extendable:
+                    continue
+                pu = self._dense(cls, pu_attr, coeffs.indexes['snapshot'], extendable) * sign
+                nominal_labels = np.asarray(m.variables[f"{cls}-{nom}"].labels.values).ravel()
+                values = coeffs.values.copy()
+                positions = coeffs.indexes['name'].get_indexer(extendable)
+                block = values[:, positions, :]
+                is_nominal = np.isin(variables[:, positions, :], nominal_labels)
+                block = np.where(is_nominal, -pu.values[:, :, None], block)
+                values[:, positions, :] = block
+                _update(con, coeffs=coeffs.copy(data=values))
+
+    def _refresh_nominal_limits(self, cls, nom, attr, names):
+        m = self.network.model
+        side = 'upper' if attr.endswith('_max') else 'lower'
+        limits = getattr(self.network, COMPONENT_LIST[cls])[attr]
+        name = f"{cls}-ext-{nom}-{side}"
+        if name in m.constraints:
+            con = m.constraints[name]
+            rhs = con.rhs
+            present = [n for n in names if n in rhs.indexes['name']]
+            missing = [n for n in names if n not in rhs.indexes['name'] and np.isfinite(limits.get(n, np.inf))]
+            if missing:
+                print(f"재풀이 경고: {name} 제약이 없는 설비 {missing[:5]}의 한도는 반영되지 않습니다 (재생성 필요).")
+            if present:
+                values = rhs.values.copy()
+                values[rhs.indexes['name'].get_indexer(present)] = limits.reindex(present).values
+                _update(con, rhs=rhs.copy(data=values))
+            return
+        # 구버전 PyPSA: 확장 한도가 변수 범위
+        variable = m.variables[f"{cls}-{nom}"]
+        bound = variable.upper if side == 'upper' else variable.lower
+        present = [n for n in names if n in bound.indexes['name']]
+        values = bound.values.copy()
+        values[bound.indexes['name'].get_indexer(present)] = limits.reindex(present).values
+        _update(variable, **{side: bound.copy(data=values)})
+
+    # ---- 결과 ----
+
+    def _snapshot(self):
+        network = self.network
+        summary = summarize_year(network)
+        prices = network.buses_t.marginal_price.mean() if not network.buses_t.marginal_price.empty else pd.Series(dtype=float)
+        mu = network.global_constraints['mu'] if 'mu' in network.global_constraints.columns else pd.Series(dtype=float)
+        capacity = {(component, carrier): value for component, caps in summary['capacity'].items()
+                    for carrier, value in caps.items()}
+        return {'summary': summary, 'prices': prices.astype(float), 'mu': mu.astype(float), 'capacity': capacity}
+
+    def _objective(self, snapshot):
+        objective = snapshot['summary']['objective']
+        return objective if objective is None or not self._objective_offset else float(objective) + self._objective_offset
+
+    def _diff(self, status, timings, changes):
+        new = self._snapshot()
+        base = self.base
+        capacity = _diff_frame(base['capacity'], new['capacity'], None)
+        capacity.index = pd.MultiIndex.from_tuples(capacity.index, names=['component', 'carrier'])
+        return {
+            'status': str(status),
+            'changes': list(changes),
+            'objective': _diff_value(base['summary']['objective'], self._objective(new)),
+            'slack_mwh': _diff_value(base['summary']['slack_mwh'], new['summary']['slack_mwh']),
+            'generation': _diff_frame(base['summary']['generation_mwh'], new['summary']['generation_mwh'], 'carrier'),
+            'capacity': capacity,
+            'prices': _diff_frame(base['prices'], new['prices'], 'bus'),
+            'global_constraint_mu': _diff_frame(base['mu'], new['mu'], 'name'),
+            'timings': timings,
+        }
+
+    def whatif(self, changes):
+        """기준 해 대비 what-if 재풀이
+
+        Args:
+            changes (dict): 변경 키 → 값 (모듈 설명의 키 형식, 빈 dict이면 기준 상태로 재풀이)
+
+        Returns:
+            dict: status, changes, objective/slack_mwh({base, new, delta}),
+                  generation(탄소별 MWh)/capacity((컴포넌트, 탄소)별)/prices(버스별 평균)/global_constraint_mu
+                  차이 표(base, new, delta), timings(update_seconds, solve_seconds)
+        """
+        t_update = time.perf_counter()
+        self._restore()
+        touched = self._apply_changes(changes)
+        targets = {key: set(names) for key, names in self._touched.items()}
+        for key, names in touched.items():
+            targets.setdefault(key, set()).update(names)
+        self._refresh(targets)
+        self._touched = touched
+        update_seconds = round(time.perf_counter() - t_update, 3)
+
+        t_solve = time.perf_counter()
+        status = self._solve()
+        timings = {'update_seconds': update_seconds, 'solve_seconds': round(time.perf_counter() - t_solve, 3)}
+        if not self._ok(status):
+            print(f"what-if 재풀이 실패: {status}")
+            return {'status': str(status), 'changes': list(changes), 'timings': timings}
+        diff = self._diff(status, timings, changes)
+        print(f"what-if 완료: 목적함수 {diff['objective']['base']} → {diff['objective']['new']} "
+              f"(모델 갱신 {update_seconds:.2f}s, 풀이 {timings['solve_seconds']:.2f}s)")
+        return diff
+
+    def check_against_rebuild(self, changes, rtol=1e-6):
+        """what-if 결과를 같은 데이터로 모델을 새로 만들어 푼 결과와 비교 (제자리 갱신 회귀 확인용)
+
+        Returns:
+            dict: whatif(what-if 목적함수), rebuilt(재생성 목적함수), delta, ok(상대 오차 rtol 이내)
+        """
+        diff = self.whatif(changes)
+        whatif_objective = diff.get('objective', {}).get('new')
+        # 풀이기 모델이 붙은 네트워크는 복사할 수 없으므로 해제 (다음 what-if는 모델 파일로 다시 풂)
+        if getattr(self.network.model, 'solver_model', None) is not None:
+            self.network.model.solver_model = None
+        rebuilt = self.network.copy()
+        variant = self._option_variants()[-1]
+        status = rebuilt.optimize(solver_name=self.solver_name, solver_options=variant['opts'])
+        if whatif_objective is None or not self._ok(status):
+            return {'whatif': whatif_objective, 'rebuilt': None, 'delta': None, 'ok': False}
+        rebuilt_objective = float(rebuilt.objective)
+        delta = float(whatif_objective) - rebuilt_objective
+        ok = abs(delta) <= rtol * max(1.0, abs(rebuilt_objective))
+        print(f"재생성 비교: what-if {whatif_objective} / 재생성 {rebuilt_objective} (차이 {delta:.6g}) → "
+              f"{'일치' if ok else '불일치'}")
+        return {'whatif': whatif_objective, 'rebuilt': rebuilt_objective, 'delta': delta, 'ok': ok}
@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+지연 로딩 결과 리더 모듈
+
+save_results가 저장한 optimization_result_*.nc 파일을 xarray로 열어
+요청한 변수/구성요소/기간만 읽어옵니다. 전체 네트워크를 pypsa.Network로
+복원하거나 CSV 전체를 파싱하지 않으므로 멀티년 결과도 일정한 메모리로 조회할 수 있습니다.
+
+사용 예:
+    with LazyResultReader(path) as reader:
+        p = reader.series('generators', 'p', names=['SEL_PV'], month=1)
+        flow = reader.series('lines', 'p0', start='2030-07-01', end='2030-07-31')
+        gens = reader.static('generators', ['bus', 'carrier', 'p_nom_opt'])
+"""
+
+import os
+import glob
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+# dask가 있으면 청크 단위로 읽어 메모리 사용을 일정하게 유지 (없으면 xarray 지연 인덱싱만 사용)
+try:
+    import dask  # noqa: F401
+    _HAS_DASK = True
+except Exception:
+    _HAS_DASK = False
+
+# 기본 시간 청크: 한 달(744시간)
+DEFAULT_TIME_CHUNK = 744
+
+
+class LazyResultReader:
+    """PyPSA netCDF 결과 파일 지연 리더"""
+
+    def __init__(self, path, time_chunk=DEFAULT_TIME_CHUNK):
+        """초기화 함수
+
+        Args:
+            path (str): optimization_result_*.nc 파일 경로
+            time_chunk (int, optional): dask 사용 시 snapshots 축 청크 크기
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"결과 파일을 찾을 수 없습니다: {path}")
+        self.path = path
+        chunks = {'snapshots': time_chunk} if _HAS_DASK else None
+        self.ds = xr.open_dataset(path, chunks=chunks)
+        self._snapshots = None
+
+    def close(self):
+        """파일 닫기"""
+        try:
+            self.ds.close()
+        except Exception:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def snapshots(self):
+        """스냅샷 시간 인덱스 (DatetimeIndex, 변환 불가 시 원래 인덱스)"""
+        if self._snapshots is None:
+            # PyPSA 버전에 따라 snapshots 좌표 자체가 시간이거나 snapshots_snapshot 변수에 시간이 저장됨
+            if 'snapshots_snapshot' in self.ds:
+                values = self.ds['snapshots_snapshot'].values
+            elif 'snapshots_timestep' in self.ds:
+                values = self.ds['snapshots_timestep'].values
+            else:
+                values = self.ds['snapshots'].values
+            try:
+                self._snapshots = pd.DatetimeIndex(values)
+            except Exception:
+                self._snapshots = pd.Index(values)
+        return self._snapshots
+
+    @property
+    def objective(self):
+        """목적함수 값 (없으면 None)"""
+        for key in ('network__objective', 'network_objective'):
+            if key in self.ds.attrs:
+                return float(self.ds.attrs[key])
+        return None
+
+    def components(self):
+        """파일에 저장된 구성요소 목록 (예: ['buses', 'generators', 'lines', ...])"""
+        return sorted(str(dim)[:-2] for dim in self.ds.dims
+                      if str(dim).endswith('_i') and '_t_' not in str(dim))
+
+    def series_attributes(self, component):
+        """구성요소의 시계열 변수 목록 (예: generators → ['p', 'p_max_pu'])"""
+        prefix = f"{component}_t_"
+        return sorted(str(var)[len(prefix):] for var in self.ds.data_vars if str(var).startswith(prefix))
+
+    def names(self, component, attr=None):
+        """구성요소 이름 목록 (attr 지정 시 해당 시계열이 저장된 이름만)"""
+        dim = f"{component}_t_{attr}_i" if attr else f"{component}_i"
+        if dim not in self.ds.coords:
+            return []
+        return [str(name) for name in self.ds[dim].values]
+
+    def static(self, component, attrs=None):
+        """정적 속성 테이블 조회
+
+        Args:
+            component (str): 'generators', 'lines' 등 (복수형 PyPSA 목록 이름)
+            attrs (list, optional): 읽을 속성 목록. 없으면 저장된 모든 정적 속성
+
+        Returns:
+            pd.DataFrame: 구성요소 이름을 인덱스로 하는 속성 테이블 (저장되지 않은 속성은 NaN)
+        """
+        dim = f"{component}_i"
+        if dim not in self.ds.coords:
+            return pd.DataFrame(columns=attrs or [])
+
+        prefix = f"{component}_"
+        if attrs is None:
+            attrs = [str(var)[len(prefix):] for var in self.ds.data_vars
+                     if str(var).startswith(prefix) and self.ds[var].dims == (dim,)]
+
+        index = pd.Index([str(name) for name in self.ds[dim].values], name=component)
+        data = {}
+        for attr in attrs:
+            var = prefix + attr
+            if var in self.ds.data_vars and self.ds[var].dims == (dim,):
+                data[attr] = self.ds[var].values
+            else:
+                data[attr] = np.nan
+        return pd.DataFrame(data, index=index)
+
+    def _time_positions(self, start=None, end=None, month=None):
+        """기간 조건 → snapshots 위치 인덱스 (조건 없으면 None)"""
+        if start is None and end is None and month is None:
+            return None
+        snapshots = self.snapshots
+        if not isinstance(snapshots, pd.DatetimeIndex):
+            raise ValueError("스냅샷이 시간 형식이 아니어서 기간 조건을 적용할 수 없습니다.")
+        mask = np.ones(len(snapshots), dtype=bool)
+        if start is not None:
+            mask &= snapshots >= pd.Timestamp(start)
+        if end is not None:
+            end_ts = pd.Timestamp(end)
+            # 날짜만 지정한 경우 그날 전체 포함
+            if end_ts == end_ts.normalize() and isinstance(end, str) and len(end) <= 10:
+                end_ts = end_ts + pd.Timedelta(days=1) - pd.Timedelta(1, 'ns')
+            mask &= snapshots <= end_ts
+        if month is not None:
+            months = [month] if np.isscalar(month) else list(month)
+            mask &= np.isin(snapshots.month, months)
+        return np.flatnonzero(mask)
+
+    def _select(self, component, attr, names=None, start=None, end=None, month=None):
+        """시계열 변수에서 요청 범위만 지연 선택 (계산 전 DataArray)"""
+        var = f"{component}_t_{attr}"
+        if var not in self.ds.data_vars:
+            return None, []
+        dim = f"{var}_i"
+        available = [str(name) for name in self.ds[dim].values]
+        da = self.ds[var]
+        if names is not None:
+            wanted = set(names)
+            positions = [i for i, name in enumerate(available) if name in wanted]
+            da = da.isel({dim: positions})
+            available = [available[i] for i in positions]
+        positions = self._time_positions(start, end, month)
+        if positions is not None:
+            da = da.isel(snapshots=positions)
+        return da, available
+
+    def series(self, component, attr, names=None, start=None, end=None, month=None):
+        """시계열 조회 (요청한 구성요소/기간만 메모리에 올림)
+
+        Args:
+            component (str): 'generators', 'lines', 'links', 'loads', 'stores' 등
+            attr (str): 'p', 'p0', 'e', 'marginal_price' 등
+            names (list, optional): 구성요소 이름 부분집합
+            start (str, optional): 시작 시각 (예: '2030-07-01')
+            end (str, optional): 종료 시각 (날짜만 주면 그날 끝까지)
+            month (int or list, optional): 월 필터 (예: 1 또는 [6, 7, 8])
+
+        Returns:
+            pd.DataFrame: 스냅샷 × 구성요소 (저장된 시계열이 없으면 빈 DataFrame)
+        """
+        da, columns = self._select(component, attr, names, start, end, month)
+        if da is None:
+            return pd.DataFrame()
+        positions = self._time_positions(start, end, month)
+        index = self.snapshots if positions is None else self.snapshots[positions]
+        return pd.DataFrame(np.asarray(da.values), index=index, columns=columns)
+
+    def aggregate(self, component, attr, how='sum', absolute=False, names=None,
+                  start=None, end=None, month=None):
+        """시계열을 시간 축으로 집계 (dask 사용 시 청크 단위 계산으로 전체를 올리지 않음)
+
+        Args:
+            component (str): 구성요소 목록 이름
+            attr (str): 시계열 속성
+            how (str): 'sum', 'mean', 'max', 'min' 중 하나
+            absolute (bool): 절대값 기준 집계 여부 (양방향 선로 흐름 등)
+            names, start, end, month: series()와 동일
+
+        Returns:
+            pd.Series: 구성요소별 집계값
+        """
+        da, columns = self._select(component, attr, names, start, end, month)
+        if da is None:
+            return pd.Series(dtype=float)
+        if absolute:
+            da = abs(da)
+        reducer = getattr(da, how)
+        return pd.Series(np.asarray(reducer('snapshots').values), index=columns, name=f"{attr}_{how}")
+
+
+def find_latest_result_nc(results_root='results', year=None):
+    """최신 optimization_result_*.nc 경로 조회 (실행 카탈로그 우선, 없으면 mtime 기준)"""
+    try:
+        from run_catalog import find_latest_artifact
+        path = find_latest_artifact('netcdf', year=year)
+        if path and os.path.exists(path):
+            return path
+    except Exception:
+        pass
+    files = glob.glob(os.path.join(results_root, '**', 'optimization_result_*.nc'), recursive=True)
+    if not files:
+        return None
+    return max(files, key=os.path.getmtime)
+
+
+def open_latest_result(results_root='results', year=None, time_chunk=DEFAULT_TIME_CHUNK):
+    """최신 결과 파일을 LazyResultReader로 열기 (없으면 None)"""
+    path = find_latest_result_nc(results_root, year)
+    if path is None:
+        print("netCDF 결과 파일을 찾을 수 없습니다.")
+        return None
+    return LazyResultReader(path, time_chunk=time_chunk)
@@ -0,0 +1,378 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+연도/실행 통합 결과 큐브 모듈
+
+연도별로 흩어진 결과 폴더 대신 (실행, 연도, 스냅샷, 구성요소) 차원의 결과를
+파티션된 Parquet 데이터셋(run_group=<그룹>/year=<연도>/<run_id>-*.parquet)에 누적합니다.
+각 연도 최적화가 끝날 때마다 save_results에서 추가되며, 집계 함수는 배치 단위로
+스캔하므로 전체 데이터를 메모리에 올리지 않습니다.
+
+데이터셋:
+    dispatch   - 발전기/저장장치 출력 (generators.p, storage_units.p, stores.p)
+    flows      - 선로/링크 흐름 (lines.p0, links.p0)
+    prices     - 버스 한계가격 (buses.marginal_price)
+    capacities - 설비 용량 (입력 용량 nom, 최적 용량 nom_opt)
+
+사용 예:
+    cube = ResultsCube()
+    cube.capacity_trajectory(name_like='PV')             # 시나리오별 PV 용량 궤적
+    cube.annual_totals('dispatch', by=('year', 'carrier'))
+    cube.peak_hours('dispatch', n=10)
+"""
+
+import os
+import argparse
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+# 기본 큐브 경로 (RESULTS_CUBE_PATH 환경변수로 변경 가능)
+DEFAULT_CUBE_ROOT = os.path.join('results', 'results_cube')
+
+DATASETS = ('dispatch', 'flows', 'prices', 'capacities')
+
+# 시계열 데이터셋 원천: 데이터셋 → [(구성요소, 시계열 속성)]
+SERIES_SOURCES = {
+    'dispatch': [('generators', 'p'), ('storage_units', 'p'), ('stores', 'p')],
+    'flows': [('lines', 'p0'), ('links', 'p0')],
+    'prices': [('buses', 'marginal_price')],
+}
+
+# 용량 속성: 구성요소 → (입력 용량, 최적 용량)
+CAPACITY_ATTRS = {
+    'generators': ('p_nom', 'p_nom_opt'),
+    'storage_units': ('p_nom', 'p_nom_opt'),
+    'stores': ('e_nom', 'e_nom_opt'),
+    'links': ('p_nom', 'p_nom_opt'),
+    'lines': ('s_nom', 's_nom_opt'),
+}
+
+# 파티션 스키마 (run_group이 숫자처럼 보여도 문자열로 고정)
+_PARTITIONING = ds.partitioning(pa.schema([('run_group', pa.string()), ('year', pa.int32())]), flavor='hive')
+
+# 단일 실행(멀티년 그룹이 없는 경우) 파티션 이름
+SINGLE_RUN_GROUP = 'single'
+
+# 최신 실행 판단 단위 (같은 run_group/year의 이전 run_id는 재실행으로 보고 제외)
+_LATEST_KEYS = ['run_group', 'year']
+
+
+def get_cube_root():
+    """큐브 루트 경로 반환"""
+    return os.environ.get('RESULTS_CUBE_PATH') or DEFAULT_CUBE_ROOT
+
+
+def _snapshot_index(network):
+    """스냅샷을 DatetimeIndex로 변환 (멀티 투자기간이면 timestep 레벨 사용)"""
+    snapshots = network.snapshots
+    if isinstance(snapshots, pd.MultiIndex):
+        snapshots = snapshots.get_level_values(-1)
+    try:
+        return pd.DatetimeIndex(snapshots)
+    except Exception:
+        return pd.DatetimeIndex(pd.to_datetime(np.asarray(snapshots), errors='coerce'))
+
+
+def _bus_and_carrier(network, component, names):
+    """구성요소 이름 → (bus, carrier) 배열"""
+    static = getattr(network, component)
+    static = static.reindex(names)
+    if component == 'buses':
+        bus = np.asarray(names, dtype=object)
+    elif 'bus' in static.columns:
+        bus = static['bus'].astype(str).to_numpy()
+    elif 'bus0' in static.columns:
+        bus = static['bus0'].astype(str).to_numpy()
+    else:
+        bus = np.full(len(names), '', dtype=object)
+    carrier = static['carrier'].fillna('').astype(str).to_numpy() if 'carrier' in static.columns \
+        else np.full(len(names), '', dtype=object)
+    return bus, carrier
+
+
+def _dictionary(indices, values):
+    """반복되는 문자열을 사전 인코딩 배열로 구성 (행 수만큼 문자열을 복제하지 않음)"""
+    return pa.DictionaryArray.from_arrays(pa.array(indices, type=pa.int32()),
+                                          pa.array([str(v) for v in values], type=pa.string()))
+
+
+def _series_table(network, component, attr, run_id, run_group, year):
+    """시계열 1종 → 긴 형식(long) Arrow 테이블 (없으면 None)"""
+    frame = getattr(getattr(network, f"{component}_t", None), attr, None)
+    if frame is None or frame.empty:
+        return None
+    names = [str(c) for c in frame.columns]
+    n_rows, n_cols = frame.shape
+    values = frame.to_numpy(dtype=np.float64, na_value=np.nan).ravel()
+    snapshots = _snapshot_index(network)
+    weights = network.snapshot_weightings['generators'].to_numpy(dtype=np.float64) \
+        if 'generators' in network.snapshot_weightings else np.ones(n_rows)
+    bus, carrier = _bus_and_carrier(network, component, list(frame.columns))
+    col_idx = np.tile(np.arange(n_cols, dtype=np.int32), n_rows)
+    n_total = n_rows * n_cols
+    return pa.table({
+        'run_id': _dictionary(np.zeros(n_total, dtype=np.int32), [run_id]),
+        'run_group': pa.array(np.full(n_total, run_group, dtype=object), type=pa.string()),
+        'year': pa.array(np.full(n_total, year, dtype=np.int32)),
+        'snapshot': pa.array(np.repeat(snapshots.to_numpy(), n_cols)),
+        'weight': pa.array(np.repeat(weights, n_cols)),
+        'component': _dictionary(np.zeros(n_total, dtype=np.int32), [component]),
+        'name': _dictionary(col_idx, names),
+        'bus': _dictionary(col_idx, bus),
+        'carrier': _dictionary(col_idx, carrier),
+        'value': pa.array(values),
+    })
+
+
+def _capacity_table(network, run_id, run_group, year):
+    """설비 용량 → Arrow 테이블 (없으면 None)"""
+    frames = []
+    for component, (nom_attr, opt_attr) in CAPACITY_ATTRS.items():
+        static = getattr(network, component, None)
+        if static is None or static.empty:
+            continue
+        names = list(static.index)
+        bus, carrier = _bus_and_carrier(network, component, names)
+        nom = static[nom_attr] if nom_attr in static.columns else pd.Series(np.nan, index=static.index)
+        opt = static[opt_attr] if opt_attr in static.columns else nom
+        frames.append(pd.DataFrame({
+            'run_id': run_id,
+            'run_group': run_group,
+            'year': np.int32(year),
+            'component': component,
+            'name': [str(n) for n in names],
+            'bus': bus,
+            'carrier': carrier,
+            'nom': pd.to_numeric(nom, errors='coerce').to_numpy(dtype=np.float64),
+            'nom_opt': pd.to_numeric(opt, errors='coerce').to_numpy(dtype=np.float64),
+        }))
+    if not frames:
+        return None
+    return pa.Table.from_pandas(pd.concat(frames, ignore_index=True), preserve_index=False)
+
+
+def _filter_expression(filters):
+    """키워드 필터 → pyarrow 데이터셋 필터식 (값이 리스트면 isin)"""
+    expr = None
+    for column, value in filters.items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple, set)):
+            cond = ds.field(column).isin(list(value))
+        else:
+            cond = ds.field(column) == value
+        expr = cond if expr is None else (expr & cond)
+    return expr
+
+
+class ResultsCube:
+    """연도/실행 통합 결과 큐브 (파티션된 Parquet)"""
+
+    def __init__(self, root=None):
+        """초기화 함수
+
+        Args:
+            root (str, optional): 큐브 루트 폴더. 없으면 get_cube_root() 사용
+        """
+        self.root = root or get_cube_root()
+
+    def _write(self, table, dataset, run_id):
+        """테이블을 run_group/year 파티션에 기록 (같은 run_id 파일은 덮어씀)"""
+        ds.write_dataset(
+            table,
+            base_dir=os.path.join(self.root, dataset),
+            format='parquet',
+            partitioning=_PARTITIONING,
+            basename_template=f"{run_id}-{{i}}.parquet",
+            existing_data_behavior='overwrite_or_ignore',
+        )
+
+    def append_network(self, network, run_id, year, run_group=None, datasets=DATASETS):
+        """최적화된 네트워크 1개(1개 연도)를 큐브에 추가
+
+        Args:
+            network (pypsa.Network): 최적화된 네트워크
+            run_id (str): 실행 ID (실행 카탈로그와 동일 ID 사용 권장)
+            year (int): 분석 연도
+            run_group (str, optional): 멀티년/스윕 묶음 ID
+            datasets (tuple, optional): 기록할 데이터셋
+
+        Returns:
+            dict: 데이터셋별 기록 행 수
+        """
+        run_group = str(run_group) if run_group else SINGLE_RUN_GROUP
+        year = int(year)
+        written = {}
+        for dataset in datasets:
+            if dataset == 'capacities':
+                tables = [_capacity_table(network, run_id, run_group, year)]
+            else:
+                tables = [_series_table(network, component, attr, run_id, run_group, year)
+                          for component, attr in SERIES_SOURCES.get(dataset, [])]
+            tables = [t for t in tables if t is not None]
+            if not tables:
+                continue
+            # 구성요소별 사전(dictionary)이 달라도 하나의 파일로 합치기 위해 사전 통합
+            table = pa.concat_tables(tables).unify_dictionaries() if len(tables) > 1 else tables[0]
+            self._write(table.combine_chunks(), dataset, run_id)
+            written[dataset] = table.num_rows
+        return written
+
+    def append_netcdf(self, path, run_id, year, run_group=None, datasets=DATASETS):
+        """저장된 .nc 결과를 큐브에 추가 (기존 결과 백필용)"""
+        import pypsa
+        return self.append_network(pypsa.Network(path), run_id, year, run_group, datasets)
+
+    def dataset(self, name):
+        """데이터셋 핸들 (없으면 None)"""
+        path = os.path.join(self.root, name)
+        if not os.path.isdir(path):
+            return None
+        return ds.dataset(path, format='parquet', partitioning=_PARTITIONING)
+
+    def scan(self, name, columns=None, name_like=None, batch_size=1_000_000, **filters):
+        """필터를 적용해 배치 단위 DataFrame을 순차 반환 (파티션/통계 기반 건너뛰기)
+
+        Args:
+            name (str): 데이터셋 이름
+            columns (list, optional): 읽을 컬럼
+            name_like (str, optional): 구성요소 이름 부분 문자열 (대소문자 무시)
+            batch_size (int, optional): 배치 행 수
+            **filters: 컬럼=값 또는 컬럼=[값, ...] (예: year=[2030, 2040], carrier='solar')
+        """
+        dataset = self.dataset(name)
+        if dataset is None:
+            return
+        if columns is not None and name_like is not None and 'name' not in columns:
+            columns = list(columns) + ['name']
+        scanner = dataset.scanner(columns=columns, filter=_filter_expression(filters), batch_size=batch_size)
+        for batch in scanner.to_batches():
+            if batch.num_rows == 0:
+                continue
+            df = batch.to_pandas()
+            if name_like is not None:
+                df = df[df['name'].astype(str).str.contains(name_like, case=False, regex=False)]
+                if df.empty:
+                    continue
+            yield df
+
+    def query(self, name, columns=None, name_like=None, **filters):
+        """필터 결과를 하나의 DataFrame으로 반환 (작은 부분집합 조회용)"""
+        frames = list(self.scan(name, columns=columns, name_like=name_like, **filters))
+        if not frames:
+            return pd.DataFrame(columns=columns or [])
+        return pd.concat(frames, ignore_index=True)
+
+    def latest_runs(self, name, **filters):
+        """run_group/year별 최신 run_id (같은 그룹·연도를 다시 실행한 경우 마지막 실행)
+
+        Returns:
+            pd.Series: index=(run_group, year), 값=run_id
+        """
+        partials = []
+        for df in self.scan(name, columns=_LATEST_KEYS + ['run_id'], **filters):
+            partials.append(df.astype({'run_id': str}).groupby(_LATEST_KEYS, observed=True)['run_id'].max())
+        if not partials:
+            return pd.Series(dtype=object)
+        return pd.concat(partials).groupby(level=[0, 1]).max()
+
+    def _scan_latest(self, name, columns, name_like, latest_only, filters):
+        """scan과 같되 latest_only면 run_group/year별 최신 run_id 행만 반환"""
+        if not latest_only:
+            yield from self.scan(name, columns=columns, name_like=name_like, **filters)
+            return
+        latest = self.latest_runs(name, **filters)
+        extra = [col for col in _LATEST_KEYS + ['run_id'] if col not in columns]
+        for df in self.scan(name, columns=columns + extra, name_like=name_like, **filters):
+            keys = pd.MultiIndex.from_arrays([df['run_group'].astype(str), df['year'].astype(int)])
+            df = df[df['run_id'].astype(str).to_numpy() == latest.reindex(keys).to_numpy()]
+            if not df.empty:
+                yield df.drop(columns=extra)
+
+    def annual_totals(self, name='dispatch', by=('run_group', 'year', 'carrier'), name_like=None, latest_only=True,
+                      **filters):
+        """연간 합계 (value × 스냅샷 가중치, 배치별 부분합 누적)
+
+        Args:
+            latest_only (bool): 같은 run_group/year에 실행이 여러 개면 최신 run_id만 사용 (재실행 중복 합산 방지)
+
+        Returns:
+            pd.DataFrame: by 컬럼 + total
+        """
+        by = list(by)
+        partials = []
+        for df in self._scan_latest(name, by + ['value', 'weight'], name_like, latest_only, filters):
+            df = df.assign(total=df['value'].fillna(0.0) * df['weight'])
+            partials.append(df.groupby(by, observed=True)['total'].sum())
+        if not partials:
+            return pd.DataFrame(columns=by + ['total'])
+        return pd.concat(partials).groupby(level=list(range(len(by)))).sum().reset_index()
+
+    def peak_hours(self, name='dispatch', n=10, by=('run_group', 'year'), name_like=None, latest_only=True,
+                   **filters):
+        """그룹별 합계가 가장 큰 n개 스냅샷 (예: 연도별 최대 발전 시간대)
+
+        Args:
+            latest_only (bool): 같은 run_group/year에 실행이 여러 개면 최신 run_id만 사용
+
+        Returns:
+            pd.DataFrame: by 컬럼 + snapshot + value (그룹별 상위 n개)
+        """
+        by = list(by)
+        keys = by + ['snapshot']
+        partials = []
+        for df in self._scan_latest(name, keys + ['value'], name_like, latest_only, filters):
+            partials.append(df.groupby(keys, observed=True)['value'].sum())
+        if not partials:
+            return pd.DataFrame(columns=keys + ['value'])
+        hourly = pd.concat(partials).groupby(level=list(range(len(keys)))).sum().reset_index()
+        hourly = hourly.sort_values('value', ascending=False)
+        return hourly.groupby(by, observed=True).head(n).sort_values(by + ['value'], ascending=[True] * len(by) + [False])
+
+    def capacity_trajectory(self, name_like=None, carrier=None, component=None, attr='nom_opt',
+                            latest_only=True, **filters):
+        """연도별 용량 궤적 (행: 연도, 열: run_group)
+
+        Args:
+            name_like (str, optional): 이름 부분 문자열 (예: 'PV')
+            carrier (str or list, optional): 캐리어 필터
+            component (str or list, optional): 구성요소 필터 (예: 'generators')
+            attr (str): 'nom_opt'(최적 용량) 또는 'nom'(입력 용량)
+            latest_only (bool): 같은 run_group/year에 실행이 여러 개면 최신 run_id만 사용
+        """
+        df = self.query('capacities', name_like=name_like, carrier=carrier, component=component, **filters)
+        if df.empty:
+            return pd.DataFrame()
+        if latest_only:
+            latest = df.groupby(_LATEST_KEYS, observed=True)['run_id'].transform('max')
+            df = df[df['run_id'] == latest]
+        summary = df.groupby(['year', 'run_group'], observed=True)[attr].sum()
+        return summary.unstack('run_group').sort_index()
+
+
+def main():
+    """명령줄 진입점: 큐브 조회"""
+    parser = argparse.ArgumentParser(description='연도/실행 통합 결과 큐브 조회')
+    parser.add_argument('--root', default=None, help='큐브 루트 경로')
+    parser.add_argument('--trajectory', metavar='NAME', help='이름에 NAME이 포함된 설비의 연도별 용량 궤적')
+    parser.add_argument('--carrier', default=None, help='캐리어 필터')
+    parser.add_argument('--totals', metavar='DATASET', help='데이터셋 연간 합계 (run_group, year, carrier)')
+    parser.add_argument('--peaks', metavar='DATASET', help='데이터셋 연도별 상위 10개 시간대')
+    args = parser.parse_args()
+
+    cube = ResultsCube(args.root)
+    pd.set_option('display.width', 200)
+    if args.trajectory is not None or (args.carrier and not args.totals and not args.peaks):
+        print(cube.capacity_trajectory(name_like=args.trajectory, carrier=args.carrier))
+    if args.totals:
+        print(cube.annual_totals(args.totals, carrier=args.carrier))
+    if args.peaks:
+        print(cube.peak_hours(args.peaks, carrier=args.carrier))
+
+
+if __name__ == '__main__':
+    main()
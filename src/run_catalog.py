@@ -0,0 +1,428 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+실행 카탈로그 모듈
+
+모든 결과 디렉터리(results/<timestamp>, results_multi/<timestamp>/<year> 등)의
+실행 정보를 로컬 SQLite 파일 하나에 기록하고 색인 조회를 제공합니다.
+분석 스크립트는 파일시스템을 glob/mtime으로 훑는 대신 이 카탈로그를 조회합니다.
+"""
+
+import os
+import re
+import json
+import glob
+import uuid
+import sqlite3
+import hashlib
+from datetime import datetime
+
+import pandas as pd
+
+# 기본 카탈로그 경로 (RUN_CATALOG_PATH 환경변수로 변경 가능)
+DEFAULT_CATALOG_PATH = os.path.join('results', 'run_catalog.sqlite')
+
+# save_results 산출물 파일명 접미사 → 아티팩트 종류
+ARTIFACT_SUFFIXES = {
+    '.xlsx': 'excel',
+    '.nc': 'netcdf',
+    '_stats.json': 'stats',
+    '_generator_info.csv': 'generator_info',
+    '_generator_output.csv': 'generator_output',
+    '_load.csv': 'load',
+    '_storage.csv': 'storage',
+    '_line_usage.csv': 'line_usage',
+    '_final_energy_supply.csv': 'final_energy_supply',
+    '_final_energy_supply_by_region.csv': 'final_energy_supply_by_region',
+    '_congestion.parquet': 'congestion',
+    '_loading_duration.parquet': 'loading_duration',
+    '_gen_generators.parquet': 'gen_metrics',
+    '_gen_generators_monthly.parquet': 'gen_metrics_monthly',
+    '_gen_groups_annual.parquet': 'gen_groups_annual',
+    '_gen_groups_monthly.parquet': 'gen_groups_monthly',
+    '_dashboard.html': 'dashboard',
+    '_presolve_screen.csv': 'presolve_screen',
+    '_지역별_발전량.csv': 'regional_generation',
+    '_발전원별_발전량.csv': 'generation_by_type',
+    '_지역별_발전원별_발전량.csv': 'regional_generation_by_type',
+    '_상위발전기_발전량.csv': 'top_generators',
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    run_group TEXT,
+    year INTEGER,
+    created_at TEXT NOT NULL,
+    results_dir TEXT,
+    input_hash TEXT,
+    solver TEXT,
+    solver_method TEXT,
+    status TEXT,
+    objective REAL,
+    slack_mwh REAL,
+    fallback_mwh REAL,
+    timings TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_year_created ON runs (year, created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_status_created ON runs (status, created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_input_hash ON runs (input_hash);
+CREATE INDEX IF NOT EXISTS idx_runs_group ON runs (run_group);
+CREATE TABLE IF NOT EXISTS artifacts (
+    run_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    path TEXT NOT NULL,
+    PRIMARY KEY (run_id, kind)
+);
+CREATE INDEX IF NOT EXISTS idx_artifacts_kind ON artifacts (kind, run_id);
+"""
+
+
+def get_catalog_path():
+    """카탈로그 파일 경로 반환 (환경변수 우선)"""
+    return os.environ.get('RUN_CATALOG_PATH') or DEFAULT_CATALOG_PATH
+
+
+def new_run_id(current_time=None):
+    """고유 실행 ID 생성 (타임스탬프 + 임의 접미사)
+
+    같은 초에 여러 실행(스윕/병렬 연도)이 저장되어도 충돌하지 않도록 접미사를 붙입니다.
+    """
+    stamp = current_time or datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"{stamp}_{uuid.uuid4().hex[:6]}"
+
+
+def compute_input_hash(input_data):
+    """입력 데이터(dict of DataFrame)의 정규화된 해시 계산
+
+    Args:
+        input_data (dict): read_input_data 결과
+
+    Returns:
+        str: sha256 16진 문자열 (입력이 없으면 None)
+    """
+    if not input_data or not isinstance(input_data, dict):
+        return None
+    h = hashlib.sha256()
+    for sheet in sorted(str(k) for k in input_data.keys()):
+        df = input_data.get(sheet)
+        if not isinstance(df, pd.DataFrame):
+            continue
+        h.update(sheet.encode('utf-8'))
+        h.update('|'.join(str(c) for c in df.columns).encode('utf-8'))
+        try:
+            h.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+        except Exception:
+            # 혼합 타입 등 해시 불가 컬럼은 CSV 직렬화로 대체
+            h.update(df.to_csv(index=False).encode('utf-8'))
+    return h.hexdigest()
+
+
+def summarize_slack(network):
+    """슬랙/보강 발전기 사용량 합계(MWh) 계산
+
+    Returns:
+        tuple: (slack_mwh, fallback_mwh)
+    """
+    try:
+        gen_p = network.generators_t.p
+        if gen_p is None or gen_p.empty:
+            return None, None
+        totals = gen_p.sum()
+        names = totals.index.astype(str)
+        slack = float(totals[names.str.contains('_Slack_')].sum())
+        fallback = float(totals[names.str.contains('_Fallback_Gen')].sum())
+        return slack, fallback
+    except Exception:
+        return None, None
+
+
+def collect_artifacts(results_dir, current_time):
+    """결과 폴더에서 save_results 산출물 경로 수집
+
+    Args:
+        results_dir (str): 결과 폴더
+        current_time (str): save_results 타임스탬프
+
+    Returns:
+        dict: {kind: path}
+    """
+    artifacts = {}
+    prefix = os.path.join(results_dir, f'optimization_result_{current_time}')
+    for suffix, kind in ARTIFACT_SUFFIXES.items():
+        path = prefix + suffix
+        if os.path.exists(path):
+            artifacts[kind] = os.path.abspath(path)
+    return artifacts
+
+
+class RunCatalog:
+    """실행 결과 카탈로그 (SQLite)"""
+
+    def __init__(self, path=None):
+        """초기화 함수
+
+        Args:
+            path (str, optional): 카탈로그 파일 경로. 없으면 get_catalog_path() 사용
+        """
+        self.path = path or get_catalog_path()
+        parent = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(parent, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def close(self):
+        """연결 종료"""
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def record_run(self, run_id, results_dir=None, year=None, run_group=None, input_hash=None,
+                   solver=None, solver_method=None, status=None, objective=None,
+                   slack_mwh=None, fallback_mwh=None, timings=None, artifacts=None,
+                   extra=None, created_at=None):
+        """실행 1건 기록 (같은 run_id는 갱신)
+
+        Args:
+            run_id (str): 실행 ID
+            results_dir (str, optional): 결과 폴더
+            year (int, optional): 분석 연도
+            run_group (str, optional): 멀티년/스윕 묶음 ID
+            input_hash (str, optional): 입력 해시
+            solver (str, optional): 솔버 이름
+            solver_method (str, optional): 솔버 방법(barrier 등)
+            status (str, optional): 'ok', 'failed' 등
+            objective (float, optional): 목적함수 값
+            slack_mwh (float, optional): 슬랙 발전기 사용량
+            fallback_mwh (float, optional): 보강 발전기 사용량
+            timings (dict, optional): 단계별 소요 시간(초)
+            artifacts (dict, optional): {kind: path}
+            extra (dict, optional): 기타 메타데이터
+            created_at (str, optional): ISO 시각 (기본 현재)
+
+        Returns:
+            str: run_id
+        """
+        try:
+            objective = float(objective) if objective is not None else None
+            if objective is not None and objective != objective:
+                objective = None
+        except Exception:
+            objective = None
+        row = (
+            run_id, run_group, int(year) if year is not None else None,
+            created_at or datetime.now().isoformat(timespec='seconds'),
+            os.path.abspath(results_dir) if results_dir else None,
+            input_hash, solver, solver_method, status, objective,
+            slack_mwh, fallback_mwh,
+            json.dumps(timings, ensure_ascii=False) if timings else None,
+            json.dumps(extra, ensure_ascii=False, default=str) if extra else None,
+        )
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO runs (run_id, run_group, year, created_at, results_dir, input_hash, "
+                "solver, solver_method, status, objective, slack_mwh, fallback_mwh, timings, extra) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+            if artifacts:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO artifacts (run_id, kind, path) VALUES (?, ?, ?)",
+                    [(run_id, k, os.path.abspath(p)) for k, p in artifacts.items() if p])
+        return run_id
+
+    def update_run(self, run_id, **fields):
+        """기존 실행의 일부 필드 갱신 (status, timings 등)"""
+        allowed = {'run_group', 'year', 'results_dir', 'input_hash', 'solver', 'solver_method',
+                   'status', 'objective', 'slack_mwh', 'fallback_mwh', 'timings', 'extra'}
+        sets, values = [], []
+        for key, val in fields.items():
+            if key not in allowed:
+                continue
+            if key in ('timings', 'extra') and val is not None and not isinstance(val, str):
+                val = json.dumps(val, ensure_ascii=False, default=str)
+            sets.append(f"{key} = ?")
+            values.append(val)
+        if not sets:
+            return False
+        with self._conn:
+            cur = self._conn.execute(f"UPDATE runs SET {', '.join(sets)} WHERE run_id = ?", values + [run_id])
+        return cur.rowcount > 0
+
+    def _where(self, year=None, status=None, run_group=None, input_hash=None, alias=''):
+        clauses, params = [], []
+        filters = [('year', int(year) if year is not None else None), ('status', status),
+                   ('run_group', run_group), ('input_hash', input_hash)]
+        for col, val in filters:
+            if val is not None:
+                clauses.append(f"{alias}{col} = ?")
+                params.append(val)
+        return clauses, params
+
+    def latest_run(self, year=None, status='ok', run_group=None):
+        """조건에 맞는 최신 실행 1건
+
+        Args:
+            year (int, optional): 연도 필터
+            status (str, optional): 상태 필터 (None이면 전체)
+            run_group (str, optional): 묶음 필터
+
+        Returns:
+            dict: 실행 정보 (artifacts 포함) 또는 None
+        """
+        clauses, params = self._where(year=year, status=status, run_group=run_group)
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        cur = self._conn.execute(f"SELECT * FROM runs{where} ORDER BY created_at DESC, rowid DESC LIMIT 1", params)
+        row = cur.fetchone()
+        if row is None:
+            return None
+        run = self._row_to_dict(row)
+        run['artifacts'] = self.artifacts(run['run_id'])
+        return run
+
+    def latest_artifact(self, kind, year=None, status='ok'):
+        """해당 종류 아티팩트를 가진 최신 실행의 파일 경로
+
+        Args:
+            kind (str): 아티팩트 종류 (예: 'netcdf', 'generator_output')
+            year (int, optional): 연도 필터
+            status (str, optional): 상태 필터
+
+        Returns:
+            str: 파일 경로 또는 None
+        """
+        clauses, params = self._where(year=year, status=status, alias='r.')
+        clauses.append("a.kind = ?")
+        params.append(kind)
+        sql = ("SELECT a.path FROM artifacts a JOIN runs r ON r.run_id = a.run_id WHERE "
+               + " AND ".join(clauses) + " ORDER BY r.created_at DESC, r.rowid DESC LIMIT 1")
+        row = self._conn.execute(sql, params).fetchone()
+        return row['path'] if row else None
+
+    def artifacts(self, run_id):
+        """실행의 아티팩트 목록 {kind: path}"""
+        cur = self._conn.execute("SELECT kind, path FROM artifacts WHERE run_id = ?", (run_id,))
+        return {r['kind']: r['path'] for r in cur.fetchall()}
+
+    def find_runs(self, year=None, status=None, run_group=None, input_hash=None, limit=None):
+        """조건 조회 결과를 DataFrame으로 반환 (다수 실행 비교용)"""
+        clauses, params = self._where(year=year, status=status, run_group=run_group, input_hash=input_hash)
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        sql = f"SELECT * FROM runs{where} ORDER BY created_at DESC, rowid DESC"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        df = pd.read_sql_query(sql, self._conn, params=params)
+        for col in ('timings', 'extra'):
+            if col in df.columns:
+                df[col] = df[col].map(lambda s: json.loads(s) if isinstance(s, str) and s else None)
+        return df
+
+    def _row_to_dict(self, row):
+        run = dict(row)
+        for col in ('timings', 'extra'):
+            if run.get(col):
+                try:
+                    run[col] = json.loads(run[col])
+                except Exception:
+                    pass
+        return run
+
+    def index_results_tree(self, root):
+        """기존 결과 폴더를 한 번 스캔해 카탈로그에 등록 (이미 등록된 폴더는 건너뜀)
+
+        Args:
+            root (str): 'results' 또는 'results_multi' 등 루트 폴더
+
+        Returns:
+            int: 새로 등록된 실행 수
+        """
+        known = {r[0] for r in self._conn.execute("SELECT results_dir FROM runs WHERE results_dir IS NOT NULL")}
+        added = 0
+        pattern = os.path.join(root, '**', 'optimization_result_*_stats.json')
+        for stats_path in glob.glob(pattern, recursive=True):
+            results_dir = os.path.abspath(os.path.dirname(stats_path))
+            m = re.search(r'optimization_result_(\d{8}_\d{6})_stats\.json$', stats_path)
+            if not m:
+                continue
+            current_time = m.group(1)
+            artifacts = collect_artifacts(results_dir, current_time)
+            if results_dir in known and artifacts.get('stats') and self._has_artifact(artifacts['stats']):
+                continue
+            try:
+                with open(stats_path, 'r', encoding='utf-8') as f:
+                    stats = json.load(f)
+            except Exception:
+                stats = {}
+            objective = stats.get('total_cost')
+            has_objective = isinstance(objective, (int, float)) and objective == objective
+            year = None
+            base = os.path.basename(results_dir)
+            if re.fullmatch(r'\d{4}', base):
+                year = int(base)
+            parent = os.path.basename(os.path.dirname(results_dir))
+            run_group = parent if year is not None and re.fullmatch(r'\d{8}_\d{6}', parent) else None
+            created = datetime.strptime(current_time, "%Y%m%d_%H%M%S").isoformat(timespec='seconds')
+            self.record_run(new_run_id(current_time), results_dir=results_dir, year=year, run_group=run_group,
+                            status='ok' if has_objective else 'failed', objective=objective,
+                            artifacts=artifacts, created_at=created, extra={'indexed_from': root})
+            added += 1
+        return added
+
+    def _has_artifact(self, path):
+        row = self._conn.execute("SELECT 1 FROM artifacts WHERE path = ? LIMIT 1", (os.path.abspath(path),)).fetchone()
+        return row is not None
+
+
+def find_latest_artifact(kind, year=None, catalog_path=None):
+    """카탈로그에서 최신 아티팩트 경로 조회 (카탈로그가 없거나 실패하면 None)
+
+    분석 스크립트의 glob 폴백 앞단에서 사용합니다.
+    """
+    path = catalog_path or get_catalog_path()
+    if not os.path.exists(path):
+        return None
+    try:
+        with RunCatalog(path) as catalog:
+            found = catalog.latest_artifact(kind, year=year)
+        if found and os.path.exists(found):
+            return found
+    except Exception as e:
+        print(f"실행 카탈로그 조회 경고: {str(e)}")
+    return None
+
+
+def main():
+    """카탈로그 색인/조회용 간단한 CLI"""
+    import argparse
+    parser = argparse.ArgumentParser(description='실행 카탈로그 색인/조회')
+    parser.add_argument('--catalog', default=None, help='카탈로그 파일 경로')
+    parser.add_argument('--index', nargs='*', default=None, help='등록할 결과 루트 폴더들')
+    parser.add_argument('--latest', type=int, default=None, help='해당 연도의 최신 실행 출력')
+    parser.add_argument('--list', action='store_true', help='전체 실행 목록 출력')
+    args = parser.parse_args()
+
+    with RunCatalog(args.catalog) as catalog:
+        if args.index is not None:
+            roots = args.index or ['results', 'results_multi']
+            for root in roots:
+                if os.path.isdir(root):
+                    n = catalog.index_results_tree(root)
+                    print(f"{root}: {n}개 실행 등록")
+        if args.latest is not None:
+            run = catalog.latest_run(year=args.latest)
+            print(json.dumps(run, ensure_ascii=False, indent=2) if run else f"{args.latest}년 실행이 없습니다.")
+        if args.list:
+            print(catalog.find_runs()[['run_id', 'year', 'status', 'objective', 'results_dir']].to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+실행 단계별 시간/메모리 프로파일 모듈
+
+파이프라인 단계(통합 입력 준비, 입력 읽기, 버스명 표준화, create_network 구성 요소 블록, optimize_network의
+linopy 모델 생성 vs 솔버 풀이, save_results의 각 저장 단계)의 경과 시간과 프로세스 메모리(RSS)를 기록하고,
+결과 폴더에 실행별 파일로 남깁니다.
+
+    optimization_result_<시각>_profile_trace.json   Chrome 트레이스 (chrome://tracing 또는 https://ui.perfetto.dev)
+                                                    단계 구간 + RSS 카운터 트랙
+    optimization_result_<시각>_profile.json         단계별 초/RSS 시작·끝·최대, 총 시간, 최대 RSS, 패키지 버전, 코드 버전
+
+단계 기록은 write_run에서 결과 폴더에 쓰고 비우므로, 멀티년 실행에서는 연도마다 그 연도 분량만 기록됩니다.
+(pipelined 모드처럼 연도 단계가 스레드로 겹치면, 저장 시점까지 끝난 다음 연도 구간도 함께 기록됩니다.)
+RSS는 psutil(없으면 /proc/self/statm)로 읽고, 백그라운드 스레드가 PROFILE_SAMPLE_INTERVAL(초, 기본 0.5, 0이면 끔)
+간격으로 샘플링해 단계별 최대 RSS를 계산합니다. DISABLE_PROFILING=1로 끕니다.
+
+사용 예:
+    with stage('read_input_data'):
+        input_data = read_input_data(path)
+
+    steps = Steps('create_network')
+    steps.next('buses')
+    ...
+    steps.done()
+
+    write_run(results_dir, current_time)
+    python src/run_profiler.py compare results/A/..._profile.json results/B/..._profile.json
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+import functools
+import contextlib
+from collections import deque
+from datetime import datetime
+
+TRACE_SUFFIX = 'profile_trace.json'
+SUMMARY_SUFFIX = 'profile.json'
+DEFAULT_SAMPLE_INTERVAL = 0.5
+# 결과를 쓰지 않는 상주 프로세스(작업 서비스)에서도 샘플이 무한히 쌓이지 않도록 상한
+MAX_SAMPLES = 100000
+# 한 줄 요약에 표시할 단계 수
+SUMMARY_TOP = 4
+# 비교 시 변화로 보고할 최소 차이 (초, 비율)
+COMPARE_MIN_SECONDS = 0.5
+COMPARE_MIN_RATIO = 0.1
+
+_lock = threading.Lock()
+_events = []
+_samples = deque(maxlen=MAX_SAMPLES)
+_origin = time.perf_counter()
+_sampler = None
+
+
+def enabled():
+    """DISABLE_PROFILING=1이면 기록하지 않음"""
+    return os.environ.get('DISABLE_PROFILING', '0') != '1'
+
+
+def rss_mb():
+    """현재 프로세스 RSS (MB, 읽을 수 없으면 None)"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 1024 ** 2
+    except Exception:
+        pass
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+    except Exception:
+        return None
+
+
+def _sample_loop(interval):
+    while True:
+        value = rss_mb()
+        if value is None:
+            return
+        with _lock:
+            _samples.append((time.perf_counter(), value))
+        time.sleep(interval)
+
+
+def _ensure_sampler():
+    global _sampler
+    if _sampler is not None:
+        return
+    try:
+        interval = float(os.environ.get('PROFILE_SAMPLE_INTERVAL', DEFAULT_SAMPLE_INTERVAL))
+    except ValueError:
+        interval = DEFAULT_SAMPLE_INTERVAL
+    _sampler = threading.Thread(target=_sample_loop, args=(interval,), daemon=True, name='rss-sampler')
+    if interval > 0:
+        _sampler.start()
+
+
+def _record(name, start, end, rss_start, rss_end, args=None):
+    with _lock:
+        _events.append({'name': name, 'start': start, 'end': end, 'tid': threading.get_ident(),
+                        'thread': threading.current_thread().name, 'rss_start': rss_start, 'rss_end': rss_end,
+                        'args': args or {}})
+
+
+@contextlib.contextmanager
+def stage(name, **args):
+    """단계 구간 기록 (예외가 나도 구간은 기록하고 예외는 그대로 전달)"""
+    if not enabled():
+        yield
+        return
+    _ensure_sampler()
+    rss_start = rss_mb()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(name, start, time.perf_counter(), rss_start, rss_mb(), args)
+
+
+def profiled(name=None):
+    """함수 전체를 단계로 기록하는 데코레이터 (기본 이름은 함수 이름)"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name or func.__name__):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class Steps:
+    """긴 함수를 들여쓰기 변경 없이 연속 구간으로 나눠 기록 (next가 이전 구간을 닫음)
+
+    구간 이름은 '<부모>.<구간>'이고, done에서 부모 구간 전체도 기록합니다.
+    """
+
+    def __init__(self, parent, **args):
+        self.parent = parent
+        self.args = args
+        self.active = enabled()
+        self.current = None
+        if self.active:
+            _ensure_sampler()
+            self.rss_start = rss_mb()
+            self.start = time.perf_counter()
+
+    def next(self, name):
+        if not self.active:
+            return
+        now, rss = time.perf_counter(), rss_mb()
+        if self.current is not None:
+            _record(f"{self.parent}.{self.current[0]}", self.current[1], now, self.current[2], rss)
+        self.current = (name, now, rss)
+
+    def done(self, **args):
+        if not self.active:
+            return
+        now, rss = time.perf_counter(), rss_mb()
+        if self.current is not None:
+            _record(f"{self.parent}.{self.current[0]}", self.current[1], now, self.current[2], rss)
+        _record(self.parent, self.start, now, self.rss_start, rss, dict(self.args, **args))
+        self.active = False
+
+
+def _peak(start, end, samples, *values):
+    peak = [v for v in values if v is not None]
+    peak += [value for t, value in samples if start <= t <= end]
+    return max(peak) if peak else None
+
+
+def _round(value, digits=1):
+    return None if value is None else round(value, digits)
+
+
+def _versions():
+    """이미 임포트된 주요 패키지 버전 (기록만을 위해 새로 임포트하지 않음)"""
+    versions = {'python': sys.version.split()[0]}
+    for package in ('pypsa', 'linopy', 'pandas', 'numpy', 'xarray', 'highspy', 'cplex'):
+        module = sys.modules.get(package)
+        version = getattr(module, '__version__', None) if module is not None else None
+        if version:
+            versions[package] = str(version)
+    return versions
+
+
+def collect(clear=True):
+    """기록된 단계 → (단계 목록, RSS 샘플) (clear=True면 비움)"""
+    with _lock:
+        events = sorted(_events, key=lambda e: (e['start'], -e['end']))
+        samples = list(_samples)
+        if clear:
+            _events.clear()
+            _samples.clear()
+    return events, samples
+
+
+def summarize(events, samples):
+    """단계별 초/RSS 표와 실행 요약 dict"""
+    stages = []
+    for event in events:
+        stages.append({
+            'name': event['name'],
+            'seconds': round(event['end'] - event['start'], 3),
+            'start_offset': round(event['start'] - events[0]['start'], 3),
+            'thread': event['thread'],
+            'rss_start_mb': _round(event['rss_start']),
+            'rss_end_mb': _round(event['rss_end']),
+            'rss_peak_mb': _round(_peak(event['start'], event['end'], samples, event['rss_start'], event['rss_end'])),
+            **({'args': event['args']} if event['args'] else {}),
+        })
+    # 최상위 단계: 다른 단계 안에 포함되지 않는 구간 (총 시간은 최상위 단계 합)
+    top = []
+    for event in events:
+        if not any(o is not event and o['tid'] == event['tid'] and o['start'] <= event['start']
+                   and event['end'] <= o['end'] and (o['end'] - o['start']) > (event['end'] - event['start'])
+                   for o in events):
+            top.append(event)
+    start = min((e['start'] for e in events), default=0.0)
+    end = max((e['end'] for e in events), default=0.0)
+    return {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'wall_seconds': round(end - start, 3),
+        'top_level_seconds': round(sum(e['end'] - e['start'] for e in top), 3),
+        'peak_rss_mb': _round(_peak(start, end, samples, *[e['rss_end'] for e in events],
+                                    *[e['rss_start'] for e in events])),
+        'top_level': [e['name'] for e in top],
+        'versions': _versions(),
+        'stages': stages,
+    }
+
+
+def chrome_trace(events, samples, meta=None):
+    """Chrome 트레이스 이벤트 형식 (단위 µs, 'X' 완료 구간 + 'C' RSS 카운터)"""
+    pid = os.getpid()
+    trace = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': 'PyPSA run'}}]
+    for tid, name in {(e['tid'], e['thread']) for e in events}:
+        trace.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}})
+    for event in events:
+        args = {'rss_start_mb': _round(event['rss_start']), 'rss_end_mb': _round(event['rss_end'])}
+        args.update({k: str(v) for k, v in event['args'].items()})
+        trace.append({'name': event['name'], 'cat': event['name'].split('.')[0], 'ph': 'X', 'pid': pid,
+                      'tid': event['tid'], 'ts': round((event['start'] - _origin) * 1e6),
+                      'dur': round((event['end'] - event['start']) * 1e6), 'args': args})
+    for t, value in samples:
+        trace.append({'name': 'rss_mb', 'ph': 'C', 'pid': pid, 'ts': round((t - _origin) * 1e6),
+                      'args': {'rss_mb': round(value, 1)}})
+    return {'traceEvents': trace, 'displayTimeUnit': 'ms', 'otherData': meta or {}}
+
+
+def summary_line(summary, trace_path=None):
+    """한 줄 요약: 총 시간, 최대 RSS, 가장 긴 하위 단계"""
+    names = set(summary['top_level'])
+    parents = {s['name'].rsplit('.', 1)[0] for s in summary['stages'] if '.' in s['name']}
+    # 하위 구간이 있는 단계는 하위 구간으로 표시
+    leaves = [s for s in summary['stages'] if s['name'] not in parents and (s['name'] in names or '.' in s['name'])]
+    leaves.sort(key=lambda s: s['seconds'], reverse=True)
+    parts = ' · '.join(f"{s['name']} {s['seconds']:.1f}초" for s in leaves[:SUMMARY_TOP])
+    peak = f", 최대 RSS {summary['peak_rss_mb'] / 1024:.2f}GB" if summary.get('peak_rss_mb') else ''
+    line = f"프로파일: 총 {summary['top_level_seconds']:.1f}초{peak} | {parts}"
+    return f"{line} | {trace_path}" if trace_path else line
+
+
+def write_run(results_dir, current_time, run_meta=None):
+    """지금까지 기록된 단계를 결과 폴더에 저장하고 비움 (한 줄 요약 출력)
+
+    Args:
+        results_dir (str): 결과 폴더
+        current_time (str): 결과 파일 시각 접두어 (save_results와 같은 값)
+        run_meta (dict, optional): 함께 기록할 실행 정보 (연도, 실행 그룹 등)
+
+    Returns:
+        dict: 요약 (기록이 없거나 비활성화면 None)
+    """
+    if not enabled():
+        return None
+    events, samples = collect(clear=True)
+    if not events:
+        return None
+    summary = summarize(events, samples)
+    meta = {k: v for k, v in (run_meta or {}).items() if k in ('year', 'run_group', 'run_id', 'input_hash')}
+    try:
+        from network_cache import code_version
+        meta['code_version'] = code_version()
+    except Exception:
+        pass
+    summary['run'] = meta
+    prefix = os.path.join(results_dir, f"optimization_result_{current_time}")
+    trace_path = f"{prefix}_{TRACE_SUFFIX}"
+    try:
+        with open(trace_path, 'w', encoding='utf-8') as f:
+            json.dump(chrome_trace(events, samples, meta), f, ensure_ascii=False, default=str)
+        with open(f"{prefix}_{SUMMARY_SUFFIX}", 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2, default=str)
+        print(summary_line(summary, trace_path))
+    except Exception as e:
+        print(f"프로파일 저장 경고: {str(e)}")
+    return summary
+
+
+def compare(base, new, min_seconds=COMPARE_MIN_SECONDS, min_ratio=COMPARE_MIN_RATIO):
+    """두 실행의 단계별 시간/최대 RSS 비교 (같은 이름 단계는 합산)
+
+    Args:
+        base, new (dict 또는 str): 요약 dict 또는 *_profile.json 경로
+
+    Returns:
+        list: (단계, 기준 초, 새 초, 차이 초, 기준 최대 RSS, 새 최대 RSS) - 변화가 큰 순서
+    """
+    def _load(summary):
+        if isinstance(summary, str):
+            with open(summary, encoding='utf-8') as f:
+                summary = json.load(f)
+        totals = {}
+        for s in summary['stages']:
+            seconds, peak = totals.get(s['name'], (0.0, None))
+            peaks = [p for p in (peak, s.get('rss_peak_mb')) if p is not None]
+            totals[s['name']] = (seconds + s['seconds'], max(peaks) if peaks else None)
+        return totals
+
+    a, b = _load(base), _load(new)
+    rows = []
+    for name in sorted(set(a) | set(b)):
+        sa, pa = a.get(name, (0.0, None))
+        sb, pb = b.get(name, (0.0, None))
+        delta = sb - sa
+        if abs(delta) >= min_seconds and abs(delta) >= min_ratio * max(sa, 1e-9):
+            rows.append((name, round(sa, 3), round(sb, 3), round(delta, 3), pa, pb))
+    rows.sort(key=lambda r: abs(r[3]), reverse=True)
+    return rows
+
+
+def main():
+    """명령줄: 두 프로파일 요약 비교 (버전 간 회귀 확인)"""
+    import argparse
+    parser = argparse.ArgumentParser(description='실행 프로파일 비교')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('compare', help='두 *_profile.json 비교')
+    p.add_argument('base')
+    p.add_argument('new')
+    p.add_argument('--min-seconds', type=float, default=COMPARE_MIN_SECONDS)
+    p = sub.add_parser('show', help='*_profile.json 한 줄 요약')
+    p.add_argument('path')
+    args = parser.parse_args()
+
+    if args.command == 'show':
+        with open(args.path, encoding='utf-8') as f:
+            print(summary_line(json.load(f)))
+        return
+    rows = compare(args.base, args.new, min_seconds=args.min_seconds)
+    if not rows:
+        print("유의한 변화가 없습니다.")
+        return
+    print(f"{'단계':<45} {'기준(초)':>10} {'새(초)':>10} {'차이':>10} {'최대RSS 기준→새(MB)':>22}")
+    for name, sa, sb, delta, pa, pb in rows:
+        rss = f"{pa if pa is not None else '-'}→{pb if pb is not None else '-'}"
+        print(f"{name:<45} {sa:>10.2f} {sb:>10.2f} {delta:>+10.2f} {rss:>22}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,401 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+시나리오 스윕 실행 모듈 - 파라미터 격자 × 코어 예산 기반 병렬 스케줄링
+
+환경변수(SLACK_GEN_COST, DISABLE_CO2_LIMIT 등)나 시트를 고쳐 PyPSA_GUI.main을 하나씩 다시 돌리던
+what-if 분석을 한 번에 실행합니다. 입력 Excel은 한 번만 파싱해 작업 프로세스에 공유하고,
+동시 실행 작업마다 솔버 스레드(SOLVER_THREADS)를 코어 예산에서 나눠 주어 과다 구독을 막습니다.
+남은 작업이 슬롯보다 적어지면(스윕 후반) 비는 코어를 다음 작업에 더 배정합니다.
+
+파라미터 키:
+    co2_limit               CO2Limit 전역 제약 상수 (None이면 DISABLE_CO2_LIMIT=1)
+    demand_scale[.EL]       부하 p_set 배율 (접미사: 버스 종류 EL/H/H2/..., 없으면 전체)
+    line_scale[.이름]       선로 s_nom 배율 (접미사: 선로 이름 포함 문자열)
+    cost.<기술>             발전기/링크 marginal_cost 배율 (carrier, 기술 분류명 또는 이름 포함 문자열)
+    <시트>/<name>/<컬럼>    임의 셀 값 (apply_year_overrides 형식, name='*'은 전체 행)
+    대문자 키               해당 환경변수 (예: SLACK_GEN_COST, ENABLE_AUTO_TRANSFORMER)
+
+사용 예:
+    grid = {'co2_limit': [None, 2.0e8, 1.5e8], 'demand_scale': [1.0, 1.1], 'cost.LNG': [1.0, 1.5]}
+    summary = run_sweep(grid, core_budget=16)
+    python src/scenario_sweep.py grid.json --budget 16 --threads-per-job 2
+"""
+
+import os
+import sys
+import json
+import time
+import itertools
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from input_overlay import InputOverlay, set_column
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 스윕 기본 환경변수 (변형마다 그림/대시보드를 만들지 않음, 필요하면 env 인자로 덮어씀)
+DEFAULT_ENV = {'DISABLE_PLOTS': '1', 'DISABLE_DASHBOARD': '1'}
+
+# 버스 종류 접미사
+BUS_SUFFIXES = ('EL', 'H2', 'H', 'LNG', 'EV')
+
+# 작업 프로세스에 공유되는 파싱된 입력 (initializer에서 1회 설정)
+_SHARED_INPUT = None
+
+
+def _gui():
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+    import PyPSA_GUI
+    return PyPSA_GUI
+
+
+# ---------------------------------------------------------------------------
+# 파라미터 격자 → 변형 목록, 변형 → 입력 데이터
+# ---------------------------------------------------------------------------
+
+def expand_grid(grid):
+    """파라미터 격자(dict: 키 → 값 목록)를 변형 목록으로 전개 (데카르트 곱)
+
+    Args:
+        grid (dict | list): {'co2_limit': [None, 1e8], ...} 또는 이미 전개된 [{...}, ...]
+
+    Returns:
+        list[dict]: 변형별 파라미터
+    """
+    if isinstance(grid, list):
+        return [dict(params) for params in grid]
+    keys = list(grid)
+    values = [v if isinstance(v, (list, tuple)) else [v] for v in grid.values()]
+    return [dict(zip(keys, combo)) for combo in itertools.product(*values)]
+
+
+def _scale_column(df, column, factor, mask=None):
+    if df is None or column not in df.columns:
+        return
+    mask = pd.Series(True, index=df.index) if mask is None else mask
+    values = pd.to_numeric(df[column], errors='coerce')
+    df[column] = values.where(~mask, values * float(factor))
+
+
+def _bus_kind(bus):
+    token = str(bus).rsplit('_', 1)[-1].upper()
+    return token if token in BUS_SUFFIXES else ''
+
+
+def _set_co2_limit(data, value, env):
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        env['DISABLE_CO2_LIMIT'] = '1'
+        return
+    env['DISABLE_CO2_LIMIT'] = '0'
+    df = data.get('constraints')
+    if df is None or df.empty or 'name' not in df.columns:
+        data['constraints'] = pd.DataFrame([{'name': 'CO2Limit', 'type': 'global', 'sense': '<=',
+                                             'constant': float(value)}])
+        return
+    # create_network는 name == 'CO2Limit' 행만 사용하므로 표기(CO2_limit 등)를 맞춤
+    key = df['name'].astype(str).str.strip().str.lower().str.replace('_', '', regex=False)
+    mask = key == 'co2limit'
+    if not mask.any():
+        data['constraints'] = pd.concat([df, pd.DataFrame([{'name': 'CO2Limit', 'constant': float(value)}])],
+                                        ignore_index=True)
+        return
+    # 컬럼 전체 교체 (오버레이 시트는 기준 입력과 배열을 공유)
+    set_column(df, 'name', 'CO2Limit', mask)
+    set_column(df, 'constant', float(value), mask)
+
+
+def apply_variant(input_data, params):
+    """변형 파라미터를 입력 데이터(copy-on-write 오버레이)와 환경변수에 반영
+
+    Args:
+        input_data (dict): read_input_data + standardize_bus_names_in_input 결과
+        params (dict): 변형 파라미터 (모듈 설명의 키 형식)
+
+    Returns:
+        tuple: (변형 입력 데이터, 환경변수 dict)
+    """
+    gui = _gui()
+    data = InputOverlay(input_data)
+    env = {}
+    overrides = {}
+    for key, value in params.items():
+        head, _, sub = key.partition('.')
+        if key.isupper():
+            env[key] = str(value)
+        elif key == 'co2_limit':
+            _set_co2_limit(data, value, env)
+        elif head == 'demand_scale':
+            loads = data.get('loads')
+            if loads is not None and 'bus' in loads.columns:
+                mask = loads['bus'].map(_bus_kind) == sub.upper() if sub else None
+                _scale_column(loads, 'p_set', value, mask)
+        elif head == 'line_scale':
+            lines = data.get('lines')
+            if lines is not None:
+                mask = lines['name'].astype(str).str.contains(sub, regex=False) if sub else None
+                _scale_column(lines, 's_nom', value, mask)
+                _scale_column(lines, 's_nom_max', value, mask)
+        elif head == 'cost' and sub:
+            target = sub.lower()
+            for sheet in ('generators', 'links'):
+                df = data.get(sheet)
+                if df is None or 'name' not in df.columns:
+                    continue
+                names = df['name'].astype(str)
+                carrier = df['carrier'].astype(str).str.lower() if 'carrier' in df.columns else ''
+                mask = ((carrier == target) | names.str.lower().str.contains(target, regex=False) |
+                        (names.map(gui._classify_technology).str.lower() == target))
+                _scale_column(df, 'marginal_cost', value, mask)
+        elif key.count('/') == 2:
+            sheet, name, column = key.split('/')
+            overrides.setdefault(sheet, {}).setdefault(name, {})[column] = value
+        else:
+            raise ValueError(f"알 수 없는 스윕 파라미터: {key}")
+    if overrides:
+        data = gui.apply_year_overrides(data, overrides)
+    return data, env
+
+
+# ---------------------------------------------------------------------------
+# 작업 프로세스
+# ---------------------------------------------------------------------------
+
+def _init_worker(input_data):
+    """작업 프로세스 초기화: 파싱된 입력을 한 번만 받아 보관"""
+    global _SHARED_INPUT
+    _SHARED_INPUT = input_data
+
+
+@contextlib.contextmanager
+def _patched_env(env):
+    saved = {key: os.environ.get(key) for key in env}
+    os.environ.update({key: str(value) for key, value in env.items()})
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _run_job(job):
+    """변형 1개 실행 (네트워크 생성 → 최적화 → 결과 저장), 요약 행 반환"""
+    gui = _gui()
+    started = time.perf_counter()
+    results_dir = job['results_dir']
+    os.makedirs(results_dir, exist_ok=True)
+    row = {'variant': job['variant'], 'threads': job['threads'], 'status': 'failed', 'objective': None,
+           'slack_mwh': None, 'results_dir': results_dir, 'error': None}
+
+    with open(os.path.join(results_dir, 'run.log'), 'w', encoding='utf-8') as log, \
+            contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+        try:
+            data, env = apply_variant(_SHARED_INPUT, job['params'])
+            env = {**DEFAULT_ENV, **job.get('env', {}), **env, 'SOLVER_THREADS': str(job['threads'])}
+            with _patched_env(env):
+                input_hash = gui._run_catalog.compute_input_hash(data) if gui._run_catalog is not None else None
+                timings = {}
+                # 중복 점/재실행은 네트워크 캐시에서 생성·풀이를 건너뜀
+                network, success = gui.build_and_optimize(data, input_hash=input_hash, timings=timings)
+                run_meta = {'run_id': job['run_id'], 'run_group': job['sweep_id'], 'input_hash': input_hash,
+                            'timings': timings,
+                            'extra': {'variant': job['variant'], 'params': job['params'], 'threads': job['threads']}}
+                if not success:
+                    run_meta['status'] = 'failed'
+                if not gui.save_results(network, subdir=results_dir, run_meta=run_meta) and not success:
+                    gui._record_failed_run(network, results_dir, run_meta)
+
+            solve_info = getattr(network, 'solve_info', None) or {}
+            row['build_seconds'] = timings.get('build_seconds')
+            row['cache'] = timings.get('cache')
+            row['solve_seconds'] = solve_info.get('solve_seconds')
+            row['error'] = solve_info.get('error')
+            if success:
+                row['status'] = 'ok'
+                row['objective'] = float(network.objective)
+            elif str(solve_info.get('status') or 'None') != 'None':
+                row['status'] = str(solve_info['status'])
+            if gui._run_catalog is not None:
+                row['slack_mwh'] = gui._run_catalog.summarize_slack(network)[0]
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            row['error'] = str(e)
+
+    row['wall_seconds'] = round(time.perf_counter() - started, 3)
+    return row
+
+
+# ---------------------------------------------------------------------------
+# 스케줄러
+# ---------------------------------------------------------------------------
+
+def _memory_slots(memory_per_job_gb):
+    """가용 메모리로 동시 작업 수 상한 (psutil, 없으면 sysconf; 둘 다 안 되면 제한 없음)"""
+    if not memory_per_job_gb:
+        return None
+    try:
+        import psutil
+        available_gb = psutil.virtual_memory().available / 1024 ** 3
+    except ImportError:
+        try:
+            available_gb = os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE') / 1024 ** 3
+        except (AttributeError, ValueError, OSError):
+            return None
+    return max(1, int(available_gb // float(memory_per_job_gb)))
+
+
+def plan_slots(n_variants, core_budget=None, threads_per_job=None, max_jobs=None, memory_per_job_gb=None):
+    """동시 작업 수(슬롯)와 작업당 기본 스레드 수 결정
+
+    Args:
+        n_variants (int): 변형 수
+        core_budget (int, optional): 사용할 총 코어 수 (기본 전체 코어)
+        threads_per_job (int, optional): 작업당 솔버 스레드 (기본: 변형이 많으면 1, 적으면 예산을 나눔)
+        max_jobs (int, optional): 동시 작업 수 상한
+        memory_per_job_gb (float, optional): 작업당 메모리(GB) - 가용 메모리로 슬롯 제한
+
+    Returns:
+        tuple: (core_budget, slots, threads_per_job)
+    """
+    core_budget = max(1, int(core_budget or multiprocessing.cpu_count()))
+    if threads_per_job is None:
+        threads_per_job = max(1, core_budget // max(1, n_variants))
+    threads_per_job = min(core_budget, max(1, int(threads_per_job)))
+    slots = max(1, min(n_variants, core_budget // threads_per_job))
+    for limit in (max_jobs, _memory_slots(memory_per_job_gb)):
+        if limit:
+            slots = max(1, min(slots, int(limit)))
+    return core_budget, slots, threads_per_job
+
+
+def load_sweep_input(input_file=None):
+    """스윕 공통 입력 로드 (PyPSA_GUI.main과 같은 전처리: 읽기 → 버스명 표준화)
+
+    Args:
+        input_file (str, optional): 입력 파일 (기본 PyPSA_GUI.INPUT_FILE)
+
+    Returns:
+        dict: 파싱된 입력 데이터 (실패 시 None)
+    """
+    gui = _gui()
+    input_data = gui.read_input_data(input_file or os.path.join(ROOT_DIR, gui.INPUT_FILE))
+    if input_data is None:
+        return None
+    return gui.standardize_bus_names_in_input(input_data)
+
+
+def run_sweep(grid, input_data=None, input_file=None, core_budget=None, threads_per_job=None,
+              max_jobs=None, memory_per_job_gb=None, results_root='results_sweep', env=None):
+    """시나리오 스윕 실행
+
+    Args:
+        grid (dict | list): 파라미터 격자 또는 변형 목록 (expand_grid 참고)
+        input_data (dict, optional): 파싱된 입력 (없으면 input_file에서 1회 로드)
+        input_file (str, optional): 입력 파일
+        core_budget (int, optional): 총 코어 예산 (기본 전체 코어)
+        threads_per_job (int, optional): 작업당 기본 솔버 스레드
+        max_jobs (int, optional): 동시 작업 수 상한
+        memory_per_job_gb (float, optional): 작업당 메모리(GB)
+        results_root (str): 결과 루트 (변형별 {results_root}/{sweep_id}/v001 ...)
+        env (dict, optional): 모든 변형에 공통 적용할 환경변수 (DEFAULT_ENV 덮어씀)
+
+    Returns:
+        pd.DataFrame: 변형별 요약 (sweep_summary.csv로도 저장)
+    """
+    variants = expand_grid(grid)
+    if not variants:
+        print("스윕 변형이 없습니다.")
+        return pd.DataFrame()
+    if input_data is None:
+        input_data = load_sweep_input(input_file)
+        if input_data is None:
+            return pd.DataFrame()
+
+    core_budget, slots, base_threads = plan_slots(len(variants), core_budget, threads_per_job,
+                                                  max_jobs, memory_per_job_gb)
+    sweep_id = 'sweep_' + datetime.now().strftime('%Y%m%d_%H%M%S')
+    sweep_dir = os.path.abspath(os.path.join(results_root, sweep_id))
+    os.makedirs(sweep_dir, exist_ok=True)
+    print(f"시나리오 스윕 {sweep_id}: 변형 {len(variants)}개, 코어 예산 {core_budget}, "
+          f"동시 {slots}개 × 기본 {base_threads}스레드")
+
+    pending = [{'variant': f"v{i + 1:03d}", 'params': params, 'env': dict(env or {}), 'sweep_id': sweep_id,
+                'run_id': f"{sweep_id}_v{i + 1:03d}", 'results_dir': os.path.join(sweep_dir, f"v{i + 1:03d}")}
+               for i, params in enumerate(variants)]
+    with open(os.path.join(sweep_dir, 'sweep_variants.json'), 'w', encoding='utf-8') as f:
+        json.dump({job['variant']: job['params'] for job in pending}, f, ensure_ascii=False, indent=2, default=str)
+
+    rows = []
+    started = time.perf_counter()
+    free_cores = core_budget
+    running = {}
+    # 파싱된 입력은 작업 프로세스당 한 번만 전달 (initializer)
+    with ProcessPoolExecutor(max_workers=slots, initializer=_init_worker, initargs=(input_data,)) as pool:
+        while pending or running:
+            while pending and len(running) < slots and free_cores > 0:
+                # 남은 작업이 슬롯보다 적으면 비는 코어를 나눠 더 배정
+                share = free_cores // max(1, min(len(pending), slots - len(running)))
+                job = dict(pending.pop(0), threads=max(1, min(free_cores, max(base_threads, share))))
+                free_cores -= job['threads']
+                running[pool.submit(_run_job, job)] = job
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                job = running.pop(future)
+                free_cores += job['threads']
+                try:
+                    row = future.result()
+                except Exception as e:
+                    row = {'variant': job['variant'], 'threads': job['threads'], 'status': 'failed',
+                           'results_dir': job['results_dir'], 'error': str(e)}
+                row.update({f"param:{k}": v for k, v in job['params'].items()})
+                rows.append(row)
+                print(f"  [{len(rows)}/{len(variants)}] {job['variant']} {row['status']} "
+                      f"({row.get('wall_seconds', 0) or 0:.1f}초, {job['threads']}스레드) {job['params']}")
+
+    summary = pd.DataFrame(rows).sort_values('variant').reset_index(drop=True)
+    summary_path = os.path.join(sweep_dir, 'sweep_summary.csv')
+    summary.to_csv(summary_path, index=False, encoding='utf-8-sig')
+    elapsed = time.perf_counter() - started
+    serial = float(pd.to_numeric(summary.get('wall_seconds'), errors='coerce').sum())
+    print(f"스윕 완료: {elapsed:.1f}초 (작업 합계 {serial:.1f}초, 병렬 효율 "
+          f"{serial / max(elapsed, 1e-9) / slots:.0%}) → {summary_path}")
+    return summary
+
+
+def main():
+    """스윕 CLI: 격자 JSON 파일 → 병렬 실행"""
+    import argparse
+    parser = argparse.ArgumentParser(description='시나리오 스윕 병렬 실행')
+    parser.add_argument('grid', help='파라미터 격자 JSON ({키: [값...]} 또는 [{변형}, ...])')
+    parser.add_argument('--input', default=None, help='입력 Excel (기본 integrated_input_data.xlsx)')
+    parser.add_argument('--budget', type=int, default=None, help='총 코어 예산 (기본 전체 코어)')
+    parser.add_argument('--threads-per-job', type=int, default=None, help='작업당 솔버 스레드')
+    parser.add_argument('--max-jobs', type=int, default=None, help='동시 작업 수 상한')
+    parser.add_argument('--memory-per-job', type=float, default=None, help='작업당 메모리(GB)')
+    parser.add_argument('--results-root', default='results_sweep', help='결과 루트 폴더')
+    parser.add_argument('--plots', action='store_true', help='변형별 그림/대시보드 생성')
+    args = parser.parse_args()
+
+    with open(args.grid, encoding='utf-8') as f:
+        grid = json.load(f)
+    env = {'DISABLE_PLOTS': '0', 'DISABLE_DASHBOARD': '0'} if args.plots else None
+    summary = run_sweep(grid, input_file=args.input, core_budget=args.budget,
+                        threads_per_job=args.threads_per_job, max_jobs=args.max_jobs,
+                        memory_per_job_gb=args.memory_per_job, results_root=args.results_root, env=env)
+    if not summary.empty:
+        print(summary.drop(columns=['results_dir']).to_string())
+
+
+if __name__ == '__main__':
+    main()
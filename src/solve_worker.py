@@ -0,0 +1,358 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+프로세스 분리 풀이 모듈 - 모델 파일 인계로 최대 메모리 절감
+
+optimize_network는 풀이 중에 pypsa.Network, linopy 모델, LP 텍스트를 파이썬 프로세스에 모두 들고 있고
+CPLEX도 같은 프로세스에서 자기 사본을 만듭니다. 전 연도·다중 에너지 모델에서는 이 최대치가 한계였습니다.
+
+SOLVE_OUT_OF_PROCESS=1이면:
+    1. linopy 모델을 작업 폴더에 한 번만 파일로 씁니다 (model.lp, SOLVE_MODEL_FORMAT=mps 가능).
+    2. 파이썬 쪽 모델에서 제약 계수/변수/우변을 해제하고 label만 남깁니다 (해를 이름 → label로 되돌리는 데 필요).
+    3. 별도 작업 프로세스(python src/solve_worker.py <작업 폴더>)가 자체 메모리 상한(SOLVE_WORKER_MEMORY_GB)으로
+       파일을 읽어 방법별 옵션을 순서대로 시도하고, 해(열/행 label → 값)를 result.npz로 씁니다.
+    4. 부모가 label로 변수 해와 쌍대값을 모델에 넣고 PyPSA 후처리(assign_solution/assign_duals/post_processing)를 실행합니다.
+
+작업 폴더(job.json + 모델 파일)만 있으면 풀이가 되므로 더 큰 머신에 옮겨 여러 풀이를 대기열로 돌릴 수 있습니다.
+(SOLVE_JOB_DIR을 지정하면 그 아래 풀이마다 새 작업 폴더(job-*)를 만들고 풀이 후에도 남김)
+
+사용 예:
+    status, error, variant = solve_out_of_process(network, option_variants, solver_name='cplex')
+    python src/solve_worker.py results/solve_jobs/2030     # 다른 머신에서 작업 폴더만으로 풀이
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import subprocess
+
+import numpy as np
+
+import run_profiler as _profiler
+
+JOB_FILE = 'job.json'
+RESULT_FILE = 'result.npz'
+RESULT_META_FILE = 'result.json'
+
+
+# ---------------------------------------------------------------------------
+# 부모 프로세스: 모델 파일 쓰기 → 모델 해제 → 작업 프로세스 실행 → 해 반영
+# ---------------------------------------------------------------------------
+
+def release_model_data(model):
+    """linopy 모델에서 파일로 쓴 뒤 필요 없는 제약 항(계수·변수, 항 수 × 행 수) 해제 (label/우변/부호만 유지)
+
+    Returns:
+        int: 해제한 바이트 수
+    """
+    from linopy.constraints import Constraint
+    released = 0
+    for name in list(model.constraints):
+        data = model.constraints[name].data
+        if '_term' not in data.dims or data.sizes['_term'] == 0:
+            continue
+        released += int(data['coeffs'].nbytes) + int(data['vars'].nbytes)
+        model.constraints.data[name] = Constraint(data.isel(_term=slice(0, 0)), model, name)
+    return released
+
+
+def write_job(network, job_dir, option_variants, solver_name='cplex', basis_fn=None, model_format=None):
+    """모델 파일과 job.json 작성
+
+    Args:
+        network (pypsa.Network): create_model이 끝난 네트워크
+        job_dir (str): 작업 폴더
+        option_variants (list[dict]): [{'name', 'opts', 'warmstart_fn'(선택)}] 순차 폴백 옵션
+        solver_name (str): 솔버
+        basis_fn (str): 풀이 basis를 쓸 경로
+        model_format (str): 'lp' 또는 'mps' (기본 SOLVE_MODEL_FORMAT, 없으면 lp)
+
+    Returns:
+        dict: job.json 내용
+    """
+    os.makedirs(job_dir, exist_ok=True)
+    # 같은 폴더를 다시 쓸 때 이전 풀이의 결과를 읽지 않도록 결과 파일 제거
+    for name in (RESULT_FILE, RESULT_META_FILE):
+        try:
+            os.remove(os.path.join(job_dir, name))
+        except FileNotFoundError:
+            pass
+    model_format = (model_format or os.environ.get('SOLVE_MODEL_FORMAT') or 'lp').lower()
+    problem_fn = os.path.join(job_dir, f"model.{model_format}")
+    t_write = time.perf_counter()
+    network.model.to_file(problem_fn)
+    variants = []
+    for variant in option_variants:
+        entry = {'name': variant['name'], 'opts': variant['opts']}
+        if variant.get('warmstart_fn'):
+            entry['warmstart_fn'] = os.path.abspath(variant['warmstart_fn'])
+        variants.append(entry)
+    job = {
+        'solver': solver_name,
+        'problem_fn': os.path.basename(problem_fn),
+        'variants': variants,
+        'basis_fn': os.path.abspath(basis_fn) if basis_fn else None,
+        'memory_gb': os.environ.get('SOLVE_WORKER_MEMORY_GB'),
+        'write_seconds': round(time.perf_counter() - t_write, 3),
+    }
+    with open(os.path.join(job_dir, JOB_FILE), 'w', encoding='utf-8') as f:
+        json.dump(job, f, ensure_ascii=False, indent=2)
+    return job
+
+
+def _run_worker(job_dir):
+    """작업 프로세스 실행 (출력은 줄 단위로 부모 stdout에 전달해 GUI/로그 리다이렉트를 따름)"""
+    command = [sys.executable, os.path.abspath(__file__), job_dir]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                               encoding='utf-8', errors='replace')
+    for line in process.stdout:
+        print(line, end='')
+    return process.wait()
+
+
+def load_result(job_dir):
+    """작업 결과 로드 → (meta dict, primal Series, dual Series) (결과가 없으면 meta만)"""
+    import pandas as pd
+    meta_path = os.path.join(job_dir, RESULT_META_FILE)
+    if not os.path.exists(meta_path):
+        return {'status': 'warning', 'termination_condition': 'unknown', 'error': '작업 결과 파일이 없습니다.'}, None, None
+    with open(meta_path, encoding='utf-8') as f:
+        meta = json.load(f)
+    result_path = os.path.join(job_dir, RESULT_FILE)
+    if not os.path.exists(result_path):
+        return meta, None, None
+    with np.load(result_path) as data:
+        primal = pd.Series(data['primal_values'], index=data['primal_labels'])
+        dual = pd.Series(data['dual_values'], index=data['dual_labels'])
+    return meta, primal, dual
+
+
+def assign_result(network, meta, primal, dual):
+    """label 기준 해/쌍대값을 모델에 넣고 PyPSA 후처리 실행 (linopy Model.solve의 결과 반영과 같은 순서)"""
+    from xarray import DataArray
+    model = network.model
+    for name in list(model.variables):
+        variable = model.variables[name]
+        labels = np.asarray(variable.labels.values)
+        values = primal.reindex(labels.ravel()).to_numpy(dtype=float).reshape(labels.shape)
+        variable.solution = DataArray(np.where(labels >= 0, values, np.nan), coords=variable.labels.coords,
+                                      dims=variable.labels.dims)
+    if dual is not None and len(dual):
+        for name in list(model.constraints):
+            con = model.constraints[name]
+            labels = np.asarray(con.labels.values)
+            values = dual.reindex(labels.ravel()).to_numpy(dtype=float).reshape(labels.shape)
+            con.dual = DataArray(np.where(labels >= 0, values, np.nan), coords=con.labels.coords, dims=con.labels.dims)
+    if meta.get('objective') is not None:
+        if callable(getattr(model.objective, 'set_value', None)):
+            model.objective.set_value(float(meta['objective']))
+        else:
+            model.objective._value = float(meta['objective'])
+    model.status = meta['status']
+    model.termination_condition = meta['termination_condition']
+    network.optimize.assign_solution()
+    network.optimize.assign_duals()
+    network.optimize.post_processing()
+
+
+def solve_out_of_process(network, option_variants, solver_name='cplex', basis_fn=None, model_ready=False,
+                         **optimize_kwargs):
+    """모델 파일 인계로 별도 프로세스에서 풀이
+
+    Args:
+        network (pypsa.Network): 네트워크
+        option_variants (list[dict]): 순차 폴백 옵션 (optimize_network의 방법별 옵션 세트, warmstart_fn 포함 가능)
+        solver_name (str): 솔버
+        basis_fn (str): 풀이 basis를 쓸 경로 (다음 해 워밍스타트용)
+        model_ready (bool): True면 이미 만든 network.model 사용 (워밍스타트 매핑에 쓴 모델), 아니면 create_model
+        optimize_kwargs: create_model에 전달 (예: multi_investment_periods=True)
+
+    Returns:
+        tuple: (상태 (status, condition), 오류 메시지, 사용한 옵션 이름)
+    """
+    import gc
+    if not model_ready or getattr(network, 'model', None) is None:
+        with _profiler.stage('optimize_network.create_model'):
+            network.optimize.create_model(**optimize_kwargs)
+    root_dir = os.environ.get('SOLVE_JOB_DIR')
+    keep_dir = bool(root_dir)
+    if root_dir:
+        os.makedirs(root_dir, exist_ok=True)
+    job_dir = tempfile.mkdtemp(prefix='job-' if root_dir else 'pypsa-solve-', dir=root_dir or None)
+    try:
+        with _profiler.stage('optimize_network.write_model'):
+            job = write_job(network, job_dir, option_variants, solver_name, basis_fn=basis_fn)
+            released = release_model_data(network.model)
+            gc.collect()
+        print(f"모델 파일 인계: {job['problem_fn']} ({os.path.getsize(os.path.join(job_dir, job['problem_fn'])) / 1024 ** 2:,.1f} MB, "
+              f"쓰기 {job['write_seconds']:.1f}s), 파이썬 쪽 모델 {released / 1024 ** 2:,.1f} MB 해제")
+        with _profiler.stage('optimize_network.solve', worker=True):
+            return_code = _run_worker(job_dir)
+        meta, primal, dual = load_result(job_dir)
+        if return_code != 0:
+            # 0이 아닌 종료 코드(풀이 실패·강제 종료·메모리 초과)는 결과 파일 내용과 관계없이 실패로 처리
+            primal = dual = None
+            if meta.get('status') == 'ok':
+                meta.update(status='warning', termination_condition='unknown')
+            meta['error'] = meta.get('error') or f"작업 프로세스 종료 코드 {return_code}"
+        status = (meta['status'], meta['termination_condition'])
+        if meta['status'] == 'ok' and primal is not None:
+            with _profiler.stage('optimize_network.assign_solution'):
+                assign_result(network, meta, primal, dual)
+        else:
+            # 실패 진단(EXPORT_LP, ANALYZE_IIS)은 전체 모델을 쓰므로 다시 생성
+            network.optimize.create_model(**optimize_kwargs)
+        return status, meta.get('error'), meta.get('variant')
+    finally:
+        if not keep_dir:
+            shutil.rmtree(job_dir, ignore_errors=True)
+
+
+# ---------------------------------------------------------------------------
+# 작업 프로세스: 모델 파일 풀이 → result.npz / result.json
+# ---------------------------------------------------------------------------
+
+def _limit_memory(memory_gb):
+    if not memory_gb:
+        return
+    try:
+        import resource
+        limit = int(float(memory_gb) * 1024 ** 3)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        print(f"작업 프로세스 메모리 상한: {float(memory_gb):g} GB")
+    except (ImportError, ValueError, OSError) as e:
+        print(f"메모리 상한 설정 경고: {str(e)}")
+
+
+def _labels(names):
+    """linopy 파일 이름(x{label}, c{label}) → label 배열 (다른 이름은 -1)"""
+    return np.array([int(name[1:]) if name[1:].isdigit() else -1 for name in names], dtype=np.int64)
+
+
+def _condition(text):
+    condition = str(text).strip().lower().replace(' ', '_')
+    return ('ok' if 'optimal' in condition and 'infeasible' not in condition else 'warning'), condition
+
+
+def _solve_cplex(problem_fn, opts, warmstart_fn=None, basis_fn=None, log_fn=None):
+    import cplex
+    m = cplex.Cplex()
+    if log_fn:
+        log = open(log_fn, 'a', encoding='utf-8')
+        m.set_results_stream(log)
+        m.set_warning_stream(log)
+    m.read(problem_fn)
+    for key, value in opts.items():
+        param = m.parameters
+        for part in key.split('.'):
+            param = getattr(param, part)
+        param.set(value)
+    if warmstart_fn:
+        m.start.read_basis(warmstart_fn)
+    m.solve()
+    status, condition = _condition(m.solution.get_status_string())
+    outcome = {'status': status, 'termination_condition': condition}
+    if status == 'ok':
+        if basis_fn:
+            try:
+                m.solution.basis.write(basis_fn)
+            except Exception as e:
+                print(f"basis 저장 경고: {str(e)}")
+        outcome.update(objective=m.solution.get_objective_value(),
+                       primal=(_labels(m.variables.get_names()), np.asarray(m.solution.get_values(), dtype=float)))
+        try:
+            outcome['dual'] = (_labels(m.linear_constraints.get_names()),
+                               np.asarray(m.solution.get_dual_values(), dtype=float))
+        except cplex.exceptions.CplexError:
+            pass
+    return outcome
+
+
+def _solve_highs(problem_fn, opts, warmstart_fn=None, basis_fn=None, log_fn=None):
+    import highspy
+    h = highspy.Highs()
+    if log_fn:
+        h.setOptionValue('log_file', log_fn)
+    for key, value in opts.items():
+        h.setOptionValue(key, value)
+    h.readModel(problem_fn)
+    if warmstart_fn:
+        h.readBasis(warmstart_fn)
+    h.run()
+    status, condition = _condition(h.modelStatusToString(h.getModelStatus()))
+    outcome = {'status': status, 'termination_condition': condition}
+    if status == 'ok':
+        if basis_fn:
+            h.writeBasis(basis_fn)
+        lp = h.getLp()
+        solution = h.getSolution()
+        outcome.update(objective=h.getInfo().objective_function_value,
+                       primal=(_labels(lp.col_names_), np.asarray(solution.col_value, dtype=float)))
+        if solution.dual_valid:
+            outcome['dual'] = (_labels(lp.row_names_), np.asarray(solution.row_dual, dtype=float))
+    return outcome
+
+
+# 솔버 이름 → 파일 풀이 함수 (해는 파일의 열/행 이름으로 label에 매핑)
+SOLVERS = {'cplex': _solve_cplex, 'highs': _solve_highs}
+
+
+def run_job(job_dir):
+    """작업 폴더의 모델을 방법별 옵션 순서대로 풀어 결과 기록
+
+    Returns:
+        dict: result.json 내용 (status, termination_condition, objective, variant, error, solve_seconds)
+    """
+    with open(os.path.join(job_dir, JOB_FILE), encoding='utf-8') as f:
+        job = json.load(f)
+    _limit_memory(job.get('memory_gb'))
+    problem_fn = os.path.join(job_dir, job['problem_fn'])
+    meta = {'status': 'warning', 'termination_condition': 'unknown', 'objective': None, 'variant': None,
+            'error': None}
+    if job['solver'] not in SOLVERS:
+        meta['error'] = f"작업 프로세스에서 지원하지 않는 솔버: {job['solver']} (지원: {', '.join(SOLVERS)})"
+        print(meta['error'])
+        variants = []
+    else:
+        variants = job['variants']
+    started = time.perf_counter()
+    outcome = None
+    for variant in variants:
+        meta['variant'] = variant['name']
+        print(f"\n[작업 프로세스 시도] {job['solver']} 방법: {variant['name']}, 옵션: {variant['opts']}")
+        try:
+            outcome = SOLVERS[job['solver']](problem_fn, variant['opts'], variant.get('warmstart_fn'),
+                                             job.get('basis_fn'), os.path.join(job_dir, 'solver.log'))
+        except Exception as e:
+            meta['error'] = str(e)
+            print(f"→ 예외: {meta['error']}")
+            outcome = None
+            continue
+        meta['status'] = outcome['status']
+        meta['termination_condition'] = outcome['termination_condition']
+        print(f"→ 상태: ({meta['status']}, {meta['termination_condition']})")
+        if meta['status'] == 'ok':
+            meta['error'] = None
+            break
+    meta['solve_seconds'] = round(time.perf_counter() - started, 3)
+    if outcome is not None and meta['status'] == 'ok':
+        meta['objective'] = float(outcome['objective'])
+        primal_labels, primal_values = outcome['primal']
+        dual_labels, dual_values = outcome.get('dual', (np.array([], dtype=np.int64), np.array([], dtype=float)))
+        np.savez(os.path.join(job_dir, RESULT_FILE), primal_labels=primal_labels, primal_values=primal_values,
+                 dual_labels=dual_labels, dual_values=dual_values)
+    with open(os.path.join(job_dir, RESULT_META_FILE), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    return meta
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print("사용법: python src/solve_worker.py <작업 폴더>")
+        sys.exit(2)
+    outcome = run_job(sys.argv[1])
+    sys.exit(0 if outcome['status'] == 'ok' else 1)
@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+연도 간 LP 워밍스타트 모듈 - 이전 해 basis를 다음 해 모델로 매핑
+
+연속된 연도의 모델은 구조가 거의 같고 최적해도 비슷합니다. 이전 해 풀이에서 솔버가 기록한 basis
+(변수/제약별 basic, 하한, 상한 상태)를 (변수/제약 이름, 요소 이름, 스냅샷 위치) 키로 바꿔 저장하고,
+다음 해 모델의 label에 다시 매핑한 basis 파일을 써서 simplex가 그 basis에서 출발하도록 합니다.
+연도가 달라도 스냅샷은 위치(0..8759)로 맞추므로 타임스탬프가 달라도 매핑됩니다.
+
+지원 형식:
+    cplex - MPS basis 형식 (XU/XL/UL/LL, 이름 x{label}/c{label}) / linopy basis_fn, warmstart_fn
+    highs - HiGHS_basis_file v2 (열/행 이름 + 상태 코드) / io_api='direct'에서 열/행 순서 = model.matrices
+
+CPLEX barrier는 시작 basis를 쓰지 않으므로 워밍스타트 시에는 dual simplex(advance=1)로 먼저 풉니다.
+
+사용 예:
+    status = network.optimize(solver_name='cplex', basis_fn='year1.bas')
+    basis = ModelBasis.from_file(network.model, 'year1.bas', 'cplex')
+    stats = basis.write_for(next_network.optimize.create_model(), 'year2_start.bas', 'cplex')
+"""
+
+import numpy as np
+import pandas as pd
+
+TIME_DIMS = ('snapshot', 'period', 'timestep')
+KEY_COLUMNS = ['name', 'element', 'pos']
+
+# HiGHS 상태 코드 (HighsBasisStatus: kLower=0, kBasic=1, kUpper=2, kZero=3, kNonbasic=4)
+_HIGHS_CODES = {0: 'L', 1: 'B', 2: 'U', 3: 'Z', 4: 'Z'}
+_HIGHS_STATUS = {'L': 0, 'B': 1, 'U': 2, 'Z': 3}
+
+
+def label_keys(container):
+    """linopy Variables/Constraints의 label → (이름, 요소, 스냅샷 위치) 키 테이블
+
+    Args:
+        container: model.variables 또는 model.constraints
+
+    Returns:
+        pd.DataFrame: name, element, pos(-1: 시간 차원 없음), label
+    """
+    frames = []
+    for name in container:
+        labels = container[name].labels
+        values = np.asarray(labels.values)
+        if values.size == 0:
+            continue
+        flat = values.ravel()
+        keep = flat >= 0
+        if not keep.any():
+            continue
+        grids = np.indices(values.shape).reshape(values.ndim, -1)[:, keep] if values.ndim else np.zeros((0, 1), int)
+        time_axes = [axis for axis, dim in enumerate(labels.dims) if dim in TIME_DIMS]
+        pos = grids[time_axes[0]].astype(np.int64) if time_axes else np.full(int(keep.sum()), -1, dtype=np.int64)
+        parts = [pd.Index(labels.coords[dim].values).astype(str).values[grids[axis]]
+                 for axis, dim in enumerate(labels.dims) if dim not in TIME_DIMS]
+        if parts:
+            element = pd.Series(parts[0])
+            if len(parts) > 1:
+                element = element.str.cat([pd.Series(p) for p in parts[1:]], sep='|')
+            element = element.values
+        else:
+            element = np.full(len(pos), '', dtype=object)
+        frames.append(pd.DataFrame({'name': name, 'element': element, 'pos': pos, 'label': flat[keep]}))
+    if not frames:
+        return pd.DataFrame(columns=KEY_COLUMNS + ['label'])
+    return pd.concat(frames, ignore_index=True)
+
+
+# ---------------------------------------------------------------------------
+# basis 파일 읽기/쓰기
+# ---------------------------------------------------------------------------
+
+def _read_cplex(path):
+    """MPS basis → ({열 label: 상태}, {행 label: 상태}), 기본값(열 L, 행 B)은 생략"""
+    columns, rows = {}, {}
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for line in f:
+            tokens = line.split()
+            if len(tokens) < 2 or tokens[0] in ('NAME', 'ENDATA') or line.startswith('*'):
+                continue
+            code = tokens[0]
+            if code in ('XU', 'XL') and len(tokens) >= 3:
+                columns[tokens[1]] = 'B'
+                rows[tokens[2]] = 'U' if code == 'XU' else 'L'
+            elif code == 'UL':
+                columns[tokens[1]] = 'U'
+            elif code == 'LL':
+                columns[tokens[1]] = 'L'
+    return columns, rows
+
+
+def _read_highs(path):
+    columns, rows = {}, {}
+    target = None
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if line.startswith('# Columns'):
+                target = columns
+                continue
+            if line.startswith('# Rows'):
+                target = rows
+                continue
+            tokens = line.split()
+            if target is None or len(tokens) != 2:
+                continue
+            target[tokens[0]] = _HIGHS_CODES.get(int(tokens[1]), 'Z')
+    # 기본값 생략 (열 L, 행 B)
+    columns = {k: v for k, v in columns.items() if v != 'L'}
+    rows = {k: v for k, v in rows.items() if v != 'B'}
+    return columns, rows
+
+
+def _status_frame(statuses, prefix):
+    """{'x12': 'B'} → label/status 프레임 (linopy 이름 규칙 x{label}, c{label})"""
+    if not statuses:
+        return pd.DataFrame({'label': pd.Series(dtype=np.int64), 'status': pd.Series(dtype=object)})
+    names = pd.Series(list(statuses.keys()))
+    valid = names.str.startswith(prefix) & names.str[1:].str.isdigit()
+    return pd.DataFrame({'label': names[valid].str[1:].astype(np.int64).values,
+                         'status': pd.Series(list(statuses.values()))[valid].values})
+
+
+class ModelBasis:
+    """솔버 중립 basis: 열/행 상태를 (이름, 요소, 스냅샷 위치) 키로 보관 (기본 상태는 생략)"""
+
+    def __init__(self, columns, rows):
+        """초기화 함수
+
+        Args:
+            columns (pd.DataFrame): name, element, pos, status ('B', 'U', 'Z')
+            rows (pd.DataFrame): name, element, pos, status ('L', 'U')
+        """
+        self.columns = columns
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.columns) + len(self.rows)
+
+    @classmethod
+    def from_file(cls, model, path, solver='cplex'):
+        """솔버가 쓴 basis 파일을 읽어 키 기반 basis 생성
+
+        Args:
+            model (linopy.Model): basis를 얻은 모델
+            path (str): basis 파일 (linopy basis_fn)
+            solver (str): 'cplex' 또는 'highs'
+
+        Returns:
+            ModelBasis: basis (읽을 내용이 없으면 None)
+        """
+        reader = _read_highs if solver == 'highs' else _read_cplex
+        col_status, row_status = reader(path)
+        if not col_status and not row_status:
+            return None
+        columns = _status_frame(col_status, 'x').merge(label_keys(model.variables), on='label')
+        rows = _status_frame(row_status, 'c').merge(label_keys(model.constraints), on='label')
+        return cls(columns[KEY_COLUMNS + ['status']], rows[KEY_COLUMNS + ['status']])
+
+    def _mapped(self, model):
+        col_keys = label_keys(model.variables)
+        row_keys = label_keys(model.constraints)
+        columns = col_keys.merge(self.columns, on=KEY_COLUMNS, how='inner')
+        rows = row_keys.merge(self.rows, on=KEY_COLUMNS, how='inner')
+        return col_keys, row_keys, columns, rows
+
+    def write_for(self, model, path, solver='cplex'):
+        """다음 모델의 label로 매핑한 basis 파일 작성 (linopy warmstart_fn으로 전달)
+
+        Args:
+            model (linopy.Model): 워밍스타트할 모델 (create_model 결과)
+            path (str): 작성할 basis 파일
+            solver (str): 'cplex' 또는 'highs'
+
+        Returns:
+            dict: columns/rows(모델 크기), mapped_columns/mapped_rows(매핑된 비기본 상태 수)
+        """
+        col_keys, row_keys, columns, rows = self._mapped(model)
+        if solver == 'highs':
+            self._write_highs(model, path, columns, rows)
+        else:
+            self._write_cplex(path, columns, rows)
+        return {'columns': len(col_keys), 'rows': len(row_keys),
+                'mapped_columns': len(columns), 'mapped_rows': len(rows),
+                'coverage': (len(columns) + len(rows)) / max(1, len(self))}
+
+    @staticmethod
+    def _write_cplex(path, columns, rows):
+        # 기저 변수는 비기저 행과 짝지어 XU/XL로, 상한 비기저 변수는 UL로 기록 (짝이 안 맞으면 CPLEX가 보정)
+        basic = columns.loc[columns['status'] == 'B', 'label'].values
+        nonbasic_rows = rows[rows['status'].isin(['L', 'U'])]
+        n_pairs = min(len(basic), len(nonbasic_rows))
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('NAME          warmstart\n')
+            for col, row, status in zip(basic[:n_pairs], nonbasic_rows['label'].values[:n_pairs],
+                                        nonbasic_rows['status'].values[:n_pairs]):
+                f.write(f" {'XU' if status == 'U' else 'XL'} x{col} c{row}\n")
+            for col in columns.loc[columns['status'] == 'U', 'label'].values:
+                f.write(f" UL x{col}\n")
+            f.write('ENDATA\n')
+
+    @staticmethod
+    def _write_highs(model, path, columns, rows):
+        # HiGHS는 전체 열/행 상태가 필요하고 기저 수 = 행 수여야 함 → 경계 유무로 기본값을 정하고 기저 수 보정
+        matrices = model.matrices
+        vlabels, clabels = np.asarray(matrices.vlabels), np.asarray(matrices.clabels)
+        lb, ub = np.asarray(matrices.lb, dtype=float), np.asarray(matrices.ub, dtype=float)
+        col_status = np.where(np.isfinite(lb), 0, np.where(np.isfinite(ub), 2, 3))
+        row_status = np.ones(len(clabels), dtype=int)
+
+        col_pos = pd.Series(np.arange(len(vlabels)), index=vlabels)
+        row_pos = pd.Series(np.arange(len(clabels)), index=clabels)
+        col_idx = col_pos.reindex(columns['label'].values).values
+        ok = ~np.isnan(col_idx)
+        col_idx = col_idx[ok].astype(int)
+        codes = columns['status'].map(_HIGHS_STATUS).values[ok]
+        # 경계가 없는 쪽 비기저 상태는 허용되지 않으므로 조정
+        codes = np.where((codes == 2) & ~np.isfinite(ub[col_idx]), 3, codes)
+        col_status[col_idx] = codes
+
+        sense = np.asarray(matrices.sense).astype(str)
+        row_idx = row_pos.reindex(rows['label'].values).values
+        ok = ~np.isnan(row_idx)
+        row_idx = row_idx[ok].astype(int)
+        codes = rows['status'].map(_HIGHS_STATUS).values[ok]
+        # linopy 행: '<'는 상한만, '>'는 하한만, '='는 둘 다
+        codes = np.where(sense[row_idx] == '<', 2, np.where(sense[row_idx] == '>', 0, codes))
+        row_status[row_idx] = codes
+
+        excess = int((col_status == 1).sum() + (row_status == 1).sum()) - len(clabels)
+        if excess > 0:
+            # 기저가 많으면 매핑되지 않은 행부터 비기저로
+            candidates = np.flatnonzero(row_status == 1)[:excess]
+            row_status[candidates] = np.where(sense[candidates] == '<', 2, 0)
+        elif excess < 0:
+            candidates = np.flatnonzero(row_status != 1)[:(-excess)]
+            row_status[candidates] = 1
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('HiGHS_basis_file v2\nValid\n')
+            f.write(f'# Columns {len(vlabels)}\n')
+            f.writelines(f'x{label} {code}\n' for label, code in zip(vlabels, col_status))
+            f.write(f'# Rows {len(clabels)}\n')
+            f.writelines(f'c{label} {code}\n' for label, code in zip(clabels, row_status))
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+멀티년 실행 연도별 체크포인트 모듈
+
+run_multi_year_sequence의 연도 간 상태(이전 해 용량 인계)는 메모리에만 있어서 중간 연도에서
+솔버/메모리/저장 오류로 중단되면 첫 해부터 다시 돌려야 했습니다. 연도 풀이와 결과 저장이 끝날 때마다
+실행 그룹 폴더(results_multi/<run_group>/checkpoints)에 다음을 기록합니다.
+
+    <연도>.json            상태(completed/failed), 입력 해시, 적용 오버라이드, 결과 폴더, 소요 시간, 결과 요약
+    <연도>_carryover.csv    풀이 후 인계 용량 (component, name, capacity)
+    <연도>_basis.pkl        워밍스타트 basis (있을 때만)
+
+이어서 실행(resume) 시 완료 상태이고 입력 해시가 같은 연도는 건너뛰고 체크포인트의 인계 용량으로
+다음 연도를 준비하므로, 첫 미완료 연도부터 다시 시작합니다. 파일은 임시 파일에 쓴 뒤 교체(os.replace)해
+쓰는 도중 중단되어도 깨진 체크포인트가 남지 않습니다.
+"""
+
+import os
+import json
+import pickle
+from datetime import datetime
+
+import pandas as pd
+
+CHECKPOINT_DIR = 'checkpoints'
+COMPLETED = 'completed'
+FAILED = 'failed'
+
+
+def checkpoint_dir(run_root):
+    """실행 그룹 폴더의 체크포인트 폴더 경로"""
+    return os.path.join(run_root, CHECKPOINT_DIR)
+
+
+def _replace_atomic(path, write):
+    tmp_path = f"{path}.tmp"
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def save_year_checkpoint(run_root, year, status, input_hash=None, overrides=None, carryover=None,
+                         results_dir=None, timings=None, basis=None, summary=None):
+    """연도 체크포인트 저장
+
+    Args:
+        run_root (str): 실행 그룹 폴더 (results_multi/<run_group>)
+        year (int): 연도
+        status (str): 'completed' 또는 'failed'
+        input_hash (str): 인계 용량까지 반영한 연도 입력 해시
+        overrides (dict): 적용한 연도 오버라이드
+        carryover (dict): extract_capacity_carryover 결과 (풀이 후 용량)
+        results_dir (str): 연도 결과 폴더
+        timings (dict): 단계별 소요 시간
+        basis: 워밍스타트 basis (warm_start.ModelBasis)
+        summary (dict): 연도 결과 요약 (year_results.summarize_year)
+
+    Returns:
+        str: 체크포인트 JSON 경로
+    """
+    folder = checkpoint_dir(run_root)
+    os.makedirs(folder, exist_ok=True)
+    meta = {
+        'year': int(year),
+        'status': status,
+        'input_hash': input_hash,
+        'overrides': overrides or {},
+        'results_dir': results_dir,
+        'timings': timings or {},
+        'summary': summary or {},
+        'saved_at': datetime.now().isoformat(timespec='seconds'),
+        'carryover_file': None,
+        'basis_file': None,
+    }
+    if carryover:
+        frames = [pd.DataFrame({'component': component, 'name': caps.index.astype(str), 'capacity': caps.values})
+                  for component, caps in ((c, pd.Series(v, dtype=float)) for c, v in carryover.items())
+                  if not caps.empty]
+        if frames:
+            meta['carryover_file'] = f"{year}_carryover.csv"
+            table = pd.concat(frames, ignore_index=True)
+            _replace_atomic(os.path.join(folder, meta['carryover_file']),
+                            lambda p: table.to_csv(p, index=False, encoding='utf-8'))
+    if basis is not None:
+        meta['basis_file'] = f"{year}_basis.pkl"
+
+        def _write_basis(p):
+            with open(p, 'wb') as f:
+                pickle.dump(basis, f, protocol=pickle.HIGHEST_PROTOCOL)
+        _replace_atomic(os.path.join(folder, meta['basis_file']), _write_basis)
+
+    path = os.path.join(folder, f"{year}.json")
+
+    def _write_meta(p):
+        with open(p, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2, default=str)
+    _replace_atomic(path, _write_meta)
+    return path
+
+
+def load_year_checkpoint(run_root, year):
+    """연도 체크포인트 로드
+
+    Args:
+        run_root (str): 실행 그룹 폴더
+        year (int): 연도
+
+    Returns:
+        dict: 메타 정보 + carryover({component: name 인덱스 Series}), basis (없으면 None 반환)
+    """
+    folder = checkpoint_dir(run_root)
+    path = os.path.join(folder, f"{year}.json")
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding='utf-8') as f:
+            meta = json.load(f)
+        meta['carryover'] = {}
+        if meta.get('carryover_file'):
+            table = pd.read_csv(os.path.join(folder, meta['carryover_file']), dtype={'name': str})
+            meta['carryover'] = {component: group.set_index('name')['capacity'].astype(float)
+                                 for component, group in table.groupby('component', sort=False)}
+        meta['basis'] = None
+        if meta.get('basis_file'):
+            try:
+                with open(os.path.join(folder, meta['basis_file']), 'rb') as f:
+                    meta['basis'] = pickle.load(f)
+            except Exception as e:
+                print(f"체크포인트 basis 로드 경고({year}): {str(e)}")
+        return meta
+    except Exception as e:
+        print(f"체크포인트 로드 경고({year}): {str(e)}")
+        return None
+
+
+def is_reusable(checkpoint, input_hash):
+    """완료 상태이고 입력 해시가 같으면 재사용 가능 (해시를 계산할 수 없으면 재사용하지 않음)"""
+    return (checkpoint is not None and checkpoint.get('status') == COMPLETED
+            and input_hash is not None and checkpoint.get('input_hash') == input_hash)
+
+
+def find_resume_root(results_root, resume):
+    """이어서 실행할 실행 그룹 폴더 탐색
+
+    Args:
+        results_root (str): 멀티년 결과 루트 (results_multi)
+        resume: True/'latest'/'1'이면 체크포인트가 있는 가장 최근 실행 그룹, 그 외 문자열은 실행 그룹 이름 또는 경로
+
+    Returns:
+        str: 실행 그룹 폴더 (없으면 None)
+    """
+    if not resume:
+        return None
+    if resume is True or str(resume).lower() in ('latest', '1', 'true'):
+        if not os.path.isdir(results_root):
+            return None
+        candidates = sorted(name for name in os.listdir(results_root)
+                            if os.path.isdir(checkpoint_dir(os.path.join(results_root, name))))
+        return os.path.join(results_root, candidates[-1]) if candidates else None
+    for path in (str(resume), os.path.join(results_root, str(resume))):
+        if os.path.isdir(path):
+            return path
+    return None
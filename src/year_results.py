@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+멀티년 실행 연도 결과 요약 모듈 (스트리밍 모드)
+
+run_multi_year_sequence는 연도마다 풀린 pypsa.Network(시계열 + linopy 모델 포함)를 결과 dict에 모두 보관해
+경로 길이에 비례해 메모리가 늘었습니다. 스트리밍 모드에서는 결과 저장과 용량 인계 추출이 끝나면
+가벼운 요약(목적함수, 용량, 주요 지표, 산출물 경로)만 남기고 네트워크와 linopy 모델을 해제합니다.
+전체 네트워크가 필요하면 YearResult['network']로 접근할 때 결과 폴더의 .nc에서 다시 읽습니다.
+
+사용 예:
+    results = run_multi_year_sequence(years, streaming=True)
+    results[2030]['summary']['objective']
+    network = results[2030]['network']     # .nc에서 필요할 때 로드 (캐시하지 않음)
+"""
+
+import os
+import glob
+
+import pandas as pd
+
+# 요약에 남길 용량 속성 (컴포넌트 → (최적 용량, 명목 용량))
+CAPACITY_ATTRS = {
+    'generators': ('p_nom_opt', 'p_nom'),
+    'links': ('p_nom_opt', 'p_nom'),
+    'lines': ('s_nom_opt', 's_nom'),
+    'stores': ('e_nom_opt', 'e_nom'),
+    'storage_units': ('p_nom_opt', 'p_nom'),
+}
+
+
+def _weighted_total(frame, weights):
+    if frame is None or frame.empty:
+        return pd.Series(dtype=float)
+    return frame.mul(weights.reindex(frame.index).fillna(1.0), axis=0).sum()
+
+
+def summarize_year(network, results_dir=None):
+    """연도 네트워크의 가벼운 요약 (JSON 직렬화 가능)
+
+    Args:
+        network (pypsa.Network): 풀이가 끝난 네트워크
+        results_dir (str): 연도 결과 폴더 (산출물 경로 수집)
+
+    Returns:
+        dict: objective, solve_seconds, slack_mwh, fallback_mwh, load_mwh,
+              generation_mwh({carrier: MWh}), capacity({컴포넌트: {carrier: 용량}}), artifacts({종류: 경로})
+    """
+    summary = {'objective': None, 'solve_seconds': None, 'slack_mwh': None, 'fallback_mwh': None,
+               'load_mwh': None, 'generation_mwh': {}, 'capacity': {}, 'artifacts': {}}
+    if network is not None:
+        try:
+            objective = getattr(network, 'objective', None)
+            summary['objective'] = float(objective) if objective is not None else None
+        except Exception:
+            pass
+        summary['solve_seconds'] = (getattr(network, 'solve_info', None) or {}).get('solve_seconds')
+        try:
+            weights = network.snapshot_weightings['generators'] \
+                if 'generators' in network.snapshot_weightings.columns else network.snapshot_weightings.iloc[:, 0]
+            gen = _weighted_total(network.generators_t.p, weights)
+            if not gen.empty:
+                names = gen.index.astype(str)
+                summary['slack_mwh'] = float(gen[names.str.contains('_Slack_')].sum())
+                summary['fallback_mwh'] = float(gen[names.str.contains('_Fallback_Gen')].sum())
+                carriers = network.generators['carrier'].reindex(gen.index).fillna('unknown')
+                summary['generation_mwh'] = {str(k): float(v) for k, v in gen.groupby(carriers).sum().items()}
+            load = _weighted_total(network.loads_t.p, weights)
+            summary['load_mwh'] = float(load.sum()) if not load.empty else None
+        except Exception as e:
+            print(f"연도 요약(발전/수요) 경고: {str(e)}")
+        for component, (opt_attr, nom_attr) in CAPACITY_ATTRS.items():
+            df = getattr(network, component, None)
+            if df is None or df.empty:
+                continue
+            caps = df[opt_attr].fillna(df[nom_attr]) if opt_attr in df.columns else df[nom_attr]
+            carriers = df['carrier'].fillna('unknown') if 'carrier' in df.columns else pd.Series('unknown', index=df.index)
+            caps = pd.to_numeric(caps, errors='coerce').groupby(carriers).sum()
+            summary['capacity'][component] = {str(k): float(v) for k, v in caps.items()}
+    summary['artifacts'] = collect_year_artifacts(results_dir)
+    return summary
+
+
+def collect_year_artifacts(results_dir):
+    """연도 결과 폴더의 save_results 산출물 경로 ({종류: 경로}, 같은 종류는 최신 파일)"""
+    if not results_dir or not os.path.isdir(results_dir):
+        return {}
+    try:
+        from run_catalog import ARTIFACT_SUFFIXES
+    except Exception:
+        ARTIFACT_SUFFIXES = {'.nc': 'netcdf', '.xlsx': 'excel', '_stats.json': 'stats'}
+    # 긴 접미사부터 비교 (예: '_gen_generators_monthly.parquet'가 '_gen_generators.parquet'보다 먼저)
+    suffixes = sorted(ARTIFACT_SUFFIXES.items(), key=lambda item: -len(item[0]))
+    artifacts = {}
+    for path in sorted(glob.glob(os.path.join(results_dir, 'optimization_result_*'))):
+        name = os.path.basename(path)
+        for suffix, kind in suffixes:
+            stem = name[len('optimization_result_'):-len(suffix)] if name.endswith(suffix) else None
+            # 타임스탬프(YYYYmmdd_HHMMSS) 바로 뒤에 접미사가 붙은 파일만 해당 종류로 인정
+            if stem is not None and len(stem) == 15 and stem.replace('_', '').isdigit():
+                artifacts[kind] = os.path.abspath(path)
+                break
+    return artifacts
+
+
+def release_network(network):
+    """네트워크에 붙은 linopy 모델과 솔버 객체 해제 (네트워크 참조를 모두 놓은 뒤 gc로 회수)"""
+    if network is None:
+        return
+    try:
+        del network.model
+    except Exception:
+        pass
+    for attr in ('solve_basis', 'screen_result'):
+        if hasattr(network, attr):
+            try:
+                delattr(network, attr)
+            except Exception:
+                pass
+
+
+class YearResult(dict):
+    """연도 결과: results_dir, status, summary (+ 네트워크를 유지하는 경우 network)
+
+    network를 보관하지 않은 경우(스트리밍 모드) result['network'] 또는 result.get('network')는
+    결과 폴더의 .nc를 읽어 새 네트워크를 반환합니다 (메모리를 잡지 않도록 캐시하지 않음).
+    """
+
+    def __init__(self, results_dir=None, status=None, summary=None, network=None):
+        super().__init__(results_dir=results_dir, status=status, summary=summary or {})
+        if network is not None:
+            self['network'] = network
+
+    def __missing__(self, key):
+        if key == 'network':
+            return self.load_network()
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key == 'network' and not dict.__contains__(self, key):
+            network = self.load_network()
+            return default if network is None else network
+        return super().get(key, default)
+
+    def load_network(self):
+        """결과 폴더의 최신 .nc에서 네트워크 로드 (없으면 None)"""
+        path = (self.get('summary') or {}).get('artifacts', {}).get('netcdf')
+        if (not path or not os.path.exists(path)) and self.get('results_dir'):
+            candidates = sorted(glob.glob(os.path.join(self['results_dir'], 'optimization_result_*.nc')))
+            path = candidates[-1] if candidates else None
+        if not path or not os.path.exists(path):
+            return None
+        import pypsa
+        return pypsa.Network(path)
+